@@ -0,0 +1,133 @@
+"""
+Concurrent uploads to the media storage, sync vs async.
+
+Simulates uploads arriving in chunks over the network, each chunk taking
+`--latency` seconds to be received. The sync scenario stores them the way
+a WSGI worker does: a fixed number of threads, each receiving and writing
+one upload at a time. The async scenario stores all of them from a single
+event loop with `astore_stream`, receiving the next chunk while the I/O
+pool writes the previous one.
+
+Usage:
+    python -m benchmarks.bench_async_storage [--uploads 64] [--chunks 16]
+        [--chunk-size 262144] [--latency 0.01] [--threads 8] [--fsync]
+        [--directory /path/on/target/disk]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.core._shared.infrastructure.storage.abstract_storage_service import (
+    sharded_path,
+)
+from src.core._shared.infrastructure.storage.local_storage import LocalStorage
+
+
+def received(key: str, block: bytes, chunks: int, latency: float):
+    """
+    Chunks of an upload received by a blocking server.
+
+    Args:
+        key (str): A prefix making the content distinct, defeating the
+            deduplication.
+        block (bytes): The content of each chunk.
+        chunks (int): The number of chunks.
+        latency (float): The time to receive each chunk, in seconds.
+    """
+
+    for index in range(chunks):
+        time.sleep(latency)
+        yield (key if index == 0 else "").encode() + block
+
+
+async def areceived(key: str, block: bytes, chunks: int, latency: float):
+    """
+    Chunks of an upload received by an ASGI server.
+
+    Args:
+        key (str): A prefix making the content distinct.
+        block (bytes): The content of each chunk.
+        chunks (int): The number of chunks.
+        latency (float): The time to receive each chunk, in seconds.
+    """
+
+    for index in range(chunks):
+        await asyncio.sleep(latency)
+        yield (key if index == 0 else "").encode() + block
+
+
+def report(name: str, uploads: int, size: int, elapsed: float) -> None:
+    print(
+        f"{name:28} {elapsed:8.2f} s {uploads / elapsed:10.1f} uploads/s "
+        f"{uploads * size / elapsed / 1e6:10.1f} MB/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--uploads", type=int, default=64)
+    parser.add_argument("--chunks", type=int, default=16)
+    parser.add_argument("--chunk-size", type=int, default=256 * 1024)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--fsync", action="store_true")
+    parser.add_argument("--directory", default=None)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="codeflix-storage-", dir=args.directory))
+    block = os.urandom(args.chunk_size)
+    size = args.chunks * args.chunk_size
+    keys = [str(uuid.uuid4()) for _ in range(args.uploads)]
+    print(
+        f"{args.uploads} uploads of {args.chunks} x {args.chunk_size} bytes, "
+        f"{args.latency * 1000:.1f} ms per chunk"
+    )
+
+    storage = LocalStorage(bucket=str(root / "sync"), fsync=args.fsync)
+
+    def upload(key: str) -> str:
+        return storage.store_stream(
+            sharded_path("videos", key, "media.bin"),
+            received(key, block, args.chunks, args.latency),
+            "application/octet-stream",
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as workers:
+        list(workers.map(upload, keys))
+    report(
+        f"sync, {args.threads} threads", args.uploads, size, time.perf_counter() - start
+    )
+
+    async_storage = LocalStorage(bucket=str(root / "async"), fsync=args.fsync)
+
+    async def upload_all() -> None:
+        await asyncio.gather(
+            *(
+                async_storage.astore_stream(
+                    sharded_path("videos", key, "media.bin"),
+                    areceived(key, block, args.chunks, args.latency),
+                    "application/octet-stream",
+                )
+                for key in keys
+            )
+        )
+
+    start = time.perf_counter()
+    asyncio.run(upload_all())
+    report(
+        f"async, {LocalStorage.IO_WORKERS} I/O threads",
+        args.uploads,
+        size,
+        time.perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    main()
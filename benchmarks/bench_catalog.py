@@ -0,0 +1,321 @@
+"""
+Use case, repository and endpoint benchmarks over a synthetic catalog.
+
+Seeds a catalog of videos (with categories, genres and cast members) through
+the repositories, then times the main use cases, the read use cases over the
+in-memory repositories warmed from the database, and the DRF endpoints, the
+latter through APIClient with a pre-generated JwtTokenGenerator token. Every
+scenario records its median/p95 time, query count and peak traced memory.
+
+Usage:
+    python -m benchmarks.bench_catalog run [--size 1k|100k|1m] [--repeat 20]
+        [--database catalog.sqlite3] [--output results.json]
+    python -m benchmarks.bench_catalog compare baseline.json results.json
+        [--threshold 0.1]
+
+`compare` exits with status 1 when a scenario's median slows down by more
+than the threshold, or when it issues more queries than in the baseline.
+Seeding 1m videos takes a long while; pass --database to keep the seeded
+file and reuse it on the next runs.
+"""
+
+import argparse
+import json
+import os
+import sys
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+from benchmarks.harness import (
+    Measurement,
+    compare_results,
+    measure,
+    setup_django,
+    write_results,
+)
+from benchmarks.seed import Catalog, parse_size, seed_catalog
+
+
+def use_case_scenarios(catalog: Catalog) -> Dict[str, Callable[[], object]]:
+    """
+    Build the use case scenarios, wired to the Django ORM repositories.
+
+    Args:
+        catalog (Catalog): The seeded catalog.
+
+    Returns:
+        Dict[str, Callable[[], object]]: The scenarios by name.
+    """
+
+    from src.core._shared.application.use_cases.list import ListRequest
+    from src.core.category.application.use_cases.list_category import ListCategory
+    from src.core.genre.application.use_cases.update_genre import UpdateGenre
+    from src.core.video.application.use_cases.create_video_without_media import (
+        CreateVideoWithoutMedia,
+    )
+    from src.core.video.application.use_cases.get_video import GetVideo
+    from src.core.video.application.use_cases.list_video_without_media import (
+        ListVideoWithoutMedia,
+    )
+    from src.core.video.domain.value_objects import Rating
+    from src.django_project.cast_member_app.repository import (
+        DjangoORMCastMemberRepository,
+    )
+    from src.django_project.category_app.repository import (
+        DjangoORMCategoryRepository,
+    )
+    from src.django_project.genre_app.repository import DjangoORMGenreRepository
+    from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+    video_repository = DjangoORMVideoRepository()
+    category_repository = DjangoORMCategoryRepository()
+    genre_repository = DjangoORMGenreRepository()
+    cast_member_repository = DjangoORMCastMemberRepository()
+
+    list_categories = ListCategory(repository=category_repository)
+    list_videos = ListVideoWithoutMedia(repository=video_repository)
+    get_video = GetVideo(repository=video_repository)
+    create_video = CreateVideoWithoutMedia(
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+    )
+    update_genre = UpdateGenre(genre_repository, category_repository)
+
+    return {
+        "use_case.list_categories": lambda: list_categories.execute(
+            ListRequest(order_by="name", current_page=2)
+        ),
+        "use_case.list_videos": lambda: list_videos.execute(
+            ListRequest(order_by="title", current_page=2)
+        ),
+        "use_case.get_video": lambda: get_video.execute(
+            GetVideo.Input(id=catalog.videos[0])
+        ),
+        "use_case.create_video_without_media": lambda: create_video.execute(
+            CreateVideoWithoutMedia.Input(
+                title="Benchmark video",
+                description="Created by the benchmark",
+                launch_year=2024,
+                duration=Decimal("120.00"),
+                rating=Rating.AGE_12,
+                categories={catalog.categories[0]},
+                genres={catalog.genres[0]},
+                cast_members={catalog.cast_members[0]},
+            )
+        ),
+        "use_case.update_genre": lambda: update_genre.execute(
+            UpdateGenre.Input(
+                id=catalog.genres[0],
+                name="Updated genre",
+                is_active=True,
+                categories=set(catalog.categories[:2]),
+            )
+        ),
+    }
+
+
+def cache_scenarios(catalog: Catalog) -> Dict[str, Callable[[], object]]:
+    """
+    Build the read use case scenarios over the indexed in-memory repositories,
+    warmed from the Django ORM repositories, for comparison with the
+    `use_case.*` scenarios.
+
+    Args:
+        catalog (Catalog): The seeded catalog.
+
+    Returns:
+        Dict[str, Callable[[], object]]: The scenarios by name.
+    """
+
+    from src.core._shared.application.use_cases.list import ListRequest
+    from src.core.category.application.use_cases.list_category import ListCategory
+    from src.core.category.infra.in_memory_category_repository import (
+        InMemoryCategoryRepository,
+    )
+    from src.core.video.application.use_cases.get_video import GetVideo
+    from src.core.video.application.use_cases.list_video_without_media import (
+        ListVideoWithoutMedia,
+    )
+    from src.core.video.infra.in_memory_video_repository import (
+        InMemoryVideoRepository,
+    )
+    from src.django_project.category_app.repository import (
+        DjangoORMCategoryRepository,
+    )
+    from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+    video_repository = InMemoryVideoRepository(DjangoORMVideoRepository().list())
+    category_repository = InMemoryCategoryRepository(
+        DjangoORMCategoryRepository().list()
+    )
+
+    list_categories = ListCategory(repository=category_repository)
+    list_videos = ListVideoWithoutMedia(repository=video_repository)
+    get_video = GetVideo(repository=video_repository)
+
+    return {
+        "cache.list_categories": lambda: list_categories.execute(
+            ListRequest(order_by="name", current_page=2)
+        ),
+        "cache.list_videos": lambda: list_videos.execute(
+            ListRequest(order_by="title", current_page=2)
+        ),
+        "cache.get_video": lambda: get_video.execute(
+            GetVideo.Input(id=catalog.videos[0])
+        ),
+    }
+
+
+def endpoint_scenarios(catalog: Catalog) -> Dict[str, Callable[[], object]]:
+    """
+    Build the DRF endpoint scenarios, authenticated with a JWT token.
+
+    Args:
+        catalog (Catalog): The seeded catalog.
+
+    Returns:
+        Dict[str, Callable[[], object]]: The scenarios by name.
+    """
+
+    from rest_framework.test import APIClient
+
+    from src.core._shared.infrastructure.auth.jwt_token_generator import (
+        JwtTokenGenerator,
+    )
+
+    generator = JwtTokenGenerator()
+    os.environ["AUTH_PUBLIC_KEY"] = (
+        generator.public_key_pem.decode()
+        .replace("-----BEGIN PUBLIC KEY-----\n", "")
+        .replace("\n-----END PUBLIC KEY-----\n", "")
+    )
+    token = generator.generate_token(
+        user_info={
+            "username": "admin",
+            "email": "admin@example.com",
+            "first_name": "Admin",
+            "last_name": "User",
+            "realm_roles": ["admin"],
+            "resource_roles": [],
+        }
+    )
+    client = APIClient(headers={"Authorization": f"Bearer {token}"})
+
+    def request(method: str, path: str, data: Dict | None = None, status=200):
+        def call():
+            response = getattr(client, method)(path, data, format="json")
+            if response.status_code != status:
+                raise RuntimeError(
+                    f"{method.upper()} {path} returned {response.status_code}"
+                )
+            return response
+
+        return call
+
+    video_id = catalog.videos[0]
+    genre_id = catalog.genres[0]
+
+    return {
+        "api.list_categories": request("get", "/api/categories/?current_page=2"),
+        "api.list_videos": request("get", "/api/videos/?current_page=2"),
+        "api.retrieve_video": request("get", f"/api/videos/{video_id}/"),
+        "api.create_video": request(
+            "post",
+            "/api/videos/",
+            {
+                "title": "Benchmark video",
+                "description": "Created by the benchmark",
+                "launch_year": 2024,
+                "duration": "120.00",
+                "rating": "AGE_12",
+                "categories": [str(catalog.categories[0])],
+                "genres": [str(catalog.genres[0])],
+                "cast_members": [str(catalog.cast_members[0])],
+            },
+            status=201,
+        ),
+        "api.update_genre": request(
+            "put",
+            f"/api/genres/{genre_id}/",
+            {
+                "id": str(genre_id),
+                "name": "Updated genre",
+                "is_active": True,
+                "categories": [str(category) for category in catalog.categories[:2]],
+            },
+            status=204,
+        ),
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    size = parse_size(args.size)
+    setup_django(args.database)
+
+    from django.db import connection
+
+    catalog = seed_catalog(size)
+    scenarios = {
+        **use_case_scenarios(catalog),
+        **cache_scenarios(catalog),
+        **endpoint_scenarios(catalog),
+    }
+    selected = [name for name in scenarios if not args.only or args.only in name]
+
+    measurements: List[Measurement] = []
+    for name in selected:
+        measurement = measure(name, scenarios[name], repeat=args.repeat)
+        measurements.append(measurement)
+        print(
+            f"{name:40} median {measurement.median_ms:10.3f}ms "
+            f"p95 {measurement.p95_ms:10.3f}ms {measurement.queries:5} queries "
+            f"{measurement.peak_memory_kb:10.1f} KiB peak",
+            file=sys.stderr,
+        )
+
+    write_results(
+        args.output,
+        {"size": size, "database": connection.vendor, "repeat": args.repeat},
+        measurements,
+    )
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.baseline) as baseline, open(args.current) as current:
+        regressions = compare_results(
+            json.load(baseline), json.load(current), args.threshold
+        )
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions above {args.threshold:.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Seed a catalog and run it")
+    run_parser.add_argument("--size", default="1k")
+    run_parser.add_argument("--repeat", type=int, default=20)
+    run_parser.add_argument("--database", help="SQLite file to seed and reuse")
+    run_parser.add_argument("--only", help="Run scenarios containing this text")
+    run_parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Per-request database connection overhead.
+
+Replays the connection lifecycle Django runs around every request (the
+`request_started` / `request_finished` signals, which close connections
+older than CONN_MAX_AGE) around one small query, first without connection
+reuse and then with the configured persistent connections.
+
+Usage:
+    python -m benchmarks.bench_db_connections [--requests 2000]
+
+Without DATABASE_* environment variables a temporary SQLite file is used.
+Point DATABASE_ENGINE=postgresql (and DATABASE_POOL=1) at a server to
+measure PostgreSQL, where connection setup is far more expensive.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+
+def run_requests(total: int) -> tuple[float, int]:
+    """
+    Run `total` simulated requests issuing one query each.
+
+    Args:
+        total (int): The number of requests.
+
+    Returns:
+        tuple[float, int]: The mean time per request in microseconds and the
+            number of database connections opened.
+    """
+
+    from django.core.signals import request_finished, request_started
+    from django.db.backends.signals import connection_created
+
+    from src.django_project.category_app.models import Category
+
+    opened = 0
+
+    def count_connection(**kwargs) -> None:
+        nonlocal opened
+        opened += 1
+
+    connection_created.connect(count_connection)
+    try:
+        start = time.perf_counter()
+        for _ in range(total):
+            request_started.send(sender=None)
+            list(Category.objects.values_list("id", flat=True)[:10])
+            request_finished.send(sender=None)
+        elapsed = time.perf_counter() - start
+    finally:
+        connection_created.disconnect(count_connection)
+
+    return elapsed / total * 1_000_000, opened
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.django_project.settings")
+    if "DATABASE_ENGINE" not in os.environ and "DATABASE_NAME" not in os.environ:
+        os.environ["DATABASE_NAME"] = os.path.join(
+            tempfile.mkdtemp(prefix="codeflix-bench-"), "db.sqlite3"
+        )
+
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connection
+
+    from src.django_project.category_app.models import Category
+
+    call_command("migrate", verbosity=0)
+    Category.objects.bulk_create(
+        Category(name=f"Category {i}", description="") for i in range(10)
+    )
+
+    configured = connection.settings_dict["CONN_MAX_AGE"]
+    pooled = "pool" in connection.settings_dict.get("OPTIONS", {})
+    scenarios = [("no reuse (CONN_MAX_AGE=0)", 0)]
+    if pooled:
+        scenarios = [("psycopg pool", 0)]
+    elif configured:
+        scenarios.append((f"persistent (CONN_MAX_AGE={configured})", configured))
+
+    print(f"{connection.vendor}, {args.requests} requests")
+    for name, conn_max_age in scenarios:
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+        run_requests(min(args.requests, 100))  # warm up
+        per_request, opened = run_requests(args.requests)
+        print(f"{name:40} {per_request:9.1f} us/request {opened:6} new connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Memory of hydrated entities.
+
+Builds `--count` categories and videos, the way the repositories hydrate
+them, and reports the traced bytes per entity of the current slotted
+entities and of the previous layout, where the base entity had no slots
+and allocated a Notification, an events list and a MessageBus for every
+entity.
+
+Usage:
+    python -m benchmarks.bench_entities [--count 1000000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, List
+
+from src.core._shared.events.message_bus import MessageBus
+from src.core.category.domain.category import Category
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+
+
+class EagerNotification:
+    """
+    The previous Notification, without slots.
+    """
+
+    def __init__(self) -> None:
+        self._errors: List[str] = []
+
+
+@dataclass(kw_only=True)
+class EagerEntity:
+    """
+    The previous AbstractEntity layout.
+    """
+
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    notification: EagerNotification = field(
+        default_factory=EagerNotification, init=False
+    )
+    events: List = field(default_factory=list, init=False)
+    message_bus: MessageBus = field(default_factory=MessageBus)
+
+
+@dataclass(eq=False)
+class EagerCategory(EagerEntity):
+    name: str
+    description: str = ""
+    is_active: bool = True
+
+
+@dataclass(kw_only=True, slots=True)
+class EagerVideo(EagerEntity):
+    title: str
+    description: str
+    launch_year: int
+    duration: Decimal
+    rating: Rating
+    published: bool = False
+    categories: set
+    genres: set
+    cast_members: set
+    banner: object = None
+    thumbnail: object = None
+    thumbnail_half: object = None
+    trailer: object = None
+    video: object = None
+
+
+def category(cls) -> Callable[[int], object]:
+    return lambda index: cls(
+        id=uuid.uuid4(), name=f"Category {index}", description="", is_active=True
+    )
+
+
+def video(cls) -> Callable[[int], object]:
+    return lambda index: cls(
+        id=uuid.uuid4(),
+        title=f"Video {index}",
+        description="",
+        launch_year=2024,
+        duration=Decimal("120.00"),
+        rating=Rating.AGE_12,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+
+
+def measure(name: str, build: Callable[[int], object], count: int) -> None:
+    """
+    Build `count` entities and print the traced bytes and time per entity.
+
+    Args:
+        name (str): The scenario name.
+        build (Callable[[int], object]): Builds the entity of an index.
+        count (int): The number of entities.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities = [build(index) for index in range(count)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:28} {current / count:10.1f} bytes/entity "
+        f"{current / 1e6:10.1f} MB {elapsed / count * 1e6:8.2f} us/entity"
+    )
+    del entities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.count} entities of each kind")
+    measure("category, eager (before)", category(EagerCategory), args.count)
+    measure("category, slotted lazy", category(Category), args.count)
+    measure("video, eager (before)", video(EagerVideo), args.count)
+    measure("video, slotted lazy", video(Video), args.count)
+
+
+if __name__ == "__main__":
+    main()
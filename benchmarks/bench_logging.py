@@ -0,0 +1,102 @@
+"""
+Per-message logging overhead of the event and consumer hot paths.
+
+Compares what the consumer paid per message before (a `print` of the raw
+payload, written synchronously) with the structured logging it uses now: the
+payload logged at DEBUG, which costs a level check when the level is INFO,
+and an INFO record handed to the background thread of the AsyncQueueHandler.
+
+Usage:
+    python -m benchmarks.bench_logging [--messages 20000]
+
+Output is written to os.devnull, so the numbers show the cost paid by the
+calling thread, not the terminal.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from src.core._shared.infrastructure.structured_logging import (
+    AsyncQueueHandler,
+    correlation,
+)
+
+PAYLOAD = json.dumps(
+    {
+        "error": "",
+        "video": {
+            "resource_id": "3fa85f64-5717-4562-b3fc-2c963f66afa6.VIDEO",
+            "encoded_video_folder": "/path/to/encoded/video",
+        },
+        "status": "COMPLETED",
+    }
+).encode()
+
+
+def per_message(func, total: int) -> float:
+    """
+    Run `func` `total` times.
+
+    Args:
+        func: The logging call to measure.
+        total (int): The number of messages.
+
+    Returns:
+        float: The mean time per message in microseconds.
+    """
+
+    for _ in range(min(total, 1000)):  # warm up
+        func()
+    start = time.perf_counter()
+    for _ in range(total):
+        func()
+
+    return (time.perf_counter() - start) / total * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    handler = AsyncQueueHandler(stream=devnull)
+    logger = logging.getLogger("benchmarks.logging")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    def print_payload() -> None:
+        print(f"Received message: {PAYLOAD}", file=devnull)
+
+    def debug_payload() -> None:
+        logger.debug("Received message: %s", PAYLOAD)
+
+    def bind_resource_id() -> None:
+        with correlation(resource="3fa85f64-5717-4562-b3fc-2c963f66afa6.VIDEO"):
+            pass
+
+    def info_record() -> None:
+        logger.info("Processed message from queue %s", "videos.converted")
+
+    scenarios = [
+        ("print payload (before)", print_payload),
+        ("debug payload at INFO level", debug_payload),
+        ("bind resource id", bind_resource_id),
+        ("info record, async JSON handler", info_record),
+    ]
+
+    print(f"{args.messages} messages")
+    for name, func in scenarios:
+        print(f"{name:40} {per_message(func, args.messages):8.2f} us/message")
+
+    handler.close()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Publication latency of the message bus with a slow handler.
+
+Publishes `--events` events, one `handle` call each as UploadVideo does,
+to a handler sleeping `--latency` seconds, like a broker round trip, and
+reports the time the caller spends in `handle` with the synchronous bus
+and with the background bus, plus the time the background workers take
+to drain the queue.
+
+Usage:
+    python -m benchmarks.bench_message_bus [--events 200] [--latency 0.005]
+        [--workers 4]
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+
+from src.core._shared.application.handler import AbstractHandler
+from src.core._shared.events.background_message_bus import BackgroundMessageBus
+from src.core._shared.events.event import Event
+from src.core._shared.events.message_bus import MessageBus
+
+
+@dataclass(frozen=True)
+class Published(Event):
+    """
+    The published event.
+    """
+
+    number: int
+
+
+class SlowHandler(AbstractHandler):
+    """
+    Handler waiting as long as a broker round trip.
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def handle(self, event: Event) -> None:
+        time.sleep(self.latency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    def build() -> MessageBus:
+        bus = MessageBus()
+        bus.handlers = {Published: [SlowHandler(args.latency)]}
+        return bus
+
+    buses = {
+        "sync": build(),
+        "background": BackgroundMessageBus(workers=args.workers, bus_factory=build),
+    }
+
+    for name, bus in buses.items():
+        start = time.perf_counter()
+        for number in range(args.events):
+            bus.handle([Published(number)])
+        caller = time.perf_counter() - start
+        if isinstance(bus, BackgroundMessageBus):
+            bus.drain()
+        total = time.perf_counter() - start
+        print(
+            f"{name:10} {caller / args.events * 1e3:8.3f}ms per handle "
+            f"{total:8.3f}s until handled"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Mapping cost of the list endpoints: entities vs read-only projections.
+
+Seeds a catalog of `--size` videos and lists them as the list endpoints
+did before, hydrating and validating Video entities from prefetched
+models, and as they do now, building VideoWithoutMediaOutput tuples from
+`values_list` rows. Each path is timed end to end and mapping only, the
+latter over rows or models already fetched.
+
+Usage:
+    python -m benchmarks.bench_projections [--size 10k] [--repeat 10]
+        [--database catalog.sqlite3]
+"""
+
+import argparse
+import sys
+
+from benchmarks.harness import measure, setup_django
+from benchmarks.seed import parse_size, seed_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--size", default="10k")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database", default=None)
+    args = parser.parse_args()
+
+    setup_django(args.database)
+    seed_catalog(parse_size(args.size))
+
+    from src.core.video.application.use_cases.list_video_without_media import (
+        VideoWithoutMediaOutput,
+    )
+    from src.django_project.projections import related_ids
+    from src.django_project.video_app.models import Video as VideoModel
+    from src.django_project.video_app.repository import (
+        DjangoORMVideoRepository,
+        VideoModelMapper,
+    )
+
+    repository = DjangoORMVideoRepository()
+    models = list(repository._with_relations())
+    rows = list(VideoModel.objects.values_list(*repository._PROJECTION_COLUMNS))
+    relations = [
+        related_ids(VideoModel, field)
+        for field in ("categories", "genres", "cast_members")
+    ]
+
+    def map_rows():
+        categories, genres, cast_members = relations
+        return [
+            VideoWithoutMediaOutput(
+                *row,
+                categories.get(row[0], set()),
+                genres.get(row[0], set()),
+                cast_members.get(row[0], set()),
+            )
+            for row in rows
+        ]
+
+    scenarios = {
+        "entities, end to end (before)": lambda: [
+            VideoModelMapper.to_entity(model) for model in repository._with_relations()
+        ],
+        "projections, end to end": repository.list_projections,
+        "entities, mapping only (before)": lambda: [
+            VideoModelMapper.to_entity(model) for model in models
+        ],
+        "projections, mapping only": map_rows,
+    }
+
+    print(f"{len(rows)} videos", file=sys.stderr)
+    for name, scenario in scenarios.items():
+        measurement = measure(name, scenario, repeat=args.repeat)
+        print(
+            f"{name:34} median {measurement.median_ms:10.3f}ms "
+            f"{measurement.queries:5} queries "
+            f"{measurement.peak_memory_kb:10.1f} KiB peak",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
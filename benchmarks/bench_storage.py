@@ -0,0 +1,114 @@
+"""
+Write throughput of the media storage.
+
+Stores small files (thumbnails, banners) and large files (video masters)
+with distinct content, so nothing is deduplicated, through the previous
+direct write (exists + mkdir + open per call), and through LocalStorage
+with and without fsync. LocalStorage also hashes the content (SHA-256) for
+the deduplication, which dominates the large writes on fast disks.
+
+Usage:
+    python -m benchmarks.bench_storage [--small 2000] [--small-size 16384]
+        [--large 4] [--large-size 67108864] [--directory /path/on/target/disk]
+
+Run it on the disk the storage uses: a tmpfs /tmp makes fsync free.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from src.core._shared.infrastructure.storage.abstract_storage_service import (
+    sharded_path,
+)
+from src.core._shared.infrastructure.storage.local_storage import LocalStorage
+
+
+def direct_write(bucket: Path, file_path: str, content: bytes) -> None:
+    """
+    Write a file the way LocalStorage did before: in place, checking the
+    directory on every call.
+
+    Args:
+        bucket (Path): The root directory.
+        file_path (str): The path of the file.
+        content (bytes): The content.
+    """
+
+    full_path = bucket / file_path
+    if not full_path.parent.exists():
+        full_path.parent.mkdir(parents=True)
+
+    with open(full_path, "wb") as file:
+        file.write(content)
+
+
+def run(name: str, write, count: int, size: int) -> None:
+    """
+    Write `count` files of `size` bytes and print the throughput.
+
+    Args:
+        name (str): The scenario name.
+        write: Callable storing a file given its path and content.
+        count (int): The number of files.
+        size (int): The size of each file, in bytes.
+    """
+
+    block = os.urandom(size)
+    files = []
+    for index in range(count):
+        # A distinct prefix per file defeats the deduplication
+        key = str(uuid.uuid4())
+        files.append((sharded_path("videos", key, "media.bin"), key.encode() + block))
+
+    start = time.perf_counter()
+    for file_path, content in files:
+        write(file_path, content)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{name:34} {count / elapsed:10.1f} files/s "
+        f"{count * size / elapsed / 1e6:10.1f} MB/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--small", type=int, default=2000)
+    parser.add_argument("--small-size", type=int, default=16 * 1024)
+    parser.add_argument("--large", type=int, default=4)
+    parser.add_argument("--large-size", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--directory", default=None)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="codeflix-storage-", dir=args.directory))
+    scenarios = [
+        ("direct write (before)", None),
+        ("LocalStorage, fsync off", False),
+        ("LocalStorage, fsync on", True),
+    ]
+
+    for label, count, size in (
+        ("small", args.small, args.small_size),
+        ("large", args.large, args.large_size),
+    ):
+        print(f"{label}: {count} files of {size} bytes")
+        for index, (name, fsync) in enumerate(scenarios):
+            bucket = root / f"{label}-{index}"
+            if fsync is None:
+                write = lambda path, content, bucket=bucket: direct_write(
+                    bucket, path, content
+                )
+            else:
+                storage = LocalStorage(bucket=str(bucket), fsync=fsync)
+                write = lambda path, content, storage=storage: storage.store(
+                    path, content, "application/octet-stream"
+                )
+            run(name, write, count, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Insert throughput and index size of random (v4) and time-ordered (v7) keys.
+
+Inserts `--rows` rows into a SQLite table laid out like the catalog
+tables, a 32-character hex UUID primary key as Django stores it on
+SQLite, in transactions of `--batch` rows, with a page cache of
+`--cache-mb`, smaller than the index so that locality matters. Reports
+the overall and last-batch insert rates, and the pages and bytes of the
+primary key index, for keys generated by uuid.uuid4 and by uuid7.
+
+Usage:
+    python -m benchmarks.bench_uuid_keys [--rows 2000000] [--batch 10000]
+        [--cache-mb 8] [--directory /tmp]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from typing import Callable
+
+from src.core._shared.domain.uuid7 import uuid7
+
+
+def run(
+    name: str,
+    generate: Callable[[], uuid.UUID],
+    rows: int,
+    batch: int,
+    cache_mb: int,
+    directory: str,
+) -> None:
+    """
+    Fill a table with the keys of a generator and print its figures.
+
+    Args:
+        name (str): The scenario name.
+        generate (Callable[[], uuid.UUID]): The key generator.
+        rows (int): The number of rows.
+        batch (int): The rows per transaction.
+        cache_mb (int): The SQLite page cache size, in MiB.
+        directory (str): Where the database file is created.
+    """
+
+    path = os.path.join(tempfile.mkdtemp(dir=directory), "keys.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA cache_size = -{cache_mb * 1024}")
+    connection.execute(
+        "CREATE TABLE video (id char(32) NOT NULL PRIMARY KEY, title varchar(255))"
+    )
+
+    start = last = time.perf_counter()
+    for offset in range(0, rows, batch):
+        last = time.perf_counter()
+        with connection:
+            connection.executemany(
+                "INSERT INTO video VALUES (?, ?)",
+                ((generate().hex, f"Video {offset + index}") for index in range(batch)),
+            )
+    end = time.perf_counter()
+
+    pages, size = connection.execute(
+        "SELECT COUNT(*), SUM(pgsize) FROM dbstat "
+        "WHERE name = 'sqlite_autoindex_video_1'"
+    ).fetchone()
+    connection.close()
+
+    print(
+        f"{name:5} {rows / (end - start):12,.0f} rows/s overall "
+        f"{batch / (end - last):12,.0f} rows/s last batch "
+        f"{pages:9,} index pages {size / 2**20:9.1f} MiB index "
+        f"{os.path.getsize(path) / 2**20:9.1f} MiB file"
+    )
+    os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--cache-mb", type=int, default=8)
+    parser.add_argument("--directory", default=None)
+    args = parser.parse_args()
+
+    for name, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        run(name, generate, args.rows, args.batch, args.cache_mb, args.directory)
+
+
+if __name__ == "__main__":
+    main()
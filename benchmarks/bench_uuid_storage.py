@@ -0,0 +1,160 @@
+"""
+Database size and join speed of text and binary UUID keys on SQLite.
+
+Builds the catalog tables twice, as Django lays them out on SQLite, once
+with the 32-character hex keys of the stock UUIDField and once with the
+16-byte BLOB keys of CompactUUIDField: `--videos` videos, each linked to
+`--links` categories, genres and cast members. Reports the file size, the
+size of the through tables with their indexes, and the time of a join of
+every video with its categories and of `--lookups` single-video joins.
+
+Usage:
+    python -m benchmarks.bench_uuid_storage [--videos 100000] [--links 3]
+        [--lookups 10000] [--directory /tmp]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from typing import Callable
+
+from src.core._shared.domain.uuid7 import uuid7
+
+THROUGH_TABLES = {
+    "video_categories": ("category_id", "category"),
+    "video_genres": ("genre_id", "genre"),
+    "video_cast_members": ("castmember_id", "cast_member"),
+}
+
+
+def build(path: str, key_type: str, encode: Callable, args) -> list:
+    """
+    Create and fill the catalog tables.
+
+    Args:
+        path (str): The database file.
+        key_type (str): The column type of the keys, "char(32)" or "blob".
+        encode (Callable): Converts a UUID to its stored value.
+        args: The command line arguments.
+
+    Returns:
+        list: The stored keys of the videos.
+    """
+
+    connection = sqlite3.connect(path)
+    related = {}
+    with connection:
+        for table in ("category", "genre", "cast_member"):
+            connection.execute(
+                f"CREATE TABLE {table} (id {key_type} NOT NULL PRIMARY KEY, "
+                "name varchar(255) NOT NULL)"
+            )
+            related[table] = [encode(uuid7()) for _ in range(1000)]
+            connection.executemany(
+                f"INSERT INTO {table} VALUES (?, ?)",
+                ((key, f"{table} {index}") for index, key in enumerate(related[table])),
+            )
+
+        connection.execute(
+            f"CREATE TABLE video (id {key_type} NOT NULL PRIMARY KEY, "
+            "title varchar(255) NOT NULL)"
+        )
+        videos = [encode(uuid7()) for _ in range(args.videos)]
+        connection.executemany(
+            "INSERT INTO video VALUES (?, ?)",
+            ((key, f"Video {index}") for index, key in enumerate(videos)),
+        )
+
+        for through, (column, table) in THROUGH_TABLES.items():
+            connection.execute(
+                f"CREATE TABLE {through} (id integer NOT NULL PRIMARY KEY "
+                f"AUTOINCREMENT, video_id {key_type} NOT NULL REFERENCES video (id), "
+                f"{column} {key_type} NOT NULL REFERENCES {table} (id))"
+            )
+            connection.execute(
+                f"CREATE UNIQUE INDEX {through}_uniq ON {through} (video_id, {column})"
+            )
+            connection.execute(
+                f"CREATE INDEX {through}_{column} ON {through} ({column})"
+            )
+            connection.executemany(
+                f"INSERT INTO {through} (video_id, {column}) VALUES (?, ?)",
+                (
+                    (video, key)
+                    for video in videos
+                    for key in random.sample(related[table], args.links)
+                ),
+            )
+    connection.execute("VACUUM")
+    connection.close()
+
+    return videos
+
+
+def report(name: str, path: str, videos: list, lookups: int) -> None:
+    """
+    Print the sizes and join times of a database.
+
+    Args:
+        name (str): The scenario name.
+        path (str): The database file.
+        videos (list): The stored keys of the videos.
+        lookups (int): The number of single-video joins.
+    """
+
+    connection = sqlite3.connect(path)
+    (through_bytes,) = connection.execute(
+        "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE 'video\\_%' ESCAPE '\\' "
+        "OR name LIKE 'sqlite_autoindex_video\\_%' ESCAPE '\\'"
+    ).fetchone()
+
+    start = time.perf_counter()
+    connection.execute(
+        "SELECT v.id, c.name FROM video v "
+        "JOIN video_categories vc ON vc.video_id = v.id "
+        "JOIN category c ON c.id = vc.category_id"
+    ).fetchall()
+    full_join = time.perf_counter() - start
+
+    sample = random.sample(videos, min(lookups, len(videos)))
+    start = time.perf_counter()
+    for video in sample:
+        connection.execute(
+            "SELECT c.name FROM video_categories vc "
+            "JOIN category c ON c.id = vc.category_id WHERE vc.video_id = ?",
+            (video,),
+        ).fetchall()
+    lookup = (time.perf_counter() - start) / len(sample)
+    connection.close()
+
+    print(
+        f"{name:6} {os.path.getsize(path) / 2**20:8.1f} MiB file "
+        f"{through_bytes / 2**20:8.1f} MiB through tables "
+        f"{full_join * 1e3:9.1f}ms full join {lookup * 1e6:8.1f}us per lookup"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--videos", type=int, default=100_000)
+    parser.add_argument("--links", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--directory", default=None)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(dir=args.directory)
+    for name, key_type, encode in (
+        ("text", "char(32)", lambda key: key.hex),
+        ("binary", "blob", lambda key: key.bytes),
+    ):
+        path = os.path.join(directory, f"{name}.sqlite3")
+        videos = build(path, key_type, encode, args)
+        report(name, path, videos, args.lookups)
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Shared helpers for the benchmark suite: Django setup, measurement and the
+JSON result format.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+
+@dataclass
+class Measurement:
+    """
+    Timing, query and memory figures of one benchmark scenario.
+    """
+
+    name: str
+    repeat: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    queries: int
+    peak_memory_kb: float
+
+
+def setup_django(database_name: str | None = None) -> None:
+    """
+    Configure Django for a benchmark run and create the database schema.
+
+    Without DATABASE_* environment variables, a SQLite file is used: the
+    given one, or a new temporary file.
+
+    Args:
+        database_name (str | None): The SQLite file to use. Defaults to None.
+    """
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.django_project.settings")
+    if database_name:
+        os.environ["DATABASE_NAME"] = database_name
+    elif "DATABASE_ENGINE" not in os.environ and "DATABASE_NAME" not in os.environ:
+        os.environ["DATABASE_NAME"] = os.path.join(
+            tempfile.mkdtemp(prefix="codeflix-bench-"), "db.sqlite3"
+        )
+
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+
+    # Allows the "testserver" host used by APIClient, and keeps DEBUG off so
+    # connection.queries doesn't grow during the run.
+    setup_test_environment(debug=False)
+    call_command("migrate", verbosity=0)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    repeat: int,
+    warmup: int = 2,
+) -> Measurement:
+    """
+    Measure a scenario: wall time over `repeat` calls, then the queries and
+    the peak traced memory of one more call each.
+
+    Args:
+        name (str): The name of the scenario.
+        func (Callable[[], object]): The scenario, called without arguments.
+        repeat (int): The number of timed calls.
+        warmup (int): The number of untimed calls made first. Defaults to 2.
+
+    Returns:
+        Measurement: The figures of the scenario.
+    """
+
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+
+    for _ in range(warmup):
+        func()
+
+    durations: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    # Requests reset the query log when they start, so it must begin empty
+    # for the captured slice to cover the whole call.
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    query_count = len(queries)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    durations.sort()
+    return Measurement(
+        name=name,
+        repeat=repeat,
+        mean_ms=round(statistics.fmean(durations), 4),
+        median_ms=round(statistics.median(durations), 4),
+        p95_ms=round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 4),
+        min_ms=round(durations[0], 4),
+        queries=query_count,
+        peak_memory_kb=round(peak / 1024, 1),
+    )
+
+
+def git_revision() -> str | None:
+    """
+    Get the commit the benchmarks run against.
+
+    Returns:
+        str | None: The abbreviated commit hash, or None outside a git checkout.
+    """
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str, meta: Dict, measurements: List[Measurement]) -> None:
+    """
+    Write the measurements of a run as JSON.
+
+    Args:
+        path (str): The output file, or "-" for stdout.
+        meta (Dict): The run metadata (catalog size, database vendor...).
+        measurements (List[Measurement]): The measurements of the run.
+    """
+
+    document = {
+        "meta": {
+            **meta,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": {
+            measurement.name: asdict(measurement) for measurement in measurements
+        },
+    }
+    content = json.dumps(document, indent=2)
+
+    if path == "-":
+        print(content)
+        return
+
+    with open(path, "w") as output:
+        output.write(content + "\n")
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """
+    Compare two result documents written by write_results.
+
+    A scenario regresses when its median time grows by more than `threshold`
+    (a fraction, 0.1 meaning 10%) or when it issues more queries.
+
+    Args:
+        baseline (Dict): The results of the reference run.
+        current (Dict): The results of the run being checked.
+        threshold (float): The tolerated relative slowdown of the median.
+
+    Returns:
+        List[str]: A description of every regression found.
+    """
+
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+
+        change = result["median_ms"] / reference["median_ms"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: median {reference['median_ms']:.3f}ms -> "
+                f"{result['median_ms']:.3f}ms (+{change:.0%})"
+            )
+        if result["queries"] > reference["queries"]:
+            regressions.append(
+                f"{name}: queries {reference['queries']} -> {result['queries']}"
+            )
+
+    return regressions
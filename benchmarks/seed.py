@@ -0,0 +1,161 @@
+"""
+Synthetic catalogs seeded through the Django ORM repositories.
+"""
+
+import sys
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import List
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+@dataclass
+class Catalog:
+    """
+    Ids of the seeded entities used by the scenarios.
+    """
+
+    categories: List
+    genres: List
+    cast_members: List
+    videos: List
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a catalog size such as "1k", "100k", "1m" or "2500".
+
+    Args:
+        value (str): The size to be parsed.
+
+    Returns:
+        int: The number of videos of the catalog.
+
+    Raises:
+        ValueError: If the size isn't a known name or a positive integer.
+    """
+
+    size = SIZES.get(value.lower())
+    if size is None:
+        size = int(value)
+    if size <= 0:
+        raise ValueError(f"Invalid catalog size: {value}")
+
+    return size
+
+
+def seed_catalog(size: int, batch: int = 1000) -> Catalog:
+    """
+    Seed a catalog of `size` videos, with one category, genre and cast member
+    for every 100 videos (at least 10 of each).
+
+    Every entity goes through its repository `save`, as the application does,
+    committing one transaction per `batch` videos. A database that already
+    holds a catalog of the same size is reused as is (the videos created by
+    the scenarios don't count).
+
+    Args:
+        size (int): The number of videos.
+        batch (int): The number of videos per transaction. Defaults to 1000.
+
+    Returns:
+        Catalog: The ids of the seeded entities.
+
+    Raises:
+        ValueError: If the database already holds a catalog of another size.
+    """
+
+    from django.db import transaction
+
+    from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+    from src.core.category.domain.category import Category
+    from src.core.genre.domain.genre import Genre
+    from src.core.video.domain.value_objects import Rating
+    from src.core.video.domain.video import Video
+    from src.django_project.cast_member_app.models import (
+        CastMember as CastMemberModel,
+    )
+    from src.django_project.cast_member_app.repository import (
+        DjangoORMCastMemberRepository,
+    )
+    from src.django_project.category_app.models import Category as CategoryModel
+    from src.django_project.category_app.repository import (
+        DjangoORMCategoryRepository,
+    )
+    from src.django_project.genre_app.models import Genre as GenreModel
+    from src.django_project.genre_app.repository import DjangoORMGenreRepository
+    from src.django_project.video_app.models import Video as VideoModel
+    from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+    seeded = VideoModel.objects.filter(title__startswith="Video ")
+    if seeded.count() == size:
+        return Catalog(
+            categories=list(CategoryModel.objects.values_list("id", flat=True)),
+            genres=list(GenreModel.objects.values_list("id", flat=True)),
+            cast_members=list(CastMemberModel.objects.values_list("id", flat=True)),
+            videos=list(seeded.values_list("id", flat=True)[:100]),
+        )
+    if VideoModel.objects.exists():
+        raise ValueError("The database already holds a catalog of another size")
+
+    related = max(10, size // 100)
+    category_repository = DjangoORMCategoryRepository()
+    genre_repository = DjangoORMGenreRepository()
+    cast_member_repository = DjangoORMCastMemberRepository()
+    video_repository = DjangoORMVideoRepository()
+    ratings = list(Rating)
+
+    with transaction.atomic():
+        categories = [
+            Category(name=f"Category {i}", description=f"Category {i}")
+            for i in range(related)
+        ]
+        for category in categories:
+            category_repository.save(category)
+
+        genres = [
+            Genre(name=f"Genre {i}", categories={categories[i].id})
+            for i in range(related)
+        ]
+        for genre in genres:
+            genre_repository.save(genre)
+
+        cast_members = [
+            CastMember(
+                name=f"Cast Member {i}",
+                type=CastMemberType.ACTOR if i % 2 else CastMemberType.DIRECTOR,
+            )
+            for i in range(related)
+        ]
+        for cast_member in cast_members:
+            cast_member_repository.save(cast_member)
+
+    videos = []
+    for start in range(0, size, batch):
+        with transaction.atomic():
+            for i in range(start, min(start + batch, size)):
+                video = Video(
+                    title=f"Video {i:07d}",
+                    description=f"Description of video {i}",
+                    launch_year=1950 + i % 75,
+                    duration=Decimal("90.00") + i % 60,
+                    rating=ratings[i % len(ratings)],
+                    published=False,
+                    categories={categories[i % related].id},
+                    genres={genres[i % related].id},
+                    cast_members={cast_members[i % related].id},
+                )
+                video_repository.save(video)
+                if len(videos) < 100:
+                    videos.append(video.id)
+
+        if size >= 100 * batch:
+            print(f"seeded {start + batch}/{size} videos", file=sys.stderr)
+
+    return Catalog(
+        categories=[category.id for category in categories],
+        genres=[genre.id for genre in genres],
+        cast_members=[cast_member.id for cast_member in cast_members],
+        videos=videos,
+    )
@@ -0,0 +1,148 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.core._shared.domain.entity import AbstractEntity
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.event import Event
+
+
+def deduplicate(events: List[Event]) -> List[Event]:
+    """
+    Drop the repeated events of a list, keeping the first of each.
+
+    Args:
+        events (List[Event]): The events, in publication order.
+
+    Returns:
+        List[Event]: The distinct events, in the same order.
+    """
+
+    distinct: List[Event] = []
+    for event in events:
+        if event not in distinct:
+            distinct.append(event)
+
+    return distinct
+
+
+class AbstractUnitOfWork(ABC):
+    """
+    Abstract base class for a unit of work.
+
+    A unit of work wraps the writes of a use case in a transaction and
+    collects the events of the aggregates it touched. The events are
+    deduplicated and handed to the message bus once, only after the
+    transaction commits, so no event is published for rolled back writes
+    and no broker I/O happens while the transaction is open.
+
+    Usage:
+        with unit_of_work as uow:
+            video.update_video(media)
+            repository.update(video)
+            uow.collect(video)
+    """
+
+    def __init__(self, message_bus: AbstractMessageBus) -> None:
+        """
+        Initialize the unit of work.
+
+        Args:
+            message_bus (AbstractMessageBus): The message bus to publish the
+                collected events to after commit.
+        """
+
+        self.message_bus = message_bus
+        self._aggregates: List[AbstractEntity] = []
+        self._events: List[Event] = []
+
+    def collect(self, *aggregates: AbstractEntity) -> None:
+        """
+        Register aggregates whose events are published after commit.
+
+        Args:
+            *aggregates (AbstractEntity): The aggregates touched by the use case.
+        """
+
+        self._aggregates.extend(aggregates)
+
+    def add_event(self, event: Event) -> None:
+        """
+        Register an event raised by the use case itself, such as an
+        integration event, to be published after commit.
+
+        Args:
+            event (Event): The event to publish.
+        """
+
+        self._events.append(event)
+
+    def pull_events(self) -> List[Event]:
+        """
+        Take the events collected so far, aggregate events first, without
+        repetitions, leaving the unit of work empty.
+
+        Returns:
+            List[Event]: The events to publish, in order.
+        """
+
+        events: List[Event] = []
+        for aggregate in self._aggregates:
+            events.extend(aggregate.pull_events())
+        events.extend(self._events)
+        self._aggregates, self._events = [], []
+
+        return deduplicate(events)
+
+    def publish(self, events: List[Event]) -> None:
+        """
+        Hand the events to the message bus, if there are any.
+
+        Args:
+            events (List[Event]): The events to publish.
+        """
+
+        if events:
+            self.message_bus.handle(events)
+
+    def __enter__(self) -> "AbstractUnitOfWork":
+        self._aggregates, self._events = [], []
+        self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self._commit()
+        else:
+            self._aggregates, self._events = [], []
+            self._rollback(exc_type, exc, tb)
+
+        return False
+
+    @abstractmethod
+    def _begin(self) -> None:
+        """
+        Open the transaction.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def _commit(self) -> None:
+        """
+        Commit the transaction and publish the collected events after it.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def _rollback(self, exc_type, exc, tb) -> None:
+        """
+        Roll the transaction back; the collected events are discarded.
+
+        Args:
+            exc_type: The type of the error raised inside the block.
+            exc: The error raised inside the block.
+            tb: The traceback of the error.
+        """
+
+        raise NotImplementedError
@@ -1,5 +1,6 @@
+import uuid
 from dataclasses import dataclass, field
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Protocol, Set, Tuple, TypeVar, runtime_checkable
 
 from src.config import DEFAULT_PAGE_SIZE
 
@@ -7,15 +8,26 @@ T = TypeVar("T")
 RequestT = TypeVar("RequestT")
 
 
+class InvalidOrderBy(Exception):
+    """
+    Exception raised when the list is sorted by a field the repository does
+    not allow sorting by
+    """
+
+
 @dataclass
 class ListRequest:
     """
     Represents the request parameters for listing entities.
+
+    With `ids`, only the entities with those ids are listed, all of them in
+    the same page, so a client holding a set of ids fetches them at once.
     """
 
     order_by: str = "id"
     sort: str = "asc"
     current_page: int = 1
+    ids: Set[uuid.UUID] | None = None
 
 
 @dataclass
@@ -39,6 +51,46 @@ class ListResponse:
     meta: ListResponseMeta = field(default_factory=ListResponseMeta)  # type: ignore
 
 
+@runtime_checkable
+class PageableRepository(Protocol):
+    """
+    Repository able to sort and paginate its entities itself, such as the
+    indexed in-memory repositories and the Django repositories, which page
+    in the database.
+    """
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List, int]: ...
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List, int]: ...
+
+
+@runtime_checkable
+class ProjectingRepository(Protocol):
+    """
+    Repository able to list read-only projections of its entities, such as
+    the list output DTOs, straight from the stored rows, skipping the
+    construction and validation of the aggregates.
+    """
+
+    def list_projections(self) -> List: ...
+
+    async def alist_projections(self) -> List: ...
+
+
 class ListUseCase(Generic[T, RequestT]):
     """
     Use case to list and sort entities based on the request parameters.
@@ -64,12 +116,163 @@ class ListUseCase(Generic[T, RequestT]):
         Returns:
             dict: A dictionary containing the paginated data and metadata information, including
                 current page, items per page, and total number of entities.
+
+        Raises:
+            InvalidOrderBy: If the repository does not allow sorting by the field.
+        """
+
+        self._check_order_by(request)
+        if isinstance(self.repository, PageableRepository):
+            return self._page(request, *self.repository.page(**self._window(request)))
+        if isinstance(self.repository, ProjectingRepository):
+            return self._paginate(self.repository.list_projections(), request)
+        if request.ids is not None:  # type: ignore
+            entities = self.repository.get_by_ids(request.ids)  # type: ignore
+            return self._paginate(entities, request)
+
+        return self._paginate(self.repository.list(), request)
+
+    async def aexecute(self, request: RequestT) -> ListResponse:
+        """
+        Asynchronously executes the use case to list and sort entities based on the
+        request parameters.
+
+        Args:
+            request (RequestT): The request object containing sorting and pagination details.
+
+        Returns:
+            dict: A dictionary containing the paginated data and metadata information, including
+                current page, items per page, and total number of entities.
+
+        Raises:
+            InvalidOrderBy: If the repository does not allow sorting by the field.
+        """
+
+        self._check_order_by(request)
+        if isinstance(self.repository, PageableRepository):
+            return self._page(
+                request, *await self.repository.apage(**self._window(request))
+            )
+        if isinstance(self.repository, ProjectingRepository):
+            return self._paginate(await self.repository.alist_projections(), request)
+        if request.ids is not None:  # type: ignore
+            entities = await self.repository.aget_by_ids(request.ids)  # type: ignore
+            return self._paginate(entities, request)
+
+        return self._paginate(await self.repository.alist(), request)
+
+    def _check_order_by(self, request: RequestT) -> None:
+        """
+        Reject sort fields outside the repository's `sortable_fields`, the
+        fields it can sort by without sorting the whole table.
+
+        Args:
+            request (RequestT): The request object containing sorting details.
+
+        Raises:
+            InvalidOrderBy: If the repository does not allow sorting by the field.
+        """
+
+        sortable_fields = getattr(self.repository, "sortable_fields", None)
+        if sortable_fields is not None and request.order_by not in sortable_fields:  # type: ignore
+            raise InvalidOrderBy(
+                f"Cannot order by {request.order_by}, "  # type: ignore
+                f"use one of: {', '.join(sortable_fields)}"
+            )
+
+    def _window(self, request: RequestT) -> dict:
+        """
+        Get the page arguments of a repository that sorts and paginates.
+
+        Args:
+            request (RequestT): The request object containing sorting and pagination details.
+
+        Returns:
+            dict: The order_by, descending, offset, limit and ids arguments.
+        """
+
+        return {
+            "order_by": request.order_by,  # type: ignore
+            "descending": request.sort.lower() == "desc",  # type: ignore
+            "offset": self._offset(request),
+            "limit": self._page_size(request),
+            "ids": request.ids,  # type: ignore
+        }
+
+    def _page(self, request: RequestT, entity_page: List, total: int) -> ListResponse:
+        """
+        Build the response of a page sorted and paginated by the repository.
+
+        Args:
+            request (RequestT): The request object containing pagination details.
+            entity_page (List): The entities of the page.
+            total (int): The total number of entities.
+
+        Returns:
+            dict: A dictionary containing the paginated data and metadata information.
+        """
+
+        return {
+            "data": entity_page,
+            "meta": ListResponseMeta(
+                current_page=request.current_page,  # type: ignore
+                per_page=self._page_size(request),
+                total=total,
+            ),
+        }
+
+    @staticmethod
+    def _page_size(request: RequestT) -> int:
+        """
+        Get the number of entities per page: every requested id fits in one
+        page, other lists are split in pages of the default size.
+
+        Args:
+            request (RequestT): The request object containing pagination details.
+
+        Returns:
+            int: The size of the page.
+        """
+
+        if request.ids is not None:  # type: ignore
+            return len(request.ids)  # type: ignore
+
+        return getattr(request, "page_size", DEFAULT_PAGE_SIZE)
+
+    @staticmethod
+    def _offset(request: RequestT) -> int:
+        """
+        Compute the number of entities before the requested page.
+
+        Args:
+            request (RequestT): The request object containing pagination details.
+
+        Returns:
+            int: The offset of the page.
         """
 
-        entity = self.repository.list()
+        page_size = ListUseCase._page_size(request)
+        return (request.current_page - 1) * page_size  # type: ignore
+
+    def _paginate(self, entities: List[T], request: RequestT) -> ListResponse:
+        """
+        Sort and paginate the given entities based on the request parameters.
+
+        Args:
+            entities (List[T]): The entities to be sorted and paginated.
+            request (RequestT): The request object containing sorting and pagination details.
+
+        Returns:
+            dict: A dictionary containing the paginated data and metadata information.
+        """
+
+        ids = request.ids  # type: ignore
+        if ids is not None:
+            entities = [entity for entity in entities if entity.id in ids]  # type: ignore
+
         reverse_order = request.sort.lower() == "desc"  # type: ignore
         sorted_entity = sorted(
-            entity,
+            entities,
             key=lambda entity: getattr(
                 entity,
                 request.order_by,  # type: ignore
@@ -77,18 +280,15 @@ class ListUseCase(Generic[T, RequestT]):
             reverse=reverse_order,
         )
 
-        page_offset = (request.current_page - 1) * getattr(  # type: ignore
-            request,
-            "page_size",
-            DEFAULT_PAGE_SIZE,
-        )
-        entity_page = sorted_entity[page_offset : page_offset + DEFAULT_PAGE_SIZE]
+        page_offset = self._offset(request)
+        page_size = self._page_size(request)
+        entity_page = sorted_entity[page_offset : page_offset + page_size]
 
         return {
             "data": entity_page,
             "meta": ListResponseMeta(
                 current_page=request.current_page,  # type: ignore
-                per_page=DEFAULT_PAGE_SIZE,
+                per_page=page_size,
                 total=len(sorted_entity),
             ),
         }
@@ -4,21 +4,59 @@ from dataclasses import dataclass, field
 from typing import List
 
 from src.core._shared.domain.notification import Notification
+from src.core._shared.domain.uuid7 import uuid7
 from src.core._shared.events.abstract_message_bus import AbstractMessageBus
 from src.core._shared.events.event import Event
-from src.core._shared.events.message_bus import MessageBus
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AbstractEntity(ABC):
     """
     Abstract base class for entities
+
+    Entities are slotted, and their notification and events are only
+    allocated on the first error or event, so entities that are only read
+    and serialized cost just their own fields.
     """
 
-    id: uuid.UUID = field(default_factory=uuid.uuid4)
-    notification: Notification = field(default_factory=Notification, init=False)
-    events: List[Event] = field(default_factory=list, init=False)
-    message_bus: AbstractMessageBus = field(default_factory=MessageBus, init=True)
+    id: uuid.UUID = field(default_factory=uuid7)
+    message_bus: AbstractMessageBus | None = field(
+        default=None, compare=False, repr=False
+    )
+    _notification: Notification | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    _events: List[Event] | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    @property
+    def notification(self) -> Notification:
+        """
+        The notification collecting the validation errors of the entity.
+
+        Returns:
+            Notification: The notification, created on first access.
+        """
+
+        if self._notification is None:
+            self._notification = Notification()
+
+        return self._notification
+
+    @property
+    def events(self) -> List[Event]:
+        """
+        The events dispatched by the entity.
+
+        Returns:
+            List[Event]: The events, created on first access.
+        """
+
+        if self._events is None:
+            self._events = []
+
+        return self._events
 
     def __eq__(self, other):
         """
@@ -53,16 +91,41 @@ class AbstractEntity(ABC):
 
         raise NotImplementedError
 
+    def raise_if_invalid(self) -> None:
+        """
+        Raise the validation errors collected in the notification, if any,
+        without allocating a notification for valid entities.
+
+        Raises:
+            ValueError: If the notification has errors.
+        """
+
+        if self._notification is not None and self._notification.has_errors:
+            raise ValueError(self._notification.messages)
+
     def dispatch(self, event: Event) -> None:
         """
         Dispatch the given event.
 
-        This method adds the given event to the entity's events list and calls the
-        message bus's handle method with the events list.
+        This method adds the given event to the entity's events list. Entities
+        given a message bus hand it the event right away; the others keep it
+        until a unit of work pulls the events and publishes them after commit.
 
         Args:
             event (Event): The event to dispatch.
         """
 
         self.events.append(event)
-        self.message_bus.handle(self.events)
+        if self.message_bus is not None:
+            self.message_bus.handle([event])
+
+    def pull_events(self) -> List[Event]:
+        """
+        Take the events dispatched by the entity, leaving it without events.
+
+        Returns:
+            List[Event]: The events, in dispatch order.
+        """
+
+        events, self._events = self._events or [], None
+        return events
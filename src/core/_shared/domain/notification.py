@@ -8,6 +8,8 @@ class Notification:
     A class to represent a notification containing a list of errors.
     """
 
+    __slots__ = ("_errors",)
+
     def __init__(self) -> None:
         """
         Initializes a Notification with an empty list of errors
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable
+
+
+class AbstractSubscription(ABC):
+    """
+    Abstract base class for a subscription to one or more broadcast channels.
+    """
+
+    @abstractmethod
+    async def get(self) -> Dict:
+        """
+        Wait for the next message published to any of the subscribed channels.
+
+        Returns:
+            Dict: The published message.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Stop receiving messages and release the subscription.
+        """
+
+        raise NotImplementedError
+
+
+class AbstractBroadcaster(ABC):
+    """
+    Abstract base class for a publish/subscribe fan-out.
+
+    Unlike the message bus, which hands events to handlers, a broadcaster
+    delivers every message published to a channel to all of its current
+    subscribers, such as clients waiting on a server-sent events stream.
+    """
+
+    @abstractmethod
+    def publish(self, channel: str, message: Dict) -> None:
+        """
+        Publish a message to every subscriber of the given channel.
+
+        Args:
+            channel (str): The channel to publish the message to.
+            message (Dict): The message to be published.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def subscribe(self, channels: Iterable[str]) -> AbstractSubscription:
+        """
+        Subscribe to the given channels.
+
+        Must be called from a running event loop, which is where the messages
+        are delivered.
+
+        Args:
+            channels (Iterable[str]): The channels to subscribe to.
+
+        Returns:
+            AbstractSubscription: The subscription receiving the messages.
+        """
+
+        raise NotImplementedError
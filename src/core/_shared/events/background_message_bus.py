@@ -0,0 +1,226 @@
+import atexit
+import logging
+import queue
+import threading
+from typing import Callable, List, Tuple
+
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.event import Event
+from src.core._shared.events.message_bus import MessageBus
+from src.core._shared.infrastructure.events.sqlite_spill_store import (
+    SqliteSpillStore,
+)
+from src.core._shared.infrastructure.metrics import REGISTRY
+from src.core._shared.infrastructure.structured_logging import correlation, request_id
+
+logger = logging.getLogger(__name__)
+
+QUEUE_DEPTH = REGISTRY.gauge(
+    "message_bus_queue_depth",
+    "Events waiting in the background message bus queue.",
+)
+EVENTS_DROPPED = REGISTRY.counter(
+    "events_dropped_total",
+    "Events dropped because the background message bus queue was full.",
+    ["event"],
+)
+EVENTS_SPILLED = REGISTRY.counter(
+    "events_spilled_total",
+    "Events spilled to the local table because the queue was full.",
+    ["event"],
+)
+
+_STOP = object()
+
+
+class BackgroundMessageBus(AbstractMessageBus):
+    """
+    Message bus that hands events to a pool of worker threads through a
+    bounded queue, so slow handlers never add to the caller's latency.
+
+    When the queue is full, the policy decides what happens to a new event:
+    "block" waits for room, "drop" discards it, and "spill" stores it in a
+    durable local table, from which idle workers move it back to the queue
+    and delete it once handled, along with the id of the request that raised
+    it. Events are handled in roughly the order they were queued, but workers
+    run concurrently and spilled events are replayed after newer ones.
+
+    Each worker builds its own MessageBus, so handlers holding connections,
+    such as the RabbitMQ dispatcher, are never shared between threads.
+    """
+
+    POLICIES = ("block", "drop", "spill")
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queued: int = 1000,
+        policy: str = "block",
+        spill_store: SqliteSpillStore | None = None,
+        bus_factory: Callable[[], MessageBus] = MessageBus,
+        idle_interval: float = 0.5,
+    ) -> None:
+        """
+        Initialize the bus and start its workers.
+
+        Args:
+            workers (int): The number of worker threads. Defaults to 4.
+            max_queued (int): The capacity of the queue. Defaults to 1000.
+            policy (str): "block", "drop" or "spill". Defaults to "block".
+            spill_store (SqliteSpillStore | None): The table of spilled events,
+                required by the "spill" policy.
+            bus_factory (Callable[[], MessageBus]): Builds the synchronous bus
+                that runs the handlers of a worker. Defaults to MessageBus.
+            idle_interval (float): The seconds a worker waits for an event
+                before replaying spilled ones. Defaults to 0.5.
+
+        Raises:
+            ValueError: If the policy is unknown, or "spill" has no store.
+        """
+
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown message bus policy: {policy}")
+        if policy == "spill" and spill_store is None:
+            raise ValueError("The spill policy requires a spill store")
+
+        self.policy = policy
+        self.spill_store = spill_store
+        self.bus_factory = bus_factory
+        self.idle_interval = idle_interval
+        self._queue: queue.Queue[Tuple[str | None, Event, int | None] | object] = (
+            queue.Queue(maxsize=max_queued)
+        )
+        # Guards the closing of the bus against the events being queued, so
+        # none is queued behind the workers' stop markers. Callers waiting for
+        # room in the queue count as producers instead of holding it
+        self._state = threading.Condition()
+        self._closed = False
+        self._producers = 0
+        self._workers = [
+            threading.Thread(
+                target=self._work, name=f"message-bus-{index}", daemon=True
+            )
+            for index in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        atexit.register(self.drain)
+
+    def handle(self, events: List[Event]) -> None:
+        """
+        Queue the given events for the workers.
+
+        Once the bus is drained, events are handled inline, so none is lost
+        during shutdown.
+
+        Args:
+            events (List[Event]): The events to handle.
+        """
+
+        with self._state:
+            closed = self._closed
+            if not closed:
+                self._producers += 1
+
+        if closed:
+            self.bus_factory().handle(events)
+            return
+
+        try:
+            for event in events:
+                self._put(event)
+        finally:
+            with self._state:
+                self._producers -= 1
+                self._state.notify_all()
+
+    def _put(self, event: Event) -> None:
+        request = request_id.get()
+        item = (request, event, None)
+        if self.policy == "block":
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                if self.policy == "spill":
+                    self.spill_store.push(event, request)  # type: ignore
+                    EVENTS_SPILLED.labels(event.type).inc()
+                else:
+                    EVENTS_DROPPED.labels(event.type).inc()
+                    logger.warning("Message bus queue full, dropped %s", event.type)
+                return
+
+        QUEUE_DEPTH.inc()
+
+    def _work(self) -> None:
+        bus = self.bus_factory()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.idle_interval)
+            except queue.Empty:
+                self._replay()
+                continue
+
+            try:
+                if item is _STOP:
+                    return
+
+                QUEUE_DEPTH.dec()
+                request, event, spilled = item  # type: ignore
+                try:
+                    with correlation(request=request):
+                        bus.dispatch(event)
+                finally:
+                    if spilled is not None:
+                        self.spill_store.ack(spilled)  # type: ignore
+            finally:
+                self._queue.task_done()
+
+    def _replay(self) -> None:
+        """
+        Move spilled events back to the queue, as far as it has room. They
+        stay claimed in their table until a worker handled them.
+        """
+
+        if self.spill_store is None:
+            return
+
+        with self._state:
+            if self._closed:
+                return
+            room = self._queue.maxsize - self._queue.qsize()
+            for id, request, event in self.spill_store.claim(room) if room > 0 else []:
+                try:
+                    self._queue.put_nowait((request, event, id))
+                except queue.Full:
+                    self.spill_store.release(id)
+                else:
+                    QUEUE_DEPTH.inc()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """
+        Stop accepting events, handle the queued ones and stop the workers.
+
+        Spilled events stay in their table, for the next process to replay.
+        Callers still waiting for room in the queue are waited for first.
+
+        Args:
+            timeout (float | None): The seconds to wait for each worker.
+                Defaults to waiting until the queue is empty.
+
+        Returns:
+            bool: True if every worker stopped in time.
+        """
+
+        with self._state:
+            if not self._closed:
+                self._closed = True
+                self._state.wait_for(lambda: not self._producers, timeout)
+                for _ in self._workers:
+                    self._queue.put(_STOP)
+
+        for worker in self._workers:
+            worker.join(timeout)
+
+        return not any(worker.is_alive() for worker in self._workers)
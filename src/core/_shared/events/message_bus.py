@@ -1,3 +1,5 @@
+import logging
+import time
 from typing import List, Type
 
 from src.core._shared.application.handler import AbstractHandler
@@ -6,6 +8,8 @@ from src.core._shared.events.event import Event
 from src.core._shared.infrastructure.events.rabbitmq_dispatcher import (
     RabbitMQDispatcher,
 )
+from src.core._shared.infrastructure.metrics import REGISTRY
+from src.core._shared.infrastructure.structured_logging import correlation
 from src.core.video.application.events.handlers import (
     PublishAudioVideoMediaUpdatedHandler,
 )
@@ -13,6 +17,24 @@ from src.core.video.application.events.integration_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
 
+logger = logging.getLogger(__name__)
+
+EVENTS_PUBLISHED = REGISTRY.counter(
+    "events_published_total",
+    "Events handled successfully by the message bus.",
+    ["event"],
+)
+EVENTS_FAILED = REGISTRY.counter(
+    "events_failed_total",
+    "Events whose handler raised an error.",
+    ["event"],
+)
+EVENT_HANDLER_SECONDS = REGISTRY.histogram(
+    "event_handler_seconds",
+    "Time spent by each handler on an event.",
+    ["event", "handler"],
+)
+
 
 class MessageBus(AbstractMessageBus):
     """
@@ -30,16 +52,40 @@ class MessageBus(AbstractMessageBus):
 
     def handle(self, events: List[Event]) -> None:
         """
-        Handle the given events.
+        Handle the given events, running their handlers inline.
 
         Args:
             events (List[Event]): The events to handle.
         """
 
         for event in events:
-            handlers = self.handlers.get(type(event), [])
+            self.dispatch(event)
+
+    def dispatch(self, event: Event) -> None:
+        """
+        Run the handlers of an event, logging and counting the handlers that
+        fail instead of raising.
+
+        Args:
+            event (Event): The event to handle.
+        """
+
+        handlers = self.handlers.get(type(event), [])
+        with correlation(resource=getattr(event, "resource_id", None)):
             for handler in handlers:
+                start = time.perf_counter()
                 try:
                     handler.handle(event)
-                except Exception as e:
-                    print(f"Error handling event {event}: {e}")
+                except Exception:
+                    EVENTS_FAILED.labels(event.type).inc()
+                    logger.exception(
+                        "Error handling event %s with %s",
+                        event.type,
+                        type(handler).__name__,
+                    )
+                else:
+                    EVENTS_PUBLISHED.labels(event.type).inc()
+                finally:
+                    EVENT_HANDLER_SECONDS.labels(
+                        event.type, type(handler).__name__
+                    ).observe(time.perf_counter() - start)
@@ -35,25 +35,32 @@ class JwtAuthService(AbstractAuthServiceInterface):
             else None
         )
         self.token = token.replace("Bearer ", "", 1) if token else None
+        self._payload: Dict | None = None
 
     def _decode_token(self) -> Dict:
         """
         Decode the token and return its payload.
 
+        The signature is verified only once per instance; later calls reuse the
+        decoded payload.
+
         Returns:
             Dict[str, Any]: The payload of the token, or an empty dictionary if the
                             token is invalid.
         """
 
-        try:
-            return jwt.decode(
-                jwt=self.token,  # type: ignore
-                key=self.public_key,  # type: ignore
-                algorithms=["RS256"],
-                audience="account",
-            )
-        except jwt.PyJWTError:
-            return {}
+        if self._payload is None:
+            try:
+                self._payload = jwt.decode(
+                    jwt=self.token,  # type: ignore
+                    key=self.public_key,  # type: ignore
+                    algorithms=["RS256"],
+                    audience="account",
+                )
+            except jwt.PyJWTError:
+                self._payload = {}
+
+        return self._payload
 
     def is_authenticated(self) -> bool:
         """
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+from typing import Dict, Iterable, Set
+
+from src.core._shared.events.abstract_broadcaster import (
+    AbstractBroadcaster,
+    AbstractSubscription,
+)
+
+
+class InMemorySubscription(AbstractSubscription):
+    """
+    Subscription delivering messages to a queue owned by an event loop.
+    """
+
+    def __init__(
+        self,
+        broadcaster: "InMemoryBroadcaster",
+        channels: Iterable[str],
+        max_pending: int,
+    ) -> None:
+        """
+        Initialize the InMemorySubscription.
+
+        Args:
+            broadcaster (InMemoryBroadcaster): The broadcaster that owns the
+                subscription.
+            channels (Iterable[str]): The subscribed channels.
+            max_pending (int): The maximum number of undelivered messages. When
+                the subscriber falls behind, the oldest message is dropped.
+        """
+
+        self.broadcaster = broadcaster
+        self.channels = frozenset(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[Dict] = asyncio.Queue(maxsize=max_pending)
+
+    def put(self, message: Dict) -> None:
+        """
+        Hand a message to the subscription from any thread.
+
+        Args:
+            message (Dict): The message to be delivered.
+        """
+
+        try:
+            self.loop.call_soon_threadsafe(self._put_nowait, message)
+        except RuntimeError:
+            # The event loop is closed, so nobody is waiting anymore.
+            self.close()
+
+    def _put_nowait(self, message: Dict) -> None:
+        """
+        Enqueue a message on the subscription event loop.
+
+        Args:
+            message (Dict): The message to be enqueued.
+        """
+
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+    async def get(self) -> Dict:
+        """
+        Wait for the next message.
+
+        Returns:
+            Dict: The next message.
+        """
+
+        return await self.queue.get()
+
+    def close(self) -> None:
+        """
+        Unsubscribe from every channel.
+        """
+
+        self.broadcaster.unsubscribe(self)
+
+
+class InMemoryBroadcaster(AbstractBroadcaster):
+    """
+    In-process implementation of a broadcaster.
+
+    Publishing costs one dictionary lookup plus one enqueue per subscriber of
+    the channel, and idle subscribers cost nothing but their queue.
+    """
+
+    def __init__(self, max_pending: int = 100) -> None:
+        """
+        Initialize the InMemoryBroadcaster.
+
+        Args:
+            max_pending (int): The maximum number of undelivered messages per
+                subscription. Defaults to 100.
+        """
+
+        self.max_pending = max_pending
+        self.subscriptions: Dict[str, Set[InMemorySubscription]] = {}
+        self.lock = threading.Lock()
+
+    def publish(self, channel: str, message: Dict) -> None:
+        """
+        Publish a message to every subscriber of the given channel.
+
+        Args:
+            channel (str): The channel to publish the message to.
+            message (Dict): The message to be published.
+        """
+
+        with self.lock:
+            subscriptions = list(self.subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            subscription.put(message)
+
+    def subscribe(self, channels: Iterable[str]) -> InMemorySubscription:
+        """
+        Subscribe to the given channels from the running event loop.
+
+        Args:
+            channels (Iterable[str]): The channels to subscribe to.
+
+        Returns:
+            InMemorySubscription: The subscription receiving the messages.
+        """
+
+        subscription = InMemorySubscription(
+            broadcaster=self,
+            channels=channels,
+            max_pending=self.max_pending,
+        )
+
+        with self.lock:
+            for channel in subscription.channels:
+                self.subscriptions.setdefault(channel, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: InMemorySubscription) -> None:
+        """
+        Remove a subscription from every channel it is subscribed to.
+
+        Args:
+            subscription (InMemorySubscription): The subscription to be removed.
+        """
+
+        with self.lock:
+            for channel in subscription.channels:
+                subscribers = self.subscriptions.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self.subscriptions[channel]
@@ -0,0 +1,121 @@
+import json
+import logging
+import threading
+from typing import Dict, Iterable
+
+import pika
+
+from src.core._shared.events.abstract_broadcaster import (
+    AbstractBroadcaster,
+    AbstractSubscription,
+)
+from src.core._shared.infrastructure.events.in_memory_broadcaster import (
+    InMemoryBroadcaster,
+)
+from src.core._shared.infrastructure.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+
+class RabbitMQBroadcaster(AbstractBroadcaster):
+    """
+    Broadcaster that fans messages out across processes through RabbitMQ.
+
+    Messages are published to a fanout exchange. Each subscribing process
+    binds one exclusive queue to the exchange, consumed by a single listener
+    thread, and fans the messages out locally through an InMemoryBroadcaster,
+    so the number of waiting clients doesn't change the broker load.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        exchange: str = "videos.media_status",
+    ) -> None:
+        """
+        Initialize the RabbitMQBroadcaster.
+
+        Args:
+            host (str): The RabbitMQ host to connect to. Defaults to "localhost".
+            exchange (str): The name of the fanout exchange. Defaults to
+                "videos.media_status".
+        """
+
+        self.host = host
+        self.exchange = exchange
+        self.connection = None
+        self.channel = None
+        self.local = InMemoryBroadcaster()
+        self.listener: threading.Thread | None = None
+        self.lock = threading.Lock()
+
+    def publish(self, channel: str, message: Dict) -> None:
+        """
+        Publish a message to the fanout exchange.
+
+        Args:
+            channel (str): The channel to publish the message to.
+            message (Dict): The message to be published.
+        """
+
+        with timed("publish"):
+            if not self.connection:
+                self.connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(host=self.host)
+                )
+                self.channel = self.connection.channel()
+                self.channel.exchange_declare(
+                    exchange=self.exchange,
+                    exchange_type="fanout",
+                )
+
+            self.channel.basic_publish(  # type: ignore
+                exchange=self.exchange,
+                routing_key=channel,
+                body=json.dumps({"channel": channel, "message": message}),
+            )
+
+    def subscribe(self, channels: Iterable[str]) -> AbstractSubscription:
+        """
+        Subscribe to the given channels, starting the listener on first use.
+
+        Args:
+            channels (Iterable[str]): The channels to subscribe to.
+
+        Returns:
+            AbstractSubscription: The subscription receiving the messages.
+        """
+
+        with self.lock:
+            if self.listener is None:
+                self.listener = threading.Thread(
+                    target=self._listen,
+                    name="rabbitmq-broadcaster",
+                    daemon=True,
+                )
+                self.listener.start()
+
+        return self.local.subscribe(channels)
+
+    def _listen(self) -> None:
+        """
+        Consume the exchange and republish every message to the local subscribers.
+        """
+
+        connection = pika.BlockingConnection(pika.ConnectionParameters(host=self.host))
+        channel = connection.channel()
+        channel.exchange_declare(exchange=self.exchange, exchange_type="fanout")
+        queue = channel.queue_declare(queue="", exclusive=True).method.queue
+        channel.queue_bind(exchange=self.exchange, queue=queue)
+
+        def on_message(ch, method, properties, body) -> None:
+            try:
+                data = json.loads(body)
+                self.local.publish(data["channel"], data["message"])
+            except (ValueError, KeyError):
+                logger.error("Invalid broadcast message %r", body, exc_info=True)
+
+        channel.basic_consume(
+            queue=queue, on_message_callback=on_message, auto_ack=True
+        )
+        channel.start_consuming()
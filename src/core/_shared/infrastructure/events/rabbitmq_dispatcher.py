@@ -1,9 +1,13 @@
 import json
+import logging
 
 import pika
 
 from src.core._shared.events.event import Event
 from src.core._shared.events.event_dispatcher import EventDispatcher
+from src.core._shared.infrastructure.instrumentation import timed
+
+logger = logging.getLogger(__name__)
 
 
 class RabbitMQDispatcher(EventDispatcher):
@@ -34,16 +38,18 @@ class RabbitMQDispatcher(EventDispatcher):
             event (Event): The event to dispatch.
         """
 
-        if not self.connection:
-            self.connection = pika.BlockingConnection(
-                pika.ConnectionParameters(host=self.host)
+        body = json.dumps(event.payload)
+        with timed("publish"):
+            if not self.connection:
+                self.connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(host=self.host)
+                )
+                self.channel = self.connection.channel()
+                self.channel.queue_declare(queue=self.queue)
+
+            self.channel.basic_publish(
+                exchange="",
+                routing_key=self.queue,
+                body=body,
             )
-            self.channel = self.connection.channel()
-            self.channel.queue_declare(queue=self.queue)
-
-        self.channel.basic_publish(
-            exchange="",
-            routing_key=self.queue,
-            body=json.dumps(event.payload),
-        )
-        print(f"Sent: {event} to queue {self.queue}")
+        logger.debug("Sent %s to queue %s: %s", event.type, self.queue, body)
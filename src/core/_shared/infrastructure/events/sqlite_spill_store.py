@@ -0,0 +1,145 @@
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Tuple
+
+from src.core._shared.events.event import Event
+
+SpilledEvent = Tuple[int, str | None, Event]
+
+
+class SqliteSpillStore:
+    """
+    Durable local table holding the events a background message bus could
+    not queue, until there is room for them again.
+
+    Events are pickled, so they must be replayed by the same code base; the
+    table survives restarts, and the events spilled by a previous process are
+    handled by the next one.
+
+    Replayed events are claimed, not removed, and only deleted once handled,
+    so the events of a process that dies before handling them are claimed
+    again after `lease` seconds.
+    """
+
+    _COLUMNS = {"request_id": "TEXT", "claimed_by": "TEXT", "claimed_at": "REAL"}
+
+    def __init__(self, path: str, lease: float = 300.0) -> None:
+        """
+        Initialize the store, creating its table if needed.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            lease (float): The seconds a claimed event waits to be handled
+                before it can be claimed again. Defaults to 300.
+        """
+
+        self.path = path
+        self.lease = lease
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS spilled_events "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, event BLOB NOT NULL)"
+            )
+            columns = {
+                row[1]
+                for row in self._connection.execute("PRAGMA table_info(spilled_events)")
+            }
+            # Tables spilled to by older versions lack the claim columns
+            for column, kind in self._COLUMNS.items():
+                if column not in columns:
+                    self._connection.execute(
+                        f"ALTER TABLE spilled_events ADD COLUMN {column} {kind}"
+                    )
+
+    def push(self, event: Event, request_id: str | None = None) -> None:
+        """
+        Store an event, durably, at the end of the table.
+
+        Args:
+            event (Event): The event to store.
+            request_id (str | None): The id of the request that raised the
+                event. Defaults to None.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO spilled_events (request_id, event) VALUES (?, ?)",
+                (request_id, pickle.dumps(event)),
+            )
+
+    def claim(self, limit: int) -> List[SpilledEvent]:
+        """
+        Claim the oldest stored events that are not claimed, or whose claim
+        expired, leaving them in the table until they are acknowledged.
+
+        Args:
+            limit (int): The maximum number of events to claim.
+
+        Returns:
+            List[SpilledEvent]: The row id, request id and event of each
+                claimed event, oldest first.
+        """
+
+        token = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE spilled_events SET claimed_by = ?, claimed_at = ? "
+                "WHERE id IN (SELECT id FROM spilled_events "
+                "WHERE claimed_at IS NULL OR claimed_at <= ? ORDER BY id LIMIT ?)",
+                (token, now, now - self.lease, limit),
+            )
+            rows = self._connection.execute(
+                "SELECT id, request_id, event FROM spilled_events "
+                "WHERE claimed_by = ? ORDER BY id",
+                (token,),
+            ).fetchall()
+
+        return [(id, request, pickle.loads(event)) for id, request, event in rows]
+
+    def ack(self, id: int) -> None:
+        """
+        Delete a claimed event once it was handled.
+
+        Args:
+            id (int): The row id of the event.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM spilled_events WHERE id = ?", (id,))
+
+    def release(self, id: int) -> None:
+        """
+        Give up the claim of an event, so it is claimed again right away.
+
+        Args:
+            id (int): The row id of the event.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE spilled_events SET claimed_by = NULL, claimed_at = NULL "
+                "WHERE id = ?",
+                (id,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM spilled_events"
+            ).fetchone()
+
+        return count
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,278 @@
+import threading
+import uuid
+from bisect import bisect_left, insort
+from typing import Any, Dict, Generic, Iterable, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Snapshot(Generic[T]):
+    """
+    Immutable state of an InMemoryRepository: the entities by id, the sorted
+    `(value, id)` keys of each index, and the indexed values of each entity,
+    needed to find its keys again once the entity itself has been mutated.
+    """
+
+    __slots__ = ("entities", "indexes", "values")
+
+    def __init__(
+        self,
+        entities: Dict[uuid.UUID, T],
+        indexes: Dict[str, List[Tuple[Any, uuid.UUID]]],
+        values: Dict[uuid.UUID, Tuple[Any, ...]],
+    ) -> None:
+        self.entities = entities
+        self.indexes = indexes
+        self.values = values
+
+
+class InMemoryRepository(Generic[T]):
+    """
+    Base of the in-memory repositories: entities keyed by id, with sorted
+    secondary indexes on the fields in INDEXES.
+
+    The state is copy-on-write: readers use the current snapshot without
+    locking, while writers, serialized by a lock, build a new snapshot and
+    swap it in. Lookups by id are O(1), ordered pages on an indexed field
+    are a slice of its index, and every write is O(n), which suits a warm
+    read cache refreshed far less often than it is read. Bulk loads, such as
+    the initial entities, go through `save_all`, which builds the snapshot
+    once in O(n log n).
+
+    Entities are stored as given, so one mutated in place is only reindexed
+    when it is saved or updated again.
+    """
+
+    INDEXES: Tuple[str, ...] = ("id",)
+
+    def __init__(self, entities: Iterable[T] | None = None) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            entities (Iterable[T] | None): The entities to initialize the
+                repository with. Defaults to none.
+        """
+
+        self._lock = threading.Lock()
+        self._snapshot: _Snapshot[T] = _Snapshot(
+            {}, {field: [] for field in self.INDEXES}, {}
+        )
+        self.save_all(entities or [])
+
+    def _values(self, entity: T) -> Tuple[Any, ...]:
+        return tuple(getattr(entity, field) for field in self.INDEXES)
+
+    def _write(self, upserted: T | None = None, deleted: uuid.UUID | None = None):
+        """
+        Swap in a new snapshot with an entity saved or deleted.
+
+        Args:
+            upserted (T | None): The entity to be saved, replacing the one
+                with the same id.
+            deleted (uuid.UUID | None): The id of the entity to be deleted.
+        """
+
+        with self._lock:
+            current = self._snapshot
+            entity_id = upserted.id if upserted is not None else deleted  # type: ignore
+            if upserted is None and entity_id not in current.entities:
+                return
+
+            entities = dict(current.entities)
+            values = dict(current.values)
+            indexes = {field: list(keys) for field, keys in current.indexes.items()}
+
+            old_values = values.pop(entity_id, None)  # type: ignore
+            if old_values is not None:
+                for field, value in zip(self.INDEXES, old_values):
+                    keys = indexes[field]
+                    del keys[bisect_left(keys, (value, entity_id))]
+
+            if upserted is None:
+                del entities[entity_id]  # type: ignore
+            else:
+                entities[entity_id] = upserted  # type: ignore
+                values[entity_id] = self._values(upserted)  # type: ignore
+                for field, value in zip(self.INDEXES, values[entity_id]):  # type: ignore
+                    insort(indexes[field], (value, entity_id))
+
+            self._snapshot = _Snapshot(entities, indexes, values)
+
+    def save(self, entity: T) -> None:
+        """
+        Save an entity to the repository.
+
+        Args:
+            entity (T): The entity to be saved.
+        """
+
+        self._write(upserted=entity)
+
+    def save_all(self, entities: Iterable[T]) -> None:
+        """
+        Save many entities to the repository at once, swapping in a single
+        snapshot whose indexes are sorted once instead of per entity.
+
+        Args:
+            entities (Iterable[T]): The entities to be saved, replacing the
+                ones with the same ids.
+        """
+
+        with self._lock:
+            current = self._snapshot
+            saved = dict(current.entities)
+            values = dict(current.values)
+            for entity in entities:
+                saved[entity.id] = entity  # type: ignore
+                values[entity.id] = self._values(entity)  # type: ignore
+
+            indexes = {
+                field: sorted(
+                    (entity_values[position], entity_id)
+                    for entity_id, entity_values in values.items()
+                )
+                for position, field in enumerate(self.INDEXES)
+            }
+            self._snapshot = _Snapshot(saved, indexes, values)
+
+    def get_by_id(self, entity_id: uuid.UUID) -> T | None:
+        """
+        Retrieve an entity by its ID from the repository.
+
+        Args:
+            entity_id (uuid.UUID): The ID of the entity to be retrieved.
+
+        Returns:
+            T | None: The entity with the given ID, or None if it doesn't exist.
+        """
+
+        return self._snapshot.entities.get(entity_id)
+
+    def get_by_ids(self, entity_ids: Iterable[uuid.UUID]) -> List[T]:
+        """
+        Retrieve the entities with the given IDs from the repository.
+
+        Args:
+            entity_ids (Iterable[uuid.UUID]): The IDs of the entities to be retrieved.
+
+        Returns:
+            List[T]: The entities found, in the order of their first ID; IDs
+                without an entity are skipped.
+        """
+
+        entities = self._snapshot.entities
+        return [
+            entities[entity_id]
+            for entity_id in dict.fromkeys(entity_ids)
+            if entity_id in entities
+        ]
+
+    def delete(self, entity_id: uuid.UUID) -> None:
+        """
+        Delete an entity by its ID from the repository.
+
+        Args:
+            entity_id (uuid.UUID): The ID of the entity to be deleted.
+        """
+
+        self._write(deleted=entity_id)
+
+    def update(self, entity: T) -> None:
+        """
+        Update an entity in the repository, if it exists.
+
+        Args:
+            entity (T): The entity to be updated.
+        """
+
+        if entity.id in self._snapshot.entities:  # type: ignore
+            self._write(upserted=entity)
+
+    def list(self) -> List[T]:
+        """
+        List all entities from the repository, in insertion order.
+
+        Returns:
+            List[T]: A list of all entities.
+        """
+
+        return list(self._snapshot.entities.values())
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[T], int]:
+        """
+        Get a page of the entities sorted by a field.
+
+        Pages on an indexed field are sliced from its index; other fields, and
+        pages filtered by id, are sorted on every call.
+
+        Args:
+            order_by (str): The field to sort by.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of entities skipped.
+            limit (int): The maximum number of entities returned.
+            ids (Set[uuid.UUID] | None): Only page the entities with these IDs.
+                Defaults to every entity.
+
+        Returns:
+            Tuple[List[T], int]: The entities of the page and the total number
+                of entities matched.
+        """
+
+        snapshot = self._snapshot
+        keys = snapshot.indexes.get(order_by)
+        if keys is None or ids is not None:
+            entities = (
+                self.get_by_ids(ids)
+                if ids is not None
+                else list(snapshot.entities.values())
+            )
+            ordered = sorted(
+                entities,
+                key=lambda entity: getattr(entity, order_by),
+                reverse=descending,
+            )
+            return ordered[offset : offset + limit], len(ordered)
+
+        total = len(snapshot.entities)
+        if descending:
+            start, stop = max(total - offset - limit, 0), max(total - offset, 0)
+            selected = reversed(keys[start:stop])
+        else:
+            selected = keys[offset : offset + limit]
+
+        return [snapshot.entities[entity_id] for _, entity_id in selected], total
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[T], int]:
+        """
+        Asynchronously get a page of the entities sorted by a field; the page
+        is read from the current snapshot without blocking.
+
+        Args:
+            order_by (str): The field to sort by.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of entities skipped.
+            limit (int): The maximum number of entities returned.
+            ids (Set[uuid.UUID] | None): Only page the entities with these IDs.
+                Defaults to every entity.
+
+        Returns:
+            Tuple[List[T], int]: The entities of the page and the total number
+                of entities matched.
+        """
+
+        return self.page(order_by, descending, offset, limit, ids)
@@ -0,0 +1,18 @@
+from src.core._shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class InMemoryUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work for the in-memory repositories, which have no transaction:
+    the collected events are published when the block completes, and
+    discarded when it raises.
+    """
+
+    def _begin(self) -> None:
+        pass
+
+    def _commit(self) -> None:
+        self.publish(self.pull_events())
+
+    def _rollback(self, exc_type, exc, tb) -> None:
+        pass
@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, List
+
+
+class Timings:
+    """
+    Accumulated durations of the instrumented spans of one unit of work, such
+    as a request.
+
+    Each span name keeps its total duration in seconds and how many times it
+    was recorded.
+    """
+
+    __slots__ = ("spans",)
+
+    def __init__(self) -> None:
+        """
+        Initialize the Timings with no recorded spans.
+        """
+
+        self.spans: Dict[str, List[float]] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Record one occurrence of a span.
+
+        Args:
+            name (str): The name of the span.
+            seconds (float): The duration of the occurrence, in seconds.
+        """
+
+        span = self.spans.get(name)
+        if span is None:
+            self.spans[name] = [seconds, 1]
+        else:
+            span[0] += seconds
+            span[1] += 1
+
+
+_current_timings: ContextVar[Timings | None] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def start_timings() -> Token:
+    """
+    Start collecting the spans recorded in the current context.
+
+    Returns:
+        Token: The token to pass to stop_timings.
+    """
+
+    return _current_timings.set(Timings())
+
+
+def stop_timings(token: Token) -> None:
+    """
+    Stop collecting spans, restoring the previous collector.
+
+    Args:
+        token (Token): The token returned by start_timings.
+    """
+
+    _current_timings.reset(token)
+
+
+def current_timings() -> Timings | None:
+    """
+    Get the collector of the current context.
+
+    Returns:
+        Timings | None: The collector, or None when nothing is being timed.
+    """
+
+    return _current_timings.get()
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Record the duration of the block as a span of the current collector.
+
+    Does nothing but a context variable lookup when no collector is active,
+    so instrumentation points can stay in the hot paths.
+
+    Args:
+        name (str): The name of the span.
+    """
+
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
@@ -0,0 +1,481 @@
+import bisect
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value in the Prometheus text format.
+
+    Args:
+        value (float): The value to be formatted.
+
+    Returns:
+        str: The formatted value.
+    """
+
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value):
+        return f"{int(value)}.0"
+
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Format a label set in the Prometheus text format.
+
+    Args:
+        names (Sequence[str]): The label names.
+        values (Sequence[str]): The label values.
+
+    Returns:
+        str: The label set, e.g. `{method="GET"}`, or "" without labels.
+    """
+
+    if not names:
+        return ""
+
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+
+    return "{" + ",".join(pairs) + "}"
+
+
+class _CounterChild:
+    """
+    Value of a counter for one label set.
+    """
+
+    __slots__ = ("value", "lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount (float): The non-negative increment. Defaults to 1.
+        """
+
+        with self.lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    """
+    Value of a gauge for one label set.
+    """
+
+    __slots__ = ()
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Decrement the gauge.
+
+        Args:
+            amount (float): The decrement. Defaults to 1.
+        """
+
+        with self.lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge to the given value.
+
+        Args:
+            value (float): The new value.
+        """
+
+        self.value = value
+
+
+class _HistogramChild:
+    """
+    Buckets, sum and count of a histogram for one label set.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "lock")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        index = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Metric:
+    """
+    Base class of the metrics: a name, a help text and the children holding
+    the values of each label set.
+    """
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        """
+        Initialize the Metric.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str]): The label names. Defaults to no labels.
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.children: Dict[Tuple[str, ...], object] = {}
+        self.lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """
+        Get the child of the given label values, creating it on first use.
+
+        Args:
+            *values (str): The label values, in the order of the label names.
+
+        Returns:
+            The child holding the values of the label set.
+
+        Raises:
+            ValueError: If the number of values doesn't match the label names.
+        """
+
+        child = self.children.get(values)
+        if child is not None:
+            return child
+
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+
+        with self.lock:
+            return self.children.setdefault(values, self._new_child())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self) -> List[str]:
+        """
+        Render the samples of every label set.
+
+        Returns:
+            List[str]: The sample lines.
+        """
+
+        lines = []
+        for values, child in list(self.children.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, values)} "
+                f"{_format_value(child.value)}"  # type: ignore
+            )
+
+        return lines
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing value, such as the number of processed messages.
+    """
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the counter of a metric without labels.
+
+        Args:
+            amount (float): The non-negative increment. Defaults to 1.
+        """
+
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """
+    Value that goes up and down, such as the number of messages in flight.
+    """
+
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the gauge of a metric without labels.
+
+        Args:
+            amount (float): The increment. Defaults to 1.
+        """
+
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Decrement the gauge of a metric without labels.
+
+        Args:
+            amount (float): The decrement. Defaults to 1.
+        """
+
+        self.labels().dec(amount)
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values, such as latencies, in cumulative buckets.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize the Histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str]): The label names. Defaults to no labels.
+            buckets (Sequence[float]): The upper bounds of the buckets, the +Inf
+                bucket is implicit. Defaults to DEFAULT_BUCKETS.
+        """
+
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation on a metric without labels.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        self.labels().observe(value)
+
+    def samples(self) -> List[str]:
+        """
+        Render the cumulative buckets, sum and count of every label set.
+
+        Returns:
+            List[str]: The sample lines.
+        """
+
+        lines = []
+        bucket_labels = self.labelnames + ("le",)
+        for values, child in list(self.children.items()):
+            with child.lock:  # type: ignore
+                counts = list(child.counts)  # type: ignore
+                total = child.sum  # type: ignore
+
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, values + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together in the Prometheus text format.
+
+    Metrics are created through `counter`, `gauge` and `histogram`, which
+    return the already registered metric when the name is reused.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty MetricsRegistry.
+        """
+
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already a {metric.type}")
+
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str]): The label names. Defaults to no labels.
+
+        Returns:
+            Counter: The registered counter.
+        """
+
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Gauge:
+        """
+        Get or create a gauge.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str]): The label names. Defaults to no labels.
+
+        Returns:
+            Gauge: The registered gauge.
+        """
+
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Iterable[str]): The label names. Defaults to no labels.
+            buckets (Sequence[float]): The bucket upper bounds. Defaults to
+                DEFAULT_BUCKETS.
+
+        Returns:
+            Histogram: The registered histogram.
+        """
+
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def start_http_server(
+    port: int,
+    addr: str = "0.0.0.0",
+    registry: MetricsRegistry = REGISTRY,
+) -> ThreadingHTTPServer:
+    """
+    Serve the metrics of a registry over HTTP from a daemon thread, for
+    processes that don't run the web application, such as the consumer.
+
+    Args:
+        port (int): The port to listen on, 0 picks a free port.
+        addr (str): The address to bind. Defaults to all interfaces.
+        registry (MetricsRegistry): The registry to serve. Defaults to REGISTRY.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            content = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+
+    return server
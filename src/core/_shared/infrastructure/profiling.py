@@ -0,0 +1,338 @@
+import cProfile
+import os
+import random
+import re
+import signal
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator
+
+PROFILE_SUFFIX = ".prof"
+COLLAPSED_SUFFIX = ".folded"
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def frame_name(frame) -> str:
+    """
+    Format a stack frame as a collapsed stack entry.
+
+    Args:
+        frame: The frame to be formatted.
+
+    Returns:
+        str: The entry, e.g. `views.py:list`.
+    """
+
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """
+    Statistical profiler sampling the stack of one thread at a fixed interval
+    from a background thread, counting the collapsed stacks seen.
+
+    Unlike cProfile, the profiled code runs untouched, so the overhead doesn't
+    grow with the number of function calls.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        """
+        Initialize the StackSampler.
+
+        Args:
+            thread_id (int): The id of the thread to be sampled.
+            interval (float): The time between samples, in seconds. Defaults
+                to 5ms.
+        """
+
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def start(self) -> None:
+        """
+        Start sampling.
+        """
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling and wait for the sampler thread to finish.
+        """
+
+        self._stopped.set()
+        self._thread.join()
+
+
+class Profiler:
+    """
+    Opt-in profiler of units of work, such as requests or consumer messages.
+
+    A sampled fraction of the units is profiled while the profiler is enabled,
+    and any unit can be forced. Each profile is written to the directory as a
+    pstats file ("cprofile" mode) or as collapsed stacks ("sampling" mode),
+    keeping only the most recent `max_files`.
+    """
+
+    MODES = ("cprofile", "sampling")
+
+    def __init__(
+        self,
+        directory: str | Path | None,
+        mode: str = "cprofile",
+        sample_rate: float = 0.01,
+        enabled: bool = False,
+        max_files: int = 500,
+        interval: float = 0.005,
+    ) -> None:
+        """
+        Initialize the Profiler.
+
+        Args:
+            directory (str | Path | None): Where the profiles are written. None
+                disables the profiler, forced units included.
+            mode (str): "cprofile" or "sampling". Defaults to "cprofile".
+            sample_rate (float): Fraction of the units profiled while enabled.
+                Defaults to 0.01.
+            enabled (bool): Whether sampling starts enabled. Defaults to False.
+            max_files (int): How many profiles are kept. Defaults to 500.
+            interval (float): The sampling interval of the "sampling" mode, in
+                seconds. Defaults to 5ms.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode {mode}, use one of {self.MODES}")
+
+        self.directory = Path(directory) if directory else None
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.enabled = enabled
+        self.max_files = max_files
+        self.interval = interval
+        self._lock = threading.Lock()
+
+    def should_profile(self, force: bool = False) -> bool:
+        """
+        Decide whether a unit of work is profiled.
+
+        Args:
+            force (bool): Whether the unit explicitly asked to be profiled.
+
+        Returns:
+            bool: True if the unit should be profiled.
+        """
+
+        if self.directory is None:
+            return False
+        if force:
+            return True
+
+        return self.enabled and random.random() < self.sample_rate
+
+    def toggle(self, *args) -> None:
+        """
+        Enable or disable the sampling, usable as a signal handler.
+        """
+
+        self.enabled = not self.enabled
+
+    def install_signal_handler(self, signum: int = signal.SIGUSR2) -> bool:
+        """
+        Toggle the sampling whenever the process receives the signal.
+
+        Args:
+            signum (int): The signal number. Defaults to SIGUSR2.
+
+        Returns:
+            bool: True if the handler was installed, False outside the main
+                thread, where signal handlers can't be set.
+        """
+
+        try:
+            signal.signal(signum, self.toggle)
+        except ValueError:
+            return False
+
+        return True
+
+    @contextmanager
+    def profile(self, name: str, force: bool = False) -> Iterator[None]:
+        """
+        Profile the block if it is sampled or forced.
+
+        Args:
+            name (str): The name of the unit, part of the file name, e.g.
+                "GET-api-videos".
+            force (bool): Whether to profile regardless of the sampling.
+        """
+
+        if not self.should_profile(force):
+            yield
+            return
+
+        if self.mode == "cprofile":
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another unit of this process is already being profiled
+                yield
+                return
+            try:
+                yield
+            finally:
+                profile.disable()
+                self.write(name, PROFILE_SUFFIX, profile.dump_stats)
+        else:
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                self.write(name, COLLAPSED_SUFFIX, sampler_writer(sampler.stacks))
+
+    def write(self, name: str, suffix: str, writer) -> None:
+        """
+        Write a profile to the directory and drop the oldest ones.
+
+        Args:
+            name (str): The name of the unit.
+            suffix (str): The file suffix.
+            writer: Callable writing the profile to the path it receives.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)  # type: ignore
+        safe_name = _UNSAFE_NAME.sub("-", name).strip("-")[:80] or "unit"
+        path = self.directory / (  # type: ignore
+            f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}-"
+            f"{threading.get_ident()}-{safe_name}{suffix}"
+        )
+        writer(str(path))
+        self.rotate()
+
+    def rotate(self) -> None:
+        """
+        Delete the oldest profiles beyond `max_files`.
+        """
+
+        with self._lock:
+            files = sorted(
+                (
+                    path
+                    for path in self.directory.iterdir()  # type: ignore
+                    if path.suffix in (PROFILE_SUFFIX, COLLAPSED_SUFFIX)
+                ),
+                key=lambda path: path.stat().st_mtime,
+            )
+            for path in files[: max(len(files) - self.max_files, 0)]:
+                path.unlink(missing_ok=True)
+
+
+def sampler_writer(stacks: Counter):
+    """
+    Build a writer of collapsed stacks for Profiler.write.
+
+    Args:
+        stacks (Counter): The sample count of each collapsed stack.
+
+    Returns:
+        Callable writing the stacks, one `frame;frame count` line each.
+    """
+
+    def write(path: str) -> None:
+        with open(path, "w") as file:
+            for stack, count in stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+    return write
+
+
+def read_collapsed(paths: Iterable[Path]) -> Dict[str, int]:
+    """
+    Merge collapsed stack files.
+
+    Args:
+        paths (Iterable[Path]): The `.folded` files.
+
+    Returns:
+        Dict[str, int]: The total sample count of each stack.
+    """
+
+    stacks: Counter = Counter()
+    for path in paths:
+        with open(path) as file:
+            for line in file:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                if stack and count.isdigit():
+                    stacks[stack] += int(count)
+
+    return dict(stacks)
+
+
+def collapse_pstats(stats) -> Dict[str, int]:
+    """
+    Approximate collapsed stacks from cProfile statistics.
+
+    pstats only keeps caller/callee pairs, so each function's own time is
+    spread over its callers by their share of the calls, walking up to the
+    roots. Times are in microseconds; branches under 1us are dropped, which
+    keeps the walk bounded on large call graphs.
+
+    Args:
+        stats (pstats.Stats): The merged statistics.
+
+    Returns:
+        Dict[str, int]: The own time of each reconstructed stack.
+    """
+
+    entries = stats.stats
+    stacks: Counter = Counter()
+
+    def name(function) -> str:
+        filename, _, function_name = function
+        return f"{os.path.basename(filename)}:{function_name}"
+
+    def walk(function, path: tuple, seen: frozenset, weight: float) -> None:
+        callers = {
+            caller: caller_stats
+            for caller, caller_stats in entries[function][4].items()
+            if caller in entries and caller not in seen
+        }
+        total_calls = sum(caller_stats[0] for caller_stats in callers.values())
+        if not total_calls:
+            stacks[";".join(reversed(path))] += weight
+            return
+        for caller, caller_stats in callers.items():
+            share = weight * caller_stats[0] / total_calls
+            if share >= 1:
+                walk(caller, path + (name(caller),), seen | {caller}, share)
+
+    for function, (_, _, own_time, _, _) in entries.items():
+        walk(function, (name(function),), frozenset({function}), own_time * 1e6)
+
+    return {stack: round(value) for stack, value in stacks.items() if value >= 1}
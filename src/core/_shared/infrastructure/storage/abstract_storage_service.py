@@ -1,4 +1,30 @@
+import asyncio
+import functools
+import hashlib
 from abc import ABC, abstractmethod
+from typing import AsyncIterable, Iterable
+
+
+def sharded_path(directory: str, key: str, file_name: str) -> str:
+    """
+    Build the storage path of a file of a key, such as a video id, spreading
+    the keys over 65536 subdirectories so no directory grows to millions of
+    entries.
+
+    The shard comes from a hash of the key rather than from the key itself,
+    so keys sharing a prefix, such as time-ordered ids, spread as well.
+
+    Args:
+        directory (str): The top directory, e.g. "videos".
+        key (str): The key the file belongs to.
+        file_name (str): The name of the file.
+
+    Returns:
+        str: The path, e.g. "videos/3f/a8/<key>/<file_name>".
+    """
+
+    digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+    return f"{directory}/{digest[:2]}/{digest[2:4]}/{key}/{file_name}"
 
 
 class AbstractStorageService(ABC):
@@ -7,7 +33,7 @@ class AbstractStorageService(ABC):
     """
 
     @abstractmethod
-    def store(self, file_path: str, content: bytes, content_type: str):
+    def store(self, file_path: str, content: bytes, content_type: str) -> str:
         """
         Store a file in the storage service.
 
@@ -16,8 +42,78 @@ class AbstractStorageService(ABC):
             content (bytes): The content of the file.
             content_type (str): The type of the content.
 
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+
         Raises:
             NotImplementedError: If the method has not been implemented.
         """
 
         raise NotImplementedError
+
+    def store_stream(
+        self, file_path: str, chunks: Iterable[bytes], content_type: str
+    ) -> str:
+        """
+        Store a file given as a stream of chunks, such as an upload read from
+        the request body.
+
+        Services that can write while reading override it; by default the
+        chunks are joined and stored at once.
+
+        Args:
+            file_path (str): The path to store the file in.
+            chunks (Iterable[bytes]): The content of the file, in chunks.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        return self.store(file_path, b"".join(chunks), content_type)
+
+    async def astore(self, file_path: str, content: bytes, content_type: str) -> str:
+        """
+        Asynchronously store a file in the storage service.
+
+        Defaults to running `store` in the default executor of the event loop,
+        so the loop keeps serving other requests during the write. Services
+        with their own I/O pool or native async support should override it.
+
+        Args:
+            file_path (str): The path to store the file in.
+            content (bytes): The content of the file.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.store, file_path, content, content_type)
+        )
+
+    async def astore_stream(
+        self, file_path: str, chunks: AsyncIterable[bytes], content_type: str
+    ) -> str:
+        """
+        Asynchronously store a file given as an asynchronous stream of chunks,
+        such as an upload received by an ASGI handler.
+
+        Defaults to receiving every chunk and storing them at once with
+        `astore`.
+
+        Args:
+            file_path (str): The path to store the file in.
+            chunks (AsyncIterable[bytes]): The content of the file, in chunks.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        content = bytearray()
+        async for chunk in chunks:
+            content += chunk
+
+        return await self.astore(file_path, bytes(content), content_type)
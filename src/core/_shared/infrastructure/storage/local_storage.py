@@ -1,43 +1,501 @@
+import asyncio
+import functools
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import AsyncIterable, Iterable, Set
 
+from src.core._shared.infrastructure.metrics import REGISTRY
 from src.core._shared.infrastructure.storage.abstract_storage_service import (
     AbstractStorageService,
 )
 
+UPLOAD_BYTES = REGISTRY.counter(
+    "storage_upload_bytes_total",
+    "Bytes written to the storage.",
+)
+DEDUPLICATED_BYTES = REGISTRY.counter(
+    "storage_deduplicated_bytes_total",
+    "Bytes not written because the content was already stored.",
+)
+UPLOAD_DURATION = REGISTRY.histogram(
+    "storage_upload_duration_seconds",
+    "Time spent writing a file to the storage.",
+)
+UPLOAD_THROUGHPUT = REGISTRY.histogram(
+    "storage_upload_throughput_bytes_per_second",
+    "Write throughput of each file stored.",
+    buckets=(1e6, 5e6, 1e7, 5e7, 1e8, 2.5e8, 5e8, 1e9, 2.5e9),
+)
+
 
 class LocalStorage(AbstractStorageService):
     """
     LocalStorage service for storing files locally.
+
+    Content is stored once, as a blob named after its SHA-256 digest under
+    `blobs/`, and every path stored with that content is a hard link to the
+    blob. The link count of the blob is its reference count: storing content
+    already present skips the write, and blobs left without paths are deleted
+    by `collect_garbage`.
+
+    Content is written to a temporary file and linked into place, so a crash
+    never leaves a partial file under a stored path. With `fsync`, the file
+    and its directory are flushed to disk before the write returns.
+
+    The async methods run the disk work on a bounded I/O thread pool, shared
+    by the instances of the process unless one is given, so an ASGI handler
+    keeps receiving the next chunk of an upload while the previous one is
+    written.
     """
 
     TMP_BUCKET = "/tmp/codeflix-storage"
+    BLOBS_DIR = "blobs"
+    TMP_DIR = ".tmp"
+
+    # Directories known to exist, shared by the instances of the process so
+    # the per-request instances don't check them again
+    _known_directories: Set[str] = set()
+    _known_directories_lock = threading.Lock()
 
-    def __init__(self, bucket: str = TMP_BUCKET) -> None:
+    # Size of the I/O thread pool shared by the instances without an executor
+    IO_WORKERS = 8
+    _shared_executor: Executor | None = None
+    _shared_executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        bucket: str = TMP_BUCKET,
+        fsync: bool = True,
+        executor: Executor | None = None,
+    ) -> None:
         """
         Initialize the LocalStorage service.
 
         Args:
             bucket (str): The path to the root directory where files will be stored.
                 Defaults to /tmp/codeflix-storage.
+            fsync (bool): Whether writes are flushed to disk before returning.
+                Defaults to True.
+            executor (Executor | None): The pool running the disk work of the
+                async methods. Defaults to a pool of IO_WORKERS threads shared
+                by the process.
         """
 
         self.bucket = Path(bucket)
-        if not self.bucket.exists():
-            self.bucket.mkdir(parents=True)
+        self.blobs = self.bucket / self.BLOBS_DIR
+        self.tmp = self.bucket / self.TMP_DIR
+        self.fsync = fsync
+        self._executor = executor
+        self._ensure_directory(self.tmp)
+        self._ensure_directory(self.blobs)
+
+    def blob_path(self, check_sum: str) -> Path:
+        """
+        Get the path of the blob holding the content with the given checksum.
+
+        Args:
+            check_sum (str): The SHA-256 checksum of the content, in hex.
 
-    def store(self, file_path: str, content: bytes, content_type: str) -> None:
+        Returns:
+            Path: The blob path, sharded by the first bytes of the checksum.
+        """
+
+        return self.blobs / check_sum[:2] / check_sum[2:4] / check_sum
+
+    def refcount(self, check_sum: str) -> int:
+        """
+        Count the paths storing the content with the given checksum.
+
+        Args:
+            check_sum (str): The SHA-256 checksum of the content, in hex.
+
+        Returns:
+            int: The number of paths linked to the blob, 0 if it isn't stored.
+        """
+
+        try:
+            return self.blob_path(check_sum).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def store(self, file_path: str, content: bytes, content_type: str) -> str:
         """
         Store a file in the storage service.
 
+        The content is hashed before anything is written, so content already
+        stored is only linked to the new path.
+
+        Args:
+            file_path (str): The path to store the file in.
+            content (bytes): The content of the file.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        start = time.perf_counter()
+        check_sum = hashlib.sha256(content).hexdigest()
+        blob = self.blob_path(check_sum)
+
+        if blob.exists():
+            DEDUPLICATED_BYTES.inc(len(content))
+        else:
+            with self._temporary_file() as (file, temporary_path):
+                file.write(content)
+            if self._commit_blob(temporary_path, blob):
+                self._observe_upload(len(content), time.perf_counter() - start)
+            else:
+                DEDUPLICATED_BYTES.inc(len(content))
+
+        self._link(blob, self.bucket / file_path)
+
+        return check_sum
+
+    def store_stream(
+        self, file_path: str, chunks: Iterable[bytes], content_type: str
+    ) -> str:
+        """
+        Store a file given as a stream of chunks, hashing it while writing.
+
+        The chunks go to a temporary file; if the content turns out to be
+        stored already, the temporary file is dropped instead of kept.
+
+        Args:
+            file_path (str): The path to store the file in.
+            chunks (Iterable[bytes]): The content of the file, in chunks.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        writer = _StreamWriter(self)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.abort(*sys.exc_info())
+            raise
+
+        return writer.finish(file_path)
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The pool running the disk work of the async methods.
+
+        Returns:
+            Executor: The executor given to the instance, or the shared one.
+        """
+
+        if self._executor is not None:
+            return self._executor
+
+        if LocalStorage._shared_executor is None:
+            with LocalStorage._shared_executor_lock:
+                if LocalStorage._shared_executor is None:
+                    LocalStorage._shared_executor = ThreadPoolExecutor(
+                        max_workers=self.IO_WORKERS, thread_name_prefix="storage-io"
+                    )
+
+        return LocalStorage._shared_executor
+
+    async def astore(self, file_path: str, content: bytes, content_type: str) -> str:
+        """
+        Asynchronously store a file, hashing and writing it on the I/O pool.
+
         Args:
             file_path (str): The path to store the file in.
             content (bytes): The content of the file.
             content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(self.store, file_path, content, content_type),
+        )
+
+    async def astore_stream(
+        self, file_path: str, chunks: AsyncIterable[bytes], content_type: str
+    ) -> str:
+        """
+        Asynchronously store a file given as an asynchronous stream of chunks.
+
+        Each chunk is hashed and written on the I/O pool while the next one is
+        received, and at most one write per upload is in flight, so a slow
+        disk slows the upload down instead of buffering it in memory.
+
+        Args:
+            file_path (str): The path to store the file in.
+            chunks (AsyncIterable[bytes]): The content of the file, in chunks.
+            content_type (str): The type of the content.
+
+        Returns:
+            str: The SHA-256 checksum of the content, in hex.
+        """
+
+        loop = asyncio.get_running_loop()
+        writer = await loop.run_in_executor(
+            self.executor, functools.partial(_StreamWriter, self)
+        )
+        pending: Future | None = None
+        try:
+            async for chunk in chunks:
+                if pending is not None:
+                    await asyncio.wrap_future(pending)
+                pending = self.executor.submit(writer.write, chunk)
+            if pending is not None:
+                await asyncio.wrap_future(pending)
+        except BaseException:
+            # The write in flight, if any, finishes before the file is dropped
+            self.executor.submit(writer.abort, *sys.exc_info(), pending)
+            raise
+
+        return await loop.run_in_executor(
+            self.executor, functools.partial(writer.finish, file_path)
+        )
+
+    def delete(self, file_path: str) -> None:
+        """
+        Delete a stored path. Its blob is kept until `collect_garbage` runs,
+        even when no other path references it.
+
+        Args:
+            file_path (str): The path of the file to be deleted.
+        """
+
+        (self.bucket / file_path).unlink(missing_ok=True)
+
+    def collect_garbage(self) -> int:
+        """
+        Delete the blobs no stored path references anymore, left behind by
+        deleted or overwritten paths.
+
+        A blob being linked to a new path while it is collected is lost, so
+        run it while no upload is in progress.
+
+        Returns:
+            int: The number of bytes freed.
+        """
+
+        freed = 0
+        for blob in self.blobs.glob("*/*/*"):
+            stat = blob.stat()
+            if stat.st_nlink == 1:
+                blob.unlink(missing_ok=True)
+                freed += stat.st_size
+
+        return freed
+
+    def _ensure_directory(self, directory: Path) -> None:
+        """
+        Create a directory, unless this process already knows it exists.
+
+        Args:
+            directory (Path): The directory.
+        """
+
+        key = str(directory)
+        if key in self._known_directories:
+            return
+
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._known_directories_lock:
+            self._known_directories.add(key)
+
+    def _forget_directory(self, directory: Path) -> None:
+        """
+        Drop a directory from the known ones, after it was found missing.
+
+        Args:
+            directory (Path): The directory.
+        """
+
+        with self._known_directories_lock:
+            self._known_directories.discard(str(directory))
+
+    def _temporary_file(self):
+        """
+        Open a temporary file in the bucket, on the same filesystem as the
+        blobs so it can be linked into place.
+
+        Returns:
+            The context manager of the open file and its path.
+        """
+
+        try:
+            return _TemporaryFile(self.tmp, self.fsync)
+        except FileNotFoundError:
+            self._forget_directory(self.tmp)
+            self._ensure_directory(self.tmp)
+            return _TemporaryFile(self.tmp, self.fsync)
+
+    def _commit_blob(self, temporary_path: str, blob: Path) -> bool:
+        """
+        Link a fully written temporary file to its blob path, then drop it.
+
+        Creating the blob with a hard link fails if it already exists, unlike
+        a rename, so when concurrent uploads of the same content race, the
+        first one creates the blob and the others keep it: every stored path
+        ends up linked to the same inode and its link count stays right.
+
+        Args:
+            temporary_path (str): The temporary file.
+            blob (Path): The blob path.
+
+        Returns:
+            bool: True if the blob was created, False if another upload had
+                created it meanwhile.
+        """
+
+        self._ensure_directory(blob.parent)
+        try:
+            try:
+                os.link(temporary_path, blob)
+            except FileNotFoundError:
+                self._forget_directory(blob.parent)
+                self._ensure_directory(blob.parent)
+                os.link(temporary_path, blob)
+        except FileExistsError:
+            return False
+        finally:
+            os.unlink(temporary_path)
+        self._sync_directory(blob.parent)
+
+        return True
+
+    def _sync_directory(self, directory: Path) -> None:
+        """
+        Flush a directory entry change, such as a rename, to disk.
+
+        Args:
+            directory (Path): The directory.
         """
 
-        full_path = self.bucket / file_path
-        if not full_path.parent.exists():
-            full_path.parent.mkdir(parents=True)
+        if not self.fsync:
+            return
+
+        descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _link(self, blob: Path, full_path: Path) -> None:
+        """
+        Point a path to a blob, replacing what the path held before.
+
+        Args:
+            blob (Path): The blob path.
+            full_path (Path): The stored path.
+        """
+
+        self._ensure_directory(full_path.parent)
+        try:
+            if os.path.samefile(blob, full_path):
+                return
+        except FileNotFoundError:
+            pass
+
+        link = full_path.parent / (
+            f".{full_path.name}.{os.getpid()}.{time.time_ns()}.link"
+        )
+        try:
+            os.link(blob, link)
+        except FileNotFoundError:
+            self._forget_directory(full_path.parent)
+            self._ensure_directory(full_path.parent)
+            os.link(blob, link)
+        os.replace(link, full_path)
+        self._sync_directory(full_path.parent)
+
+    @staticmethod
+    def _observe_upload(size: int, elapsed: float) -> None:
+        UPLOAD_BYTES.inc(size)
+        UPLOAD_DURATION.observe(elapsed)
+        if elapsed > 0:
+            UPLOAD_THROUGHPUT.observe(size / elapsed)
+
+
+class _StreamWriter:
+    """
+    Writer of a stream of chunks to a temporary file, hashing it on the way,
+    then storing it as a blob linked to its path, or dropping it when the
+    content turns out to be stored already.
+    """
+
+    def __init__(self, storage: LocalStorage) -> None:
+        self.storage = storage
+        self.start = time.perf_counter()
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.temporary = storage._temporary_file()
+
+    def write(self, chunk: bytes) -> None:
+        self.digest.update(chunk)
+        self.temporary.file.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self, file_path: str) -> str:
+        self.temporary.__exit__(None, None, None)
+
+        check_sum = self.digest.hexdigest()
+        blob = self.storage.blob_path(check_sum)
+        if blob.exists():
+            os.unlink(self.temporary.path)
+            DEDUPLICATED_BYTES.inc(self.size)
+        elif self.storage._commit_blob(self.temporary.path, blob):
+            self.storage._observe_upload(self.size, time.perf_counter() - self.start)
+        else:
+            DEDUPLICATED_BYTES.inc(self.size)
+
+        self.storage._link(blob, self.storage.bucket / file_path)
+
+        return check_sum
+
+    def abort(self, exc_type, exc, traceback, pending: Future | None = None) -> None:
+        if pending is not None:
+            try:
+                pending.result()
+            except BaseException:
+                pass
+        self.temporary.__exit__(exc_type, exc, traceback)
+
+
+class _TemporaryFile:
+    """
+    Context manager of a named temporary file that is kept after closing, so
+    it can be linked, and deleted if the write fails.
+    """
+
+    def __init__(self, directory: Path, fsync: bool) -> None:
+        descriptor, self.path = tempfile.mkstemp(dir=directory)
+        self.file = os.fdopen(descriptor, "wb")
+        self.fsync = fsync
+
+    def __enter__(self):
+        return self.file, self.path
 
-        with open(full_path, "wb") as file:
-            file.write(content)
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        failed = exc_type is not None
+        try:
+            if not failed and self.fsync:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+        except OSError:
+            failed = True
+            raise
+        finally:
+            self.file.close()
+            if failed:
+                os.unlink(self.path)
@@ -0,0 +1,164 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+resource_id: ContextVar[str | None] = ContextVar("resource_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "request_id", "resource_id"}
+
+
+@contextmanager
+def correlation(
+    request: str | None = None, resource: str | None = None
+) -> Iterator[None]:
+    """
+    Bind correlation ids to every log record emitted inside the block.
+
+    Args:
+        request (str | None): The id of the request being handled.
+        resource (str | None): The id of the resource being processed, e.g. the
+            `resource_id` of a media message.
+    """
+
+    tokens = []
+    if request is not None:
+        tokens.append((request_id, request_id.set(request)))
+    if resource is not None:
+        tokens.append((resource_id, resource_id.set(resource)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Filter copying the correlation ids of the current context to the record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Attach the request and resource ids to the record.
+
+        Args:
+            record (logging.LogRecord): The record being logged.
+
+        Returns:
+            bool: Always True, records are never dropped.
+        """
+
+        record.request_id = request_id.get()
+        record.resource_id = resource_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter writing each record as one JSON object per line, including the
+    correlation ids and the fields passed through `extra`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format the record as JSON.
+
+        Args:
+            record (logging.LogRecord): The record to be formatted.
+
+        Returns:
+            str: The JSON line.
+        """
+
+        document = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in ("request_id", "resource_id"):
+            value = getattr(record, name, None)
+            if value is not None:
+                document[name] = value
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES:
+                document[name] = value
+        if record.exc_info:
+            document["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(document, default=str)
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Handler that hands records to a background thread, which formats and
+    writes them, so logging never blocks on stdout.
+
+    Unlike the stock QueueHandler, records are not formatted before being
+    enqueued: the message is only built, off the calling thread, for records
+    that pass the level checks.
+    """
+
+    def __init__(self, format: str = "json", stream=None) -> None:
+        """
+        Initialize the AsyncQueueHandler and start its listener thread.
+
+        Args:
+            format (str): "json" for JSON lines, or "text" for a plain format.
+                Defaults to "json".
+            stream: The stream written by the listener. Defaults to stdout.
+        """
+
+        super().__init__(queue.SimpleQueue())
+        self.addFilter(CorrelationFilter())
+        target = logging.StreamHandler(stream or sys.stdout)
+        target.setFormatter(
+            JsonFormatter()
+            if format == "json"
+            else logging.Formatter(
+                "%(asctime)s %(levelname)s %(name)s "
+                "[%(request_id)s %(resource_id)s] %(message)s"
+            )
+        )
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        atexit.register(self.stop_listener)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue the record as is, leaving the formatting to the listener.
+
+        Args:
+            record (logging.LogRecord): The record being logged.
+
+        Returns:
+            logging.LogRecord: The same record.
+        """
+
+        return record
+
+    def stop_listener(self) -> None:
+        """
+        Write the pending records and stop the listener thread, once.
+        """
+
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def close(self) -> None:
+        """
+        Flush the pending records and stop the listener thread.
+        """
+
+        self.stop_listener()
+        super().close()
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core._shared.application.unit_of_work import deduplicate
+from src.core._shared.domain.entity import AbstractEntity
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.event import Event
+from src.core._shared.infrastructure.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+@dataclass(frozen=True)
+class Renamed(Event):
+    """
+    Dummy event
+    """
+
+    name: str
+
+
+class Aggregate(AbstractEntity):
+    """
+    Dummy aggregate
+    """
+
+    def validate(self):
+        pass
+
+
+class TestUnitOfWork:
+    """
+    Test the event publication of a unit of work.
+    """
+
+    def test_publishes_collected_events_once_after_the_block(self):
+        message_bus = create_autospec(AbstractMessageBus)
+        aggregate = Aggregate()
+
+        with InMemoryUnitOfWork(message_bus) as uow:
+            aggregate.dispatch(Renamed(name="a"))
+            uow.collect(aggregate)
+            uow.add_event(Renamed(name="integration"))
+            message_bus.handle.assert_not_called()
+
+        message_bus.handle.assert_called_once_with(
+            [Renamed(name="a"), Renamed(name="integration")]
+        )
+        assert aggregate.events == []
+
+    def test_deduplicates_events(self):
+        message_bus = create_autospec(AbstractMessageBus)
+        aggregate = Aggregate()
+
+        with InMemoryUnitOfWork(message_bus) as uow:
+            aggregate.dispatch(Renamed(name="a"))
+            aggregate.dispatch(Renamed(name="a"))
+            uow.collect(aggregate, aggregate)
+            uow.add_event(Renamed(name="a"))
+
+        message_bus.handle.assert_called_once_with([Renamed(name="a")])
+
+    def test_discards_events_when_the_block_raises(self):
+        message_bus = create_autospec(AbstractMessageBus)
+        uow = InMemoryUnitOfWork(message_bus)
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.add_event(Renamed(name="a"))
+                raise RuntimeError
+
+        with uow:
+            pass
+
+        message_bus.handle.assert_not_called()
+
+    def test_deduplicate_keeps_first_occurrence_order(self):
+        events = [Renamed(name="b"), Renamed(name="a"), Renamed(name="b")]
+
+        assert deduplicate(events) == [Renamed(name="b"), Renamed(name="a")]
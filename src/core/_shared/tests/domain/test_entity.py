@@ -1,8 +1,13 @@
 from unittest.mock import create_autospec
 
+import pytest
+
 from src.core._shared.domain.entity import AbstractEntity
 from src.core._shared.events.abstract_message_bus import AbstractMessageBus
 from src.core._shared.events.event import Event
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
 
 
 class DummyEvent(Event):
@@ -48,3 +53,32 @@ class TestDispatch:
         entity.dispatch(DummyEvent())
         assert entity.events == [DummyEvent()]
         mock_message_bus.handle.assert_called_once_with(entity.events)
+
+
+class TestLazyAllocation:
+    """
+    Test that entities only allocate what they use
+    """
+
+    def test_valid_entity_allocates_nothing(self):
+        entity = DummyEntity()
+        entity.raise_if_invalid()
+
+        assert entity._notification is None
+        assert entity._events is None
+        assert entity.message_bus is None
+
+    def test_concrete_entities_are_slotted(self):
+        for entity in (
+            Category(name="Drama"),
+            Genre(name="Drama"),
+            CastMember(name="John Doe", type=CastMemberType.ACTOR),
+        ):
+            assert not hasattr(entity, "__dict__")
+
+    def test_errors_are_raised_once_collected(self):
+        entity = DummyEntity()
+        entity.notification.add_error("Name cannot be empty")
+
+        with pytest.raises(ValueError, match="Name cannot be empty"):
+            entity.raise_if_invalid()
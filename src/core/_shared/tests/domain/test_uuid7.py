@@ -0,0 +1,40 @@
+import time
+import uuid
+
+import pytest
+
+from src.core._shared.domain.uuid7 import uuid7, uuid7_time_ms
+from src.core.category.domain.category import Category
+
+
+class TestUUID7:
+    """
+    Test the UUIDv7 generator
+    """
+
+    def test_sets_version_and_variant(self):
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_encodes_the_creation_time(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= uuid7_time_ms(value) <= after + 1
+
+    def test_ids_are_strictly_increasing(self):
+        values = [uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        assert [str(value) for value in values] == sorted(map(str, values))
+
+    def test_time_of_other_versions_raises(self):
+        with pytest.raises(ValueError, match="not a version 7 UUID"):
+            uuid7_time_ms(uuid.uuid4())
+
+    def test_entities_default_to_uuid7(self):
+        assert Category(name="Movie").id.version == 7
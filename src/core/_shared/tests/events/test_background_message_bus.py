@@ -0,0 +1,281 @@
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from src.core._shared.application.handler import AbstractHandler
+from src.core._shared.events.background_message_bus import BackgroundMessageBus
+from src.core._shared.events.event import Event
+from src.core._shared.events.message_bus import MessageBus
+from src.core._shared.infrastructure.events.sqlite_spill_store import (
+    SqliteSpillStore,
+)
+from src.core._shared.infrastructure.structured_logging import correlation, request_id
+
+
+@dataclass(frozen=True)
+class DummyEvent(Event):
+    """
+    Dummy event
+    """
+
+    number: int = 0
+
+
+class RecordingHandler(AbstractHandler):
+    """
+    Handler recording the events and request ids it sees, optionally waiting
+    for a gate before handling.
+    """
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.gate = gate
+        self.events: list = []
+        self.request_ids: list = []
+
+    def handle(self, event: Event) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.events.append(event)
+        self.request_ids.append(request_id.get())
+
+
+def bus_factory(handler: AbstractHandler):
+    def build() -> MessageBus:
+        bus = MessageBus()
+        bus.handlers = {DummyEvent: [handler]}
+        return bus
+
+    return build
+
+
+class TestBackgroundMessageBus:
+    """
+    Test the background message bus
+    """
+
+    def test_handles_events_in_workers_and_drains(self):
+        handler = RecordingHandler()
+        bus = BackgroundMessageBus(workers=2, bus_factory=bus_factory(handler))
+
+        with correlation(request="req-1"):
+            bus.handle([DummyEvent(number) for number in range(10)])
+        assert bus.drain(timeout=5)
+
+        assert sorted(event.number for event in handler.events) == list(range(10))
+        assert set(handler.request_ids) == {"req-1"}
+
+    def test_handle_does_not_wait_for_handlers(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        bus = BackgroundMessageBus(workers=1, bus_factory=bus_factory(handler))
+
+        bus.handle([DummyEvent()])
+        assert handler.events == []
+
+        gate.set()
+        bus.drain(timeout=5)
+        assert handler.events == [DummyEvent()]
+
+    def test_drop_policy_discards_events_when_full(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        bus = BackgroundMessageBus(
+            workers=1, max_queued=1, policy="drop", bus_factory=bus_factory(handler)
+        )
+
+        bus.handle([DummyEvent(0)])
+        while bus._queue.qsize():
+            pass
+        bus.handle([DummyEvent(1), DummyEvent(2), DummyEvent(3)])
+
+        gate.set()
+        bus.drain(timeout=5)
+        assert [event.number for event in handler.events] == [0, 1]
+
+    def test_spill_policy_replays_spilled_events(self, tmp_path):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        store = SqliteSpillStore(str(tmp_path / "spill.sqlite3"))
+        bus = BackgroundMessageBus(
+            workers=1,
+            max_queued=1,
+            policy="spill",
+            spill_store=store,
+            bus_factory=bus_factory(handler),
+            idle_interval=0.01,
+        )
+
+        with correlation(request="req-1"):
+            bus.handle([DummyEvent(0)])
+            while bus._queue.qsize():
+                pass
+            bus.handle([DummyEvent(1), DummyEvent(2), DummyEvent(3)])
+        assert len(store) == 2
+
+        gate.set()
+        while len(store) or bus._queue.unfinished_tasks:
+            pass
+        bus.drain(timeout=5)
+        assert [event.number for event in handler.events] == [0, 1, 2, 3]
+        assert set(handler.request_ids) == {"req-1"}
+
+    def test_spilled_events_stay_stored_until_handled(self, tmp_path):
+        store = SqliteSpillStore(str(tmp_path / "spill.sqlite3"))
+        stored: list = []
+
+        class StoreSizeHandler(RecordingHandler):
+            def handle(self, event: Event) -> None:
+                stored.append(len(store))
+                super().handle(event)
+
+        gate = threading.Event()
+        handler = StoreSizeHandler(gate)
+        bus = BackgroundMessageBus(
+            workers=1,
+            max_queued=1,
+            policy="spill",
+            spill_store=store,
+            bus_factory=bus_factory(handler),
+            idle_interval=0.01,
+        )
+
+        bus.handle([DummyEvent(0)])
+        while bus._queue.qsize():
+            pass
+        bus.handle([DummyEvent(1), DummyEvent(2), DummyEvent(3)])
+
+        gate.set()
+        while len(store) or bus._queue.unfinished_tasks:
+            pass
+        bus.drain(timeout=5)
+        assert [event.number for event in handler.events] == [0, 1, 2, 3]
+        assert stored[-2:] == [2, 1]
+
+    def test_block_policy_waits_for_room_without_holding_the_bus(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        bus = BackgroundMessageBus(
+            workers=1, max_queued=1, bus_factory=bus_factory(handler)
+        )
+
+        bus.handle([DummyEvent(0)])
+        while bus._queue.qsize():
+            pass
+        bus.handle([DummyEvent(1)])
+        producer = threading.Thread(target=bus.handle, args=([DummyEvent(2)],))
+        producer.start()
+        producer.join(0.1)
+        assert producer.is_alive()
+
+        assert bus._state.acquire(timeout=1)
+        bus._state.release()
+
+        gate.set()
+        producer.join(5)
+        bus.drain(timeout=5)
+        assert [event.number for event in handler.events] == [0, 1, 2]
+
+    def test_handles_inline_after_drain(self):
+        handler = RecordingHandler()
+        bus = BackgroundMessageBus(workers=1, bus_factory=bus_factory(handler))
+        bus.drain(timeout=5)
+
+        bus.handle([DummyEvent()])
+
+        assert handler.events == [DummyEvent()]
+
+    def test_events_queued_while_draining_are_handled(self, monkeypatch):
+        handler = RecordingHandler()
+        bus = BackgroundMessageBus(workers=1, bus_factory=bus_factory(handler))
+        putting, proceed = threading.Event(), threading.Event()
+        put = bus._put
+
+        def slow_put(event: Event) -> None:
+            putting.set()
+            proceed.wait(5)
+            put(event)
+
+        monkeypatch.setattr(bus, "_put", slow_put)
+        producer = threading.Thread(target=bus.handle, args=([DummyEvent(1)],))
+        producer.start()
+        putting.wait(5)
+        drainer = threading.Thread(target=bus.drain, args=(5,))
+        drainer.start()
+        drainer.join(0.1)
+
+        proceed.set()
+        producer.join(5)
+        drainer.join(5)
+
+        assert handler.events == [DummyEvent(1)]
+
+    def test_rejects_unknown_policy_and_spill_without_store(self):
+        with pytest.raises(ValueError, match="Unknown message bus policy"):
+            BackgroundMessageBus(policy="lose")
+        with pytest.raises(ValueError, match="requires a spill store"):
+            BackgroundMessageBus(policy="spill")
+
+
+class TestSqliteSpillStore:
+    """
+    Test the spill store
+    """
+
+    def test_claims_oldest_events_first_and_survives_reopening(self, tmp_path):
+        path = str(tmp_path / "spill.sqlite3")
+        store = SqliteSpillStore(path)
+        for number in range(3):
+            store.push(DummyEvent(number), f"req-{number}")
+        store.close()
+
+        reopened = SqliteSpillStore(path)
+        claimed = reopened.claim(2)
+        assert [(request, event) for _, request, event in claimed] == [
+            ("req-0", DummyEvent(0)),
+            ("req-1", DummyEvent(1)),
+        ]
+        assert [event for _, _, event in reopened.claim(2)] == [DummyEvent(2)]
+        assert reopened.claim(2) == []
+
+        for id, _, _ in claimed:
+            reopened.ack(id)
+        assert len(reopened) == 1
+
+    def test_released_and_expired_claims_are_claimed_again(self, tmp_path):
+        path = str(tmp_path / "spill.sqlite3")
+        store = SqliteSpillStore(path)
+        store.push(DummyEvent(0))
+        store.push(DummyEvent(1))
+        [(first, _, _), _] = store.claim(2)
+        store.release(first)
+        assert [event for _, _, event in store.claim(2)] == [DummyEvent(0)]
+        # The process holding the claims died before handling the events
+        store.close()
+
+        reopened = SqliteSpillStore(path, lease=0)
+        assert [event for _, _, event in reopened.claim(2)] == [
+            DummyEvent(0),
+            DummyEvent(1),
+        ]
+        assert len(reopened) == 2
+
+    def test_adds_the_claim_columns_to_an_older_table(self, tmp_path):
+        path = str(tmp_path / "spill.sqlite3")
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE spilled_events "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, event BLOB NOT NULL)"
+            )
+            connection.execute(
+                "INSERT INTO spilled_events (event) VALUES (?)",
+                (pickle.dumps(DummyEvent(0)),),
+            )
+        connection.close()
+
+        store = SqliteSpillStore(path)
+        assert [(request, event) for _, request, event in store.claim(1)] == [
+            (None, DummyEvent(0))
+        ]
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+from src.core._shared.infrastructure.events.in_memory_broadcaster import (
+    InMemoryBroadcaster,
+)
+
+
+class TestInMemoryBroadcaster:
+    """
+    Test the in-memory broadcaster
+    """
+
+    def test_delivers_messages_to_every_subscriber_of_the_channel(self):
+        """
+        Tests that a message reaches all the subscribers of its channel and only them.
+        """
+
+        broadcaster = InMemoryBroadcaster()
+
+        async def scenario():
+            first = broadcaster.subscribe(["videos.1"])
+            second = broadcaster.subscribe(["videos.1", "videos.2"])
+            other = broadcaster.subscribe(["videos.3"])
+
+            broadcaster.publish("videos.1", {"status": "COMPLETED"})
+
+            received = [await first.get(), await second.get()]
+            assert other.queue.empty()
+            return received
+
+        assert asyncio.run(scenario()) == [
+            {"status": "COMPLETED"},
+            {"status": "COMPLETED"},
+        ]
+
+    def test_delivers_messages_published_from_other_threads(self):
+        """
+        Tests that messages published by another thread are delivered on the
+        subscriber event loop.
+        """
+
+        broadcaster = InMemoryBroadcaster()
+
+        async def scenario():
+            subscription = broadcaster.subscribe(["videos.1"])
+            publisher = threading.Thread(
+                target=broadcaster.publish,
+                args=("videos.1", {"status": "PROCESSING"}),
+            )
+            publisher.start()
+            message = await asyncio.wait_for(subscription.get(), timeout=1)
+            publisher.join()
+            return message
+
+        assert asyncio.run(scenario()) == {"status": "PROCESSING"}
+
+    def test_drops_oldest_message_when_subscriber_falls_behind(self):
+        """
+        Tests that a slow subscriber keeps only the most recent messages.
+        """
+
+        broadcaster = InMemoryBroadcaster(max_pending=2)
+
+        async def scenario():
+            subscription = broadcaster.subscribe(["videos.1"])
+            for status in ["PENDING", "PROCESSING", "COMPLETED"]:
+                broadcaster.publish("videos.1", {"status": status})
+            await asyncio.sleep(0)
+            return [await subscription.get(), await subscription.get()]
+
+        assert asyncio.run(scenario()) == [
+            {"status": "PROCESSING"},
+            {"status": "COMPLETED"},
+        ]
+
+    def test_close_removes_subscription(self):
+        """
+        Tests that closing a subscription unsubscribes it from every channel.
+        """
+
+        broadcaster = InMemoryBroadcaster()
+
+        async def scenario():
+            subscription = broadcaster.subscribe(["videos.1", "videos.2"])
+            subscription.close()
+
+        asyncio.run(scenario())
+
+        assert broadcaster.subscriptions == {}
@@ -0,0 +1,206 @@
+import threading
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from src.core._shared.application.use_cases.list import InvalidOrderBy, ListRequest
+from src.core.category.application.use_cases.list_category import ListCategory
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+
+
+@pytest.fixture
+def categories():
+    return [
+        Category(name=name, description=f"{name} movies")
+        for name in ("Drama", "Action", "Horror", "Comedy", "Anime")
+    ]
+
+
+class TestInMemoryRepository:
+    """
+    Test the indexed, copy-on-write in-memory repository
+    """
+
+    def test_pages_follow_the_name_index(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        page, total = repository.page("name", False, offset=1, limit=3)
+        assert [category.name for category in page] == ["Anime", "Comedy", "Drama"]
+        assert total == 5
+
+        page, _ = repository.page("name", True, offset=0, limit=2)
+        assert [category.name for category in page] == ["Horror", "Drama"]
+
+        page, _ = repository.page("name", True, offset=4, limit=2)
+        assert [category.name for category in page] == ["Action"]
+
+    def test_pages_on_fields_without_index_are_sorted(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        page, total = repository.page("description", False, offset=0, limit=2)
+
+        assert [category.name for category in page] == ["Action", "Anime"]
+        assert total == 5
+
+    def test_updates_and_deletes_keep_the_index_sorted(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+        drama = categories[0]
+
+        drama.update_category(name="Biography", description="Biographies")
+        repository.update(drama)
+        repository.delete(categories[1].id)
+
+        page, total = repository.page("name", False, offset=0, limit=10)
+        assert [category.name for category in page] == [
+            "Anime",
+            "Biography",
+            "Comedy",
+            "Horror",
+        ]
+        assert total == 4
+        assert repository.get_by_id(drama.id) is drama
+
+    def test_saving_an_existing_id_replaces_it(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        repository.save(categories[0])
+
+        assert len(repository.list()) == 5
+
+    def test_save_all_indexes_new_and_replaced_entities(self, categories):
+        repository = InMemoryCategoryRepository(categories[:3])
+        drama = categories[0]
+        drama.update_category(name="Biography", description="Biographies")
+        listed = repository.list()
+
+        repository.save_all([drama, *categories[3:]])
+
+        page, total = repository.page("name", False, offset=0, limit=10)
+        assert [category.name for category in page] == [
+            "Action",
+            "Anime",
+            "Biography",
+            "Comedy",
+            "Horror",
+        ]
+        assert total == 5
+        assert repository.list() == categories
+        assert len(listed) == 3
+
+    def test_seeds_large_repositories_in_one_snapshot(self):
+        categories = [Category(name=f"Category {index}") for index in range(20_000)]
+
+        repository = InMemoryCategoryRepository(categories)
+
+        page, total = repository.page("name", True, offset=0, limit=1)
+        assert [category.name for category in page] == ["Category 9999"]
+        assert total == 20_000
+
+    def test_readers_keep_their_snapshot(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+        listed = repository.list()
+
+        repository.delete(categories[0].id)
+
+        assert len(listed) == 5
+        assert len(repository.list()) == 4
+
+    def test_concurrent_writes_are_not_lost(self):
+        repository = InMemoryCategoryRepository()
+
+        def save_many():
+            for index in range(200):
+                repository.save(Category(name=f"Category {index}"))
+
+        threads = [threading.Thread(target=save_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        page, total = repository.page("name", False, offset=0, limit=1000)
+        assert total == 800
+        assert [category.name for category in page] == sorted(
+            category.name for category in repository.list()
+        )
+
+    def test_list_use_case_pages_through_the_index(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        response = ListCategory(repository=repository).execute(
+            ListRequest(order_by="name", sort="desc", current_page=2)
+        )
+
+        assert [category.name for category in response["data"]] == [
+            "Comedy",
+            "Anime",
+        ]
+        assert response["meta"].total == 5
+
+    def test_list_use_case_pages_asynchronously(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        response = async_to_sync(ListCategory(repository=repository).aexecute)(
+            ListRequest(order_by="name", sort="asc", current_page=1)
+        )
+
+        assert [category.name for category in response["data"]] == [
+            "Action",
+            "Anime",
+        ]
+
+    def test_list_use_case_rejects_fields_outside_sortable_fields(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+        repository.sortable_fields = ("name", "id")
+
+        with pytest.raises(InvalidOrderBy, match="Cannot order by description"):
+            ListCategory(repository=repository).execute(
+                ListRequest(order_by="description")
+            )
+
+    def test_get_by_ids_skips_missing_and_repeated_ids(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+
+        found = repository.get_by_ids(
+            [categories[2].id, uuid.uuid4(), categories[0].id, categories[2].id]
+        )
+
+        assert found == [categories[2], categories[0]]
+
+    def test_list_use_case_lists_every_requested_id_in_one_page(self, categories):
+        repository = InMemoryCategoryRepository(categories)
+        ids = {category.id for category in categories[:3]} | {uuid.uuid4()}
+
+        response = ListCategory(repository=repository).execute(
+            ListRequest(order_by="name", ids=ids)
+        )
+
+        assert [category.name for category in response["data"]] == [
+            "Action",
+            "Drama",
+            "Horror",
+        ]
+        assert response["meta"].per_page == 4
+        assert response["meta"].total == 3
+
+    def test_list_use_case_reads_requested_ids_from_repositories_without_pages(
+        self, categories
+    ):
+        repository = create_autospec(CategoryRepository)
+        repository.get_by_ids.return_value = categories[:2]
+
+        response = ListCategory(repository=repository).execute(
+            ListRequest(order_by="name", ids={categories[0].id, categories[1].id})
+        )
+
+        repository.list.assert_not_called()
+        assert [category.name for category in response["data"]] == [
+            "Action",
+            "Drama",
+        ]
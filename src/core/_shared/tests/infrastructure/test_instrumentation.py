@@ -0,0 +1,45 @@
+from src.core._shared.infrastructure.instrumentation import (
+    current_timings,
+    start_timings,
+    stop_timings,
+    timed,
+)
+
+
+class TestTimed:
+    """
+    Test the instrumentation spans
+    """
+
+    def test_does_nothing_without_collector(self):
+        """
+        Tests that timed blocks run normally when nothing is being timed.
+        """
+
+        with timed("db"):
+            pass
+
+        assert current_timings() is None
+
+    def test_accumulates_spans_of_the_current_collector(self):
+        """
+        Tests that every occurrence of a span adds to its duration and count.
+        """
+
+        token = start_timings()
+        try:
+            with timed("db"):
+                pass
+            with timed("db"):
+                pass
+            with timed("use_case"):
+                pass
+            timings = current_timings()
+        finally:
+            stop_timings(token)
+
+        assert timings is not None
+        assert timings.spans["db"][1] == 2
+        assert timings.spans["use_case"][1] == 1
+        assert timings.spans["db"][0] >= 0
+        assert current_timings() is None
@@ -0,0 +1,257 @@
+import asyncio
+import hashlib
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from src.core._shared.infrastructure.storage.abstract_storage_service import (
+    AbstractStorageService,
+    sharded_path,
+)
+from src.core._shared.infrastructure.storage.local_storage import (
+    DEDUPLICATED_BYTES,
+    LocalStorage,
+)
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalStorage:
+    return LocalStorage(bucket=str(tmp_path))
+
+
+class TestLocalStorage:
+    """
+    Test the content-addressed local storage
+    """
+
+    def test_stores_content_under_its_checksum(self, storage, tmp_path):
+        check_sum = storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+
+        assert check_sum == hashlib.sha256(b"movie").hexdigest()
+        assert (tmp_path / "videos/1/movie.mp4").read_bytes() == b"movie"
+        assert storage.blob_path(check_sum).read_bytes() == b"movie"
+        assert storage.refcount(check_sum) == 1
+
+    def test_links_duplicate_content_to_the_same_blob(self, storage, tmp_path):
+        deduplicated = DEDUPLICATED_BYTES.labels().value
+
+        first = storage.store("videos/1/trailer.mp4", b"trailer", "video/mp4")
+        second = storage.store("videos/2/trailer.mp4", b"trailer", "video/mp4")
+
+        assert first == second
+        assert storage.refcount(first) == 2
+        assert (tmp_path / "videos/1/trailer.mp4").samefile(
+            tmp_path / "videos/2/trailer.mp4"
+        )
+        assert DEDUPLICATED_BYTES.labels().value - deduplicated == len(b"trailer")
+
+    def test_hashes_streams_while_writing(self, storage, tmp_path):
+        check_sum = storage.store_stream(
+            "videos/1/movie.mp4", iter([b"mo", b"vie"]), "video/mp4"
+        )
+        duplicate = storage.store_stream(
+            "videos/2/movie.mp4", iter([b"movie"]), "video/mp4"
+        )
+
+        assert check_sum == duplicate == hashlib.sha256(b"movie").hexdigest()
+        assert storage.refcount(check_sum) == 2
+        assert list((tmp_path / LocalStorage.TMP_DIR).iterdir()) == []
+
+    def test_racing_upload_of_the_same_content_keeps_the_blob(
+        self, storage, tmp_path, monkeypatch
+    ):
+        deduplicated = DEDUPLICATED_BYTES.labels().value
+        check_sum = storage.store("videos/1/trailer.mp4", b"trailer", "video/mp4")
+        blob = storage.blob_path(check_sum)
+
+        # An upload that checked for the blob before the first one created it
+        monkeypatch.setattr(Path, "exists", lambda path: False)
+        storage.store("videos/2/trailer.mp4", b"trailer", "video/mp4")
+        monkeypatch.undo()
+
+        assert storage.refcount(check_sum) == 2
+        assert (tmp_path / "videos/1/trailer.mp4").samefile(blob)
+        assert (tmp_path / "videos/2/trailer.mp4").samefile(blob)
+        assert list((tmp_path / LocalStorage.TMP_DIR).iterdir()) == []
+        assert DEDUPLICATED_BYTES.labels().value - deduplicated == len(b"trailer")
+
+    def test_storing_the_same_path_again_is_a_no_op(self, storage):
+        check_sum = storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+        storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+
+        assert storage.refcount(check_sum) == 1
+
+    def test_overwriting_a_path_releases_the_previous_blob(self, storage, tmp_path):
+        old = storage.store("videos/1/movie.mp4", b"old cut", "video/mp4")
+        new = storage.store("videos/1/movie.mp4", b"new cut", "video/mp4")
+
+        assert (tmp_path / "videos/1/movie.mp4").read_bytes() == b"new cut"
+        assert storage.refcount(old) == 0
+        assert storage.refcount(new) == 1
+        assert storage.collect_garbage() == len(b"old cut")
+        assert not storage.blob_path(old).exists()
+
+    def test_collects_blobs_without_paths(self, storage):
+        check_sum = storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+        storage.store("videos/2/movie.mp4", b"movie", "video/mp4")
+
+        storage.delete("videos/1/movie.mp4")
+        assert storage.collect_garbage() == 0
+
+        storage.delete("videos/2/movie.mp4")
+        assert storage.collect_garbage() == len(b"movie")
+        assert storage.refcount(check_sum) == 0
+
+    def test_failed_stream_leaves_no_file(self, storage, tmp_path):
+        def chunks():
+            yield b"partial"
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            storage.store_stream("videos/1/movie.mp4", chunks(), "video/mp4")
+
+        assert not (tmp_path / "videos/1/movie.mp4").exists()
+        assert list((tmp_path / LocalStorage.TMP_DIR).iterdir()) == []
+
+    def test_writes_without_fsync(self, tmp_path):
+        storage = LocalStorage(bucket=str(tmp_path), fsync=False)
+
+        check_sum = storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+
+        assert storage.blob_path(check_sum).read_bytes() == b"movie"
+
+    def test_recreates_directories_removed_behind_its_back(self, storage, tmp_path):
+        storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+        shutil.rmtree(tmp_path / "videos")
+        shutil.rmtree(tmp_path / LocalStorage.TMP_DIR)
+
+        storage.store("videos/1/movie.mp4", b"movie", "video/mp4")
+
+        assert (tmp_path / "videos/1/movie.mp4").read_bytes() == b"movie"
+
+
+async def receive(*chunks: bytes):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+class TestAsyncLocalStorage:
+    """
+    Test the async methods of the local storage
+    """
+
+    def test_astore_writes_on_the_io_pool(self, tmp_path):
+        threads = []
+        with ThreadPoolExecutor(1, thread_name_prefix="test-io") as executor:
+            storage = LocalStorage(bucket=str(tmp_path), executor=executor)
+            store = storage.store
+
+            def recording_store(*args):
+                threads.append(threading.current_thread().name)
+                return store(*args)
+
+            storage.store = recording_store
+            check_sum = async_to_sync(storage.astore)(
+                "videos/1/movie.mp4", b"movie", "video/mp4"
+            )
+
+        assert check_sum == hashlib.sha256(b"movie").hexdigest()
+        assert (tmp_path / "videos/1/movie.mp4").read_bytes() == b"movie"
+        assert threads[0].startswith("test-io")
+
+    def test_astore_stream_hashes_while_receiving(self, storage, tmp_path):
+        check_sum = async_to_sync(storage.astore_stream)(
+            "videos/1/movie.mp4", receive(b"mo", b"v", b"ie"), "video/mp4"
+        )
+        duplicate = async_to_sync(storage.astore_stream)(
+            "videos/2/movie.mp4", receive(b"movie"), "video/mp4"
+        )
+
+        assert check_sum == duplicate == hashlib.sha256(b"movie").hexdigest()
+        assert (tmp_path / "videos/1/movie.mp4").read_bytes() == b"movie"
+        assert storage.refcount(check_sum) == 2
+        assert list((tmp_path / LocalStorage.TMP_DIR).iterdir()) == []
+
+    def test_concurrent_uploads_share_the_pool(self, tmp_path):
+        with ThreadPoolExecutor(2) as executor:
+            storage = LocalStorage(bucket=str(tmp_path), executor=executor)
+
+            async def upload_all():
+                return await asyncio.gather(
+                    *(
+                        storage.astore_stream(
+                            f"videos/{index}/movie.mp4",
+                            receive(b"movie-", str(index).encode()),
+                            "video/mp4",
+                        )
+                        for index in range(10)
+                    )
+                )
+
+            check_sums = async_to_sync(upload_all)()
+
+        assert len(set(check_sums)) == 10
+        for index in range(10):
+            assert (tmp_path / f"videos/{index}/movie.mp4").read_bytes() == (
+                f"movie-{index}".encode()
+            )
+
+    def test_failed_stream_leaves_no_file(self, tmp_path):
+        async def failing():
+            yield b"partial"
+            await asyncio.sleep(0)
+            raise ConnectionResetError
+
+        # The temporary file is dropped on the pool, after the last write
+        with ThreadPoolExecutor(2) as executor:
+            storage = LocalStorage(bucket=str(tmp_path), executor=executor)
+            with pytest.raises(ConnectionResetError):
+                async_to_sync(storage.astore_stream)(
+                    "videos/1/movie.mp4", failing(), "video/mp4"
+                )
+
+        assert list((tmp_path / LocalStorage.TMP_DIR).iterdir()) == []
+        assert not (tmp_path / "videos/1/movie.mp4").exists()
+
+    def test_default_astore_stream_stores_the_joined_chunks(self):
+        class MemoryStorage(AbstractStorageService):
+            files: dict = {}
+
+            def store(self, file_path, content, content_type):
+                self.files[file_path] = content
+                return hashlib.sha256(content).hexdigest()
+
+        storage = MemoryStorage()
+        check_sum = async_to_sync(storage.astore_stream)(
+            "movie.mp4", receive(b"mo", b"vie"), "video/mp4"
+        )
+
+        assert storage.files == {"movie.mp4": b"movie"}
+        assert check_sum == hashlib.sha256(b"movie").hexdigest()
+
+
+class TestShardedPath:
+    """
+    Test the sharded layout of the stored files
+    """
+
+    def test_spreads_keys_over_two_directory_levels(self):
+        path = sharded_path("videos", "3fa85f64", "movie.mp4")
+
+        videos, first, second, key, file_name = path.split("/")
+        assert videos == "videos"
+        assert len(first) == len(second) == 2
+        assert (key, file_name) == ("3fa85f64", "movie.mp4")
+
+    def test_spreads_keys_with_a_common_prefix(self):
+        shards = {
+            sharded_path("videos", f"01890a5d-ac96-7{index:03}", "movie.mp4")[:13]
+            for index in range(100)
+        }
+
+        assert len(shards) > 90
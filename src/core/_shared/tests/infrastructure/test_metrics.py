@@ -0,0 +1,106 @@
+import urllib.request
+
+import pytest
+
+from src.core._shared.infrastructure.metrics import MetricsRegistry, start_http_server
+
+
+class TestMetricsRegistry:
+    """
+    Test the Prometheus-style metrics registry
+    """
+
+    def test_renders_counters_and_gauges(self):
+        """
+        Tests that counters and gauges render one sample per label set.
+        """
+
+        registry = MetricsRegistry()
+        messages = registry.counter("messages_total", "Messages.", ["queue"])
+        in_flight = registry.gauge("in_flight", "In flight.")
+
+        messages.labels("videos.converted").inc()
+        messages.labels("videos.converted").inc(2)
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+
+        assert registry.render() == (
+            "# HELP messages_total Messages.\n"
+            "# TYPE messages_total counter\n"
+            'messages_total{queue="videos.converted"} 3.0\n'
+            "# HELP in_flight In flight.\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1.0\n"
+        )
+
+    def test_renders_cumulative_histogram_buckets(self):
+        """
+        Tests that histograms render cumulative buckets, sum and count.
+        """
+
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+
+        for value in (0.05, 0.1, 0.5, 2):
+            latency.observe(value)
+
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1.0"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 2.65",
+            "latency_seconds_count 4",
+        ]
+
+    def test_escapes_label_values(self):
+        """
+        Tests that quotes, backslashes and newlines are escaped in label values.
+        """
+
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors.", ["error"]).labels('a"b\\c\n').inc()
+
+        assert 'errors_total{error="a\\"b\\\\c\\n"} 1.0' in registry.render()
+
+    def test_reuses_metrics_by_name(self):
+        """
+        Tests that creating a metric twice returns the registered one.
+        """
+
+        registry = MetricsRegistry()
+
+        assert registry.counter("a_total", "A.") is registry.counter("a_total", "A.")
+        with pytest.raises(ValueError, match="already a counter"):
+            registry.gauge("a_total", "A.")
+
+    def test_rejects_wrong_label_count(self):
+        """
+        Tests that the label values must match the label names.
+        """
+
+        registry = MetricsRegistry()
+        counter = registry.counter("a_total", "A.", ["queue"])
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("a", "b")
+
+    def test_serves_metrics_over_http(self):
+        """
+        Tests that the HTTP listener serves the registry exposition.
+        """
+
+        registry = MetricsRegistry()
+        registry.counter("a_total", "A.").inc()
+        server = start_http_server(0, addr="127.0.0.1", registry=registry)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert "a_total 1.0" in body
@@ -0,0 +1,133 @@
+import cProfile
+import os
+import pstats
+import time
+
+import pytest
+
+from src.core._shared.infrastructure.profiling import (
+    Profiler,
+    collapse_pstats,
+    read_collapsed,
+)
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def handle_request() -> None:
+    busy(0.03)
+
+
+class RecordingProfile(cProfile.Profile):
+    """
+    cProfile profiler recording when it is enabled and disabled.
+
+    Since Python 3.12 cProfile receives the events of every thread, so what a
+    profile contains depends on the other threads of the test process, e.g.
+    the log listener; the tests check the profiler's lifecycle instead.
+    """
+
+    instances: list = []
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls: list = []
+        self.instances.append(self)
+
+    def enable(self, *args, **kwargs) -> None:
+        self.calls.append("enable")
+        super().enable(*args, **kwargs)
+
+    def disable(self) -> None:
+        super().disable()
+        self.calls.append("disable")
+
+
+class TestProfiler:
+    """
+    Test the sampling profiler of units of work
+    """
+
+    def test_profiles_nothing_without_directory(self):
+        profiler = Profiler(directory=None, enabled=True, sample_rate=1.0)
+
+        assert profiler.should_profile(force=True) is False
+
+    def test_profiles_only_when_enabled_or_forced(self, tmp_path):
+        profiler = Profiler(directory=tmp_path, sample_rate=1.0)
+
+        assert profiler.should_profile() is False
+        assert profiler.should_profile(force=True) is True
+
+        profiler.toggle()
+        assert profiler.should_profile() is True
+
+    def test_rejects_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown profiling mode"):
+            Profiler(directory=tmp_path, mode="perf")
+
+    def test_writes_pstats_in_cprofile_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cProfile, "Profile", RecordingProfile)
+        monkeypatch.setattr(RecordingProfile, "instances", [])
+        profiler = Profiler(directory=tmp_path)
+
+        with profiler.profile("GET /api/videos/", force=True):
+            (profile,) = RecordingProfile.instances
+            assert profile.calls == ["enable"]
+            handle_request()
+
+        assert profile.calls[:2] == ["enable", "disable"]
+        (path,) = tmp_path.iterdir()
+        assert path.name.endswith("-GET-api-videos.prof")
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_writes_collapsed_stacks_in_sampling_mode(self, tmp_path):
+        profiler = Profiler(directory=tmp_path, mode="sampling", interval=0.001)
+
+        with profiler.profile("message-videos.converted", force=True):
+            handle_request()
+
+        (path,) = tmp_path.iterdir()
+        assert path.suffix == ".folded"
+        stacks = read_collapsed([path])
+        assert any(
+            "test_profiling.py:handle_request;test_profiling.py:busy" in stack
+            for stack in stacks
+        )
+
+    def test_keeps_only_the_most_recent_files(self, tmp_path):
+        profiler = Profiler(directory=tmp_path, max_files=2)
+
+        for index in range(4):
+            with profiler.profile(f"unit-{index}", force=True):
+                pass
+            path = max(tmp_path.iterdir(), key=lambda path: path.name)
+            os.utime(path, (index, index))
+
+        names = sorted(path.name.split("-")[-1] for path in tmp_path.iterdir())
+        assert names == ["2.prof", "3.prof"]
+
+
+class TestCollapsePstats:
+    """
+    Test the stacks reconstructed from cProfile statistics
+    """
+
+    def test_attributes_own_time_to_the_caller_chain(self, tmp_path):
+        profiler = Profiler(directory=tmp_path)
+        with profiler.profile("unit", force=True):
+            handle_request()
+
+        (path,) = tmp_path.iterdir()
+        stacks = collapse_pstats(pstats.Stats(str(path)))
+
+        (stack,) = [stack for stack in stacks if stack.endswith(":busy")]
+        assert "test_profiling.py:handle_request;test_profiling.py:busy" in stack
+        under_request = sum(
+            value for stack, value in stacks.items() if ":handle_request;" in stack
+        )
+        assert under_request >= 20_000
@@ -0,0 +1,112 @@
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from src.core._shared.infrastructure.structured_logging import (
+    AsyncQueueHandler,
+    correlation,
+)
+
+
+@pytest.fixture
+def stream() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture
+def logger(stream):
+    handler = AsyncQueueHandler(stream=stream)
+    logger = logging.getLogger("test_structured_logging")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    logger.removeHandler(handler)
+    handler.close()
+
+
+def flush(logger) -> None:
+    for handler in logger.handlers:
+        handler.stop_listener()
+
+
+class TestAsyncQueueHandler:
+    """
+    Test the queue-based structured log handler
+    """
+
+    def test_writes_json_lines_with_correlation_ids(self, logger, stream):
+        """
+        Tests that each record is a JSON line with the correlation ids bound
+        to the context and the fields passed through `extra`.
+        """
+
+        with correlation(request="req-1", resource="abc.VIDEO"):
+            logger.info("Processed %s", "message", extra={"queue": "videos"})
+        logger.info("Outside")
+        flush(logger)
+
+        first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert first["level"] == "INFO"
+        assert first["logger"] == "test_structured_logging"
+        assert first["message"] == "Processed message"
+        assert first["request_id"] == "req-1"
+        assert first["resource_id"] == "abc.VIDEO"
+        assert first["queue"] == "videos"
+        assert "request_id" not in second
+        assert "resource_id" not in second
+
+    def test_does_not_format_records_below_the_level(self, logger, stream):
+        """
+        Tests that debug payloads are never formatted when the level is INFO.
+        """
+
+        class Payload:
+            formatted = False
+
+            def __str__(self) -> str:
+                Payload.formatted = True
+                return "payload"
+
+        logger.debug("Received message: %s", Payload())
+        flush(logger)
+
+        assert Payload.formatted is False
+        assert stream.getvalue() == ""
+
+    def test_formats_records_off_the_calling_thread(self, logger, stream):
+        """
+        Tests that the message is built by the listener thread, not by the
+        thread that logs it.
+        """
+
+        formatting_threads = []
+
+        class Payload:
+            def __str__(self) -> str:
+                formatting_threads.append(threading.current_thread())
+                return "payload"
+
+        logger.info("Received message: %s", Payload())
+        flush(logger)
+
+        assert formatting_threads
+        assert threading.current_thread() not in formatting_threads
+
+    def test_includes_the_exception(self, logger, stream):
+        """
+        Tests that the traceback of logged exceptions is included.
+        """
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Error handling event")
+        flush(logger)
+
+        document = json.loads(stream.getvalue())
+        assert document["level"] == "ERROR"
+        assert "ValueError: boom" in document["exception"]
@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass, field
 
+from src.core._shared.domain.uuid7 import uuid7
 from src.core.cast_member.application.exceptions import InvalidCastMember
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
@@ -29,7 +30,7 @@ class CreateCastMember:
 
         name: str
         type: CastMemberType
-        id: uuid.UUID = field(default_factory=uuid.uuid4)
+        id: uuid.UUID = field(default_factory=uuid7)
 
     @dataclass
     class Output:
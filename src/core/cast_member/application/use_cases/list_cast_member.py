@@ -1,5 +1,5 @@
 import uuid
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from src.core._shared.application.use_cases.list import (
     ListRequest,
@@ -10,8 +10,7 @@ from src.core.cast_member.domain.cast_member import CastMemberType
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 
 
-@dataclass
-class CastMemberOutput:
+class CastMemberOutput(NamedTuple):
     """
     Output for the ListCastMember use case
     """
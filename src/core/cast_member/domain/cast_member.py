@@ -13,7 +13,7 @@ class CastMemberType(StrEnum):
     DIRECTOR = "DIRECTOR"
 
 
-@dataclass()
+@dataclass(slots=True)
 class CastMember(AbstractEntity):
     """
     Represents a cast member of a movie.
@@ -92,8 +92,7 @@ class CastMember(AbstractEntity):
                 "Type must be a valid CastMemberType: ACTOR or DIRECTOR"
             )
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self.raise_if_invalid()
 
     def update_cast_member(self, name: str, type: CastMemberType):
         """
@@ -1,6 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 
 from src.core.cast_member.domain.cast_member import CastMember
 
@@ -46,6 +46,21 @@ class CastMemberRepository(ABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, cast_member_ids: Iterable[uuid.UUID]) -> List[CastMember]:
+        """
+        Retrieve the cast members with the given IDs from the repository at once.
+
+        Args:
+            cast_member_ids (Iterable[uuid.UUID]): The IDs of the cast members to be retrieved.
+
+        Returns:
+            List[CastMember]: The cast members found, in no particular order; IDs without
+                a cast member are skipped.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, cast_member_id: uuid.UUID):
         """
@@ -67,3 +82,49 @@ class CastMemberRepository(ABC):
         """
 
         raise NotImplementedError
+
+    async def aget_by_id(self, cast_member_id: uuid.UUID) -> CastMember | None:
+        """
+        Asynchronously retrieve a cast member by its ID from the repository.
+
+        Repositories backed by a blocking store can rely on this default, which
+        delegates to `get_by_id`. Implementations with native async support
+        should override it.
+
+        Args:
+            cast_member_id (uuid.UUID): The ID of the cast member to be retrieved.
+
+        Returns:
+            CastMember | None: The cast member with the given ID, or None if it doesn't exist.
+        """
+
+        return self.get_by_id(cast_member_id)
+
+    async def aget_by_ids(
+        self, cast_member_ids: Iterable[uuid.UUID]
+    ) -> List[CastMember]:
+        """
+        Asynchronously retrieve the cast members with the given IDs at once.
+
+        Defaults to delegating to `get_by_ids`.
+
+        Args:
+            cast_member_ids (Iterable[uuid.UUID]): The IDs of the cast members to be retrieved.
+
+        Returns:
+            List[CastMember]: The cast members found, in no particular order.
+        """
+
+        return self.get_by_ids(cast_member_ids)
+
+    async def alist(self) -> List[CastMember]:
+        """
+        Asynchronously list all cast members from the repository.
+
+        Defaults to delegating to `list`.
+
+        Returns:
+            list[CastMember]: A list of all cast members.
+        """
+
+        return self.list()
@@ -1,36 +1,32 @@
 import uuid
 from typing import List
 
+from src.core._shared.infrastructure.in_memory_repository import InMemoryRepository
 from src.core.cast_member.domain.cast_member import CastMember
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 
 
-class InMemoryCastMemberRepository(CastMemberRepository):
+class InMemoryCastMemberRepository(
+    InMemoryRepository[CastMember], CastMemberRepository
+):
     """
     An in-memory implementation of the CastMemberRepository interface.
-    """
 
-    def __init__(self, cast_members: List[CastMember] = None):  # type: ignore
-        """
-        Initialize the in-memory cast member repository.
-
-        Args:
-            cast_members (List[CastMember], optional): A list of cast members to
-                initialize the repository with.
-            Defaults to an empty list if not provided.
-        """
+    Cast members are indexed by id and name, the sort fields of the list endpoint.
+    """
 
-        self.cast_members = cast_members or []
+    INDEXES = ("id", "name")
 
-    def save(self, cast_member: CastMember):
+    def __init__(self, cast_members: List[CastMember] | None = None) -> None:
         """
-        Save a cast member to the repository.
+        Initialize the in-memory cast member repository.
 
         Args:
-            cast_member (CastMember): The cast member to be saved.
+            cast_members (List[CastMember], optional): A list of cast members to initialize the
+                repository with. Defaults to an empty list if not provided.
         """
 
-        self.cast_members.append(cast_member)
+        super().__init__(cast_members)
 
     def get_by_id(self, cast_member_id: uuid.UUID) -> CastMember | None:
         """
@@ -43,21 +39,7 @@ class InMemoryCastMemberRepository(CastMemberRepository):
             CastMember | None: The cast member with the given ID, or None if it doesn't exist.
         """
 
-        for cast_member in self.cast_members:
-            if cast_member.id == cast_member_id:
-                return cast_member
-
-        return None
-
-    def list(self) -> List[CastMember]:
-        """
-        List all cast members from the repository.
-
-        Returns:
-            List[CastMember]: A list of all cast members.
-        """
-
-        return [cast_member for cast_member in self.cast_members]
+        return super().get_by_id(cast_member_id)
 
     def delete(self, cast_member_id: uuid.UUID) -> None:
         """
@@ -67,21 +49,15 @@ class InMemoryCastMemberRepository(CastMemberRepository):
             cast_member_id (uuid.UUID): The ID of the cast member to be deleted.
         """
 
-        cast_member = self.get_by_id(cast_member_id)
+        super().delete(cast_member_id)
 
-        if cast_member:
-            self.cast_members.remove(cast_member)
-
-    def update(self, cast_member: CastMember) -> None:
+    @property
+    def cast_members(self) -> List[CastMember]:
         """
-        Update a cast member in the repository.
+        The cast members of the repository, in insertion order.
 
-        Args:
-            cast_member (CastMember): The cast member to be updated.
+        Returns:
+            List[CastMember]: A snapshot of the cast members.
         """
 
-        old_cast_member = self.get_by_id(cast_member.id)
-
-        if old_cast_member:
-            self.cast_members.remove(old_cast_member)
-            self.cast_members.append(cast_member)
+        return self.list()
@@ -2,6 +2,7 @@ import uuid
 from dataclasses import dataclass
 
 from src.core.category.application.exceptions import CategoryNotFound
+from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
 
@@ -53,6 +54,42 @@ class GetCategory:
         """
         category = self.repository.get_by_id(category_id=request.id)
 
+        return self._to_response(request, category)
+
+    async def aexecute(self, request: GetCategoryRequest) -> GetCategoryResponse:
+        """
+        Asynchronously gets a category by its ID.
+
+        Args:
+            request (GetCategoryRequest): The request with the category ID.
+
+        Returns:
+            GetCategoryResponse: The response with the category data.
+        """
+
+        category = await self.repository.aget_by_id(category_id=request.id)
+
+        return self._to_response(request, category)
+
+    @staticmethod
+    def _to_response(
+        request: GetCategoryRequest,
+        category: Category | None,
+    ) -> GetCategoryResponse:
+        """
+        Map the retrieved category to the use case response.
+
+        Args:
+            request (GetCategoryRequest): The request with the category ID.
+            category (Category | None): The retrieved category, if any.
+
+        Returns:
+            GetCategoryResponse: The response with the category data.
+
+        Raises:
+            CategoryNotFound: If the category does not exist.
+        """
+
         if category is None:
             raise CategoryNotFound(f"Category with ID {request.id} not found")
 
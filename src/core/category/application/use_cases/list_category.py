@@ -1,5 +1,5 @@
 import uuid
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from src.core._shared.application.use_cases.list import (
     ListRequest,
@@ -9,8 +9,7 @@ from src.core._shared.application.use_cases.list import (
 from src.core.category.domain.category_repository import CategoryRepository
 
 
-@dataclass
-class CategoryOutput:
+class CategoryOutput(NamedTuple):
     """
     Represents the output of a category.
     """
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.core._shared.domain.entity import AbstractEntity
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Category(AbstractEntity):
     """
     Represents a category of movies.
@@ -63,8 +63,7 @@ class Category(AbstractEntity):
                 "Description must have less then 1024 characters"
             )
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self.raise_if_invalid()
 
     def update_category(self, name: str, description: str):
         """
@@ -1,6 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 
 from src.core.category.domain.category import Category
 
@@ -33,6 +33,20 @@ class CategoryRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, category_ids: Iterable[uuid.UUID]) -> List[Category]:
+        """
+        Retrieve the categories with the given IDs from the repository at once.
+
+        Args:
+            category_ids (Iterable[uuid.UUID]): The IDs of the categories to be retrieved.
+
+        Returns:
+            List[Category]: The categories found, in no particular order; IDs without
+                a category are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, category_id: uuid.UUID):
         """
@@ -62,3 +76,47 @@ class CategoryRepository(ABC):
             list[Category]: A list of all categories.
         """
         raise NotImplementedError
+
+    async def aget_by_id(self, category_id: uuid.UUID) -> Category | None:
+        """
+        Asynchronously retrieve a category by its ID from the repository.
+
+        Repositories backed by a blocking store can rely on this default, which
+        delegates to `get_by_id`. Implementations with native async support
+        should override it.
+
+        Args:
+            category_id (uuid.UUID): The ID of the category to be retrieved.
+
+        Returns:
+            Category | None: The category with the given ID, or None if it doesn't exist.
+        """
+
+        return self.get_by_id(category_id)
+
+    async def aget_by_ids(self, category_ids: Iterable[uuid.UUID]) -> List[Category]:
+        """
+        Asynchronously retrieve the categories with the given IDs at once.
+
+        Defaults to delegating to `get_by_ids`.
+
+        Args:
+            category_ids (Iterable[uuid.UUID]): The IDs of the categories to be retrieved.
+
+        Returns:
+            List[Category]: The categories found, in no particular order.
+        """
+
+        return self.get_by_ids(category_ids)
+
+    async def alist(self) -> List[Category]:
+        """
+        Asynchronously list all categories from the repository.
+
+        Defaults to delegating to `list`.
+
+        Returns:
+            list[Category]: A list of all categories.
+        """
+
+        return self.list()
@@ -1,87 +1,61 @@
 import uuid
 from typing import List
 
+from src.core._shared.infrastructure.in_memory_repository import InMemoryRepository
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
 
-class InMemoryCategoryRepository(CategoryRepository):
+class InMemoryCategoryRepository(InMemoryRepository[Category], CategoryRepository):
     """
     In memory category repository
-    """
 
-    def __init__(self, categories=None):
-        """
-        Initialize the in-memory category repository.
-
-        Args:
-            categories (list, optional): A list of categories to initialize the repository with.
-            Defaults to an empty list if not provided.
-        """
+    Categories are indexed by id and name, the sort fields of the list endpoint.
+    """
 
-        self.categories = categories or []
+    INDEXES = ("id", "name")
 
-    def save(self, category: Category) -> None:
+    def __init__(self, categories: List[Category] | None = None) -> None:
         """
-        Save a category to the in-memory repository.
+        Initialize the in-memory category repository.
 
         Args:
-            category (Category): The category to be saved.
+            categories (List[Category], optional): A list of categories to initialize the
+                repository with. Defaults to an empty list if not provided.
         """
 
-        self.categories.append(category)
+        super().__init__(categories)
 
     def get_by_id(self, category_id: uuid.UUID) -> Category | None:
         """
-        Retrieve a category by its ID from the in-memory repository.
+        Retrieve a category by its ID from the repository.
 
         Args:
-            id (uuid.UUID): The ID of the category to be retrieved.
+            category_id (uuid.UUID): The ID of the category to be retrieved.
 
         Returns:
             Category | None: The category with the given ID, or None if it doesn't exist.
         """
 
-        for category in self.categories:
-            if category.id == category_id:
-                return category
-
-        return None
+        return super().get_by_id(category_id)
 
     def delete(self, category_id: uuid.UUID) -> None:
         """
-        Delete a category by its ID from the in-memory repository.
+        Delete a category by its ID from the repository.
 
         Args:
-            id (uuid.UUID): The ID of the category to be deleted.
+            category_id (uuid.UUID): The ID of the category to be deleted.
         """
 
-        self.categories = [
-            category for category in self.categories if category.id != category_id
-        ]
-
-        return None
-
-    def update(self, category: Category) -> None:
-        """
-        Update a category in the in-memory repository.
-
-        Args:
-            category (Category): The category to be updated.
-        """
-
-        for idx, cat in enumerate(self.categories):
-            if cat.id == category.id:
-                self.categories[idx] = category
-
-        return None
+        super().delete(category_id)
 
-    def list(self) -> List[Category]:
+    @property
+    def categories(self) -> List[Category]:
         """
-        List all categories in the in-memory repository.
+        The categories of the repository, in insertion order.
 
         Returns:
-            list[Category]: A list of all categories in the repository.
+            List[Category]: A snapshot of the categories.
         """
 
-        return [category for category in self.categories]
+        return self.list()
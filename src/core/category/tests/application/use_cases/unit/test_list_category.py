@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import create_autospec
 
 from src.config import DEFAULT_PAGE_SIZE
@@ -110,3 +111,24 @@ class TestListCategory:
         }
 
         assert mock_repository.list.called is True
+
+    def test_aexecute_paginates_like_execute(self):
+        """
+        Test that the async variant of `list_category` awaits `alist` and returns
+        the same page as `execute`.
+        """
+
+        category_action = Category(name="Action", description="Action movies")
+        category_drama = Category(name="Drama", description="Drama movies")
+
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.list.return_value = [category_drama, category_action]
+        mock_repository.alist.return_value = [category_drama, category_action]
+
+        use_case = ListCategory(mock_repository)
+        request = ListRequest(order_by="name")
+
+        response = asyncio.run(use_case.aexecute(request))
+
+        assert response == use_case.execute(request)
+        mock_repository.alist.assert_awaited_once()
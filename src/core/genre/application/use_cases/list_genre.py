@@ -1,5 +1,5 @@
 import uuid
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from src.core._shared.application.use_cases.list import (
     ListRequest,
@@ -9,8 +9,7 @@ from src.core._shared.application.use_cases.list import (
 from src.core.genre.domain.genre_repository import GenreRepository
 
 
-@dataclass
-class GenreOutput:
+class GenreOutput(NamedTuple):
     """
     Represents the output of a genre.
     """
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from src.core._shared.domain.entity import AbstractEntity
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Genre(AbstractEntity):
     """
     Represents a genre of movies.
@@ -58,8 +58,7 @@ class Genre(AbstractEntity):
         if len(self.name) > 255:
             self.notification.add_error("Name must have less then 256 characters")
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self.raise_if_invalid()
 
     def change_name(self, name: str):
         """
@@ -1,6 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 
 from src.core.genre.domain.genre import Genre
 
@@ -33,6 +33,20 @@ class GenreRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, genre_ids: Iterable[uuid.UUID]) -> List[Genre]:
+        """
+        Retrieve the genres with the given IDs from the repository at once.
+
+        Args:
+            genre_ids (Iterable[uuid.UUID]): The IDs of the genres to be retrieved.
+
+        Returns:
+            List[Genre]: The genres found, in no particular order; IDs without
+                a genre are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, genre_id: uuid.UUID):
         """
@@ -62,3 +76,47 @@ class GenreRepository(ABC):
             list[Genre]: A list of all categories.
         """
         raise NotImplementedError
+
+    async def aget_by_id(self, genre_id: uuid.UUID) -> Genre | None:
+        """
+        Asynchronously retrieve a genre by its ID from the repository.
+
+        Repositories backed by a blocking store can rely on this default, which
+        delegates to `get_by_id`. Implementations with native async support
+        should override it.
+
+        Args:
+            genre_id (uuid.UUID): The ID of the genre to be retrieved.
+
+        Returns:
+            Genre | None: The genre with the given ID, or None if it doesn't exist.
+        """
+
+        return self.get_by_id(genre_id)
+
+    async def aget_by_ids(self, genre_ids: Iterable[uuid.UUID]) -> List[Genre]:
+        """
+        Asynchronously retrieve the genres with the given IDs at once.
+
+        Defaults to delegating to `get_by_ids`.
+
+        Args:
+            genre_ids (Iterable[uuid.UUID]): The IDs of the genres to be retrieved.
+
+        Returns:
+            List[Genre]: The genres found, in no particular order.
+        """
+
+        return self.get_by_ids(genre_ids)
+
+    async def alist(self) -> List[Genre]:
+        """
+        Asynchronously list all genres from the repository.
+
+        Defaults to delegating to `list`.
+
+        Returns:
+            list[Genre]: A list of all genres.
+        """
+
+        return self.list()
@@ -1,85 +1,61 @@
 import uuid
 from typing import List
 
+from src.core._shared.infrastructure.in_memory_repository import InMemoryRepository
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
 
-class InMemoryGenreRepository(GenreRepository):
+class InMemoryGenreRepository(InMemoryRepository[Genre], GenreRepository):
     """
     In memory genre repository
-    """
 
-    def __init__(self, genres=None):
-        """
-        Initialize the in-memory genre repository.
-
-        Args:
-            genres (list, optional): A list of genres to initialize the repository with.
-            Defaults to an empty list if not provided.
-        """
+    Genres are indexed by id and name, the sort fields of the list endpoint.
+    """
 
-        self.genres = genres or []
+    INDEXES = ("id", "name")
 
-    def save(self, genre: Genre) -> None:
+    def __init__(self, genres: List[Genre] | None = None) -> None:
         """
-        Save a genre to the in-memory repository.
+        Initialize the in-memory genre repository.
 
         Args:
-            genre (Genre): The genre to be saved.
+            genres (List[Genre], optional): A list of genres to initialize the
+                repository with. Defaults to an empty list if not provided.
         """
 
-        self.genres.append(genre)
+        super().__init__(genres)
 
     def get_by_id(self, genre_id: uuid.UUID) -> Genre | None:
         """
-        Retrieve a genre by its ID from the in-memory repository.
+        Retrieve a genre by its ID from the repository.
 
         Args:
-            id (uuid.UUID): The ID of the genre to be retrieved.
+            genre_id (uuid.UUID): The ID of the genre to be retrieved.
 
         Returns:
             Genre | None: The genre with the given ID, or None if it doesn't exist.
         """
 
-        for genre in self.genres:
-            if genre.id == genre_id:
-                return genre
-
-        return None
+        return super().get_by_id(genre_id)
 
     def delete(self, genre_id: uuid.UUID) -> None:
         """
-        Delete a genre by its ID from the in-memory repository.
+        Delete a genre by its ID from the repository.
 
         Args:
-            id (uuid.UUID): The ID of the genre to be deleted.
+            genre_id (uuid.UUID): The ID of the genre to be deleted.
         """
 
-        self.genres = [genre for genre in self.genres if genre.id != genre_id]
-
-        return None
-
-    def update(self, genre: Genre) -> None:
-        """
-        Update a genre in the in-memory repository.
-
-        Args:
-            genre (Genre): The genre to be updated.
-        """
-
-        for idx, gen in enumerate(self.genres):
-            if gen.id == genre.id:
-                self.genres[idx] = genre
-
-        return None
+        super().delete(genre_id)
 
-    def list(self) -> List[Genre]:
+    @property
+    def genres(self) -> List[Genre]:
         """
-        List all genres in the in-memory repository.
+        The genres of the repository, in insertion order.
 
         Returns:
-            list[Genre]: A list of all genres in the repository.
+            List[Genre]: A snapshot of the genres.
         """
 
-        return [genre for genre in self.genres]
+        return self.list()
@@ -1,9 +1,13 @@
+import logging
+
 from src.core._shared.application.handler import AbstractHandler
 from src.core._shared.events.event_dispatcher import EventDispatcher
 from src.core.video.application.events.integration_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class PublishAudioVideoMediaUpdatedHandler(AbstractHandler):
     """
@@ -24,12 +28,12 @@ class PublishAudioVideoMediaUpdatedHandler(AbstractHandler):
         """
         Handle the AudioVideoMediaUpdatedIntegrationEvent.
 
-        This method publishes the given event by printing it and dispatching it
-        through the assigned event dispatcher.
+        This method publishes the given event through the assigned event
+        dispatcher.
 
         Args:
             event (AudioVideoMediaUpdatedIntegrationEvent): The event to be published.
         """
 
         self.event_dispatcher.dispatch(event)
-        print(f"Publishing event: {event}")
+        logger.debug("Published event %s", event.type)
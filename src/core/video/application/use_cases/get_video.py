@@ -5,6 +5,7 @@ from typing import Optional
 
 from src.core.video.application.exceptions import VideoNotFound
 from src.core.video.domain.value_objects import AudioVideoMedia, ImageMedia, Rating
+from src.core.video.domain.video import Video
 from src.core.video.domain.video_repository import VideoRepository
 
 
@@ -68,6 +69,42 @@ class GetVideo:
 
         video = self.repository.get_by_id(request.id)
 
+        return self._to_output(request, video)
+
+    async def aexecute(self, request: Input) -> Output:
+        """
+        Asynchronously executes the GetVideo use case to retrieve a video based on its ID.
+
+        Args:
+            request (GetVideo.Input): The request object containing the video ID.
+
+        Returns:
+            GetVideo.Output: A response containing the video data.
+
+        Raises:
+            VideoNotFound: If the video with the given ID does not exist.
+        """
+
+        video = await self.repository.aget_by_id(request.id)
+
+        return self._to_output(request, video)
+
+    @staticmethod
+    def _to_output(request: Input, video: Video | None) -> Output:
+        """
+        Map the retrieved video to the use case output.
+
+        Args:
+            request (GetVideo.Input): The request object containing the video ID.
+            video (Video | None): The retrieved video, if any.
+
+        Returns:
+            GetVideo.Output: A response containing the video data.
+
+        Raises:
+            VideoNotFound: If the video does not exist.
+        """
+
         if not video:
             raise VideoNotFound(f"Video with id {request.id} not found")
 
@@ -0,0 +1,91 @@
+import uuid
+from dataclasses import dataclass
+
+from src.core.video.application.exceptions import MediaNotFound, VideoNotFound
+from src.core.video.domain.value_objects import AudioVideoMedia
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class GetVideoMedia:
+    """
+    Use case to locate a stored media of a video, to be served back.
+    """
+
+    # Media attributes of the Video entity, by the name used in the API
+    MEDIA_TYPES = ("video", "trailer", "banner", "thumbnail", "thumbnail_half")
+
+    @dataclass
+    class Input:
+        """
+        Input data for the GetVideoMedia use case
+        """
+
+        video_id: uuid.UUID
+        media_type: str
+
+    @dataclass
+    class Output:
+        """
+        Output data for the GetVideoMedia use case
+        """
+
+        name: str
+        location: str
+        check_sum: str
+
+    def __init__(self, repository: VideoRepository) -> None:
+        """
+        Initialize the GetVideoMedia use case.
+
+        Args:
+            repository (VideoRepository): The repository to manage video entities.
+        """
+
+        self.repository = repository
+
+    def execute(self, request: Input) -> Output:
+        """
+        Executes the GetVideoMedia use case to find where a media is stored.
+
+        Audio and video media are served from their raw (uploaded) location.
+
+        Args:
+            request (GetVideoMedia.Input): The video ID and the media type, one
+                of MEDIA_TYPES.
+
+        Returns:
+            GetVideoMedia.Output: The name, storage location and checksum of the
+                media.
+
+        Raises:
+            VideoNotFound: If the video with the given ID does not exist.
+            MediaNotFound: If the media type is unknown or the video has no such
+                media.
+        """
+
+        if request.media_type not in self.MEDIA_TYPES:
+            raise MediaNotFound(f"Unknown media type {request.media_type}")
+
+        video = self.repository.get_by_id(request.video_id)
+        if not video:
+            raise VideoNotFound(f"Video with id {request.video_id} not found")
+
+        media = getattr(video, request.media_type)
+        if media is None:
+            raise MediaNotFound(
+                f"Video with id {request.video_id} has no {request.media_type}"
+            )
+
+        location = (
+            media.raw_location if isinstance(media, AudioVideoMedia) else media.location
+        )
+        if not location:
+            raise MediaNotFound(
+                f"The {request.media_type} of video {request.video_id} is not stored"
+            )
+
+        return GetVideoMedia.Output(
+            name=media.name,
+            location=location,
+            check_sum=media.check_sum,
+        )
@@ -1,6 +1,6 @@
 import uuid
-from dataclasses import dataclass
 from decimal import Decimal
+from typing import NamedTuple
 
 from src.core._shared.application.use_cases.list import (
     ListRequest,
@@ -11,8 +11,7 @@ from src.core.video.domain.value_objects import Rating
 from src.core.video.domain.video_repository import VideoRepository
 
 
-@dataclass
-class VideoWithoutMediaOutput:
+class VideoWithoutMediaOutput(NamedTuple):
     """
     Output data for the list video without media use case.
     """
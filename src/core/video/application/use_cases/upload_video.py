@@ -1,10 +1,10 @@
 import uuid
 from dataclasses import dataclass
-from pathlib import Path
 
-from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.application.unit_of_work import AbstractUnitOfWork
 from src.core._shared.infrastructure.storage.abstract_storage_service import (
     AbstractStorageService,
+    sharded_path,
 )
 from src.core.video.application.events.integration_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
@@ -34,7 +34,7 @@ class UploadVideo:
         self,
         video_repository: VideoRepository,
         storage_service: AbstractStorageService,
-        message_bus: AbstractMessageBus,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         """
         Initialize the UploadVideo use case.
@@ -43,20 +43,23 @@ class UploadVideo:
             video_repository (VideoRepository): The repository to manage video entities.
             storage_service (AbstractStorageService): The storage service to store the
                 video media.
-            message_bus (AbstractMessageBus): The message bus to publish integration events.
+            unit_of_work (AbstractUnitOfWork): The unit of work updating the video
+                and publishing its events after commit.
         """
 
         self.video_repository = video_repository
         self.storage_service = storage_service
-        self.message_bus = message_bus
+        self.unit_of_work = unit_of_work
 
     def execute(self, input: Input) -> None:
         """
         Execute the UploadVideo use case.
 
         This method uploads video media to a storage service and updates
-        the corresponding video entity in the repository. An integration
-        event is published after the video is updated.
+        the corresponding video entity in the repository, with the checksum
+        of the stored content. The media is stored before the transaction is
+        opened, and the video events and the integration event are published
+        once, after the update commits.
 
         Args:
             input (Input): The input data containing the video ID, file name,
@@ -70,30 +73,29 @@ class UploadVideo:
         if not video:
             raise VideoNotFound(f"Video with ID {input.video_id} not found")
 
-        file_path = Path("videos") / str(input.video_id) / input.file_name
-        self.storage_service.store(
-            file_path=str(file_path),
+        file_path = sharded_path("videos", str(input.video_id), input.file_name)
+        check_sum = self.storage_service.store(
+            file_path=file_path,
             content=input.content,
             content_type=input.content_type,
         )
 
         audio_video_media = AudioVideoMedia(
             name=input.file_name,
-            raw_location=str(file_path),
+            raw_location=file_path,
             encoded_location="",
             status=MediaStatus.PENDING,
             media_type=MediaType.VIDEO,
+            check_sum=check_sum,
         )
 
-        video.update_video(audio_video_media)
-
-        self.video_repository.update(video)
-
-        self.message_bus.handle(
-            [
+        with self.unit_of_work as uow:
+            video.update_video(audio_video_media)
+            self.video_repository.update(video)
+            uow.collect(video)
+            uow.add_event(
                 AudioVideoMediaUpdatedIntegrationEvent(
                     resource_id=f"{video.id}.{MediaType.VIDEO}",
-                    file_path=str(file_path),
+                    file_path=file_path,
                 )
-            ]
-        )
+            )
@@ -61,8 +61,7 @@ class Video(AbstractEntity):
         if len(self.title) > 255:
             self.notification.add_error("Title must have less than 256 characters")
 
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self.raise_if_invalid()
 
     def update(
         self,
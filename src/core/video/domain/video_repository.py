@@ -1,6 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 
 from src.core.video.domain.video import Video
 
@@ -33,6 +33,20 @@ class VideoRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, video_ids: Iterable[uuid.UUID]) -> List[Video]:
+        """
+        Retrieve the videos with the given IDs from the repository at once.
+
+        Args:
+            video_ids (Iterable[uuid.UUID]): The IDs of the videos to be retrieved.
+
+        Returns:
+            List[Video]: The videos found, in no particular order; IDs without
+                a video are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, video_id: uuid.UUID):
         """
@@ -62,3 +76,47 @@ class VideoRepository(ABC):
             list[Video]: A list of all categories.
         """
         raise NotImplementedError
+
+    async def aget_by_id(self, video_id: uuid.UUID) -> Video | None:
+        """
+        Asynchronously retrieve a video by its ID from the repository.
+
+        Repositories backed by a blocking store can rely on this default, which
+        delegates to `get_by_id`. Implementations with native async support
+        should override it.
+
+        Args:
+            video_id (uuid.UUID): The ID of the video to be retrieved.
+
+        Returns:
+            Video | None: The video with the given ID, or None if it doesn't exist.
+        """
+
+        return self.get_by_id(video_id)
+
+    async def aget_by_ids(self, video_ids: Iterable[uuid.UUID]) -> List[Video]:
+        """
+        Asynchronously retrieve the videos with the given IDs at once.
+
+        Defaults to delegating to `get_by_ids`.
+
+        Args:
+            video_ids (Iterable[uuid.UUID]): The IDs of the videos to be retrieved.
+
+        Returns:
+            List[Video]: The videos found, in no particular order.
+        """
+
+        return self.get_by_ids(video_ids)
+
+    async def alist(self) -> List[Video]:
+        """
+        Asynchronously list all videos from the repository.
+
+        Defaults to delegating to `list`.
+
+        Returns:
+            list[Video]: A list of all videos.
+        """
+
+        return self.list()
@@ -1,80 +1,61 @@
 import uuid
+from typing import List
 
+from src.core._shared.infrastructure.in_memory_repository import InMemoryRepository
 from src.core.video.domain.video import Video
 from src.core.video.domain.video_repository import VideoRepository
 
 
-class InMemoryVideoRepository(VideoRepository):
+class InMemoryVideoRepository(InMemoryRepository[Video], VideoRepository):
     """
     An in-memory implementation of the VideoRepository interface.
-    """
-
-    def __init__(self, videos=None):
-        """
-        Initialize the in-memory video repository.
 
-        Args:
-            videos (list, optional): A list of videos to initialize the repository with.
-            Defaults to an empty list if not provided.
-        """
+    Videos are indexed by id and title, the sort fields of the list endpoint.
+    """
 
-        self.videos = videos or []
+    INDEXES = ("id", "title")
 
-    def save(self, video: Video):
+    def __init__(self, videos: List[Video] | None = None) -> None:
         """
-        Save a video to the in-memory repository.
+        Initialize the in-memory video repository.
 
         Args:
-            video (Video): The video to be saved.
+            videos (List[Video], optional): A list of videos to initialize the
+                repository with. Defaults to an empty list if not provided.
         """
 
-        self.videos.append(video)
+        super().__init__(videos)
 
     def get_by_id(self, video_id: uuid.UUID) -> Video | None:
         """
-        Retrieve a video by its ID from the in-memory repository.
+        Retrieve a video by its ID from the repository.
 
         Args:
-            id (uuid.UUID): The ID of the video to be retrieved.
+            video_id (uuid.UUID): The ID of the video to be retrieved.
 
         Returns:
-            Video: The video with the given ID, or None if it doesn't exist.
+            Video | None: The video with the given ID, or None if it doesn't exist.
         """
 
-        for video in self.videos:
-            if video.id == video_id:
-                return video
-
-        return None
+        return super().get_by_id(video_id)
 
     def delete(self, video_id: uuid.UUID) -> None:
         """
-        Delete a video by its ID from the in-memory repository.
-
-        Args:
-            id (uuid.UUID): The ID of the video to be deleted.
-        """
-
-        self.videos = [video for video in self.videos if video.id != video_id]
-
-    def update(self, video: Video) -> None:
-        """
-        Update a video in the in-memory repository.
+        Delete a video by its ID from the repository.
 
         Args:
-            video (Video): The video to be updated.
+            video_id (uuid.UUID): The ID of the video to be deleted.
         """
 
-        for i, v in enumerate(self.videos):
-            if v.id == video.id:
-                self.videos[i] = video
+        super().delete(video_id)
 
-    def list(self) -> list[Video]:
+    @property
+    def videos(self) -> List[Video]:
         """
-        List all videos in the in-memory repository.
+        The videos of the repository, in insertion order.
 
         Returns:
-            list[Video]: A list of all videos in the repository.
+            List[Video]: A snapshot of the videos.
         """
 
-        return list(self.videos)
+        return self.list()
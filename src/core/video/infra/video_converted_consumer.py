@@ -1,25 +1,63 @@
 import json
 import logging
+import time
 from uuid import UUID
 
 import pika
 
+from src.core._shared.events.abstract_broadcaster import AbstractBroadcaster
 from src.core._shared.events.abstract_consumer import AbstractConsumer
+from src.core._shared.infrastructure.metrics import REGISTRY
+from src.core._shared.infrastructure.profiling import Profiler
+from src.core._shared.infrastructure.structured_logging import correlation
 from src.core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
 from src.core.video.domain.value_objects import MediaStatus, MediaType
+from src.django_project.video_app.media_status import (
+    get_media_status_broadcaster,
+    media_status_channel,
+    media_status_message,
+)
+from src.django_project.profiling import get_profiler
 from src.django_project.video_app.repository import DjangoORMVideoRepository
 
 logger = logging.getLogger(__name__)
 
+MESSAGES_PROCESSED = REGISTRY.counter(
+    "consumer_messages_processed_total",
+    "Messages processed by the consumer.",
+    ["queue"],
+)
+MESSAGES_FAILED = REGISTRY.counter(
+    "consumer_messages_failed_total",
+    "Messages the consumer failed to process, or that reported an error.",
+    ["queue"],
+)
+MESSAGES_IN_FLIGHT = REGISTRY.gauge(
+    "consumer_messages_in_flight",
+    "Messages being processed by the consumer.",
+    ["queue"],
+)
+PROCESSING_LATENCY = REGISTRY.histogram(
+    "consumer_processing_duration_seconds",
+    "Time spent processing each message.",
+    ["queue"],
+)
+
 
 class VideoConvertedRabbitMQConsumer(AbstractConsumer):
     """
     RabbitMQ consumer for video converted events.
     """
 
-    def __init__(self, host: str = "localhost", queue: str = "videos.converted"):
+    def __init__(
+        self,
+        host: str = "localhost",
+        queue: str = "videos.converted",
+        broadcaster: AbstractBroadcaster | None = None,
+        profiler: Profiler | None = None,
+    ):
         """
         Initialize the VideoConvertedRabbitMQConsumer.
 
@@ -27,10 +65,17 @@ class VideoConvertedRabbitMQConsumer(AbstractConsumer):
             host (str): The RabbitMQ host to connect to. Defaults to "localhost".
             queue (str): The name of the RabbitMQ queue to consume messages from.
                 Defaults to "videos.converted".
+            broadcaster (AbstractBroadcaster | None): The broadcaster notified of
+                media status changes. Defaults to the configured media status
+                broadcaster.
+            profiler (Profiler | None): The profiler of a sampled fraction of the
+                messages. Defaults to the configured profiler.
         """
 
         self.host = host
         self.queue = queue
+        self.broadcaster = broadcaster or get_media_status_broadcaster()
+        self.profiler = profiler or get_profiler()
         self.connection = None
         self.channel = None
 
@@ -39,30 +84,96 @@ class VideoConvertedRabbitMQConsumer(AbstractConsumer):
         Handle an incoming message.
 
         This method is called by the consumer's infrastructure when a message is received.
+        It records the messages processed, failed and in flight, and the processing time,
+        and profiles a sampled fraction of the messages.
 
         Args:
             message (bytes): The message to be handled, as a byte string.
         """
 
-        print(f"Received message: {message}")
+        in_flight = MESSAGES_IN_FLIGHT.labels(self.queue)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            with self.profiler.profile(f"message-{self.queue}"):
+                succeeded = self.process(message)
+        finally:
+            in_flight.dec()
+            PROCESSING_LATENCY.labels(self.queue).observe(time.perf_counter() - start)
+
+        if succeeded:
+            MESSAGES_PROCESSED.labels(self.queue).inc()
+        else:
+            MESSAGES_FAILED.labels(self.queue).inc()
+
+    def process(self, message: bytes) -> bool:
+        """
+        Process a message, updating the media of the video it refers to.
+
+        Args:
+            message (bytes): The message to be processed, as a byte string.
+
+        Returns:
+            bool: True if the media was updated, False if the message reported
+                an error or couldn't be processed.
+        """
+
+        logger.debug("Received message: %s", message)
         try:
             message = json.loads(message)
+        except ValueError:
+            logger.error("Error decoding message from queue %s", self.queue)
+            return False
+
+        with correlation(resource=self.resource_id(message)):
+            return self.process_payload(message)
+
+    @staticmethod
+    def resource_id(message) -> str | None:
+        """
+        Get the resource id a decoded message refers to, to correlate its logs.
 
-            error_message = message["error"]  # type: ignore
+        Args:
+            message: The decoded message.
+
+        Returns:
+            str | None: The `<id>.<MediaType>` resource id, or None if the message
+                is malformed.
+        """
+
+        try:
+            source = message["message"] if message["error"] else message["video"]
+            return source["resource_id"]
+        except (KeyError, TypeError):
+            return None
+
+    def process_payload(self, message: dict) -> bool:
+        """
+        Process a decoded message, updating the media of the video it refers to.
+
+        Args:
+            message (dict): The decoded message.
+
+        Returns:
+            bool: True if the media was updated, False otherwise.
+        """
+
+        try:
+            error_message = message["error"]
             if error_message:
-                aggregate_id_raw, _ = message["message"]["resource_id"].split(".")  # type: ignore
+                aggregate_id_raw, _ = message["message"]["resource_id"].split(".")
                 logger.error(
-                    f"Error processing video {aggregate_id_raw}: {error_message}"
+                    "Error processing video %s: %s", aggregate_id_raw, error_message
                 )
-                return
+                return False
 
-            aggregate_id_raw, media_type_raw = message["video"]["resource_id"].split(  # type: ignore
+            aggregate_id_raw, media_type_raw = message["video"]["resource_id"].split(
                 "."
             )
             aggregate_id = UUID(aggregate_id_raw)
             media_type = MediaType(media_type_raw)
-            encoded_location = message["video"]["encoded_video_folder"]  # type: ignore
-            status = MediaStatus(message["status"])  # type: ignore
+            encoded_location = message["video"]["encoded_video_folder"]
+            status = MediaStatus(message["status"])
 
             process_audio_video_media_input = ProcessAudioVideoMedia.Input(
                 video_id=aggregate_id,
@@ -70,14 +181,28 @@ class VideoConvertedRabbitMQConsumer(AbstractConsumer):
                 media_type=media_type,
                 status=status,
             )
-            print("Calling use case with input", process_audio_video_media_input)
+            logger.debug(
+                "Calling use case with input %s", process_audio_video_media_input
+            )
             use_case = ProcessAudioVideoMedia(
                 video_repository=DjangoORMVideoRepository()
             )
             use_case.execute(request=process_audio_video_media_input)
-        except Exception as e:
-            logger.error(f"Error processing payload {message}", exc_info=True)
-            return
+            self.broadcaster.publish(
+                channel=media_status_channel(aggregate_id),
+                message=media_status_message(
+                    video_id=aggregate_id,
+                    media_type=media_type,
+                    status=status,
+                    encoded_location=encoded_location,
+                ),
+            )
+        except Exception:
+            # The payload is only logged at debug level, on receipt
+            logger.exception("Error processing message from queue %s", self.queue)
+            return False
+
+        return True
 
     def start(self) -> None:
         """
@@ -100,7 +225,7 @@ class VideoConvertedRabbitMQConsumer(AbstractConsumer):
             queue=self.queue,
             on_message_callback=self.on_message_callback,
         )
-        print("Consumer started. Waiting for messages. To exit press CTRL+C")
+        logger.info("Consumer started on queue %s. To exit press CTRL+C", self.queue)
         self.channel.start_consuming()
 
     def on_message_callback(self, ch, method, properties, body) -> None:
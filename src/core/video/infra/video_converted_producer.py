@@ -1,7 +1,10 @@
 import json
+import logging
 
 import pika
 
+logger = logging.getLogger(__name__)
+
 
 class VideoConvertedRabbitMQProducer:
     """
@@ -36,7 +39,7 @@ class VideoConvertedRabbitMQProducer:
         Establish a connection to RabbitMQ and declare a queue.
 
         This method will block until it can connect to RabbitMQ and declare a queue.
-        If an error occurs, it will print the error message to the console.
+        If an error occurs, it is logged.
         """
 
         try:
@@ -49,14 +52,14 @@ class VideoConvertedRabbitMQProducer:
             self.channel = self.connection.channel()
             self.channel.queue_declare(queue=self.queue)
         except Exception as e:
-            print("Error connecting to RabbitMQ:", e)
+            logger.error("Error connecting to RabbitMQ: %s", e)
 
     def publish(self, message: dict) -> None:
         """
         Publish a message to the RabbitMQ queue.
 
         This method publishes a given message to the specified RabbitMQ queue.
-        If the RabbitMQ channel is not initialized, it prints an error message
+        If the RabbitMQ channel is not initialized, it logs an error message
         and exits the method. It also handles any exceptions that occur during
         the publishing process.
 
@@ -66,7 +69,7 @@ class VideoConvertedRabbitMQProducer:
 
         try:
             if not self.channel:
-                print("RabbitMQ channel not initialized")
+                logger.error("RabbitMQ channel not initialized")
                 return
 
             self.channel.basic_publish(
@@ -74,9 +77,9 @@ class VideoConvertedRabbitMQProducer:
                 routing_key=self.queue,
                 body=json.dumps(message),
             )
-            print(f"Sent: {message} to queue {self.queue}")
+            logger.debug("Sent %s to queue %s", message, self.queue)
         except Exception as e:
-            print("Error sending message to RabbitMQ queue:", e)
+            logger.error("Error sending message to RabbitMQ queue: %s", e)
 
     def close(self):
         """
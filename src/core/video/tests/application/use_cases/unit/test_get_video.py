@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from unittest.mock import create_autospec
 
@@ -117,3 +118,20 @@ class TestGetVideo:
 
         repository.get_by_id.assert_called_once_with(invalid_id)
         assert str(exc_info.value) == f"Video with id {invalid_id} not found"
+
+    def test_aexecute_with_invalid_id(self) -> None:
+        """
+        When getting a video asynchronously by an invalid ID, it awaits `aget_by_id`
+        and raises a VideoNotFound exception.
+        """
+
+        repository = create_autospec(VideoRepository)
+        repository.aget_by_id.return_value = None
+
+        use_case = GetVideo(repository=repository)
+        invalid_id = uuid.uuid4()
+
+        with pytest.raises(VideoNotFound):
+            asyncio.run(use_case.aexecute(GetVideo.Input(invalid_id)))
+
+        repository.aget_by_id.assert_awaited_once_with(invalid_id)
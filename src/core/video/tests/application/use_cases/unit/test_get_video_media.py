@@ -0,0 +1,97 @@
+import uuid
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.video.application.exceptions import MediaNotFound, VideoNotFound
+from src.core.video.application.use_cases.get_video_media import GetVideoMedia
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    ImageType,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoRepository
+
+
+@pytest.fixture
+def video() -> Video:
+    return Video(
+        title="Avatar",
+        description="A paraplegic Marine dispatched to the moon Pandora...",
+        duration=162.0,  # type: ignore
+        launch_year=2009,
+        rating=Rating.AGE_12,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+        banner=ImageMedia(
+            name="banner.png",
+            location="images/banner.png",
+            image_type=ImageType.BANNER,
+            check_sum="b4",
+        ),
+        video=AudioVideoMedia(
+            name="avatar.mp4",
+            raw_location="videos/ab/cd/avatar.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+            check_sum="a1",
+        ),
+    )
+
+
+@pytest.fixture
+def repository(video) -> VideoRepository:
+    repository = create_autospec(VideoRepository)
+    repository.get_by_id.return_value = video
+    return repository
+
+
+class TestGetVideoMedia:
+    """
+    Test class for the GetVideoMedia use case
+    """
+
+    def test_locates_audio_video_media_by_raw_location(self, video, repository):
+        output = GetVideoMedia(repository).execute(
+            GetVideoMedia.Input(video_id=video.id, media_type="video")
+        )
+
+        assert output == GetVideoMedia.Output(
+            name="avatar.mp4", location="videos/ab/cd/avatar.mp4", check_sum="a1"
+        )
+
+    def test_locates_image_media(self, video, repository):
+        output = GetVideoMedia(repository).execute(
+            GetVideoMedia.Input(video_id=video.id, media_type="banner")
+        )
+
+        assert output.location == "images/banner.png"
+        assert output.check_sum == "b4"
+
+    def test_raises_when_video_does_not_exist(self, repository):
+        repository.get_by_id.return_value = None
+
+        with pytest.raises(VideoNotFound):
+            GetVideoMedia(repository).execute(
+                GetVideoMedia.Input(video_id=uuid.uuid4(), media_type="video")
+            )
+
+    def test_raises_when_video_has_no_such_media(self, video, repository):
+        with pytest.raises(MediaNotFound, match="has no trailer"):
+            GetVideoMedia(repository).execute(
+                GetVideoMedia.Input(video_id=video.id, media_type="trailer")
+            )
+
+    def test_raises_for_unknown_media_type(self, video, repository):
+        with pytest.raises(MediaNotFound, match="Unknown media type"):
+            GetVideoMedia(repository).execute(
+                GetVideoMedia.Input(video_id=video.id, media_type="title")
+            )
+
+        repository.get_by_id.assert_not_called()
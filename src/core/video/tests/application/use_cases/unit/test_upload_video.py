@@ -1,18 +1,20 @@
 import uuid
-from pathlib import Path
 from unittest.mock import create_autospec
 
 import pytest
 
 from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.infrastructure.in_memory_unit_of_work import InMemoryUnitOfWork
 from src.core._shared.infrastructure.storage.abstract_storage_service import (
     AbstractStorageService,
+    sharded_path,
 )
 from src.core.video.application.events.integration_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
 from src.core.video.application.exceptions import VideoNotFound
 from src.core.video.application.use_cases.upload_video import UploadVideo
+from src.core.video.domain.events.event import AudioVideoMediaUpdated
 from src.core.video.domain.value_objects import (
     AudioVideoMedia,
     MediaStatus,
@@ -56,12 +58,13 @@ class TestUploadVideo:
         assert video_repository.videos[0] == video
 
         mock_storage = create_autospec(AbstractStorageService)
+        mock_storage.store.return_value = "a1b2c3"
         mock_message_bus = create_autospec(AbstractMessageBus)
 
         use_case = UploadVideo(
             video_repository,
             mock_storage,
-            mock_message_bus,
+            InMemoryUnitOfWork(mock_message_bus),
         )
         use_case.execute(
             UploadVideo.Input(
@@ -73,7 +76,7 @@ class TestUploadVideo:
         )
 
         mock_storage.store.assert_called_once_with(
-            file_path=str(Path("videos") / str(video.id) / "avatar.mp4"),
+            file_path=sharded_path("videos", str(video.id), "avatar.mp4"),
             content=b"avatar_movie_test",
             content_type="video/mp4",
         )
@@ -81,18 +84,24 @@ class TestUploadVideo:
         video_from_repository = video_repository.get_by_id(video.id)
         assert video_from_repository.video == AudioVideoMedia(  # type: ignore
             name="avatar.mp4",
-            raw_location=str(Path("videos") / str(video.id) / "avatar.mp4"),
+            raw_location=sharded_path("videos", str(video.id), "avatar.mp4"),
             encoded_location="",
             status=MediaStatus.PENDING,
             media_type=MediaType.VIDEO,
+            check_sum="a1b2c3",
         )
         assert video_repository.videos[0] == video
         mock_message_bus.handle.assert_called_once_with(
             [
+                AudioVideoMediaUpdated(
+                    aggregate_id=video.id,
+                    file_path=sharded_path("videos", str(video.id), "avatar.mp4"),
+                    media_type=MediaType.VIDEO,
+                ),
                 AudioVideoMediaUpdatedIntegrationEvent(
                     resource_id=f"{video.id}.{MediaType.VIDEO}",
-                    file_path=str(Path("videos") / str(video.id) / "avatar.mp4"),
-                )
+                    file_path=sharded_path("videos", str(video.id), "avatar.mp4"),
+                ),
             ]
         )
 
@@ -110,7 +119,7 @@ class TestUploadVideo:
         use_case = UploadVideo(
             video_repository,
             mock_storage,
-            mock_message_bus,
+            InMemoryUnitOfWork(mock_message_bus),
         )
         with pytest.raises(VideoNotFound) as exc_info:
             use_case.execute(
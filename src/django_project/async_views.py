@@ -0,0 +1,122 @@
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.exceptions import NotAuthenticated, PermissionDenied
+from rest_framework.status import HTTP_200_OK, HTTP_403_FORBIDDEN
+
+from src.core._shared.infrastructure.auth.jwt_auth_service import JwtAuthService
+from src.core._shared.infrastructure.instrumentation import timed
+from src.django_project.compiled_serializers import CompiledSerializer
+from src.django_project.instrumentation import TimedJSONRenderer
+
+
+class AsyncReadView(View):
+    """
+    Base class for read-only views served natively under ASGI.
+
+    DRF viewsets are synchronous, so every request holds a worker while waiting
+    on the database. Subclasses implement `handle` as a coroutine that calls the
+    async variants of the use cases and repositories instead. Permissions and
+    response rendering mirror the DRF viewsets, so both paths answer the same
+    requests with the same bytes.
+    """
+
+    http_method_names = ["get"]
+    renderer = TimedJSONRenderer()
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Check the permissions and delegate the request to `handle`.
+
+        Args:
+            request (HttpRequest): The incoming request.
+
+        Returns:
+            HttpResponse: The rendered response.
+        """
+
+        denied = self.permission_denied(request)
+        if denied is not None:
+            return self.render(data={"detail": denied}, status=HTTP_403_FORBIDDEN)
+
+        return await self.handle(request, *args, **kwargs)
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Handle an authorized request.
+
+        Args:
+            request (HttpRequest): The incoming request.
+
+        Returns:
+            HttpResponse: The rendered response.
+        """
+
+        raise NotImplementedError
+
+    def permission_denied(self, request: HttpRequest) -> str | None:
+        """
+        Check that the request carries a valid token with the admin role.
+
+        Equivalent to the IsAuthenticated and IsAdmin permissions used by the
+        viewsets, telling a missing or invalid token from a user lacking the
+        admin role.
+
+        Args:
+            request (HttpRequest): The incoming request.
+
+        Returns:
+            str | None: The reason the request is denied, or None if allowed.
+        """
+
+        with timed("auth"):
+            auth_service = JwtAuthService(
+                token=request.headers.get("Authorization", "")
+            )
+            if not auth_service.is_authenticated():
+                return str(NotAuthenticated.default_detail)
+            if not auth_service.has_role("admin"):
+                return str(PermissionDenied.default_detail)
+
+        return None
+
+    def render(self, data, status: int) -> HttpResponse:
+        """
+        Render the given data as JSON, exactly like the DRF JSONRenderer.
+
+        Args:
+            data: The data to be rendered.
+            status (int): The HTTP status code of the response.
+
+        Returns:
+            HttpResponse: The rendered response.
+        """
+
+        return HttpResponse(
+            content=self.renderer.render(data),
+            status=status,
+            content_type="application/json",
+        )
+
+    def render_compiled(
+        self,
+        serializer: CompiledSerializer,
+        instance,
+        status: int = HTTP_200_OK,
+    ) -> HttpResponse:
+        """
+        Render a use case output straight to JSON through a compiled serializer.
+
+        Args:
+            serializer (CompiledSerializer): The compiled response serializer.
+            instance: The use case output to be rendered.
+            status (int): The HTTP status code of the response.
+
+        Returns:
+            HttpResponse: The rendered response.
+        """
+
+        return HttpResponse(
+            content=serializer.render(instance),
+            status=status,
+            content_type="application/json",
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="castmember",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
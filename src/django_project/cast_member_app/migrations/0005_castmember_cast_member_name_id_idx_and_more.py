@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0004_alter_castmember_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="castmember",
+            index=models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="castmember",
+            index=models.Index(
+                fields=["type", "name", "id"], name="cast_member_type_name_id_idx"
+            ),
+        ),
+    ]
@@ -1,15 +1,15 @@
-import uuid
-
 from django.db import models
 
+from src.core._shared.domain.uuid7 import uuid7
 from src.core.cast_member.domain.cast_member import CastMemberType
+from src.django_project.fields import CompactUUIDField
 
 
 # Create your models here.
 class CastMember(models.Model):
     app_label = "cast_member_app"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = CompactUUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255, null=False, blank=False)
     type = models.CharField(
         max_length=8,
@@ -17,6 +17,7 @@ class CastMember(models.Model):
         blank=False,
         choices=[(tag.name, tag.value) for tag in CastMemberType],
     )
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return str(self.name)
@@ -25,3 +26,9 @@ class CastMember(models.Model):
         verbose_name = "Cast Member"
         verbose_name_plural = "Cast Members"
         db_table = "cast_member"
+        indexes = [
+            models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+            models.Index(
+                fields=["type", "name", "id"], name="cast_member_type_name_id_idx"
+            ),
+        ]
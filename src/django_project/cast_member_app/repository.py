@@ -1,16 +1,30 @@
 import uuid
-from typing import List
+from typing import Iterable, List, Set, Tuple
 
+from django.db import transaction
+from django.utils import timezone
+
+from src.core.cast_member.application.use_cases.list_cast_member import (
+    CastMemberOutput,
+)
 from src.core.cast_member.domain.cast_member import CastMember
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 from src.django_project.cast_member_app.models import CastMember as CastMemberModel
+from src.django_project.conditional import touch_related
+from src.django_project.metrics import instrument_repository
+from src.django_project.projections import matching, ordering
+from src.django_project.totals import atotal, record, total
 
 
+@instrument_repository("cast_member")
 class DjangoORMCastMemberRepository(CastMemberRepository):
     """
     Django ORM implementation for a cast member repository.
     """
 
+    # The fields the list endpoint sorts by, each backed by a (field, id) index
+    sortable_fields = ("name", "id")
+
     def __init__(self, cast_member_model: CastMemberModel | None = None):
         """
         Initialize the Django ORM Cast Member repository.
@@ -36,6 +50,7 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
         }
 
         self.cast_member_model.objects.create(**cast_member_data)
+        record(self.cast_member_model, 1)
 
     def get_by_id(self, cast_member_id: uuid.UUID) -> CastMember | None:
         """
@@ -58,6 +73,28 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
         except self.cast_member_model.DoesNotExist:
             return None
 
+    def get_by_ids(self, cast_member_ids: Iterable[uuid.UUID]) -> List[CastMember]:
+        """
+        Retrieve the cast members with the given IDs in a single query.
+
+        Args:
+            cast_member_ids (Iterable[uuid.UUID]): The IDs of the cast members to be retrieved.
+
+        Returns:
+            List[CastMember]: The cast members found, in no particular order.
+        """
+
+        return [
+            CastMember(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=cast_member.type,  # type: ignore
+            )
+            for cast_member in self.cast_member_model.objects.filter(
+                pk__in=list(cast_member_ids)
+            )
+        ]
+
     def list(self) -> List[CastMember]:
         """
         List all cast members from the repository.
@@ -75,6 +112,166 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             for cast_member in self.cast_member_model.objects.all()
         ]
 
+    async def aget_by_id(self, cast_member_id: uuid.UUID) -> CastMember | None:
+        """
+        Asynchronously retrieve a cast member by its ID from the repository.
+
+        Args:
+            cast_member_id (uuid.UUID): The ID of the cast member to be retrieved.
+
+        Returns:
+            CastMember | None: The cast member with the given ID, or None if it doesn't exist.
+        """
+
+        try:
+            cast_member = await self.cast_member_model.objects.aget(pk=cast_member_id)
+            return CastMember(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=cast_member.type,  # type: ignore
+            )
+        except self.cast_member_model.DoesNotExist:
+            return None
+
+    async def aget_by_ids(
+        self, cast_member_ids: Iterable[uuid.UUID]
+    ) -> List[CastMember]:
+        """
+        Asynchronously retrieve the cast members with the given IDs in a single query.
+
+        Args:
+            cast_member_ids (Iterable[uuid.UUID]): The IDs of the cast members to be retrieved.
+
+        Returns:
+            List[CastMember]: The cast members found, in no particular order.
+        """
+
+        return [
+            CastMember(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=cast_member.type,  # type: ignore
+            )
+            async for cast_member in self.cast_member_model.objects.filter(
+                pk__in=list(cast_member_ids)
+            )
+        ]
+
+    async def alist(self) -> List[CastMember]:
+        """
+        Asynchronously list all cast members from the repository.
+
+        Returns:
+            list[CastMember]: A list of all cast members.
+        """
+
+        return [
+            CastMember(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=cast_member.type,  # type: ignore
+            )
+            async for cast_member in self.cast_member_model.objects.all()
+        ]
+
+    def list_projections(self) -> List[CastMemberOutput]:
+        """
+        List all cast members as read-only outputs, straight from the rows.
+
+        Returns:
+            List[CastMemberOutput]: A list of all cast members.
+        """
+
+        return list(
+            map(
+                CastMemberOutput._make,
+                self.cast_member_model.objects.values_list(*CastMemberOutput._fields),
+            )
+        )
+
+    async def alist_projections(self) -> List[CastMemberOutput]:
+        """
+        Asynchronously list all cast members as read-only outputs.
+
+        Returns:
+            List[CastMemberOutput]: A list of all cast members.
+        """
+
+        return [
+            CastMemberOutput._make(row)
+            async for row in self.cast_member_model.objects.values_list(
+                *CastMemberOutput._fields
+            )
+        ]
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[CastMemberOutput], int]:
+        """
+        Get a page of the cast members as read-only outputs, sorted and sliced by
+        the database.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of cast members skipped.
+            limit (int): The maximum number of cast members returned.
+            ids (Set[uuid.UUID] | None): Only page the cast members with these ids.
+                Defaults to every cast member.
+
+        Returns:
+            Tuple[List[CastMemberOutput], int]: The cast members of the page and the total
+                number of cast members.
+        """
+
+        matched = matching(self.cast_member_model.objects.all(), ids)
+        rows = matched.order_by(*ordering(order_by, descending)).values_list(
+            *CastMemberOutput._fields
+        )[offset : offset + limit]
+
+        return (
+            list(map(CastMemberOutput._make, rows)),
+            total(matched, exact=ids is not None),
+        )
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[CastMemberOutput], int]:
+        """
+        Asynchronously get a page of the cast members as read-only outputs.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of cast members skipped.
+            limit (int): The maximum number of cast members returned.
+            ids (Set[uuid.UUID] | None): Only page the cast members with these ids.
+                Defaults to every cast member.
+
+        Returns:
+            Tuple[List[CastMemberOutput], int]: The cast members of the page and the total
+                number of cast members.
+        """
+
+        matched = matching(self.cast_member_model.objects.all(), ids)
+        rows = matched.order_by(*ordering(order_by, descending)).values_list(
+            *CastMemberOutput._fields
+        )[offset : offset + limit]
+
+        return [CastMemberOutput._make(row) async for row in rows], await atotal(
+            matched, exact=ids is not None
+        )
+
     def delete(self, cast_member_id: uuid.UUID):
         """
         Delete a cast member by its ID from the repository.
@@ -83,7 +280,15 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             cast_member_id (uuid.UUID): The ID of the cast member to be deleted.
         """
 
-        self.cast_member_model.objects.filter(pk=cast_member_id).delete()
+        with transaction.atomic():
+            touch_related(self.cast_member_model, [cast_member_id])
+            _, deleted = self.cast_member_model.objects.filter(
+                pk=cast_member_id
+            ).delete()
+        record(
+            self.cast_member_model,
+            -deleted.get(self.cast_member_model._meta.label, 0),
+        )
 
     def update(self, cast_member: CastMember):
         """
@@ -96,6 +301,7 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
         cast_member_data = {
             "name": cast_member.name,
             "type": cast_member.type,
+            "updated_at": timezone.now(),
         }
 
         self.cast_member_model.objects.filter(pk=cast_member.id).update(
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from src.core.cast_member.domain.cast_member import CastMemberType
+from src.django_project.compiled_serializers import compile_serializer
 from src.django_project.serializers import ListResponseSerializer
 
 
@@ -90,3 +91,6 @@ class UpdateCastMemberRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     type = CastMemberTypeField(required=True)
+
+
+LIST_CAST_MEMBER_RESPONSE = compile_serializer(ListCastMemberResponseSerializer())
@@ -2,6 +2,9 @@ import uuid
 
 import pytest
 
+from src.core.cast_member.application.use_cases.list_cast_member import (
+    CastMemberOutput,
+)
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.django_project.cast_member_app.models import CastMember as CastMemberModel
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
@@ -120,6 +123,23 @@ class TestList:
         assert cast_members_from_db[2].name == "Clint Eastwood"
         assert cast_members_from_db[2].type == CastMemberType.DIRECTOR
 
+    def test_list_projections(self):
+        """
+        Test that the projections hold the same data as the listed CastMembers.
+        """
+
+        repository = DjangoORMCastMemberRepository()
+        cast_member = CastMember(name="Clint Eastwood", type=CastMemberType.DIRECTOR)
+        repository.save(cast_member=cast_member)
+
+        assert repository.list_projections() == [
+            CastMemberOutput(
+                id=cast_member.id,
+                name="Clint Eastwood",
+                type=CastMemberType.DIRECTOR,
+            )
+        ]
+
 
 @pytest.mark.django_db
 class TestDelete:
@@ -1,3 +1,4 @@
+from django.http import HttpRequest, HttpResponse
 from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -10,7 +11,12 @@ from rest_framework.status import (
 )
 
 from src.core._shared.application.use_cases.delete import DeleteRequest
-from src.core._shared.application.use_cases.list import ListRequest, ListResponse
+from src.core._shared.application.use_cases.list import (
+    InvalidOrderBy,
+    ListRequest,
+    ListResponse,
+)
+from src.core._shared.infrastructure.instrumentation import timed
 from src.core.cast_member.application.exceptions import (
     CastMemberNotFound,
     InvalidCastMember,
@@ -25,15 +31,19 @@ from src.core.cast_member.application.use_cases.list_cast_member import ListCast
 from src.core.cast_member.application.use_cases.update_cast_member import (
     UpdateCastMember,
 )
+from src.django_project.async_views import AsyncReadView
+from src.django_project.cast_member_app.models import CastMember as CastMemberModel
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.cast_member_app.serializers import (
+    LIST_CAST_MEMBER_RESPONSE,
     CreateCastMemberRequestSerializer,
-    ListCastMemberResponseSerializer,
     UpdateCastMemberRequestSerializer,
 )
+from src.django_project.conditional import collection_version, conditional
 from src.django_project.permissions import IsAdmin, IsAuthenticated
 from src.django_project.serializers import (
     CreateResponseSerializer,
+    ListRequestSerializer,
     RetrieveDeleteRequestSerializer,
 )
 
@@ -45,6 +55,7 @@ class CastMemberViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    @conditional(collection_version(CastMemberModel))
     def list(self, request: Request) -> Response:
         """
         List all cast members.
@@ -55,21 +66,28 @@ class CastMemberViewSet(viewsets.ViewSet):
 
         order_by = request.query_params.get("order_by", "name")
         reverse_order = request.query_params.get("sort", "asc")
-        current_page = request.query_params.get("current_page", 1)
+        filters = ListRequestSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
         use_case = ListCastMember(DjangoORMCastMemberRepository())
-        res: ListResponse = use_case.execute(
-            ListRequest(
-                order_by=order_by,
-                sort=reverse_order,
-                current_page=int(current_page),
+        try:
+            with timed("use_case"):
+                res: ListResponse = use_case.execute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )
+        except InvalidOrderBy as e:
+            return Response(
+                data={"error": str(e)},
+                status=HTTP_400_BAD_REQUEST,
             )
-        )
-
-        serializer = ListCastMemberResponseSerializer(instance=res)
 
         return Response(
-            data=serializer.data,
+            data=LIST_CAST_MEMBER_RESPONSE.to_representation(res),
             status=HTTP_200_OK,
         )
 
@@ -92,7 +110,8 @@ class CastMemberViewSet(viewsets.ViewSet):
         )
         use_case = CreateCastMember(DjangoORMCastMemberRepository())
         try:
-            output: CreateCastMember.Output = use_case.execute(req)
+            with timed("use_case"):
+                output: CreateCastMember.Output = use_case.execute(req)
         except InvalidCastMember as e:
             return Response(
                 data={"error": str(e)},
@@ -129,7 +148,8 @@ class CastMemberViewSet(viewsets.ViewSet):
         )
         use_case = UpdateCastMember(DjangoORMCastMemberRepository())
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except InvalidCastMember as e:
             return Response(
                 data={"error": str(e)},
@@ -164,7 +184,8 @@ class CastMemberViewSet(viewsets.ViewSet):
 
         use_case = DeleteCastMember(DjangoORMCastMemberRepository())
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except CastMemberNotFound:
             return Response(
                 data={"detail": "Cast member not found"},
@@ -174,3 +195,42 @@ class CastMemberViewSet(viewsets.ViewSet):
         return Response(
             status=HTTP_204_NO_CONTENT,
         )
+
+
+class AsyncCastMemberListView(AsyncReadView):
+    """
+    Async view for listing cast members under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        List all cast members.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+
+        Returns:
+            HttpResponse: A response containing a list of CastMemberOutput objects.
+        """
+
+        order_by = request.GET.get("order_by", "name")
+        reverse_order = request.GET.get("sort", "asc")
+        filters = ListRequestSerializer(data=request.GET)
+        if not filters.is_valid():
+            return self.render(data=filters.errors, status=HTTP_400_BAD_REQUEST)
+
+        use_case = ListCastMember(DjangoORMCastMemberRepository())
+        try:
+            with timed("use_case"):
+                res: ListResponse = await use_case.aexecute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )
+        except InvalidOrderBy as e:
+            return self.render(data={"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+
+        return self.render_compiled(LIST_CAST_MEMBER_RESPONSE, res)
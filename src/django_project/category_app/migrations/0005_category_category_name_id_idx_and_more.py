@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0004_alter_category_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(fields=["name", "id"], name="category_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["is_active", "name", "id"], name="category_active_name_id_idx"
+            ),
+        ),
+    ]
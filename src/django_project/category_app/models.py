@@ -1,7 +1,8 @@
-import uuid
-
 from django.db import models
 
+from src.core._shared.domain.uuid7 import uuid7
+from src.django_project.fields import CompactUUIDField
+
 
 # Create your models here.
 class Category(models.Model):
@@ -11,10 +12,11 @@ class Category(models.Model):
 
     app_label = "category_app"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = CompactUUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255, null=False, blank=False)
     description = models.TextField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return str(self.name)
@@ -27,3 +29,11 @@ class Category(models.Model):
         verbose_name = "Category"
         verbose_name_plural = "Categories"
         db_table = "category"
+        # (field, id) pairs match the list ordering, ties broken by id, so
+        # pages are read from an index instead of sorting the table
+        indexes = [
+            models.Index(fields=["name", "id"], name="category_name_id_idx"),
+            models.Index(
+                fields=["is_active", "name", "id"], name="category_active_name_id_idx"
+            ),
+        ]
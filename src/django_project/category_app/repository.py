@@ -1,16 +1,28 @@
 import uuid
-from typing import List
+from typing import Iterable, List, Set, Tuple
 
+from django.db import transaction
+from django.utils import timezone
+
+from src.core.category.application.use_cases.list_category import CategoryOutput
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.conditional import touch_related
+from src.django_project.metrics import instrument_repository
+from src.django_project.projections import matching, ordering
+from src.django_project.totals import atotal, record, total
 
 
+@instrument_repository("category")
 class DjangoORMCategoryRepository(CategoryRepository):
     """
     Django ORM implementation for a category repository.
     """
 
+    # The fields the list endpoint sorts by, each backed by a (field, id) index
+    sortable_fields = ("name", "id")
+
     def __init__(self, category_model: CategoryModel | None = None):
         """
         Initialize the DjangoORMCategoryRepository with an optional CategoryModel.
@@ -32,6 +44,7 @@ class DjangoORMCategoryRepository(CategoryRepository):
 
         category_model = CategoryModelMapper.to_model(category)
         category_model.save()
+        record(self.category_model, 1)
 
     def get_by_id(self, category_id: uuid.UUID) -> Category | None:
         """
@@ -50,6 +63,24 @@ class DjangoORMCategoryRepository(CategoryRepository):
         except self.category_model.DoesNotExist:
             return None
 
+    def get_by_ids(self, category_ids: Iterable[uuid.UUID]) -> List[Category]:
+        """
+        Retrieve the categories with the given IDs in a single query.
+
+        Args:
+            category_ids (Iterable[uuid.UUID]): The IDs of the categories to be retrieved.
+
+        Returns:
+            List[Category]: The categories found, in no particular order.
+        """
+
+        return [
+            CategoryModelMapper.to_entity(category_model)
+            for category_model in self.category_model.objects.filter(
+                pk__in=list(category_ids)
+            )
+        ]
+
     def delete(self, category_id: uuid.UUID):
         """
         Delete a category by its ID from the Django ORM database.
@@ -58,7 +89,10 @@ class DjangoORMCategoryRepository(CategoryRepository):
             category_id (uuid.UUID): The ID of the category to be deleted.
         """
 
-        self.category_model.objects.filter(pk=category_id).delete()
+        with transaction.atomic():
+            touch_related(self.category_model, [category_id])
+            _, deleted = self.category_model.objects.filter(pk=category_id).delete()
+        record(self.category_model, -deleted.get(self.category_model._meta.label, 0))
 
     def update(self, category: Category):
         """
@@ -75,6 +109,7 @@ class DjangoORMCategoryRepository(CategoryRepository):
             "name": category.name,
             "description": category.description,
             "is_active": category.is_active,
+            "updated_at": timezone.now(),
         }
 
         self.category_model.objects.filter(pk=category.id).update(**category_data)
@@ -92,6 +127,153 @@ class DjangoORMCategoryRepository(CategoryRepository):
             for category_model in self.category_model.objects.all()
         ]
 
+    async def aget_by_id(self, category_id: uuid.UUID) -> Category | None:
+        """
+        Asynchronously retrieve a category by its ID from the Django ORM database.
+
+        Args:
+            category_id (uuid.UUID): The ID of the category to be retrieved.
+
+        Returns:
+            Category | None: The category with the given ID, or None if it doesn't exist.
+        """
+
+        try:
+            category = await self.category_model.objects.aget(pk=category_id)
+            return CategoryModelMapper.to_entity(category)
+        except self.category_model.DoesNotExist:
+            return None
+
+    async def aget_by_ids(self, category_ids: Iterable[uuid.UUID]) -> List[Category]:
+        """
+        Asynchronously retrieve the categories with the given IDs in a single query.
+
+        Args:
+            category_ids (Iterable[uuid.UUID]): The IDs of the categories to be retrieved.
+
+        Returns:
+            List[Category]: The categories found, in no particular order.
+        """
+
+        return [
+            CategoryModelMapper.to_entity(category_model)
+            async for category_model in self.category_model.objects.filter(
+                pk__in=list(category_ids)
+            )
+        ]
+
+    async def alist(self) -> List[Category]:
+        """
+        Asynchronously list all categories from the Django ORM database.
+
+        Returns:
+            list[Category]: A list of all categories in the database.
+        """
+
+        return [
+            CategoryModelMapper.to_entity(category_model)
+            async for category_model in self.category_model.objects.all()
+        ]
+
+    def list_projections(self) -> List[CategoryOutput]:
+        """
+        List all categories as read-only outputs, built from the rows without
+        constructing and validating the entities.
+
+        Returns:
+            List[CategoryOutput]: A list of all categories in the database.
+        """
+
+        return list(
+            map(
+                CategoryOutput._make,
+                self.category_model.objects.values_list(*CategoryOutput._fields),
+            )
+        )
+
+    async def alist_projections(self) -> List[CategoryOutput]:
+        """
+        Asynchronously list all categories as read-only outputs.
+
+        Returns:
+            List[CategoryOutput]: A list of all categories in the database.
+        """
+
+        return [
+            CategoryOutput._make(row)
+            async for row in self.category_model.objects.values_list(
+                *CategoryOutput._fields
+            )
+        ]
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[CategoryOutput], int]:
+        """
+        Get a page of the categories as read-only outputs, sorted and sliced by
+        the database.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of categories skipped.
+            limit (int): The maximum number of categories returned.
+            ids (Set[uuid.UUID] | None): Only page the categories with these ids.
+                Defaults to every category.
+
+        Returns:
+            Tuple[List[CategoryOutput], int]: The categories of the page and the total
+                number of categories.
+        """
+
+        matched = matching(self.category_model.objects.all(), ids)
+        rows = matched.order_by(*ordering(order_by, descending)).values_list(
+            *CategoryOutput._fields
+        )[offset : offset + limit]
+
+        return (
+            list(map(CategoryOutput._make, rows)),
+            total(matched, exact=ids is not None),
+        )
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[CategoryOutput], int]:
+        """
+        Asynchronously get a page of the categories as read-only outputs.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of categories skipped.
+            limit (int): The maximum number of categories returned.
+            ids (Set[uuid.UUID] | None): Only page the categories with these ids.
+                Defaults to every category.
+
+        Returns:
+            Tuple[List[CategoryOutput], int]: The categories of the page and the total
+                number of categories.
+        """
+
+        matched = matching(self.category_model.objects.all(), ids)
+        rows = matched.order_by(*ordering(order_by, descending)).values_list(
+            *CategoryOutput._fields
+        )[offset : offset + limit]
+
+        return [CategoryOutput._make(row) async for row in rows], await atotal(
+            matched, exact=ids is not None
+        )
+
 
 class CategoryModelMapper:
     """
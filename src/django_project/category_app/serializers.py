@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from src.django_project.compiled_serializers import compile_serializer
 from src.django_project.serializers import ListResponseSerializer
 
 
@@ -58,3 +59,8 @@ class UpdateCategoryRequestSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255, allow_blank=False)
     description = serializers.CharField()
     is_active = serializers.BooleanField()
+
+
+LIST_CATEGORY_RESPONSE = compile_serializer(ListCategoryResponseSerializer())
+
+RETRIEVE_CATEGORY_RESPONSE = compile_serializer(RetrieveCategoryResponseSerializer())
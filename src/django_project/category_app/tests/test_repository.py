@@ -1,5 +1,9 @@
+import uuid
+
 import pytest
+from asgiref.sync import async_to_sync
 
+from src.core.category.application.use_cases.list_category import CategoryOutput
 from src.core.category.domain.category import Category
 from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
@@ -20,3 +24,39 @@ class TestSave:
         assert category_db.name == category.name
         assert category_db.description == category.description
         assert category_db.is_active == category.is_active
+
+
+@pytest.mark.django_db
+class TestAsyncRead:
+    def test_aget_by_id_and_alist(self):
+        category = Category(name="Action", description="Action movies")
+        repository = DjangoORMCategoryRepository()
+        repository.save(category)
+
+        assert async_to_sync(repository.aget_by_id)(category.id) == category
+        assert async_to_sync(repository.alist)() == [category]
+
+    def test_get_by_ids(self, django_assert_num_queries):
+        categories = [Category(name=name) for name in ("Action", "Drama", "Horror")]
+        repository = DjangoORMCategoryRepository()
+        for category in categories:
+            repository.save(category)
+        requested = [categories[0].id, categories[2].id, uuid.uuid4()]
+
+        with django_assert_num_queries(1):
+            found = repository.get_by_ids(requested)
+
+        assert sorted(found, key=lambda category: category.name) == [
+            categories[0],
+            categories[2],
+        ]
+        assert len(async_to_sync(repository.aget_by_ids)(requested)) == 2
+
+    def test_alist_projections(self):
+        category = Category(name="Action", description="Action movies")
+        repository = DjangoORMCategoryRepository()
+        repository.save(category)
+
+        expected = [CategoryOutput(category.id, "Action", "Action movies", True)]
+        assert repository.list_projections() == expected
+        assert async_to_sync(repository.alist_projections)() == expected
@@ -0,0 +1,45 @@
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.application.use_cases.list import ListResponseMeta
+from src.core.category.domain.category import Category
+from src.django_project.category_app.serializers import (
+    LIST_CATEGORY_RESPONSE,
+    RETRIEVE_CATEGORY_RESPONSE,
+    ListCategoryResponseSerializer,
+    RetrieveCategoryResponseSerializer,
+)
+
+
+class TestCompiledSerializer:
+    """
+    Tests that compiled serializers render the same bytes as the DRF serializers.
+    """
+
+    def test_categories_match_serializer(self):
+        categories = [
+            Category(name="Movie", description="Movies category"),
+            Category(name="Série", description="", is_active=False),
+        ]
+        res = {
+            "data": categories,
+            "meta": ListResponseMeta(current_page=2, per_page=2, total=4),
+        }
+
+        assert LIST_CATEGORY_RESPONSE.render(res) == JSONRenderer().render(
+            ListCategoryResponseSerializer(instance=res).data
+        )
+        assert RETRIEVE_CATEGORY_RESPONSE.render(
+            categories[1]
+        ) == JSONRenderer().render(
+            RetrieveCategoryResponseSerializer(instance=categories[1]).data
+        )
+
+    def test_empty_list_matches_serializer(self):
+        res = {
+            "data": [],
+            "meta": ListResponseMeta(current_page=1, per_page=2, total=0),
+        }
+
+        assert LIST_CATEGORY_RESPONSE.render(res) == JSONRenderer().render(
+            ListCategoryResponseSerializer(instance=res).data
+        )
@@ -2,11 +2,15 @@ import os
 import uuid
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
 )
 from rest_framework.test import APIClient
@@ -162,6 +166,177 @@ class TestListAPI:
         assert response.status_code == HTTP_200_OK  # type: ignore
         assert response.data == expected_data  # type: ignore
 
+    @pytest.mark.parametrize("path", ["/api/categories/", "/api/async/categories/"])
+    def test_list_rejects_unindexed_order_by(
+        self, path: str, api_client_with_auth: APIClient
+    ):
+        """
+        Test that sorting by a field outside the indexed whitelist returns 400
+        instead of sorting the whole table.
+        """
+
+        response = api_client_with_auth.get(f"{path}?order_by=description")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST  # type: ignore
+        assert response.json() == {  # type: ignore
+            "error": "Cannot order by description, use one of: name, id"
+        }
+
+    @pytest.mark.parametrize("path", ["/api/categories/", "/api/async/categories/"])
+    def test_list_filters_by_ids_in_one_page(
+        self,
+        path: str,
+        category_movie: Category,
+        category_tv_show: Category,
+        category_repository: DjangoORMCategoryRepository,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Test that `?ids=` lists every requested category in a single page,
+        skipping the ids without a category.
+        """
+
+        documentary = Category(name="Documentary", description="Documentaries")
+        for category in (category_movie, category_tv_show, documentary):
+            category_repository.save(category)
+        ids = [category_movie.id, documentary.id, uuid.uuid4()]
+
+        response = api_client_with_auth.get(
+            f"{path}?ids={','.join(str(id) for id in ids)}"
+        )
+
+        assert response.status_code == HTTP_200_OK  # type: ignore
+        body = response.json()  # type: ignore
+        assert [category["name"] for category in body["data"]] == [
+            "Documentary",
+            "Movie",
+        ]
+        assert body["meta"] == {"current_page": 1, "per_page": 3, "total": 2}
+
+    @pytest.mark.parametrize("path", ["/api/categories/", "/api/async/categories/"])
+    def test_list_rejects_invalid_current_page(
+        self, path: str, api_client_with_auth: APIClient
+    ):
+        """
+        Test that a current_page that is not a positive integer returns 400.
+        """
+
+        for current_page in ("abc", "0"):
+            response = api_client_with_auth.get(f"{path}?current_page={current_page}")
+
+            assert response.status_code == HTTP_400_BAD_REQUEST  # type: ignore
+            assert "current_page" in response.json()  # type: ignore
+
+    def test_async_list_denies_authenticated_users_without_admin_role(
+        self, setup_auth_env
+    ):
+        """
+        Test that the async list tells a valid token without the admin role
+        that it lacks the permission, not that it sent no credentials.
+        """
+
+        path = "/api/async/categories/"
+        token = setup_auth_env.generate_token(
+            user_info={"username": "viewer", "realm_roles": ["viewer"]}
+        )
+        client = APIClient(headers={"Authorization": f"Bearer {token}"})
+
+        response = client.get(path)
+
+        assert response.status_code == HTTP_403_FORBIDDEN  # type: ignore
+        assert response.json() == {  # type: ignore
+            "detail": "You do not have permission to perform this action."
+        }
+        assert APIClient().get(path).json() == {  # type: ignore
+            "detail": "Authentication credentials were not provided."
+        }
+
+    @pytest.mark.parametrize("path", ["/api/categories/", "/api/async/categories/"])
+    def test_list_rejects_invalid_ids(self, path: str, api_client_with_auth: APIClient):
+        """
+        Test that `?ids=` with a value that is not a UUID, or without any id,
+        returns 400.
+        """
+
+        for ids in ("invalid", ",", " , "):
+            response = api_client_with_auth.get(f"{path}?ids={ids}")
+
+            assert response.status_code == HTTP_400_BAD_REQUEST  # type: ignore
+            assert "ids" in response.json()  # type: ignore
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedTotalAPI:
+    """
+    Test the list totals kept in the cache, outside of any transaction
+    """
+
+    @pytest.fixture(autouse=True)
+    def cached_totals(self, settings, setup_auth_env, monkeypatch):
+        # Transactional tests run last, after the session fixtures of other
+        # modules replaced the public key
+        monkeypatch.setenv(
+            "AUTH_PUBLIC_KEY",
+            setup_auth_env.public_key_pem.decode()
+            .replace("-----BEGIN PUBLIC KEY-----\n", "")
+            .replace("\n-----END PUBLIC KEY-----\n", ""),
+        )
+        settings.LIST_TOTAL_MODE = "cached"
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.mark.parametrize("path", ["/api/categories/", "/api/async/categories/"])
+    def test_writes_move_the_total_without_counting(
+        self,
+        path: str,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Test that the total is counted once, then moved by the writes of the
+        API instead of counted again.
+        """
+
+        category_repository.save(category_movie)
+        assert api_client_with_auth.get(path).json()["meta"]["total"] == 1  # type: ignore
+
+        created = api_client_with_auth.post(
+            "/api/categories/", {"name": "Series", "description": "TV series"}
+        )
+        assert created.status_code == HTTP_201_CREATED  # type: ignore
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client_with_auth.get(path)
+        assert response.json()["meta"]["total"] == 2  # type: ignore
+        assert not any('"__count"' in query["sql"] for query in queries)
+
+        api_client_with_auth.delete(f"/api/categories/{created.json()['id']}/")  # type: ignore
+        assert api_client_with_auth.get(path).json()["meta"]["total"] == 1  # type: ignore
+
+    def test_list_reads_the_version_and_the_page_only(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Test that a list GET with a cached total reads the latest update and
+        the page, without counting the rows for the total or the ETag.
+        """
+
+        category_repository.save(category_movie)
+        etag = api_client_with_auth.get("/api/categories/").headers["ETag"]  # type: ignore
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client_with_auth.get("/api/categories/")
+        assert response.headers["ETag"] == etag  # type: ignore
+        assert len(queries) == 2
+        assert not any("COUNT(" in query["sql"] for query in queries)
+
+        category_repository.delete(category_movie.id)
+        assert api_client_with_auth.get("/api/categories/").headers["ETag"] != etag  # type: ignore
+
 
 @pytest.mark.django_db
 class TestRetrieveAPI:
@@ -239,6 +414,77 @@ class TestRetrieveAPI:
         assert response.status_code == HTTP_404_NOT_FOUND  # type: ignore
 
 
+@pytest.mark.django_db
+class TestAsyncReadAPI:
+    """
+    Test the async read endpoints served under ASGI.
+    """
+
+    def test_list_matches_sync_endpoint(
+        self,
+        category_movie: Category,
+        category_tv_show: Category,
+        category_repository: DjangoORMCategoryRepository,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Test that GET /api/async/categories/ returns the same bytes as the sync list.
+        """
+
+        category_repository.save(category_movie)
+        category_repository.save(category_tv_show)
+
+        sync_response = api_client_with_auth.get("/api/categories/?order_by=name")
+        async_response = api_client_with_auth.get(
+            "/api/async/categories/?order_by=name"
+        )
+
+        assert async_response.status_code == HTTP_200_OK  # type: ignore
+        assert async_response.content == sync_response.content  # type: ignore
+
+    def test_retrieve_matches_sync_endpoint(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Test that GET /api/async/categories/<id>/ returns the same bytes as the sync
+        retrieve.
+        """
+
+        category_repository.save(category_movie)
+
+        sync_response = api_client_with_auth.get(
+            f"/api/categories/{category_movie.id}/"
+        )
+        async_response = api_client_with_auth.get(
+            f"/api/async/categories/{category_movie.id}/"
+        )
+
+        assert async_response.status_code == HTTP_200_OK  # type: ignore
+        assert async_response.content == sync_response.content  # type: ignore
+
+    def test_retrieve_returns_400_and_404(self, api_client_with_auth: APIClient):
+        """
+        Test that the async retrieve validates the ID and reports missing categories.
+        """
+
+        response = api_client_with_auth.get("/api/async/categories/123456789/")
+        assert response.status_code == HTTP_400_BAD_REQUEST  # type: ignore
+
+        response = api_client_with_auth.get(f"/api/async/categories/{uuid.uuid4()}/")
+        assert response.status_code == HTTP_404_NOT_FOUND  # type: ignore
+
+    def test_unauthenticated_request_is_forbidden(self):
+        """
+        Test that the async endpoints require the same credentials as the viewsets.
+        """
+
+        response = APIClient().get("/api/async/categories/")
+        assert response.status_code == 403  # type: ignore
+
+
 @pytest.mark.django_db
 class TestCreateAPI:
     """
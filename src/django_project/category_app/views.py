@@ -1,3 +1,4 @@
+from django.http import HttpRequest, HttpResponse
 from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -5,11 +6,17 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
 )
 
 from src.core._shared.application.use_cases.delete import DeleteRequest
-from src.core._shared.application.use_cases.list import ListRequest, ListUseCase
+from src.core._shared.application.use_cases.list import (
+    InvalidOrderBy,
+    ListRequest,
+    ListUseCase,
+)
+from src.core._shared.infrastructure.instrumentation import timed
 from src.core.category.application.exceptions import CategoryNotFound
 from src.core.category.application.use_cases.create_category import (
     CreateCategory,
@@ -24,17 +31,25 @@ from src.core.category.application.use_cases.update_category import (
     UpdateCategory,
     UpdateCategoryRequest,
 )
+from src.django_project.async_views import AsyncReadView
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.category_app.serializers import (
+    LIST_CATEGORY_RESPONSE,
+    RETRIEVE_CATEGORY_RESPONSE,
     CreateCategoryRequestSerializer,
-    ListCategoryResponseSerializer,
     RetrieveCategoryRequestSerializer,
-    RetrieveCategoryResponseSerializer,
     UpdateCategoryRequestSerializer,
 )
+from src.django_project.conditional import (
+    collection_version,
+    conditional,
+    row_version,
+)
 from src.django_project.permissions import IsAdmin, IsAuthenticated
 from src.django_project.serializers import (
     CreateResponseSerializer,
+    ListRequestSerializer,
     RetrieveDeleteRequestSerializer,
 )
 
@@ -47,6 +62,7 @@ class CategoryViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    @conditional(collection_version(CategoryModel))
     def list(self, request: Request) -> Response:
         """
         Retrieve a list of categories.
@@ -61,24 +77,32 @@ class CategoryViewSet(viewsets.ViewSet):
 
         order_by = request.query_params.get("order_by", "name")
         reverse_order = request.query_params.get("sort", "asc")
-        current_page = request.query_params.get("current_page", 1)
+        filters = ListRequestSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
         use_case = ListUseCase(DjangoORMCategoryRepository())
-        res = use_case.execute(
-            ListRequest(
-                order_by=order_by,
-                sort=reverse_order,
-                current_page=int(current_page),
+        try:
+            with timed("use_case"):
+                res = use_case.execute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )
+        except InvalidOrderBy as e:
+            return Response(
+                data={"error": str(e)},
+                status=HTTP_400_BAD_REQUEST,
             )
-        )
-
-        serializer = ListCategoryResponseSerializer(instance=res)
 
         return Response(
-            data=serializer.data,
+            data=LIST_CATEGORY_RESPONSE.to_representation(res),
             status=HTTP_200_OK,
         )
 
+    @conditional(row_version(CategoryModel))
     def retrieve(self, request: Request, pk: None) -> Response:
         """
         Retrieve a category by its id.
@@ -97,17 +121,16 @@ class CategoryViewSet(viewsets.ViewSet):
         try:
             req = GetCategoryRequest(id=serializer.validated_data["id"])  # type: ignore
             use_case = GetCategory(DjangoORMCategoryRepository())
-            res = use_case.execute(req)
+            with timed("use_case"):
+                res = use_case.execute(req)
         except CategoryNotFound:
             return Response(
                 data={"detail": "Category not found"},
                 status=HTTP_404_NOT_FOUND,
             )
 
-        category_output = RetrieveCategoryResponseSerializer(instance=res)
-
         return Response(
-            data=category_output.data,
+            data=RETRIEVE_CATEGORY_RESPONSE.to_representation(res),
             status=HTTP_200_OK,
         )
 
@@ -127,7 +150,8 @@ class CategoryViewSet(viewsets.ViewSet):
 
         req = CreateCategoryRequest(**serializer.validated_data)  # type: ignore
         use_case = CreateCategory(DjangoORMCategoryRepository())
-        output = use_case.execute(req)
+        with timed("use_case"):
+            output = use_case.execute(req)
 
         return Response(
             data=CreateResponseSerializer(instance=output).data,
@@ -158,7 +182,8 @@ class CategoryViewSet(viewsets.ViewSet):
         use_case = UpdateCategory(DjangoORMCategoryRepository())
 
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except CategoryNotFound:
             return Response(
                 data={"detail": "Category not found"},
@@ -187,7 +212,8 @@ class CategoryViewSet(viewsets.ViewSet):
         req = DeleteRequest(id=pk)  # type: ignore
         use_case = DeleteCategory(DjangoORMCategoryRepository())
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except CategoryNotFound:
             return Response(
                 data={"detail": "Category not found"},
@@ -223,7 +249,8 @@ class CategoryViewSet(viewsets.ViewSet):
         use_case = UpdateCategory(DjangoORMCategoryRepository())
 
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except CategoryNotFound:
             return Response(
                 data={"detail": "Category not found"},
@@ -233,3 +260,77 @@ class CategoryViewSet(viewsets.ViewSet):
         return Response(
             status=HTTP_204_NO_CONTENT,
         )
+
+
+class AsyncCategoryListView(AsyncReadView):
+    """
+    Async view for listing categories under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Retrieve a list of categories.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+
+        Returns:
+            HttpResponse: A response object containing a list of categories.
+        """
+
+        order_by = request.GET.get("order_by", "name")
+        reverse_order = request.GET.get("sort", "asc")
+        filters = ListRequestSerializer(data=request.GET)
+        if not filters.is_valid():
+            return self.render(data=filters.errors, status=HTTP_400_BAD_REQUEST)
+
+        use_case = ListUseCase(DjangoORMCategoryRepository())
+        try:
+            with timed("use_case"):
+                res = await use_case.aexecute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )
+        except InvalidOrderBy as e:
+            return self.render(data={"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+
+        return self.render_compiled(LIST_CATEGORY_RESPONSE, res)
+
+
+class AsyncCategoryDetailView(AsyncReadView):
+    """
+    Async view for retrieving a category under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, pk: str) -> HttpResponse:  # type: ignore
+        """
+        Retrieve a category by its id.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+            pk (str): The id of the category to be retrieved.
+
+        Returns:
+            HttpResponse: A response object containing the category data.
+        """
+
+        serializer = RetrieveCategoryRequestSerializer(data={"id": pk})
+        if not serializer.is_valid():
+            return self.render(data=serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            req = GetCategoryRequest(id=serializer.validated_data["id"])  # type: ignore
+            use_case = GetCategory(DjangoORMCategoryRepository())
+            with timed("use_case"):
+                res = await use_case.aexecute(req)
+        except CategoryNotFound:
+            return self.render(
+                data={"detail": "Category not found"},
+                status=HTTP_404_NOT_FOUND,
+            )
+
+        return self.render_compiled(RETRIEVE_CATEGORY_RESPONSE, res)
@@ -0,0 +1,311 @@
+import decimal
+import operator
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any, Callable
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+from src.core._shared.infrastructure.instrumentation import timed
+
+Converter = Callable[[Any], Any]
+
+_SKIP = object()
+
+
+class CompiledSerializer:
+    """
+    Serializer-free output path for response serializers.
+
+    DRF serializers resolve fields, sources and nested serializers on every
+    call, which dominates the cost of rendering large pages. A compiled
+    serializer walks the serializer declaration once and builds a plan of
+    plain functions that map use case outputs (dataclasses or dicts) straight
+    to JSON-ready primitives. UUIDs and CharFields become `str`, choice fields
+    (StrEnum values) are memoized and the remaining fields reuse their own
+    `to_representation`, so the output is exactly what the serializer would
+    produce and renders to the same bytes as the DRF JSONRenderer.
+    """
+
+    def __init__(self, serializer: serializers.BaseSerializer):
+        """
+        Compile the given serializer instance.
+
+        Args:
+            serializer (serializers.BaseSerializer): The response serializer to be
+                compiled. An instance is expected, since some serializers (like
+                ListResponseSerializer) declare their fields in `__init__`.
+        """
+
+        self._convert = _compile_field(serializer)
+        self._encoder = encoders.JSONEncoder(
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=((",", ":") if api_settings.COMPACT_JSON else (", ", ": ")),
+        )
+
+    def to_representation(self, instance: Any) -> Any:
+        """
+        Convert the given instance to primitives, like `serializer.data`.
+
+        Args:
+            instance (Any): The use case output to be converted.
+
+        Returns:
+            Any: The primitive representation of the instance.
+        """
+
+        with timed("serialize"):
+            return self._convert(instance)
+
+    def render(self, instance: Any) -> bytes:
+        """
+        Convert the given instance straight to JSON bytes.
+
+        Args:
+            instance (Any): The use case output to be rendered.
+
+        Returns:
+            bytes: The same bytes the JSONRenderer produces for `serializer.data`.
+        """
+
+        with timed("serialize"):
+            content = self._encoder.encode(self._convert(instance))
+            return (
+                content.replace("\u2028", "\\u2028")
+                .replace("\u2029", "\\u2029")
+                .encode()
+            )
+
+
+def compile_serializer(serializer: serializers.BaseSerializer) -> CompiledSerializer:
+    """
+    Compile a response serializer into a serializer-free output path.
+
+    Args:
+        serializer (serializers.BaseSerializer): The serializer instance to compile.
+
+    Returns:
+        CompiledSerializer: The compiled serializer.
+    """
+
+    return CompiledSerializer(serializer)
+
+
+def _compile_field(field: serializers.Field) -> Converter:
+    """
+    Build the converter for a single (possibly nested) field.
+
+    Args:
+        field (serializers.Field): The field to be compiled.
+
+    Returns:
+        Converter: A function mapping a non-null attribute to its representation.
+    """
+
+    if isinstance(field, serializers.ListSerializer):
+        child = _compile_field(field.child)  # type: ignore
+        return lambda data: [child(item) for item in data]
+
+    if isinstance(field, serializers.Serializer):
+        return _compile_serializer_fields(field)
+
+    if isinstance(field, serializers.ListField):
+        child = _compile_field(field.child)
+        return lambda data: [None if item is None else child(item) for item in data]
+
+    field_type = type(field)
+    if field_type is serializers.CharField:
+        return str
+    if field_type is serializers.IntegerField:
+        return int
+    if field_type is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+
+    if isinstance(field, serializers.ChoiceField):
+        return _memoize(field.to_representation)
+    if field_type is serializers.DecimalField:
+        return _compile_decimal(field)
+
+    return field.to_representation
+
+
+def _compile_serializer_fields(serializer: serializers.Serializer) -> Converter:
+    """
+    Build the converter for a serializer, resolving its readable fields once.
+
+    Args:
+        serializer (serializers.Serializer): The serializer to be compiled.
+
+    Returns:
+        Converter: A function mapping an instance to a dict of primitives.
+    """
+
+    fields = list(serializer._readable_fields)
+    plan = [
+        (field.field_name, _compile_accessor(field), _compile_field(field))
+        for field in fields
+    ]
+
+    def convert_fields(instance: Any) -> dict:
+        ret = {}
+        for name, get_attribute, to_representation in plan:
+            attribute = get_attribute(instance)
+            if attribute is _SKIP:
+                continue
+            ret[name] = None if attribute is None else to_representation(attribute)
+        return ret
+
+    if not fields or any(len(field.source_attrs) != 1 for field in fields):
+        return convert_fields
+
+    # Every field reads a plain attribute (or key), so all of them are fetched
+    # with a single attrgetter/itemgetter call, falling back to the per field
+    # plan when one is missing.
+    sources = [field.source_attrs[0] for field in fields]
+    names = [field.field_name for field in fields]
+    converters = [to_representation for _, _, to_representation in plan]
+    get_attributes = operator.attrgetter(*sources)
+    get_items = operator.itemgetter(*sources)
+    if len(sources) == 1:
+        get_attributes = _as_tuple(get_attributes)
+        get_items = _as_tuple(get_items)
+
+    def convert(instance: Any) -> dict:
+        try:
+            if isinstance(instance, dict):
+                attributes = get_items(instance)
+            else:
+                attributes = get_attributes(instance)
+        except (KeyError, AttributeError):
+            return convert_fields(instance)
+
+        return {
+            name: None if attribute is None else to_representation(attribute)
+            for name, to_representation, attribute in zip(names, converters, attributes)
+        }
+
+    return convert
+
+
+def _as_tuple(getter: Converter) -> Converter:
+    """
+    Wrap a single-item getter so it returns a tuple, like multi-item getters do.
+
+    Args:
+        getter (Converter): The getter to be wrapped.
+
+    Returns:
+        Converter: The wrapped getter.
+    """
+
+    return lambda instance: (getter(instance),)
+
+
+def _compile_accessor(field: serializers.Field) -> Converter:
+    """
+    Build the attribute accessor of a field.
+
+    Plain attribute or key sources are inlined; dotted sources fall back to
+    `field.get_attribute`.
+
+    Args:
+        field (serializers.Field): The field whose source is resolved.
+
+    Returns:
+        Converter: A function returning the field attribute of an instance, or
+            `_SKIP` when the field must be left out of the output.
+    """
+
+    if field.source == "*":
+        return lambda instance: instance
+
+    if len(field.source_attrs) != 1:
+
+        def get_nested_attribute(instance: Any) -> Any:
+            try:
+                return field.get_attribute(instance)
+            except serializers.SkipField:
+                return _SKIP
+
+        return get_nested_attribute
+
+    (attr,) = field.source_attrs
+
+    def get_attribute(instance: Any) -> Any:
+        try:
+            if isinstance(instance, Mapping):
+                return instance[attr]
+            return getattr(instance, attr)
+        except (KeyError, AttributeError):
+            if field.default is not serializers.empty:
+                return field.get_default()
+            if not field.required:
+                return _SKIP
+            raise
+
+    return get_attribute
+
+
+def _compile_decimal(field: serializers.DecimalField) -> Converter:
+    """
+    Build a native converter for a DecimalField coerced to a fixed point string.
+
+    Args:
+        field (serializers.DecimalField): The field to be compiled.
+
+    Returns:
+        Converter: A function quantizing a Decimal and formatting it as a string.
+    """
+
+    if (
+        field.decimal_places is None
+        or field.normalize_output
+        or field.localize
+        or not getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    ):
+        return field.to_representation
+
+    exponent = decimal.Decimal(".1") ** field.decimal_places
+    rounding = field.rounding
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+
+    def convert(value: Any) -> str:
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return "{:f}".format(
+            value.quantize(exponent, rounding=rounding, context=context)
+        )
+
+    return convert
+
+
+def _memoize(to_representation: Converter) -> Converter:
+    """
+    Cache the representation of enum members, such as StrEnum choices.
+
+    Only enum members are cached, so arbitrary values can't grow the cache.
+
+    Args:
+        to_representation (Converter): The field converter to be cached.
+
+    Returns:
+        Converter: The cached converter.
+    """
+
+    cache: dict = {}
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, Enum):
+            return to_representation(value)
+        try:
+            return cache[value]
+        except KeyError:
+            cache[value] = result = to_representation(value)
+            return result
+
+    return convert
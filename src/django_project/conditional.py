@@ -0,0 +1,198 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Iterable, Optional, Type
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from src.django_project.totals import table_state
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+@dataclass(frozen=True)
+class Version:
+    """
+    Represents the version of a resource or of a collection.
+    """
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+
+VersionFunc = Callable[..., Optional[Version]]
+
+
+def _timestamp(value: Optional[datetime]) -> int:
+    """
+    Convert an `updated_at` value to microseconds since the epoch.
+
+    Args:
+        value (Optional[datetime]): The value to be converted.
+
+    Returns:
+        int: The timestamp in microseconds, or 0 when there is no value.
+    """
+
+    return int(value.timestamp() * 1_000_000) if value else 0
+
+
+def row_version(model: Type[models.Model]) -> VersionFunc:
+    """
+    Build a version lookup for a single row of the given model.
+
+    The version is read with one primary key lookup on the `updated_at`
+    column, so the aggregate is not loaded to answer a conditional request.
+
+    Args:
+        model (Type[models.Model]): The model of the resource.
+
+    Returns:
+        VersionFunc: A function returning the version of the row identified by
+            `pk`, or None when the row does not exist or the id is invalid.
+    """
+
+    def version(request: Request, pk=None, **kwargs) -> Optional[Version]:
+        try:
+            updated_at = (
+                model.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+            )
+        except (ValidationError, ValueError):
+            return None
+
+        if updated_at is None:
+            return None
+
+        return Version(
+            etag=f"{pk}-{_timestamp(updated_at)}",
+            last_modified=updated_at,
+        )
+
+    return version
+
+
+def collection_version(model: Type[models.Model]) -> VersionFunc:
+    """
+    Build a version lookup for the lists of the given model.
+
+    Any insert or update moves the latest `updated_at` forward, read from its
+    index, and any delete changes the row count. When the list totals are
+    cached, the count and the generation of the table's cached total stand in
+    for counting the rows, so the version costs one index lookup; otherwise
+    both are read by a single aggregate query. Deletes don't move
+    `updated_at`, so collections only get an ETag, not a Last-Modified date.
+    The query parameters are part of the ETag, since each page, ordering and
+    filter is a different body.
+
+    Args:
+        model (Type[models.Model]): The model of the collection.
+
+    Returns:
+        VersionFunc: A function returning the version of the requested list.
+    """
+
+    def version(request: Request, **kwargs) -> Optional[Version]:
+        state = table_state(model)
+        if state is None:
+            aggregate = model.objects.aggregate(
+                total=models.Count("pk"),
+                last_updated=models.Max("updated_at"),
+            )
+            state = aggregate["total"]
+        else:
+            aggregate = model.objects.aggregate(last_updated=models.Max("updated_at"))
+        query = hashlib.sha1(
+            repr(sorted(request.query_params.lists())).encode()
+        ).hexdigest()[:16]
+
+        return Version(etag=f"{state}-{_timestamp(aggregate['last_updated'])}-{query}")
+
+    return version
+
+
+def touch_related(model: Type[models.Model], pks: Iterable) -> None:
+    """
+    Move the `updated_at` of the rows related to the given ones through a
+    many-to-many relation, before they are deleted.
+
+    Deleting a category, genre or cast member cascades into the through tables
+    of the genres and videos listing it, changing their bodies without a write
+    to their own rows, so their versions would otherwise stay the same.
+
+    Args:
+        model (Type[models.Model]): The model of the rows about to be deleted.
+        pks (Iterable): The primary keys of those rows.
+    """
+
+    pks = list(pks)
+    now = timezone.now()
+    for relation in model._meta.related_objects:
+        related_model = relation.related_model
+        if not relation.many_to_many or not hasattr(related_model, "updated_at"):
+            continue
+
+        related_model.objects.filter(
+            **{f"{relation.field.name}__in": pks}  # type: ignore
+        ).update(updated_at=now)
+
+
+def conditional(version_func: VersionFunc) -> Callable:
+    """
+    Decorate a viewset action with ETag and Last-Modified support.
+
+    The version is resolved before the action runs, so `If-None-Match` and
+    `If-Modified-Since` are answered with 304 without loading the aggregate.
+    The headers of a full response carry the version read before loading it,
+    so a concurrent update can only make the client refetch, never miss it.
+    Permissions are checked by DRF before the action is called.
+
+    Args:
+        version_func (VersionFunc): The version lookup, called with the
+            request and the action keyword arguments.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(action: Callable) -> Callable:
+        @wraps(action)
+        def wrapper(self, request: Request, *args, **kwargs) -> Response:
+            if request.method not in SAFE_METHODS:
+                return action(self, request, *args, **kwargs)
+
+            version = version_func(request, **kwargs)
+            if version is None:
+                return action(self, request, *args, **kwargs)
+
+            last_modified = (
+                int(version.last_modified.timestamp())
+                if version.last_modified
+                else None
+            )
+            response = get_conditional_response(
+                request,
+                etag=quote_etag(version.etag),
+                last_modified=last_modified,
+            )
+            if response is None:
+                response = action(self, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response.headers.setdefault("ETag", quote_etag(version.etag))
+                if last_modified is not None:
+                    response.headers.setdefault(
+                        "Last-Modified", http_date(last_modified)
+                    )
+
+            return response
+
+        return wrapper
+
+    return decorator
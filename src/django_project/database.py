@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+DEFAULT_CONN_MAX_AGE = 60
+DEFAULT_READ_YOUR_WRITES_WINDOW = 5
+
+# Pragmas for single-node SQLite deployments: WAL lets readers run alongside
+# the writer, and NORMAL sync is durable in WAL mode except on power loss.
+SQLITE_WAL_INIT_COMMAND = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA temp_store=MEMORY;"
+)
+
+
+def env_bool(env: Mapping[str, str], name: str, default: bool = False) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        env (Mapping[str, str]): The environment variables.
+        name (str): The name of the variable.
+        default (bool): The value used when the variable is not set.
+
+    Returns:
+        bool: True for "1", "true", "yes" or "on" (case insensitive).
+    """
+
+    value = env.get(name)
+    if value is None:
+        return default
+
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def database_config(env: Mapping[str, str], base_dir: Path) -> Dict[str, Any]:
+    """
+    Build the default database settings from environment variables.
+
+    DATABASE_ENGINE selects "sqlite" (default) or "postgresql". Connections are
+    persistent (DATABASE_CONN_MAX_AGE seconds, 60 by default) and health
+    checked before reuse. With PostgreSQL, DATABASE_POOL enables the psycopg
+    connection pool instead, since Django doesn't allow pooling together with
+    persistent connections. With SQLite, DATABASE_SQLITE_WAL enables WAL mode.
+
+    Args:
+        env (Mapping[str, str]): The environment variables.
+        base_dir (Path): The project base directory, where the SQLite database
+            file is kept by default.
+
+    Returns:
+        Dict[str, Any]: The settings of the default database.
+
+    Raises:
+        ValueError: If DATABASE_ENGINE names an unsupported engine.
+    """
+
+    engine = env.get("DATABASE_ENGINE", "sqlite")
+    config: Dict[str, Any] = {
+        "CONN_MAX_AGE": int(env.get("DATABASE_CONN_MAX_AGE", DEFAULT_CONN_MAX_AGE)),
+        "CONN_HEALTH_CHECKS": env_bool(env, "DATABASE_CONN_HEALTH_CHECKS", True),
+    }
+
+    if engine == "sqlite":
+        config.update(
+            {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": env.get("DATABASE_NAME", base_dir / "db.sqlite3"),
+            }
+        )
+        if env_bool(env, "DATABASE_SQLITE_WAL"):
+            config["OPTIONS"] = {
+                "init_command": SQLITE_WAL_INIT_COMMAND,
+                "transaction_mode": "IMMEDIATE",
+            }
+        return config
+
+    if engine == "postgresql":
+        config.update(
+            {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": env.get("DATABASE_NAME", "codeflix"),
+                "USER": env.get("DATABASE_USER", "postgres"),
+                "PASSWORD": env.get("DATABASE_PASSWORD", ""),
+                "HOST": env.get("DATABASE_HOST", "localhost"),
+                "PORT": env.get("DATABASE_PORT", "5432"),
+            }
+        )
+        if env_bool(env, "DATABASE_POOL"):
+            config["CONN_MAX_AGE"] = 0
+            config["OPTIONS"] = {
+                "pool": {
+                    "min_size": int(env.get("DATABASE_POOL_MIN_SIZE", 2)),
+                    "max_size": int(env.get("DATABASE_POOL_MAX_SIZE", 10)),
+                    "timeout": float(env.get("DATABASE_POOL_TIMEOUT", 10)),
+                }
+            }
+        return config
+
+    raise ValueError(f"Unsupported DATABASE_ENGINE: {engine}")
+
+
+def replica_database_config(
+    env: Mapping[str, str], primary: Dict[str, Any]
+) -> Dict[str, Any] | None:
+    """
+    Build the read replica settings from environment variables.
+
+    The replica shares the engine and options of the primary. It is enabled by
+    DATABASE_REPLICA_NAME (a second SQLite file, or another database name) or
+    DATABASE_REPLICA_HOST, and mirrors the primary under test.
+
+    Args:
+        env (Mapping[str, str]): The environment variables.
+        primary (Dict[str, Any]): The settings of the default database.
+
+    Returns:
+        Dict[str, Any] | None: The settings of the replica database, or None if
+            no replica is configured.
+    """
+
+    name = env.get("DATABASE_REPLICA_NAME")
+    host = env.get("DATABASE_REPLICA_HOST")
+    if not name and not host:
+        return None
+
+    config = {**primary, "TEST": {"MIRROR": "default"}}
+    if name:
+        config["NAME"] = name
+    if host:
+        config["HOST"] = host
+        config["PORT"] = env.get("DATABASE_REPLICA_PORT", primary.get("PORT", ""))
+
+    return config
@@ -0,0 +1,214 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+PRIMARY_DATABASE = "default"
+REPLICA_DATABASE = "replica"
+PIN_COOKIE = "db_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Send every read made inside the block to the primary database.
+
+    Commands use it so that the reads they make before writing never see a
+    lagging replica.
+    """
+
+    token = _pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    """
+    Check whether the reads of the current context go to the primary database.
+
+    Returns:
+        bool: True inside a use_primary() block.
+    """
+
+    return _pinned_to_primary.get()
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router splitting reads and writes between primary and replica.
+
+    Writes always go to the primary. Reads go to the replica when one is
+    configured, unless the current context is pinned to the primary.
+    """
+
+    def db_for_read(self, model, **hints) -> str:
+        """
+        Choose the database for read operations.
+
+        Args:
+            model: The model being read.
+
+        Returns:
+            str: The alias of the database.
+        """
+
+        if _pinned_to_primary.get() or REPLICA_DATABASE not in connections.settings:
+            return PRIMARY_DATABASE
+
+        return REPLICA_DATABASE
+
+    def db_for_write(self, model, **hints) -> str:
+        """
+        Choose the database for write operations.
+
+        Args:
+            model: The model being written.
+
+        Returns:
+            str: The alias of the primary database.
+        """
+
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        """
+        Allow relations between objects loaded from the primary or the replica,
+        since both hold the same data.
+
+        Args:
+            obj1: The first object of the relation.
+            obj2: The second object of the relation.
+
+        Returns:
+            bool | None: True when both objects come from primary or replica,
+                None to leave the decision to other routers.
+        """
+
+        aliases = {PRIMARY_DATABASE, REPLICA_DATABASE}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin requests to the primary database while their writes may not have
+    reached the replica.
+
+    Unsafe requests run entirely against the primary. After a successful one,
+    a cookie pins the client's following requests to the primary for
+    DATABASE_READ_YOUR_WRITES_WINDOW seconds, so they read their own writes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Initialize the ReadYourWritesMiddleware.
+
+        Args:
+            get_response: The next handler in the middleware chain.
+        """
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Handle the request, pinning it to the primary database when needed.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        writes = request.method not in SAFE_METHODS
+        if not writes and not self.is_pinned(request):
+            return self.get_response(request)
+
+        with use_primary():
+            response = self.get_response(request)
+
+        return self.pin(response) if writes else response
+
+    async def __acall__(self, request):
+        """
+        Handle the request in an async handler chain, pinning it to the primary
+        database when needed. The pin is a context variable, so it follows the
+        ORM calls that async views run in worker threads.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        writes = request.method not in SAFE_METHODS
+        if not writes and not self.is_pinned(request):
+            return await self.get_response(request)
+
+        with use_primary():
+            response = await self.get_response(request)
+
+        return self.pin(response) if writes else response
+
+    @staticmethod
+    def pin(response):
+        """
+        Pin the client's following requests to the primary database after a
+        successful write.
+
+        Args:
+            response: The response to the write.
+
+        Returns:
+            The response, with the read-your-writes cookie when it succeeded.
+        """
+
+        window = settings.DATABASE_READ_YOUR_WRITES_WINDOW
+        if window > 0 and response.status_code < 400:
+            response.set_cookie(
+                PIN_COOKIE,
+                str(time.time() + window),
+                max_age=window,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+    @staticmethod
+    def is_pinned(request) -> bool:
+        """
+        Check whether the request carries a read-your-writes cookie that hasn't
+        expired yet.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            bool: True if the request must read from the primary database.
+        """
+
+        try:
+            return float(request.COOKIES[PIN_COOKIE]) > time.time()
+        except (KeyError, ValueError):
+            return False
@@ -0,0 +1,58 @@
+import uuid
+
+from django.db import models
+
+
+class CompactUUIDField(models.UUIDField):
+    """
+    UUID field stored as a 16-byte BLOB on SQLite, where the stock UUIDField
+    takes a 32-character hex string, and as the native `uuid` type on the
+    backends that have one.
+
+    Foreign keys and many-to-many through tables pointing to the field take
+    its column type and its conversions, so every key column shrinks.
+    Backends without a native type or BLOB handling here keep the stock
+    char(32) storage.
+    """
+
+    def get_internal_type(self) -> str:
+        # Not "UUIDField", which would make the SQLite backend parse the
+        # stored bytes as a hex string
+        return "CompactUUIDField"
+
+    def db_type(self, connection) -> str | None:
+        if connection.vendor == "sqlite":
+            return "blob"
+        if connection.features.has_native_uuid_field:
+            return "uuid"
+
+        return "char(32)"
+
+    def rel_db_type(self, connection) -> str | None:
+        return self.db_type(connection)
+
+    def to_python(self, value):
+        # Raw column values, such as the prefetch keys Django reads without
+        # converters, reach get_db_prep_value as bytes
+        if isinstance(value, bytes) and len(value) == 16:
+            return uuid.UUID(bytes=value)
+
+        return super().to_python(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if connection.vendor != "sqlite":
+            return super().get_db_prep_value(value, connection, prepared)
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+
+        return value.bytes
+
+    def from_db_value(self, value, expression, connection):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, bytes):
+            return uuid.UUID(bytes=value)
+
+        return uuid.UUID(value)
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genre_app", "0002_alter_genre_table"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="genre",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
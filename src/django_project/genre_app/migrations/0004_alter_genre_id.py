@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:13
+
+import src.core._shared.domain.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genre_app", "0003_genre_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="genre",
+            name="id",
+            field=models.UUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:15
+
+import src.core._shared.domain.uuid7
+import src.django_project.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genre_app", "0004_alter_genre_id"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="genre",
+            name="id",
+            field=src.django_project.fields.CompactUUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
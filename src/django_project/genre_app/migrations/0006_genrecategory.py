@@ -0,0 +1,64 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Declare the genre_categories table, created implicitly for
+    Genre.categories, as the GenreCategory model. The table is unchanged.
+    """
+
+    dependencies = [
+        ("category_app", "0004_alter_category_id"),
+        ("genre_app", "0005_alter_genre_id"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="GenreCategory",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "genre",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="genre_app.genre",
+                            ),
+                        ),
+                        (
+                            "category",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="category_app.category",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "genre_categories",
+                        "unique_together": {("genre", "category")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="genre",
+                    name="categories",
+                    field=models.ManyToManyField(
+                        related_name="genres",
+                        through="genre_app.GenreCategory",
+                        to="category_app.category",
+                    ),
+                ),
+            ],
+        ),
+    ]
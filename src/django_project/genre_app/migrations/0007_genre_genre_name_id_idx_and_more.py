@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0005_category_category_name_id_idx_and_more"),
+        ("genre_app", "0006_genrecategory"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="genre",
+            index=models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="genre",
+            index=models.Index(
+                fields=["is_active", "name", "id"], name="genre_active_name_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="genrecategory",
+            index=models.Index(
+                fields=["category", "genre"], name="genre_categories_reverse_idx"
+            ),
+        ),
+    ]
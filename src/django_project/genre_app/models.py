@@ -1,19 +1,22 @@
-import uuid
-
 from django.db import models
 
+from src.core._shared.domain.uuid7 import uuid7
+from src.django_project.fields import CompactUUIDField
+
 
 # Create your models here.
 class Genre(models.Model):
     app_label = "genre_app"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = CompactUUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255, null=False, blank=False)
     categories = models.ManyToManyField(
         to="category_app.Category",
         related_name="genres",
+        through="GenreCategory",
     )
     is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return str(self.name)
@@ -22,3 +25,30 @@ class Genre(models.Model):
         verbose_name = "Genre"
         verbose_name_plural = "Genres"
         db_table = "genre"
+        indexes = [
+            models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+            models.Index(
+                fields=["is_active", "name", "id"], name="genre_active_name_id_idx"
+            ),
+        ]
+
+
+class GenreCategory(models.Model):
+    """
+    Relation between a genre and a category: the genre_categories table,
+    declared to index its reverse lookups.
+    """
+
+    genre = models.ForeignKey("Genre", on_delete=models.CASCADE, related_name="+")
+    category = models.ForeignKey(
+        "category_app.Category", on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        db_table = "genre_categories"
+        unique_together = [("genre", "category")]
+        indexes = [
+            models.Index(
+                fields=["category", "genre"], name="genre_categories_reverse_idx"
+            ),
+        ]
@@ -1,18 +1,27 @@
 import uuid
-from typing import List
+from typing import Iterable, List, Set, Tuple
 
 from django.db import transaction
 
+from src.core.genre.application.use_cases.list_genre import GenreOutput
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 from src.django_project.genre_app.models import Genre as GenreORM
+from src.django_project.conditional import touch_related
+from src.django_project.metrics import instrument_repository
+from src.django_project.projections import arelated_ids, matching, ordering, related_ids
+from src.django_project.totals import atotal, record, total
 
 
+@instrument_repository("genre")
 class DjangoORMGenreRepository(GenreRepository):
     """
     Django ORM implementation of the GenreRepository interface.
     """
 
+    # The fields the list endpoint sorts by, each backed by a (field, id) index
+    sortable_fields = ("name", "id")
+
     def save(self, genre: Genre):
         """
         Save a genre to the repository.
@@ -28,6 +37,7 @@ class DjangoORMGenreRepository(GenreRepository):
                 is_active=genre.is_active,
             )
             genre_model.categories.set(genre.categories)
+            record(GenreORM, 1)
 
     def get_by_id(self, genre_id: uuid.UUID) -> Genre | None:
         """
@@ -52,6 +62,211 @@ class DjangoORMGenreRepository(GenreRepository):
             categories={category.id for category in genre_model.categories.all()},
         )
 
+    def get_by_ids(self, genre_ids: Iterable[uuid.UUID]) -> List[Genre]:
+        """
+        Retrieve the genres with the given IDs from the repository, in one query
+        for the genres and one for their categories.
+
+        Args:
+            genre_ids (Iterable[uuid.UUID]): The IDs of the genres to be retrieved.
+
+        Returns:
+            List[Genre]: The genres found, in no particular order.
+        """
+
+        return [
+            Genre(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories={category.id for category in genre.categories.all()},
+            )
+            for genre in GenreORM.objects.prefetch_related("categories").filter(
+                pk__in=list(genre_ids)
+            )
+        ]
+
+    async def aget_by_id(self, genre_id: uuid.UUID) -> Genre | None:
+        """
+        Asynchronously retrieve a genre by its ID from the repository.
+
+        Args:
+            genre_id (uuid.UUID): The ID of the genre to be retrieved.
+
+        Returns:
+            Genre: The genre with the given ID, or None if it doesn't exist.
+        """
+
+        try:
+            genre_model = await GenreORM.objects.prefetch_related("categories").aget(
+                pk=genre_id
+            )
+        except GenreORM.DoesNotExist:
+            return None
+
+        return Genre(
+            id=genre_model.id,
+            name=genre_model.name,
+            is_active=genre_model.is_active,
+            categories={category.id for category in genre_model.categories.all()},
+        )
+
+    async def aget_by_ids(self, genre_ids: Iterable[uuid.UUID]) -> List[Genre]:
+        """
+        Asynchronously retrieve the genres with the given IDs from the repository.
+
+        Args:
+            genre_ids (Iterable[uuid.UUID]): The IDs of the genres to be retrieved.
+
+        Returns:
+            List[Genre]: The genres found, in no particular order.
+        """
+
+        return [
+            Genre(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories={category.id for category in genre.categories.all()},
+            )
+            async for genre in GenreORM.objects.prefetch_related("categories").filter(
+                pk__in=list(genre_ids)
+            )
+        ]
+
+    async def alist(self) -> List[Genre]:
+        """
+        Asynchronously list all genres from the repository.
+
+        The categories are prefetched so that no query is issued while mapping.
+
+        Returns:
+            list[Genre]: A list of all genres.
+        """
+
+        return [
+            Genre(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories={category.id for category in genre.categories.all()},
+            )
+            async for genre in GenreORM.objects.prefetch_related("categories")
+        ]
+
+    def list_projections(self) -> List[GenreOutput]:
+        """
+        List all genres as read-only outputs, without constructing the entities.
+
+        The category ids come from one query on the relation table, instead of
+        one query per genre.
+
+        Returns:
+            List[GenreOutput]: A list of all genres.
+        """
+
+        categories = related_ids(GenreORM, "categories")
+        return [
+            GenreOutput(id, name, is_active, categories.get(id, set()))
+            for id, name, is_active in GenreORM.objects.values_list(
+                "id", "name", "is_active"
+            )
+        ]
+
+    async def alist_projections(self) -> List[GenreOutput]:
+        """
+        Asynchronously list all genres as read-only outputs.
+
+        Returns:
+            List[GenreOutput]: A list of all genres.
+        """
+
+        categories = await arelated_ids(GenreORM, "categories")
+        return [
+            GenreOutput(id, name, is_active, categories.get(id, set()))
+            async for id, name, is_active in GenreORM.objects.values_list(
+                "id", "name", "is_active"
+            )
+        ]
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[GenreOutput], int]:
+        """
+        Get a page of the genres as read-only outputs, sorted and sliced by the
+        database, reading the category ids of the page's genres only.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of genres skipped.
+            limit (int): The maximum number of genres returned.
+            ids (Set[uuid.UUID] | None): Only page the genres with these ids.
+                Defaults to every genre.
+
+        Returns:
+            Tuple[List[GenreOutput], int]: The genres of the page and the total
+                number of genres.
+        """
+
+        matched = matching(GenreORM.objects.all(), ids)
+        rows = list(
+            matched.order_by(*ordering(order_by, descending)).values_list(
+                "id", "name", "is_active"
+            )[offset : offset + limit]
+        )
+        categories = related_ids(GenreORM, "categories", [row[0] for row in rows])
+
+        return [
+            GenreOutput(id, name, is_active, categories.get(id, set()))
+            for id, name, is_active in rows
+        ], total(matched, exact=ids is not None)
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[GenreOutput], int]:
+        """
+        Asynchronously get a page of the genres as read-only outputs.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of genres skipped.
+            limit (int): The maximum number of genres returned.
+            ids (Set[uuid.UUID] | None): Only page the genres with these ids.
+                Defaults to every genre.
+
+        Returns:
+            Tuple[List[GenreOutput], int]: The genres of the page and the total
+                number of genres.
+        """
+
+        matched = matching(GenreORM.objects.all(), ids)
+        rows = [
+            row
+            async for row in matched.order_by(
+                *ordering(order_by, descending)
+            ).values_list("id", "name", "is_active")[offset : offset + limit]
+        ]
+        categories = await arelated_ids(
+            GenreORM, "categories", [row[0] for row in rows]
+        )
+
+        return [
+            GenreOutput(id, name, is_active, categories.get(id, set()))
+            for id, name, is_active in rows
+        ], await atotal(matched, exact=ids is not None)
+
     def delete(self, genre_id: uuid.UUID):
         """
         Delete a genre by its ID from the repository.
@@ -61,7 +276,10 @@ class DjangoORMGenreRepository(GenreRepository):
         """
 
         try:
-            GenreORM.objects.filter(pk=genre_id).delete()
+            with transaction.atomic():
+                touch_related(GenreORM, [genre_id])
+                _, deleted = GenreORM.objects.filter(pk=genre_id).delete()
+            record(GenreORM, -deleted.get(GenreORM._meta.label, 0))
         except GenreORM.DoesNotExist:
             return None
 
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from src.django_project.compiled_serializers import compile_serializer
 from src.django_project.serializers import ListResponseSerializer, SetField
 
 
@@ -46,3 +47,6 @@ class UpdateGenreRequestSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255, allow_blank=False)
     is_active = serializers.BooleanField()
     categories = SetField(child=serializers.UUIDField())
+
+
+LIST_GENRE_RESPONSE = compile_serializer(ListGenreResponseSerializer())
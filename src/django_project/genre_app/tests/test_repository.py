@@ -1,6 +1,7 @@
 import pytest
 
 from src.core.category.domain.category import Category
+from src.core.genre.application.use_cases.list_genre import GenreOutput
 from src.core.genre.domain.genre import Genre
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.models import Genre as GenreORM
@@ -309,3 +310,29 @@ class TestList:
         assert genres[0].name == "Action"
         assert genres[0].is_active is True
         assert movie_category.id in genres[0].categories
+
+
+@pytest.mark.django_db
+class TestListProjections:
+    """
+    Test class for the DjangoORMGenreRepository.list_projections method.
+    """
+
+    def test_lists_outputs_with_category_ids(self, django_assert_num_queries):
+        movie_category = Category(name="Movie")
+        DjangoORMCategoryRepository().save(movie_category)
+        action = Genre(name="Action", categories={movie_category.id})
+        drama = Genre(name="Drama", is_active=False)
+        genre_repository = DjangoORMGenreRepository()
+        genre_repository.save(action)
+        genre_repository.save(drama)
+
+        with django_assert_num_queries(2):
+            genres = sorted(genre_repository.list_projections())
+
+        assert genres == sorted(
+            [
+                GenreOutput(action.id, "Action", True, {movie_category.id}),
+                GenreOutput(drama.id, "Drama", False, set()),
+            ]
+        )
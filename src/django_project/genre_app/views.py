@@ -1,3 +1,4 @@
+from django.http import HttpRequest, HttpResponse
 from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -10,7 +11,12 @@ from rest_framework.status import (
 )
 
 from src.core._shared.application.use_cases.delete import DeleteRequest
-from src.core._shared.application.use_cases.list import ListRequest, ListResponse
+from src.core._shared.application.use_cases.list import (
+    InvalidOrderBy,
+    ListRequest,
+    ListResponse,
+)
+from src.core._shared.infrastructure.instrumentation import timed
 from src.core.genre.application.exceptions import (
     GenreNotFound,
     InvalidGenre,
@@ -20,16 +26,20 @@ from src.core.genre.application.use_cases.create_genre import CreateGenre
 from src.core.genre.application.use_cases.delete_genre import DeleteGenre
 from src.core.genre.application.use_cases.list_genre import ListGenre
 from src.core.genre.application.use_cases.update_genre import UpdateGenre
+from src.django_project.async_views import AsyncReadView
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.conditional import collection_version, conditional
+from src.django_project.genre_app.models import Genre as GenreModel
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
 from src.django_project.genre_app.serializers import (
+    LIST_GENRE_RESPONSE,
     CreateGenreRequestSerializer,
-    ListGenreResponseSerializer,
     UpdateGenreRequestSerializer,
 )
 from src.django_project.permissions import IsAdmin, IsAuthenticated
 from src.django_project.serializers import (
     CreateResponseSerializer,
+    ListRequestSerializer,
     RetrieveDeleteRequestSerializer,
 )
 
@@ -42,6 +52,7 @@ class GenreViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    @conditional(collection_version(GenreModel))
     def list(self, request: Request) -> Response:
         """
         Retrieve a list of categories.
@@ -55,21 +66,28 @@ class GenreViewSet(viewsets.ViewSet):
         """
         order_by = request.query_params.get("order_by", "name")
         reverse_order = request.query_params.get("sort", "asc")
-        current_page = request.query_params.get("current_page", 1)
+        filters = ListRequestSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
         use_case = ListGenre(DjangoORMGenreRepository())
-        res: ListResponse = use_case.execute(
-            ListRequest(
-                order_by=order_by,
-                sort=reverse_order,
-                current_page=int(current_page),
+        try:
+            with timed("use_case"):
+                res: ListResponse = use_case.execute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )  # type: ignore
+        except InvalidOrderBy as e:
+            return Response(
+                data={"error": str(e)},
+                status=HTTP_400_BAD_REQUEST,
             )
-        )  # type: ignore
-
-        serializer = ListGenreResponseSerializer(instance=res)
 
         return Response(
-            data=serializer.data,
+            data=LIST_GENRE_RESPONSE.to_representation(res),
             status=HTTP_200_OK,
         )
 
@@ -93,7 +111,8 @@ class GenreViewSet(viewsets.ViewSet):
             category_repository=DjangoORMCategoryRepository(),
         )
         try:
-            output: CreateGenre.Output = use_case.execute(req)
+            with timed("use_case"):
+                output: CreateGenre.Output = use_case.execute(req)
         except (InvalidGenre, RelatedCategoriesNotFound) as err:
             return Response(
                 data={"error": str(err)},
@@ -132,7 +151,8 @@ class GenreViewSet(viewsets.ViewSet):
         )
 
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except GenreNotFound:
             return Response(
                 data={"error": "Genre not found"},
@@ -166,7 +186,8 @@ class GenreViewSet(viewsets.ViewSet):
         req = DeleteRequest(id=pk)  # type: ignore
         use_case = DeleteGenre(DjangoORMGenreRepository())
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except GenreNotFound:
             return Response(
                 data={"error": "Genre not found"},
@@ -176,3 +197,42 @@ class GenreViewSet(viewsets.ViewSet):
         return Response(
             status=HTTP_204_NO_CONTENT,
         )
+
+
+class AsyncGenreListView(AsyncReadView):
+    """
+    Async view for listing genres under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Retrieve a list of genres.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+
+        Returns:
+            HttpResponse: A response object containing a list of genres.
+        """
+
+        order_by = request.GET.get("order_by", "name")
+        reverse_order = request.GET.get("sort", "asc")
+        filters = ListRequestSerializer(data=request.GET)
+        if not filters.is_valid():
+            return self.render(data=filters.errors, status=HTTP_400_BAD_REQUEST)
+
+        use_case = ListGenre(DjangoORMGenreRepository())
+        try:
+            with timed("use_case"):
+                res: ListResponse = await use_case.aexecute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )  # type: ignore
+        except InvalidOrderBy as e:
+            return self.render(data={"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+
+        return self.render_compiled(LIST_GENRE_RESPONSE, res)
@@ -0,0 +1,280 @@
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.infrastructure.instrumentation import (
+    Timings,
+    current_timings,
+    start_timings,
+    stop_timings,
+    timed,
+)
+
+logger = logging.getLogger(__name__)
+
+# Order of the spans in the Server-Timing header and in the log lines
+SPANS = ("db", "auth", "use_case", "serialize", "publish")
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper adding every query to the "db" span of the
+    current request.
+
+    Args:
+        execute: The next callable in the execute chain.
+        sql: The SQL statement.
+        params: The statement parameters.
+        many (bool): Whether it is an executemany call.
+        context: The execution context.
+
+    Returns:
+        The result of the query execution.
+    """
+
+    timings = current_timings()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add("db", time.perf_counter() - start)
+
+
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    """
+    Install the query recorder on a database connection once.
+
+    Connected to `connection_created`, so it also covers the connections
+    opened by the threads that run the async ORM calls.
+
+    Args:
+        sender: The database backend class.
+        connection: The database connection wrapper.
+    """
+
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """
+    JSON renderer recording the rendering time in the "serialize" span.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render the data into JSON.
+
+        Args:
+            data: The data to be rendered.
+            accepted_media_type: The accepted media type.
+            renderer_context: The renderer context.
+
+        Returns:
+            bytes: The rendered JSON.
+        """
+
+        with timed("serialize"):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class TimingMiddleware:
+    """
+    Opt-in middleware breaking the time of each request down into database,
+    auth, use case, serialization and broker publish spans.
+
+    Enabled by INSTRUMENTATION_ENABLED. A fraction of the requests, set by
+    INSTRUMENTATION_SAMPLE_RATE, is timed; each one gets a Server-Timing
+    header and a structured log line.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Initialize the TimingMiddleware.
+
+        Args:
+            get_response: The next handler in the middleware chain.
+
+        Raises:
+            MiddlewareNotUsed: If the instrumentation is disabled, which removes
+                the middleware from the chain.
+        """
+
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        self.sample_rate = settings.INSTRUMENTATION_SAMPLE_RATE
+        connection_created.connect(
+            install_query_recorder, dispatch_uid="instrumentation.query_recorder"
+        )
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(sender=None, connection=connection)
+
+    def __call__(self, request):
+        """
+        Handle the request, timing it when it is sampled.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.sampled():
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        token = start_timings()
+        timings: Timings = current_timings()  # type: ignore
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_timings(token)
+
+        return self.report(request, response, timings, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        """
+        Handle the request in an async handler chain, timing it when it is
+        sampled.
+
+        The timings are bound to a context variable around the awaited handler,
+        and the ORM calls the async views run in worker threads copy the
+        context, so their queries land in the same spans.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        if not self.sampled():
+            return await self.get_response(request)
+
+        start = time.perf_counter()
+        token = start_timings()
+        timings: Timings = current_timings()  # type: ignore
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_timings(token)
+
+        return self.report(request, response, timings, time.perf_counter() - start)
+
+    def sampled(self) -> bool:
+        """
+        Decide whether a request is timed.
+
+        Returns:
+            bool: True for a INSTRUMENTATION_SAMPLE_RATE fraction of the requests.
+        """
+
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def report(self, request, response, timings: Timings, total: float):
+        """
+        Add the Server-Timing header to the response and log the spans.
+
+        Args:
+            request: The timed request.
+            response: Its response.
+            timings (Timings): The spans of the request.
+            total (float): The total request time, in seconds.
+
+        Returns:
+            The response, with the Server-Timing header.
+        """
+
+        response["Server-Timing"] = self.server_timing(timings, total)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s %s %s %s",
+                request.method,
+                request.path,
+                response.status_code,
+                self.log_fields(timings, total),
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "timings": {
+                        name: round(seconds * 1000, 3)
+                        for name, (seconds, _) in timings.spans.items()
+                    },
+                    "total_ms": round(total * 1000, 3),
+                },
+            )
+
+        return response
+
+    @staticmethod
+    def server_timing(timings: Timings, total: float) -> str:
+        """
+        Format the spans as a Server-Timing header value.
+
+        Args:
+            timings (Timings): The spans of the request.
+            total (float): The total request time, in seconds.
+
+        Returns:
+            str: The header value, e.g. `db;dur=1.2;desc="3 queries", total;dur=4.5`.
+        """
+
+        metrics = []
+        for name in SPANS:
+            span = timings.spans.get(name)
+            if span is None:
+                continue
+            metric = f"{name};dur={span[0] * 1000:.2f}"
+            if name == "db":
+                metric += f';desc="{span[1]} queries"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={total * 1000:.2f}")
+
+        return ", ".join(metrics)
+
+    @staticmethod
+    def log_fields(timings: Timings, total: float) -> str:
+        """
+        Format the spans as key=value fields for the log line.
+
+        Args:
+            timings (Timings): The spans of the request.
+            total (float): The total request time, in seconds.
+
+        Returns:
+            str: The fields, e.g. `db_ms=1.20 db_count=3 total_ms=4.50`.
+        """
+
+        fields = []
+        for name in SPANS:
+            span = timings.spans.get(name)
+            if span is None:
+                continue
+            fields.append(f"{name}_ms={span[0] * 1000:.2f}")
+            if name == "db":
+                fields.append(f"db_count={span[1]}")
+        fields.append(f"total_ms={total * 1000:.2f}")
+
+        return " ".join(fields)
@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+from django.conf import settings
+
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.background_message_bus import BackgroundMessageBus
+from src.core._shared.events.message_bus import MessageBus
+from src.core._shared.infrastructure.events.sqlite_spill_store import (
+    SqliteSpillStore,
+)
+
+
+def get_message_bus() -> AbstractMessageBus:
+    """
+    Get the message bus configured by the MESSAGE_BUS_* settings.
+
+    "sync" runs the handlers inline, in the caller's thread, with a new bus
+    per call, since its handlers hold connections, such as the RabbitMQ
+    dispatcher's, that must not be shared between request threads.
+    "background" queues the events for the process-wide pool of worker
+    threads, each with its own bus.
+
+    Returns:
+        AbstractMessageBus: The message bus.
+
+    Raises:
+        ValueError: If the settings name an unknown mode or policy.
+    """
+
+    mode = settings.MESSAGE_BUS_MODE
+    if mode == "sync":
+        return MessageBus()
+    if mode == "background":
+        return get_background_message_bus()
+
+    raise ValueError(f"Unknown message bus mode: {mode}")
+
+
+@lru_cache(maxsize=None)
+def get_background_message_bus() -> BackgroundMessageBus:
+    """
+    Get the background message bus of the process, configured by the
+    MESSAGE_BUS_* settings.
+
+    Returns:
+        BackgroundMessageBus: The process-wide background message bus.
+
+    Raises:
+        ValueError: If the settings name an unknown policy.
+    """
+
+    policy = settings.MESSAGE_BUS_POLICY
+    return BackgroundMessageBus(
+        workers=settings.MESSAGE_BUS_WORKERS,
+        max_queued=settings.MESSAGE_BUS_MAX_QUEUED,
+        policy=policy,
+        spill_store=(
+            SqliteSpillStore(settings.MESSAGE_BUS_SPILL_PATH)
+            if policy == "spill"
+            else None
+        ),
+    )
@@ -0,0 +1,160 @@
+import functools
+import inspect
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from src.core._shared.infrastructure.metrics import CONTENT_TYPE, REGISTRY
+
+REQUEST_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests by view and action.",
+    ["view", "action", "status"],
+)
+REPOSITORY_LATENCY = REGISTRY.histogram(
+    "repository_operation_duration_seconds",
+    "Latency of the repository operations.",
+    ["repository", "operation"],
+)
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Expose the metrics of the web process in the Prometheus text format.
+
+    Args:
+        request (HttpRequest): The incoming request.
+
+    Returns:
+        HttpResponse: The metrics exposition.
+    """
+
+    return HttpResponse(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+
+class MetricsMiddleware:
+    """
+    Middleware observing the latency of every request, labelled by view and
+    viewset action (list, retrieve, create...), or by HTTP method for plain
+    views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Initialize the MetricsMiddleware.
+
+        Args:
+            get_response: The next handler in the middleware chain.
+        """
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Handle the request, observing its latency.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+
+        return response
+
+    async def __acall__(self, request):
+        """
+        Handle the request in an async handler chain, observing its latency.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+
+        return response
+
+    @staticmethod
+    def observe(request, response, elapsed: float) -> None:
+        """
+        Observe the latency of a request, labelled by its view and action.
+
+        Args:
+            request: The handled request.
+            response: Its response.
+            elapsed (float): The time it took, in seconds.
+        """
+
+        view, action = "unmatched", request.method.lower()
+        match = request.resolver_match
+        if match is not None:
+            view = match.view_name
+            actions = getattr(match.func, "actions", None)
+            if actions:
+                action = actions.get(action, action)
+
+        REQUEST_LATENCY.labels(view, action, str(response.status_code)).observe(elapsed)
+
+
+def instrument_repository(name: str):
+    """
+    Class decorator observing the latency of every public method of a
+    repository, sync or async.
+
+    Args:
+        name (str): The repository label, e.g. "category".
+
+    Returns:
+        The class decorator.
+    """
+
+    def wrap(operation: str, method):
+        histogram = REPOSITORY_LATENCY.labels(name, operation)
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_observed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start)
+
+            return async_observed
+
+        @functools.wraps(method)
+        def observed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return observed
+
+    def decorate(cls):
+        for attribute, value in list(vars(cls).items()):
+            if not attribute.startswith("_") and inspect.isfunction(value):
+                setattr(cls, attribute, wrap(attribute, value))
+        return cls
+
+    return decorate
@@ -1,6 +1,29 @@
 from rest_framework.permissions import BasePermission
 
 from src.core._shared.infrastructure.auth.jwt_auth_service import JwtAuthService
+from src.core._shared.infrastructure.instrumentation import timed
+
+
+def get_auth_service(request) -> JwtAuthService:
+    """
+    Get the auth service of the request, creating it on first use.
+
+    The service is shared by every permission checked for the request, so the
+    token signature is verified only once per request.
+
+    Args:
+        request: The request object
+
+    Returns:
+        JwtAuthService: The auth service for the request token.
+    """
+
+    auth_service = getattr(request, "_auth_service", None)
+    if auth_service is None:
+        auth_service = JwtAuthService(token=request.headers.get("Authorization"))
+        request._auth_service = auth_service
+
+    return auth_service
 
 
 class IsAuthenticated(BasePermission):
@@ -22,8 +45,8 @@ class IsAuthenticated(BasePermission):
             bool: True if the user is authenticated, False otherwise
         """
 
-        token = request.headers.get("Authorization")
-        return JwtAuthService(token=token).is_authenticated()
+        with timed("auth"):
+            return get_auth_service(request).is_authenticated()
 
 
 class IsAdmin(BasePermission):
@@ -45,5 +68,5 @@ class IsAdmin(BasePermission):
             bool: True if the user is an admin, False otherwise.
         """
 
-        token = request.headers.get("Authorization")
-        return JwtAuthService(token=token).has_role("admin")
+        with timed("auth"):
+            return get_auth_service(request).has_role("admin")
@@ -0,0 +1,126 @@
+import functools
+import hmac
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from src.core._shared.infrastructure.profiling import Profiler
+
+PROFILE_HEADER = "X-Profile"
+
+
+@functools.lru_cache(maxsize=None)
+def get_profiler() -> Profiler:
+    """
+    Get the profiler configured by the PROFILING_* settings, shared by the
+    requests and the consumer of the process.
+
+    Returns:
+        Profiler: The profiler, disabled when PROFILING_DIR is not set.
+    """
+
+    return Profiler(
+        directory=settings.PROFILING_DIR,
+        mode=settings.PROFILING_MODE,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        enabled=settings.PROFILING_ENABLED,
+        max_files=settings.PROFILING_MAX_FILES,
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Middleware profiling a sampled fraction of the requests, and the requests
+    carrying the X-Profile header with the PROFILING_TOKEN.
+
+    Removed from the chain when PROFILING_DIR is not set. The sampling is
+    turned on by PROFILING_ENABLED or toggled at runtime with SIGUSR2.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Initialize the ProfilingMiddleware.
+
+        Args:
+            get_response: The next handler in the middleware chain.
+
+        Raises:
+            MiddlewareNotUsed: If no profiling directory is configured.
+        """
+
+        self.profiler = get_profiler()
+        if self.profiler.directory is None:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        self.token = settings.PROFILING_TOKEN
+        self.profiler.install_signal_handler()
+
+    def __call__(self, request):
+        """
+        Handle the request, profiling it when it is sampled or forced.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with self.profiler.profile(self.name(request), force=self.forced(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        """
+        Handle the request in an async handler chain, profiling it when it is
+        sampled or forced.
+
+        The profile covers the event loop thread while the request is handled,
+        so it also records the other requests the loop serves meanwhile.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler.
+        """
+
+        with self.profiler.profile(self.name(request), force=self.forced(request)):
+            return await self.get_response(request)
+
+    @staticmethod
+    def name(request) -> str:
+        """
+        Name the profile of a request.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            str: The method and path of the request.
+        """
+
+        return f"{request.method} {request.path}"
+
+    def forced(self, request) -> bool:
+        """
+        Check whether the request carries the X-Profile header with the token.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            bool: True if the request must be profiled.
+        """
+
+        header = request.headers.get(PROFILE_HEADER)
+        return bool(self.token and header and hmac.compare_digest(header, self.token))
@@ -0,0 +1,120 @@
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, Set, Tuple
+
+from django.db import models
+
+
+def ordering(order_by: str, descending: bool) -> Tuple[str, ...]:
+    """
+    Get the ordering of a page: the field, then the id to break ties, both in
+    the requested direction, matching the (field, id) indexes of the models.
+
+    Args:
+        order_by (str): The field to sort by.
+        descending (bool): Whether to sort in descending order.
+
+    Returns:
+        Tuple[str, ...]: The arguments of `QuerySet.order_by`.
+    """
+
+    fields = (order_by,) if order_by == "id" else (order_by, "id")
+    return tuple(f"-{field}" if descending else field for field in fields)
+
+
+def matching(queryset: models.QuerySet, ids: Set[uuid.UUID] | None) -> models.QuerySet:
+    """
+    Restrict a list query to the requested ids, if any.
+
+    Args:
+        queryset (models.QuerySet): The list query.
+        ids (Set[uuid.UUID] | None): The ids requested, or None for every row.
+
+    Returns:
+        models.QuerySet: The query, filtered by primary key when ids are given.
+    """
+
+    return queryset if ids is None else queryset.filter(pk__in=ids)
+
+
+def _through_rows(
+    model: type[models.Model],
+    field_name: str,
+    owner_ids: Iterable[uuid.UUID] | None = None,
+):
+    """
+    Build the query of the (owner id, related id) pairs of a many-to-many
+    field, read from its through table without joining the related table.
+
+    Args:
+        model (type[models.Model]): The model owning the field.
+        field_name (str): The name of the many-to-many field.
+        owner_ids (Iterable[uuid.UUID] | None): Only read the pairs of these
+            owners. Defaults to every owner.
+
+    Returns:
+        QuerySet: The pairs, as tuples.
+    """
+
+    field = model._meta.get_field(field_name)
+    owner_column = f"{field.m2m_field_name()}_id"  # type: ignore
+    rows = field.remote_field.through.objects.all()  # type: ignore
+    if owner_ids is not None:
+        rows = rows.filter(**{f"{owner_column}__in": list(owner_ids)})
+
+    return rows.values_list(
+        owner_column,
+        f"{field.m2m_reverse_field_name()}_id",  # type: ignore
+    )
+
+
+def related_ids(
+    model: type[models.Model],
+    field_name: str,
+    owner_ids: Iterable[uuid.UUID] | None = None,
+) -> Dict[uuid.UUID, Set[uuid.UUID]]:
+    """
+    Get the related ids of every row of a many-to-many field in one query.
+
+    Args:
+        model (type[models.Model]): The model owning the field.
+        field_name (str): The name of the many-to-many field, e.g. "categories".
+        owner_ids (Iterable[uuid.UUID] | None): Only read the relations of
+            these owners, such as the rows of a page. Defaults to every owner.
+
+    Returns:
+        Dict[uuid.UUID, Set[uuid.UUID]]: The related ids by owner id; owners
+            without relations are missing.
+    """
+
+    ids: Dict[uuid.UUID, Set[uuid.UUID]] = defaultdict(set)
+    for owner_id, related_id in _through_rows(model, field_name, owner_ids):
+        ids[owner_id].add(related_id)
+
+    return ids
+
+
+async def arelated_ids(
+    model: type[models.Model],
+    field_name: str,
+    owner_ids: Iterable[uuid.UUID] | None = None,
+) -> Dict[uuid.UUID, Set[uuid.UUID]]:
+    """
+    Asynchronously get the related ids of every row of a many-to-many field.
+
+    Args:
+        model (type[models.Model]): The model owning the field.
+        field_name (str): The name of the many-to-many field, e.g. "categories".
+        owner_ids (Iterable[uuid.UUID] | None): Only read the relations of
+            these owners, such as the rows of a page. Defaults to every owner.
+
+    Returns:
+        Dict[uuid.UUID, Set[uuid.UUID]]: The related ids by owner id; owners
+            without relations are missing.
+    """
+
+    ids: Dict[uuid.UUID, Set[uuid.UUID]] = defaultdict(set)
+    async for owner_id, related_id in _through_rows(model, field_name, owner_ids):
+        ids[owner_id].add(related_id)
+
+    return ids
@@ -0,0 +1,95 @@
+import re
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from src.core._shared.infrastructure.structured_logging import correlation
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Ids accepted from the client; anything else is replaced by a generated one
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """
+    Middleware tagging the log records of each request with a request id.
+
+    The id is taken from the X-Request-ID header, so a request can be followed
+    across services, or generated, and is echoed back in the response.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """
+        Initialize the RequestIdMiddleware.
+
+        Args:
+            get_response: The next handler in the middleware chain.
+        """
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Handle the request with its id bound to the log records.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler, with the X-Request-ID header.
+        """
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        request_id = self.request_id(request)
+        with correlation(request=request_id):
+            response = self.get_response(request)
+        response[REQUEST_ID_HEADER] = request_id
+
+        return response
+
+    async def __acall__(self, request):
+        """
+        Handle the request with its id bound to the log records, in an async
+        handler chain.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            The response of the next handler, with the X-Request-ID header.
+        """
+
+        request_id = self.request_id(request)
+        with correlation(request=request_id):
+            response = await self.get_response(request)
+        response[REQUEST_ID_HEADER] = request_id
+
+        return response
+
+    @staticmethod
+    def request_id(request) -> str:
+        """
+        Take the request id from the X-Request-ID header, or generate one, and
+        set it on the request.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            str: The request id.
+        """
+
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+
+        return request_id
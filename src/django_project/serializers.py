@@ -2,6 +2,9 @@ from typing import Generic, Type, TypeVar
 
 from rest_framework import serializers
 
+# The most ids the list endpoints accept in their `ids` filter
+MAX_LIST_IDS = 100
+
 TSerializer = TypeVar(
     "TSerializer",
     bound=serializers.Serializer,
@@ -69,6 +72,35 @@ class ListResponseSerializer(serializers.Serializer, Generic[TSerializer]):
         self.fields["data"] = serializers.ListSerializer(child=child_serializer())
 
 
+class ListFilterRequestSerializer(serializers.Serializer):
+    """
+    Generic serializer for the filters of the list endpoints: `ids`, a comma
+    separated list of the ids to list
+    """
+
+    ids = serializers.CharField(required=False)
+
+    def validate_ids(self, value: str) -> set:
+        """
+        Parse the ids filter into a set of uuids.
+        """
+
+        return SetField(
+            child=serializers.UUIDField(),
+            allow_empty=False,
+            max_length=MAX_LIST_IDS,
+        ).run_validation([id.strip() for id in value.split(",") if id.strip()])
+
+
+class ListRequestSerializer(ListFilterRequestSerializer):
+    """
+    Generic serializer for the query parameters of the list endpoints: the
+    page, a positive integer, and the filters
+    """
+
+    current_page = serializers.IntegerField(min_value=1, default=1)
+
+
 class RetrieveDeleteRequestSerializer(serializers.Serializer):
     """
     Generic serializer for retrieve and delete request
@@ -10,8 +10,16 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from src.django_project.database import (
+    DEFAULT_READ_YOUR_WRITES_WINDOW,
+    database_config,
+    env_bool,
+    replica_database_config,
+)
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -48,6 +56,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "src.django_project.request_id.RequestIdMiddleware",
+    "src.django_project.profiling.ProfilingMiddleware",
+    "src.django_project.instrumentation.TimingMiddleware",
+    "src.django_project.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -55,6 +67,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "src.django_project.db_router.ReadYourWritesMiddleware",
 ]
 
 ROOT_URLCONF = "src.django_project.urls"
@@ -80,14 +93,22 @@ WSGI_APPLICATION = "src.django_project.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+# Configured through DATABASE_* environment variables, see database.py
 
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_config(os.environ, BASE_DIR),
 }
 
+# Reads go to the "replica" alias when DATABASE_REPLICA_* is set; writes, and
+# every read for a few seconds after a client writes, go to "default".
+if replica := replica_database_config(os.environ, DATABASES["default"]):
+    DATABASES["replica"] = replica
+
+DATABASE_ROUTERS = ["src.django_project.db_router.PrimaryReplicaRouter"]
+DATABASE_READ_YOUR_WRITES_WINDOW = int(
+    os.getenv("DATABASE_READ_YOUR_WRITES_WINDOW", DEFAULT_READ_YOUR_WRITES_WINDOW)
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -133,4 +154,104 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST FRAMEWORK SETTINGS
 REST_FRAMEWORK = {
     "TEST_REQUEST_DEFAULT_FORMAT": "json",
+    "DEFAULT_RENDERER_CLASSES": [
+        "src.django_project.instrumentation.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+# REQUEST INSTRUMENTATION
+# Adds a Server-Timing header and a log line with the db/auth/use case/
+# serialization/publish breakdown to a sampled fraction of the requests.
+INSTRUMENTATION_ENABLED = env_bool(os.environ, "INSTRUMENTATION_ENABLED")
+INSTRUMENTATION_SAMPLE_RATE = float(os.getenv("INSTRUMENTATION_SAMPLE_RATE", "1.0"))
+
+# MEDIA STORAGE
+# Whether uploads are flushed to disk (file and directory) before the request
+# returns. Turning it off trades durability on power loss for throughput.
+STORAGE_BUCKET = os.getenv("STORAGE_BUCKET", "/tmp/codeflix-storage")
+STORAGE_FSYNC = env_bool(os.environ, "STORAGE_FSYNC", default=True)
+# Media downloads are sent by the application unless a proxy takes over:
+# "nginx" answers with X-Accel-Redirect to MEDIA_ACCEL_PREFIX (an internal
+# location aliased to STORAGE_BUCKET), "sendfile" with X-Sendfile.
+MEDIA_ACCEL = os.getenv("MEDIA_ACCEL", "")
+MEDIA_ACCEL_PREFIX = os.getenv("MEDIA_ACCEL_PREFIX", "/protected-media/")
+
+# MESSAGE BUS
+# "sync" publishes the events in the request thread; "background" queues them
+# for MESSAGE_BUS_WORKERS threads. When MESSAGE_BUS_MAX_QUEUED events are
+# waiting, new ones "block" the caller, are dropped ("drop") or "spill" to a
+# SQLite table at MESSAGE_BUS_SPILL_PATH, replayed when the queue has room.
+MESSAGE_BUS_MODE = os.getenv("MESSAGE_BUS_MODE", "sync")
+MESSAGE_BUS_WORKERS = int(os.getenv("MESSAGE_BUS_WORKERS", "4"))
+MESSAGE_BUS_MAX_QUEUED = int(os.getenv("MESSAGE_BUS_MAX_QUEUED", "1000"))
+MESSAGE_BUS_POLICY = os.getenv("MESSAGE_BUS_POLICY", "block")
+MESSAGE_BUS_SPILL_PATH = os.getenv(
+    "MESSAGE_BUS_SPILL_PATH", str(BASE_DIR / "message_bus_spill.sqlite3")
+)
+
+# CACHE
+# Local to each process unless CACHE_BACKEND names a shared one, such as
+# django.core.cache.backends.db.DatabaseCache or a Redis or Memcached backend,
+# found at CACHE_LOCATION.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
 }
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# LIST TOTALS
+# How the list endpoints get meta.total: "exact" counts the rows on every
+# request, "cached" keeps per-table counters in the cache, moved by the
+# repositories' writes, and caches filtered counts for LIST_TOTAL_TTL seconds,
+# and "approximate" reads the query planner's row estimates. A write only moves
+# the counters of the cache of its own process unless the cache is shared, so
+# "cached" is the default only with a shared cache.
+LIST_TOTAL_MODE = os.getenv(
+    "LIST_TOTAL_MODE",
+    "exact" if CACHES["default"]["BACKEND"] in LOCAL_CACHE_BACKENDS else "cached",
+)
+LIST_TOTAL_TTL = int(os.getenv("LIST_TOTAL_TTL", "30"))
+
+# PROFILING
+# With PROFILING_DIR set, requests sent with `X-Profile: <PROFILING_TOKEN>` are
+# profiled, as is a PROFILING_SAMPLE_RATE fraction of the requests and consumer
+# messages while sampling is on (PROFILING_ENABLED, toggled by SIGUSR2).
+PROFILING_DIR = os.getenv("PROFILING_DIR") or None
+PROFILING_MODE = os.getenv("PROFILING_MODE", "cprofile")
+PROFILING_ENABLED = env_bool(os.environ, "PROFILING_ENABLED")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0.01"))
+PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "500"))
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+
+# LOGGING
+# Records go through a queue to a background thread that formats and writes
+# them, as JSON lines by default ("text" for a human-readable format), tagged
+# with the request id and the resource id being processed.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "async": {
+            "()": "src.core._shared.infrastructure.structured_logging.AsyncQueueHandler",
+            "format": os.getenv("LOG_FORMAT", "json"),
+        },
+    },
+    "root": {
+        "handlers": ["async"],
+        "level": os.getenv("LOG_LEVEL", "INFO").upper(),
+    },
+}
+
+# MEDIA STATUS NOTIFICATIONS
+# "memory" fans out within a single process; use "rabbitmq" when the consumer
+# runs apart from the ASGI workers.
+MEDIA_STATUS_BROADCASTER = os.getenv("MEDIA_STATUS_BROADCASTER", "memory")
+RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "localhost")
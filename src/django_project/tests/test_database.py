@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from src.django_project.database import (
+    DEFAULT_CONN_MAX_AGE,
+    SQLITE_WAL_INIT_COMMAND,
+    database_config,
+    replica_database_config,
+)
+
+
+class TestDatabaseConfig:
+    """
+    Test the environment-driven database settings.
+    """
+
+    def test_defaults_to_persistent_sqlite(self):
+        config = database_config({}, Path("/app"))
+
+        assert config == {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": Path("/app") / "db.sqlite3",
+            "CONN_MAX_AGE": DEFAULT_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+        }
+
+    def test_sqlite_wal_mode(self):
+        config = database_config({"DATABASE_SQLITE_WAL": "true"}, Path("/app"))
+
+        assert config["OPTIONS"] == {
+            "init_command": SQLITE_WAL_INIT_COMMAND,
+            "transaction_mode": "IMMEDIATE",
+        }
+
+    def test_postgresql_with_persistent_connections(self):
+        config = database_config(
+            {
+                "DATABASE_ENGINE": "postgresql",
+                "DATABASE_NAME": "catalog",
+                "DATABASE_HOST": "db",
+                "DATABASE_CONN_MAX_AGE": "300",
+                "DATABASE_CONN_HEALTH_CHECKS": "false",
+            },
+            Path("/app"),
+        )
+
+        assert config["ENGINE"] == "django.db.backends.postgresql"
+        assert config["NAME"] == "catalog"
+        assert config["HOST"] == "db"
+        assert config["CONN_MAX_AGE"] == 300
+        assert config["CONN_HEALTH_CHECKS"] is False
+        assert "OPTIONS" not in config
+
+    def test_postgresql_pool_disables_persistent_connections(self):
+        config = database_config(
+            {
+                "DATABASE_ENGINE": "postgresql",
+                "DATABASE_POOL": "1",
+                "DATABASE_POOL_MAX_SIZE": "20",
+            },
+            Path("/app"),
+        )
+
+        assert config["CONN_MAX_AGE"] == 0
+        assert config["OPTIONS"] == {
+            "pool": {"min_size": 2, "max_size": 20, "timeout": 10.0},
+        }
+
+    def test_unsupported_engine(self):
+        with pytest.raises(ValueError, match="Unsupported DATABASE_ENGINE: mysql"):
+            database_config({"DATABASE_ENGINE": "mysql"}, Path("/app"))
+
+
+class TestReplicaDatabaseConfig:
+    """
+    Test the environment-driven read replica settings.
+    """
+
+    def test_no_replica_by_default(self):
+        primary = database_config({}, Path("/app"))
+
+        assert replica_database_config({}, primary) is None
+
+    def test_sqlite_replica_file(self):
+        primary = database_config({}, Path("/app"))
+
+        config = replica_database_config(
+            {"DATABASE_REPLICA_NAME": "/app/replica.sqlite3"}, primary
+        )
+
+        assert config == {
+            **primary,
+            "NAME": "/app/replica.sqlite3",
+            "TEST": {"MIRROR": "default"},
+        }
+
+    def test_postgresql_replica_host(self):
+        primary = database_config({"DATABASE_ENGINE": "postgresql"}, Path("/app"))
+
+        config = replica_database_config(
+            {"DATABASE_REPLICA_HOST": "replica", "DATABASE_REPLICA_PORT": "5433"},
+            primary,
+        )
+
+        assert config["HOST"] == "replica"
+        assert config["PORT"] == "5433"
+        assert config["NAME"] == primary["NAME"]
@@ -0,0 +1,191 @@
+import os
+import time
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.management import call_command
+from django.db import connections
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from rest_framework.test import APIClient
+
+from src.core._shared.infrastructure.auth.jwt_token_generator import JwtTokenGenerator
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.db_router import (
+    PIN_COOKIE,
+    PRIMARY_DATABASE,
+    REPLICA_DATABASE,
+    PrimaryReplicaRouter,
+    ReadYourWritesMiddleware,
+    is_pinned_to_primary,
+    use_primary,
+)
+
+
+@pytest.fixture(scope="class")
+def replica_database(tmp_path_factory, django_db_setup, django_db_blocker):
+    """
+    Fixture adding a second SQLite file standing in for a read replica.
+
+    Nothing replicates the writes, so tests copy rows to the replica by hand
+    to simulate replication, and rows missing from it simulate replica lag.
+    """
+
+    name = tmp_path_factory.mktemp("replica") / "replica.sqlite3"
+    connections.settings[REPLICA_DATABASE] = {
+        **connections.settings[PRIMARY_DATABASE],
+        "NAME": str(name),
+    }
+
+    with django_db_blocker.unblock():
+        call_command("migrate", database=REPLICA_DATABASE, verbosity=0)
+
+    yield
+
+    connections[REPLICA_DATABASE].close()
+    del connections[REPLICA_DATABASE]
+    del connections.settings[REPLICA_DATABASE]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_auth_env():
+    fake_auth = JwtTokenGenerator()
+    os.environ["AUTH_PUBLIC_KEY"] = (
+        fake_auth.public_key_pem.decode()
+        .replace("-----BEGIN PUBLIC KEY-----\n", "")
+        .replace("\n-----END PUBLIC KEY-----\n", "")
+    )
+    return fake_auth
+
+
+@pytest.fixture
+def auth_token(setup_auth_env):
+    return setup_auth_env.generate_token(
+        user_info={
+            "username": "admin",
+            "email": "admin@example.com",
+            "first_name": "Admin",
+            "last_name": "User",
+            "realm_roles": ["admin"],
+            "resource_roles": [],
+        }
+    )
+
+
+def make_client(auth_token) -> APIClient:
+    return APIClient(headers={"Authorization": f"Bearer {auth_token}"})
+
+
+class TestPrimaryReplicaRouter:
+    """
+    Test the routing decisions without a replica configured.
+    """
+
+    def test_reads_and_writes_go_to_primary_without_replica(self):
+        router = PrimaryReplicaRouter()
+
+        assert router.db_for_read(CategoryModel) == PRIMARY_DATABASE
+        assert router.db_for_write(CategoryModel) == PRIMARY_DATABASE
+
+
+class TestReadYourWritesMiddleware:
+    """
+    Test the middleware in an async handler chain.
+    """
+
+    def test_pins_async_writes_without_adapting_the_chain(self):
+        pinned = []
+
+        async def get_response(request):
+            pinned.append(is_pinned_to_primary())
+            return HttpResponse(status=201)
+
+        middleware = ReadYourWritesMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().post("/api/categories/"))
+
+        assert iscoroutinefunction(middleware)
+        assert pinned == [True]
+        assert PIN_COOKIE in response.cookies
+
+
+@pytest.mark.usefixtures("replica_database")
+@pytest.mark.django_db(databases=[PRIMARY_DATABASE, REPLICA_DATABASE])
+class TestReadReplicaRouting:
+    """
+    Test the read/write split against two SQLite databases.
+    """
+
+    def test_reads_go_to_replica_unless_pinned(self):
+        router = PrimaryReplicaRouter()
+
+        assert router.db_for_read(CategoryModel) == REPLICA_DATABASE
+        with use_primary():
+            assert router.db_for_read(CategoryModel) == PRIMARY_DATABASE
+        assert router.db_for_write(CategoryModel) == PRIMARY_DATABASE
+
+    def test_list_reads_from_replica(self, auth_token):
+        CategoryModel.objects.using(REPLICA_DATABASE).create(
+            name="Replicated", description=""
+        )
+
+        response = make_client(auth_token).get("/api/categories/")
+
+        assert response.status_code == HTTP_200_OK
+        assert [item["name"] for item in response.data["data"]] == ["Replicated"]
+        assert not CategoryModel.objects.using(PRIMARY_DATABASE).exists()
+
+    def test_client_reads_its_own_writes_from_primary(self, auth_token):
+        writer = make_client(auth_token)
+
+        response = writer.post(
+            "/api/categories/", {"name": "Movie", "description": "Movies"}
+        )
+
+        assert response.status_code == HTTP_201_CREATED
+        assert PIN_COOKIE in response.cookies
+        assert CategoryModel.objects.using(PRIMARY_DATABASE).count() == 1
+        assert not CategoryModel.objects.using(REPLICA_DATABASE).exists()
+
+        pinned = writer.get("/api/categories/")
+        lagging = make_client(auth_token).get("/api/categories/")
+
+        assert [item["name"] for item in pinned.data["data"]] == ["Movie"]
+        assert lagging.data["data"] == []
+
+    def test_async_views_read_pinned_clients_from_primary(self, auth_token):
+        CategoryModel.objects.using(PRIMARY_DATABASE).create(
+            name="Movie", description=""
+        )
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        writer = AsyncClient()
+        writer.cookies[PIN_COOKIE] = str(time.time() + 60)
+
+        pinned = async_to_sync(writer.get)("/api/async/categories/", headers=headers)
+        lagging = async_to_sync(AsyncClient().get)(
+            "/api/async/categories/", headers=headers
+        )
+
+        assert [item["name"] for item in pinned.json()["data"]] == ["Movie"]
+        assert lagging.json()["data"] == []
+
+    def test_expired_pin_reads_from_replica(self, auth_token):
+        CategoryModel.objects.using(PRIMARY_DATABASE).create(
+            name="Movie", description=""
+        )
+        client = make_client(auth_token)
+        client.cookies[PIN_COOKIE] = str(time.time() - 1)
+
+        response = client.get("/api/categories/")
+
+        assert response.data["data"] == []
+
+    def test_commands_read_from_primary(self, auth_token):
+        category = CategoryModel.objects.using(PRIMARY_DATABASE).create(
+            name="Movie", description=""
+        )
+
+        response = make_client(auth_token).delete(f"/api/categories/{category.id}/")
+
+        assert response.status_code == HTTP_204_NO_CONTENT
+        assert not CategoryModel.objects.using(PRIMARY_DATABASE).exists()
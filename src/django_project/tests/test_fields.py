@@ -0,0 +1,42 @@
+import uuid
+
+import pytest
+from django.db import connection
+
+from src.django_project.category_app.models import Category
+from src.django_project.genre_app.models import Genre
+
+
+@pytest.mark.django_db
+class TestCompactUUIDField:
+    """
+    Test the storage and the lookups of the compact UUID field.
+    """
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite storage")
+    def test_stores_16_byte_blobs_on_sqlite(self):
+        category = Category.objects.create(name="Movie")
+        genre = Genre.objects.create(name="Drama")
+        genre.categories.add(category)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT typeof(id), length(id) FROM category")
+            assert cursor.fetchall() == [("blob", 16)]
+            cursor.execute(
+                "SELECT typeof(genre_id), typeof(category_id) FROM genre_categories"
+            )
+            assert cursor.fetchall() == [("blob", "blob")]
+
+    def test_round_trips_keys_and_relations(self):
+        category = Category.objects.create(name="Movie")
+        genre = Genre.objects.create(name="Drama")
+        genre.categories.add(category)
+
+        assert Category.objects.get(pk=str(category.id)).id == category.id
+        assert list(Category.objects.filter(id__in=[category.id, uuid.uuid4()])) == [
+            category
+        ]
+        assert list(
+            Genre.objects.prefetch_related("categories").get().categories.all()
+        ) == [category]
+        assert list(Genre.objects.values_list("categories", flat=True)) == [category.id]
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import os
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.status import HTTP_200_OK
+from rest_framework.test import APIClient
+
+from src.core._shared.infrastructure.auth.jwt_token_generator import JwtTokenGenerator
+from src.core._shared.infrastructure.instrumentation import timed
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.instrumentation import TimingMiddleware
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_auth_env():
+    fake_auth = JwtTokenGenerator()
+    os.environ["AUTH_PUBLIC_KEY"] = (
+        fake_auth.public_key_pem.decode()
+        .replace("-----BEGIN PUBLIC KEY-----\n", "")
+        .replace("\n-----END PUBLIC KEY-----\n", "")
+    )
+    return fake_auth
+
+
+@pytest.fixture
+def api_client_with_auth(setup_auth_env) -> APIClient:
+    token = setup_auth_env.generate_token(
+        user_info={
+            "username": "admin",
+            "email": "admin@example.com",
+            "first_name": "Admin",
+            "last_name": "User",
+            "realm_roles": ["admin"],
+            "resource_roles": [],
+        }
+    )
+    return APIClient(headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture
+def instrumentation(settings):
+    settings.INSTRUMENTATION_ENABLED = True
+    settings.INSTRUMENTATION_SAMPLE_RATE = 1.0
+    return settings
+
+
+@pytest.mark.django_db
+class TestTimingMiddleware:
+    """
+    Test the per-request timing breakdown.
+    """
+
+    def test_disabled_by_default(self, api_client_with_auth):
+        response = api_client_with_auth.get("/api/categories/")
+
+        assert response.status_code == HTTP_200_OK
+        assert "Server-Timing" not in response
+
+    def test_breaks_request_time_down(
+        self, instrumentation, api_client_with_auth, caplog
+    ):
+        CategoryModel.objects.create(name="Movie", description="")
+
+        with caplog.at_level(logging.INFO, logger="src.django_project.instrumentation"):
+            response = api_client_with_auth.get("/api/categories/")
+
+        assert response.status_code == HTTP_200_OK
+        metrics = [
+            metric.split(";")[0] for metric in response["Server-Timing"].split(", ")
+        ]
+        assert metrics == ["db", "auth", "use_case", "serialize", "total"]
+        # The collection version (ETag) query, the page query and the count
+        assert 'desc="3 queries"' in response["Server-Timing"]
+
+        (record,) = caplog.records
+        assert record.path == "/api/categories/"
+        assert record.status == HTTP_200_OK
+        assert set(record.timings) == {"db", "auth", "use_case", "serialize"}
+        assert "db_count=3" in record.getMessage()
+
+    def test_times_async_views(self, instrumentation, api_client_with_auth):
+        response = api_client_with_auth.get("/api/async/categories/")
+
+        assert response.status_code == HTTP_200_OK
+        assert "use_case;dur=" in response["Server-Timing"]
+        assert "serialize;dur=" in response["Server-Timing"]
+
+    def test_times_the_awaited_handler_in_async_chains(self, instrumentation):
+        async def get_response(request):
+            with timed("use_case"):
+                await asyncio.sleep(0.01)
+            return HttpResponse()
+
+        middleware = TimingMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().get("/api/categories/"))
+
+        assert iscoroutinefunction(middleware)
+        use_case = response["Server-Timing"].split(", ")[0]
+        assert use_case.startswith("use_case;dur=")
+        assert float(use_case.split("=")[1]) >= 10
+
+    def test_skips_requests_out_of_the_sample(
+        self, instrumentation, api_client_with_auth
+    ):
+        instrumentation.INSTRUMENTATION_SAMPLE_RATE = 0.0
+
+        response = api_client_with_auth.get("/api/categories/")
+
+        assert "Server-Timing" not in response
@@ -0,0 +1,48 @@
+import pytest
+from django.test import override_settings
+
+from src.core._shared.events.background_message_bus import BackgroundMessageBus
+from src.core._shared.events.message_bus import MessageBus
+from src.django_project.message_bus import (
+    get_background_message_bus,
+    get_message_bus,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_background_message_bus.cache_clear()
+    yield
+    get_background_message_bus.cache_clear()
+
+
+class TestGetMessageBus:
+    """
+    Test the message bus built from the settings.
+    """
+
+    @override_settings(MESSAGE_BUS_MODE="sync")
+    def test_sync_mode(self):
+        bus = get_message_bus()
+
+        assert type(bus) is MessageBus
+        assert get_message_bus() is not bus
+
+    @override_settings(
+        MESSAGE_BUS_MODE="background",
+        MESSAGE_BUS_WORKERS=1,
+        MESSAGE_BUS_MAX_QUEUED=10,
+        MESSAGE_BUS_POLICY="drop",
+    )
+    def test_background_mode(self):
+        bus = get_message_bus()
+
+        assert isinstance(bus, BackgroundMessageBus)
+        assert bus.policy == "drop"
+        assert get_message_bus() is bus
+        assert bus.drain(timeout=5)
+
+    @override_settings(MESSAGE_BUS_MODE="kafka")
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown message bus mode"):
+            get_message_bus()
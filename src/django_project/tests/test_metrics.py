@@ -0,0 +1,80 @@
+import os
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient
+from rest_framework.status import HTTP_200_OK
+from rest_framework.test import APIClient
+
+from src.core._shared.infrastructure.auth.jwt_token_generator import JwtTokenGenerator
+from src.django_project.metrics import MetricsMiddleware
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_auth_env():
+    fake_auth = JwtTokenGenerator()
+    os.environ["AUTH_PUBLIC_KEY"] = (
+        fake_auth.public_key_pem.decode()
+        .replace("-----BEGIN PUBLIC KEY-----\n", "")
+        .replace("\n-----END PUBLIC KEY-----\n", "")
+    )
+    return fake_auth
+
+
+@pytest.fixture
+def api_client_with_auth(setup_auth_env) -> APIClient:
+    token = setup_auth_env.generate_token(
+        user_info={
+            "username": "admin",
+            "email": "admin@example.com",
+            "first_name": "Admin",
+            "last_name": "User",
+            "realm_roles": ["admin"],
+            "resource_roles": [],
+        }
+    )
+    return APIClient(headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    """
+    Test the /metrics endpoint of the web process.
+    """
+
+    def test_exposes_request_and_repository_latency(self, api_client_with_auth):
+        api_client_with_auth.get("/api/categories/")
+
+        response = APIClient().get("/metrics")
+        body = response.content.decode()
+
+        assert response.status_code == HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_request_duration_seconds_count{view="category-list",'
+            'action="list",status="200"}'
+        ) in body
+        assert (
+            'repository_operation_duration_seconds_count{repository="category",'
+            'operation="list"}'
+        ) in body
+
+    def test_observes_requests_of_async_chains(self, setup_auth_env):
+        token = setup_auth_env.generate_token(
+            user_info={"username": "admin", "realm_roles": ["admin"]}
+        )
+
+        async_to_sync(AsyncClient().get)(
+            "/api/async/categories/", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        async def get_response(request):
+            return HttpResponse()
+
+        assert iscoroutinefunction(MetricsMiddleware(get_response))
+        body = APIClient().get("/metrics").content.decode()
+        assert (
+            'http_request_duration_seconds_count{view="async-category-list",'
+            'action="get",status="200"}'
+        ) in body
@@ -0,0 +1,84 @@
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from src.django_project.profiling import ProfilingMiddleware, get_profiler
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    settings.PROFILING_DIR = str(tmp_path)
+    settings.PROFILING_TOKEN = "secret"
+    get_profiler.cache_clear()
+    yield tmp_path
+    get_profiler.cache_clear()
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """
+    Test the profiling of the requests.
+    """
+
+    def test_profiles_requests_with_the_token(self, profiling):
+        APIClient().get("/api/categories/", headers={"X-Profile": "secret"})
+
+        (path,) = profiling.iterdir()
+        assert path.name.endswith("-GET-api-categories.prof")
+
+    def test_ignores_requests_with_a_wrong_token(self, profiling):
+        APIClient().get("/api/categories/", headers={"X-Profile": "guess"})
+        APIClient().get("/api/categories/")
+
+        assert list(profiling.iterdir()) == []
+
+    def test_samples_requests_when_enabled(self, profiling, settings):
+        settings.PROFILING_ENABLED = True
+        settings.PROFILING_SAMPLE_RATE = 1.0
+        get_profiler.cache_clear()
+
+        APIClient().get("/api/categories/")
+
+        assert len(list(profiling.iterdir())) == 1
+
+    def test_profiles_requests_of_async_chains(self, profiling):
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = ProfilingMiddleware(get_response)
+        async_to_sync(middleware)(
+            RequestFactory().get("/api/categories/", headers={"X-Profile": "secret"})
+        )
+
+        assert iscoroutinefunction(middleware)
+        (path,) = profiling.iterdir()
+        assert path.name.endswith("-GET-api-categories.prof")
+
+
+@pytest.mark.django_db
+class TestProfileReportCommand:
+    """
+    Test the aggregation of the profiles.
+    """
+
+    def test_aggregates_profiles_into_collapsed_stacks(self, profiling, tmp_path):
+        client = APIClient()
+        for _ in range(2):
+            client.get("/api/categories/", headers={"X-Profile": "secret"})
+        output = tmp_path / "report.folded"
+
+        call_command("profilereport", output=str(output), stderr=None)
+
+        lines = output.read_text().splitlines()
+        assert lines
+        stack, _, value = lines[0].rpartition(" ")
+        assert ";" in stack
+        assert int(value) > 0
+        assert any("views.py:dispatch" in line for line in lines)
+
+    def test_fails_without_profiles(self, profiling):
+        with pytest.raises(CommandError, match="No profiles found"):
+            call_command("profilereport")
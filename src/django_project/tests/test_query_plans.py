@@ -0,0 +1,66 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.django_project.category_app.models import Category
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.models import Video
+from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plans"),
+]
+
+REPOSITORIES = [
+    DjangoORMCategoryRepository,
+    DjangoORMCastMemberRepository,
+    DjangoORMGenreRepository,
+    DjangoORMVideoRepository,
+]
+
+
+def query_plan(sql: str) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return "\n".join(row[-1] for row in cursor.fetchall())
+
+
+@pytest.mark.parametrize(
+    "repository, order_by",
+    [
+        (repository, order_by)
+        for repository in REPOSITORIES
+        for order_by in repository.sortable_fields
+    ],
+)
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_are_read_from_an_index(repository, order_by, descending):
+    with CaptureQueriesContext(connection) as queries:
+        repository().page(order_by, descending, offset=2, limit=2)
+
+    (page_query,) = [
+        query["sql"] for query in queries.captured_queries if "ORDER BY" in query["sql"]
+    ]
+    plan = query_plan(page_query)
+
+    assert "USE TEMP B-TREE" not in plan
+    assert "USING INDEX" in plan or "USING PRIMARY KEY" in plan, plan
+
+
+@pytest.mark.parametrize(
+    "queryset",
+    [
+        lambda category: Video.objects.filter(categories=category),
+        lambda category: Category.objects.get(pk=category).genres.all(),
+    ],
+)
+def test_reverse_relation_lookups_use_covering_indexes(queryset):
+    category = Category.objects.create(name="Movie")
+
+    plan = queryset(category.id).values("id").explain()
+
+    assert "_reverse_idx" in plan, plan
+    assert "SCAN" not in plan.replace("SCAN CONSTANT ROW", ""), plan
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from src.core._shared.infrastructure.structured_logging import (
+    CorrelationFilter,
+    request_id,
+)
+from src.django_project.request_id import RequestIdMiddleware
+
+
+@pytest.mark.django_db
+class TestRequestIdMiddleware:
+    """
+    Test the request id bound to the logs of each request.
+    """
+
+    def test_generates_a_request_id(self):
+        response = APIClient().get("/api/categories/")
+
+        assert len(response["X-Request-ID"]) == 32
+
+    def test_reuses_the_request_id_of_the_client(self):
+        response = APIClient().get(
+            "/api/categories/", headers={"X-Request-ID": "trace-123"}
+        )
+
+        assert response["X-Request-ID"] == "trace-123"
+
+    def test_replaces_an_invalid_request_id(self):
+        response = APIClient().get(
+            "/api/categories/", headers={"X-Request-ID": "bad id\n" * 20}
+        )
+
+        assert response["X-Request-ID"] != "bad id\n" * 20
+        assert len(response["X-Request-ID"]) == 32
+
+    def test_tags_the_log_records_of_the_request(self, settings, caplog):
+        settings.INSTRUMENTATION_ENABLED = True
+        settings.INSTRUMENTATION_SAMPLE_RATE = 1.0
+        caplog.handler.addFilter(CorrelationFilter())
+
+        with caplog.at_level(logging.INFO, logger="src.django_project.instrumentation"):
+            APIClient().get("/api/categories/", headers={"X-Request-ID": "trace-123"})
+
+        (record,) = [
+            record
+            for record in caplog.records
+            if record.name == "src.django_project.instrumentation"
+        ]
+        assert record.request_id == "trace-123"
+
+    def test_binds_the_request_id_in_async_chains(self):
+        bound = []
+
+        async def get_response(request):
+            bound.append(request_id.get())
+            return HttpResponse()
+
+        middleware = RequestIdMiddleware(get_response)
+        response = async_to_sync(middleware)(
+            RequestFactory().get("/", headers={"X-Request-ID": "trace-123"})
+        )
+
+        assert iscoroutinefunction(middleware)
+        assert bound == ["trace-123"]
+        assert response["X-Request-ID"] == "trace-123"
@@ -0,0 +1,152 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.totals import atotal, record, total
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def drop_statistics():
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS sqlite_stat1")
+
+
+@pytest.fixture
+def repository() -> DjangoORMCategoryRepository:
+    return DjangoORMCategoryRepository()
+
+
+def save_categories(repository: DjangoORMCategoryRepository, count: int) -> None:
+    for index in range(count):
+        repository.save(Category(name=f"Category {index}", is_active=index % 2 == 0))
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedTotal:
+    """
+    Test the totals cached and moved by the repositories' writes.
+    """
+
+    @pytest.fixture(autouse=True)
+    def mode(self, settings):
+        settings.LIST_TOTAL_MODE = "cached"
+
+    def test_counts_the_rows_once(
+        self, repository: DjangoORMCategoryRepository, django_assert_num_queries
+    ):
+        save_categories(repository, 3)
+
+        with django_assert_num_queries(1):
+            assert total(CategoryModel.objects.all()) == 3
+            assert total(CategoryModel.objects.all()) == 3
+
+    def test_repository_writes_move_the_total_without_counting(
+        self, repository: DjangoORMCategoryRepository, django_assert_num_queries
+    ):
+        save_categories(repository, 2)
+        total(CategoryModel.objects.all())
+
+        category = Category(name="Movie")
+        repository.save(category)
+        with django_assert_num_queries(0):
+            assert total(CategoryModel.objects.all()) == 3
+
+        repository.delete(category.id)
+        repository.delete(category.id)
+        with django_assert_num_queries(0):
+            assert total(CategoryModel.objects.all()) == 2
+
+    def test_filtered_total_is_counted_again_after_a_write(
+        self, repository: DjangoORMCategoryRepository, django_assert_num_queries
+    ):
+        save_categories(repository, 3)
+        active = CategoryModel.objects.filter(is_active=True)
+
+        assert total(active) == 2
+        with django_assert_num_queries(0):
+            assert total(CategoryModel.objects.filter(is_active=True)) == 2
+
+        repository.save(Category(name="Movie"))
+        assert total(CategoryModel.objects.filter(is_active=True)) == 3
+
+    def test_rolled_back_writes_do_not_move_the_total(
+        self, repository: DjangoORMCategoryRepository
+    ):
+        save_categories(repository, 2)
+        total(CategoryModel.objects.all())
+
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                repository.save(Category(name="Movie"))
+                assert total(CategoryModel.objects.all()) == 3
+                raise RuntimeError
+
+        assert total(CategoryModel.objects.all()) == 2
+
+    def test_atotal(self, repository: DjangoORMCategoryRepository):
+        save_categories(repository, 2)
+
+        assert async_to_sync(atotal)(CategoryModel.objects.all()) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_exact_total_counts_every_time(
+    repository: DjangoORMCategoryRepository, django_assert_num_queries, settings
+):
+    settings.LIST_TOTAL_MODE = "exact"
+    save_categories(repository, 2)
+    record(CategoryModel, 5)
+
+    with django_assert_num_queries(2):
+        assert total(CategoryModel.objects.all()) == 2
+        assert total(CategoryModel.objects.all()) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("drop_statistics")
+class TestApproximateTotal:
+    """
+    Test the totals estimated from the planner statistics.
+    """
+
+    @pytest.fixture(autouse=True)
+    def mode(self, settings):
+        settings.LIST_TOTAL_MODE = "approximate"
+
+    def test_reads_the_statistics(self, repository: DjangoORMCategoryRepository):
+        save_categories(repository, 4)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        save_categories(repository, 1)
+
+        assert total(CategoryModel.objects.all()) == 4
+
+    def test_counts_without_statistics(self, repository: DjangoORMCategoryRepository):
+        save_categories(repository, 3)
+
+        assert total(CategoryModel.objects.all()) == 3
+        assert total(CategoryModel.objects.filter(is_active=True)) == 2
+
+
+@pytest.mark.django_db
+def test_counts_inside_transactions(
+    repository: DjangoORMCategoryRepository, django_assert_num_queries, settings
+):
+    settings.LIST_TOTAL_MODE = "cached"
+    save_categories(repository, 2)
+
+    with django_assert_num_queries(2):
+        assert total(CategoryModel.objects.all()) == 2
+        assert total(CategoryModel.objects.all()) == 2
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.event import Event
+from src.django_project.category_app.models import Category
+from src.django_project.unit_of_work import DjangoUnitOfWork
+
+
+@dataclass(frozen=True)
+class Saved(Event):
+    """
+    Dummy event
+    """
+
+    name: str
+
+
+@pytest.mark.django_db
+class TestDjangoUnitOfWork:
+    """
+    Test that the Django unit of work publishes only after commit.
+    """
+
+    def test_publishes_on_commit(self, django_capture_on_commit_callbacks):
+        message_bus = create_autospec(AbstractMessageBus)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with DjangoUnitOfWork(message_bus) as uow:
+                Category.objects.create(name="Movie")
+                uow.add_event(Saved(name="Movie"))
+                uow.add_event(Saved(name="Movie"))
+            message_bus.handle.assert_not_called()
+
+        assert len(callbacks) == 1
+        message_bus.handle.assert_called_once_with([Saved(name="Movie")])
+
+    def test_rollback_publishes_nothing(self, django_capture_on_commit_callbacks):
+        message_bus = create_autospec(AbstractMessageBus)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(RuntimeError):
+                with DjangoUnitOfWork(message_bus) as uow:
+                    Category.objects.create(name="Movie")
+                    uow.add_event(Saved(name="Movie"))
+                    raise RuntimeError
+
+        assert callbacks == []
+        assert not Category.objects.exists()
+        message_bus.handle.assert_not_called()
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections, models, router, transaction
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "list_total"
+
+
+def _table_key(model: type[models.Model]) -> str:
+    return f"{KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def _generation_key(model: type[models.Model]) -> str:
+    return f"{_table_key(model)}:generation"
+
+
+def _filter_key(queryset: models.QuerySet) -> str:
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.sha1(f"{sql}{params!r}".encode()).hexdigest()
+    generation = cache.get_or_set(_generation_key(queryset.model), 0, None)
+
+    return f"{_table_key(queryset.model)}:{generation}:{digest}"
+
+
+def total(queryset: models.QuerySet, exact: bool = False) -> int:
+    """
+    Get the number of rows of a list query, as configured by LIST_TOTAL_MODE.
+
+    "exact" counts the rows every time. "cached" keeps the total of each table
+    in the cache for LIST_TOTAL_TTL seconds, moved meanwhile by the
+    repositories' saves and deletes through `record`, and the totals of
+    filtered queries until they expire or the table is written to.
+    "approximate" reads the query planner's row estimates, falling back to the
+    cached totals where the database has none.
+
+    Inside a transaction the rows are always counted, since the transaction
+    may see writes the cached totals must not include yet.
+
+    Args:
+        queryset (models.QuerySet): The unsliced query of the list.
+        exact (bool): Count the rows whatever the mode, for queries that are
+            cheap to count and not worth caching, such as lookups by id.
+
+    Returns:
+        int: The number of rows, possibly a few writes behind in the cached
+            and approximate modes.
+    """
+
+    mode = "exact" if exact else settings.LIST_TOTAL_MODE
+    if mode == "exact" or transaction.get_connection(queryset.db).in_atomic_block:
+        return queryset.count()
+    if mode == "approximate":
+        estimate = _estimate(queryset)
+        if estimate is not None:
+            return estimate
+
+    return _cached_count(queryset)
+
+
+async def atotal(queryset: models.QuerySet, exact: bool = False) -> int:
+    """
+    Asynchronously get the number of rows of a list query.
+
+    Args:
+        queryset (models.QuerySet): The unsliced query of the list.
+        exact (bool): Count the rows whatever the mode.
+
+    Returns:
+        int: The number of rows, as returned by `total`.
+    """
+
+    return await sync_to_async(total)(queryset, exact)
+
+
+def table_state(model: type[models.Model]) -> str | None:
+    """
+    Get the state of the cached total of a table, which moves with every save
+    or delete `record`ed since it was counted.
+
+    Args:
+        model (type[models.Model]): The model of the table.
+
+    Returns:
+        str | None: The generation and total of the table, or None when the
+            totals are not cached, in the "exact" mode or inside a transaction.
+    """
+
+    queryset = model._default_manager.all()
+    if (
+        settings.LIST_TOTAL_MODE == "exact"
+        or transaction.get_connection(queryset.db).in_atomic_block
+    ):
+        return None
+
+    count = _cached_count(queryset)
+    generation = cache.get_or_set(_generation_key(model), 0, None)
+
+    return f"{generation}.{count}"
+
+
+def record(model: type[models.Model], delta: int) -> None:
+    """
+    Move the cached total of a table after rows were saved or deleted, and
+    drop the cached totals of its filtered queries.
+
+    The cache changes once the current transaction commits, so rolled back
+    writes never reach it, or right away outside a transaction.
+
+    Args:
+        model (type[models.Model]): The model of the written table.
+        delta (int): The number of rows added, negative for removed ones.
+    """
+
+    if settings.LIST_TOTAL_MODE == "exact" or not delta:
+        return
+
+    def apply() -> None:
+        for key, step in ((_table_key(model), delta), (_generation_key(model), 1)):
+            try:
+                cache.incr(key, step)
+            except ValueError:
+                # Not cached: the next read counts the rows
+                pass
+
+    transaction.on_commit(apply, using=router.db_for_write(model))
+
+
+def _cached_count(queryset: models.QuerySet) -> int:
+    """
+    Read the total of a list query from the cache, counting and caching it on
+    a miss.
+
+    Args:
+        queryset (models.QuerySet): The unsliced query of the list.
+
+    Returns:
+        int: The cached number of rows.
+    """
+
+    filtered = bool(queryset.query.where)
+    key = _filter_key(queryset) if filtered else _table_key(queryset.model)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.LIST_TOTAL_TTL)
+
+    return max(count, 0)
+
+
+def _estimate(queryset: models.QuerySet) -> int | None:
+    """
+    Read the query planner's estimate of the number of rows of a query.
+
+    PostgreSQL estimates whole tables from `pg_class.reltuples`, refreshed by
+    VACUUM and ANALYZE, and filtered queries from their plan. SQLite estimates
+    whole tables from the `sqlite_stat1` table written by ANALYZE.
+
+    Args:
+        queryset (models.QuerySet): The unsliced query of the list.
+
+    Returns:
+        int | None: The estimated number of rows, or None if the database has
+            no statistics for the query.
+    """
+
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    filtered = bool(queryset.query.where)
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                if filtered:
+                    plan = json.loads(queryset.explain(format="json"))
+                    return int(plan[0]["Plan"]["Plan Rows"])
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(table)],
+                )
+                row = cursor.fetchone()
+                # -1 until the table is first vacuumed or analyzed
+                return int(row[0]) if row and row[0] >= 0 else None
+            if connection.vendor == "sqlite" and not filtered:
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [table])
+                rows = [int(stat.split()[0]) for (stat,) in cursor.fetchall()]
+                return max(rows) if rows else None
+    except DatabaseError:
+        # sqlite_stat1 only exists once ANALYZE ran
+        logger.debug("No row estimate for %s", table, exc_info=True)
+
+    return None
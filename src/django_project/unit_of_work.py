@@ -0,0 +1,47 @@
+from django.db import transaction
+
+from src.core._shared.application.unit_of_work import AbstractUnitOfWork
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+
+
+class DjangoUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work wrapping `transaction.atomic()`.
+
+    The collected events are handed to the message bus from a
+    `transaction.on_commit` callback, so they are published once the
+    outermost transaction commits, and never for writes that roll back.
+    """
+
+    def __init__(self, message_bus: AbstractMessageBus, using: str | None = None):
+        """
+        Initialize the unit of work.
+
+        Args:
+            message_bus (AbstractMessageBus): The message bus to publish the
+                collected events to after commit.
+            using (str | None): The database alias of the transaction.
+        """
+
+        super().__init__(message_bus)
+        self.using = using
+        self._atomic: transaction.Atomic | None = None
+
+    def _begin(self) -> None:
+        self._atomic = transaction.atomic(using=self.using)
+        self._atomic.__enter__()
+
+    def _commit(self) -> None:
+        events = self.pull_events()
+        if events:
+            transaction.on_commit(
+                lambda: self.publish(events), using=self.using, robust=True
+            )
+        self._exit(None, None, None)
+
+    def _rollback(self, exc_type, exc, tb) -> None:
+        self._exit(exc_type, exc, tb)
+
+    def _exit(self, exc_type, exc, tb) -> None:
+        atomic, self._atomic = self._atomic, None
+        atomic.__exit__(exc_type, exc, tb)  # type: ignore
@@ -19,10 +19,23 @@ from django.contrib import admin
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from src.django_project.cast_member_app.views import CastMemberViewSet
-from src.django_project.category_app.views import CategoryViewSet
-from src.django_project.genre_app.views import GenreViewSet
-from src.django_project.video_app.views import VideoViewSet
+from src.django_project.cast_member_app.views import (
+    AsyncCastMemberListView,
+    CastMemberViewSet,
+)
+from src.django_project.category_app.views import (
+    AsyncCategoryDetailView,
+    AsyncCategoryListView,
+    CategoryViewSet,
+)
+from src.django_project.genre_app.views import AsyncGenreListView, GenreViewSet
+from src.django_project.metrics import metrics_view
+from src.django_project.video_app.views import (
+    AsyncVideoDetailView,
+    AsyncVideoListView,
+    MediaStatusStreamView,
+    VideoViewSet,
+)
 
 router = DefaultRouter()
 router.register(r"api/categories", CategoryViewSet, "category")
@@ -30,6 +43,50 @@ router.register(r"api/genres", GenreViewSet, "genre")
 router.register(r"api/cast_members", CastMemberViewSet, "cast_member")
 router.register(r"api/videos", VideoViewSet, "video")
 
-urlpatterns = [
-    path("admin/", admin.site.urls),
-] + router.urls
+# Read-only endpoints served natively by the ASGI application
+async_urlpatterns = [
+    path(
+        "api/async/categories/",
+        AsyncCategoryListView.as_view(),
+        name="async-category-list",
+    ),
+    path(
+        "api/async/categories/<str:pk>/",
+        AsyncCategoryDetailView.as_view(),
+        name="async-category-detail",
+    ),
+    path(
+        "api/async/genres/",
+        AsyncGenreListView.as_view(),
+        name="async-genre-list",
+    ),
+    path(
+        "api/async/cast_members/",
+        AsyncCastMemberListView.as_view(),
+        name="async-cast-member-list",
+    ),
+    path(
+        "api/async/videos/",
+        AsyncVideoListView.as_view(),
+        name="async-video-list",
+    ),
+    path(
+        "api/async/videos/<str:pk>/",
+        AsyncVideoDetailView.as_view(),
+        name="async-video-detail",
+    ),
+    path(
+        "api/videos/media-status/",
+        MediaStatusStreamView.as_view(),
+        name="video-media-status",
+    ),
+]
+
+urlpatterns = (
+    [
+        path("admin/", admin.site.urls),
+        path("metrics", metrics_view, name="metrics"),
+    ]
+    + async_urlpatterns
+    + router.urls
+)
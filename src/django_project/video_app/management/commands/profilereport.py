@@ -0,0 +1,100 @@
+import pstats
+import sys
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from src.core._shared.infrastructure.profiling import (
+    COLLAPSED_SUFFIX,
+    PROFILE_SUFFIX,
+    collapse_pstats,
+    read_collapsed,
+)
+
+
+class Command(BaseCommand):
+    """
+    Command to aggregate the profiles written by the profiler into a
+    flamegraph-ready report
+    """
+
+    help = "Aggregate the recorded profiles into collapsed stacks for a flamegraph"
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add the command arguments.
+
+        Args:
+            parser: The argument parser of the command.
+        """
+
+        parser.add_argument(
+            "--directory",
+            default=settings.PROFILING_DIR,
+            help="Directory of the profiles, defaults to PROFILING_DIR",
+        )
+        parser.add_argument(
+            "--match",
+            default="",
+            help="Only aggregate the profiles whose file name contains this text",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="File of the collapsed stacks, '-' for stdout",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=0,
+            help="Also print the N functions with the most own time to stderr",
+        )
+
+    def handle(self, *args, **kwargs) -> None:
+        """
+        Handles the command to aggregate the profiles.
+
+        pstats files are merged and turned into approximate stacks, collapsed
+        stack files are summed as is, and both are written as `frame;frame
+        value` lines, the input of flamegraph.pl, speedscope or inferno. The
+        values are microseconds for pstats and samples for collapsed stacks,
+        so only aggregate one kind at a time.
+
+        Raises:
+            CommandError: If there is no profile to aggregate.
+        """
+
+        if not kwargs["directory"]:
+            raise CommandError("Set PROFILING_DIR or pass --directory")
+
+        directory = Path(kwargs["directory"])
+        files = sorted(
+            path
+            for path in directory.glob("*")
+            if path.suffix in (PROFILE_SUFFIX, COLLAPSED_SUFFIX)
+            and kwargs["match"] in path.name
+        )
+        profiles = [path for path in files if path.suffix == PROFILE_SUFFIX]
+        collapsed = [path for path in files if path.suffix == COLLAPSED_SUFFIX]
+        if not files:
+            raise CommandError(f"No profiles found in {directory}")
+
+        stacks: Counter = Counter(read_collapsed(collapsed))
+        if profiles:
+            stats = pstats.Stats(*map(str, profiles), stream=sys.stderr)
+            stacks.update(collapse_pstats(stats))
+            if kwargs["top"]:
+                stats.sort_stats(pstats.SortKey.TIME).print_stats(kwargs["top"])
+
+        lines = [f"{stack} {value}\n" for stack, value in stacks.most_common()]
+        if kwargs["output"] == "-":
+            self.stdout.write("".join(lines), ending="")
+        else:
+            Path(kwargs["output"]).write_text("".join(lines))
+
+        self.stderr.write(
+            f"Aggregated {len(profiles)} pstats and {len(collapsed)} "
+            f"collapsed stack files into {len(lines)} stacks"
+        )
@@ -1,6 +1,10 @@
+import os
+
 from django.core.management.base import BaseCommand
 
+from src.core._shared.infrastructure.metrics import start_http_server
 from src.core.video.infra.video_converted_consumer import VideoConvertedRabbitMQConsumer
+from src.django_project.db_router import use_primary
 
 
 class Command(BaseCommand):
@@ -10,13 +14,36 @@ class Command(BaseCommand):
 
     help = "Start the RabbitMQ consumer to process the converted videos"
 
+    def add_arguments(self, parser) -> None:
+        """
+        Add the command arguments.
+
+        Args:
+            parser: The argument parser of the command.
+        """
+
+        parser.add_argument(
+            "--metrics-port",
+            type=int,
+            default=int(os.getenv("CONSUMER_METRICS_PORT", "9100")),
+            help="Port of the Prometheus metrics listener, 0 disables it",
+        )
+
     def handle(self, *args, **kwargs) -> None:
         """
         Handles the command to start the RabbitMQ consumer.
 
         This method will create an instance of the VideoConvertedRabbitMQConsumer
-        and call its start method to begin consuming messages from the queue.
+        and call its start method to begin consuming messages from the queue. The
+        consumer only runs commands, so its reads go to the primary database. Its
+        metrics are served over HTTP on --metrics-port, and SIGUSR2 toggles
+        the profiling of its messages.
         """
 
+        if kwargs["metrics_port"]:
+            start_http_server(kwargs["metrics_port"])
+
         consumer = VideoConvertedRabbitMQConsumer()
-        consumer.start()
+        consumer.profiler.install_signal_handler()
+        with use_primary():
+            consumer.start()
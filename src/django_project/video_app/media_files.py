@@ -0,0 +1,219 @@
+import io
+import mimetypes
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.negotiation import BaseContentNegotiation
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class FileRange(io.RawIOBase):
+    """
+    Read-only view of a byte range of an open file.
+
+    `tell` and `fileno` expose the underlying file, so WSGI servers with a
+    `wsgi.file_wrapper` (gunicorn, uWSGI) send the range with `os.sendfile`
+    from the current offset for Content-Length bytes, without copying it
+    through Python; other servers read it in blocks, bounded to the range.
+    """
+
+    def __init__(self, file, start: int, length: int) -> None:
+        """
+        Initialize the FileRange, positioning the file at the range start.
+
+        Args:
+            file: The open binary file.
+            start (int): The offset of the first byte.
+            length (int): The number of bytes of the range.
+        """
+
+        super().__init__()
+        self.file = file
+        self.start = start
+        self.end = start + length
+        self.name = file.name
+        file.seek(start)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_END:
+            offset, whence = self.end + offset, io.SEEK_SET
+        return self.file.seek(offset, whence)
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = max(self.end - self.file.tell(), 0)
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self.file.read(size)
+
+    def close(self) -> None:
+        self.file.close()
+        super().close()
+
+
+class IgnoreAcceptNegotiation(BaseContentNegotiation):
+    """
+    Content negotiation of the media downloads, which answer with the media
+    itself whatever the client accepts (e.g. `Accept: video/*`), so only the
+    JSON error responses go through a renderer.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header.
+
+    Args:
+        header (str): The header value, e.g. "bytes=0-1023" or "bytes=-500".
+        size (int): The size of the file.
+
+    Returns:
+        Optional[Tuple[int, int]]: The start offset and length of the range,
+            (0, 0) for an unsatisfiable range, or None when the header can't
+            be honoured (malformed or multiple ranges) and the whole file is
+            sent instead.
+    """
+
+    match = _RANGE.match(header.replace(" ", ""))
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        length = min(int(last), size)
+        return (size - length, length) if length else (0, 0)
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return (0, 0) if start >= size else None
+
+    return start, end - start + 1
+
+
+def media_response(
+    request: HttpRequest, root: Path, location: str, name: str, check_sum: str
+) -> HttpResponse:
+    """
+    Serve a stored media file, honouring conditional and Range requests.
+
+    The ETag is the content checksum, so it survives re-uploads of the same
+    content and copies across hosts. With MEDIA_ACCEL set, the transfer is
+    left to the proxy (`X-Accel-Redirect` for nginx, `X-Sendfile` for Apache
+    or lighttpd), which also handles the ranges.
+
+    Args:
+        request (HttpRequest): The request.
+        root (Path): The root directory of the storage.
+        location (str): The path of the file in the storage.
+        name (str): The file name presented to the client.
+        check_sum (str): The SHA-256 checksum of the content, if known.
+
+    Returns:
+        HttpResponse: The file, a part of it, 304, 412 or 416.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist or is outside the root.
+    """
+
+    path = (root / location).resolve()
+    if not path.is_relative_to(root.resolve()):
+        raise FileNotFoundError(location)
+
+    stat = path.stat()
+    etag = quote_etag(
+        check_sum or f"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    )
+    conditional = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if conditional is not None:
+        return conditional
+
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    accel = settings.MEDIA_ACCEL
+    if accel:
+        response = HttpResponse(content_type=content_type)
+        if accel == "nginx":
+            relative = path.relative_to(root.resolve()).as_posix()
+            response["X-Accel-Redirect"] = quote(
+                f"{settings.MEDIA_ACCEL_PREFIX.rstrip('/')}/{relative}"
+            )
+        else:
+            response["X-Sendfile"] = str(path)
+        return _with_headers(response, etag, stat.st_mtime, name)
+
+    size = stat.st_size
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if "Range" in request.headers and (if_range is None or if_range == etag):
+        byte_range = parse_range(request.headers["Range"], size)
+
+    if byte_range == (0, 0):
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    file = open(path, "rb")
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+    else:
+        start, length = byte_range
+        response = FileResponse(
+            FileRange(file, start, length), content_type=content_type
+        )
+        response.status_code = 206
+        response["Content-Range"] = f"bytes {start}-{start + length - 1}/{size}"
+    response["Content-Length"] = str(byte_range[1] if byte_range else size)
+
+    return _with_headers(response, etag, stat.st_mtime, name)
+
+
+def _with_headers(
+    response: HttpResponse, etag: str, modified: float, name: str
+) -> HttpResponse:
+    """
+    Add the validators and the range and disposition headers of a media
+    response.
+
+    Args:
+        response (HttpResponse): The response.
+        etag (str): The quoted ETag.
+        modified (float): The modification time of the file.
+        name (str): The file name presented to the client.
+
+    Returns:
+        HttpResponse: The same response.
+    """
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(modified)
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = f"inline; filename*=UTF-8''{quote(name)}"
+    response["Cache-Control"] = "private, max-age=0, must-revalidate"
+
+    return response
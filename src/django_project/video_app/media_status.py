@@ -0,0 +1,78 @@
+import uuid
+from functools import lru_cache
+
+from django.conf import settings
+
+from src.core._shared.events.abstract_broadcaster import AbstractBroadcaster
+from src.core._shared.infrastructure.events.in_memory_broadcaster import (
+    InMemoryBroadcaster,
+)
+from src.core._shared.infrastructure.events.rabbitmq_broadcaster import (
+    RabbitMQBroadcaster,
+)
+from src.core.video.domain.value_objects import MediaStatus, MediaType
+
+
+def media_status_channel(video_id: uuid.UUID) -> str:
+    """
+    Get the broadcast channel for the media status changes of a video.
+
+    Args:
+        video_id (uuid.UUID): The id of the video.
+
+    Returns:
+        str: The channel name.
+    """
+
+    return f"videos.{video_id}.media_status"
+
+
+def media_status_message(
+    video_id: uuid.UUID,
+    media_type: MediaType,
+    status: MediaStatus,
+    encoded_location: str,
+) -> dict:
+    """
+    Build the message published when the status of a media changes.
+
+    Args:
+        video_id (uuid.UUID): The id of the video that owns the media.
+        media_type (MediaType): The type of the media.
+        status (MediaStatus): The new status of the media.
+        encoded_location (str): The location of the encoded media.
+
+    Returns:
+        dict: The message to be published.
+    """
+
+    return {
+        "video_id": str(video_id),
+        "media_type": str(media_type),
+        "status": str(status),
+        "encoded_location": encoded_location,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_media_status_broadcaster() -> AbstractBroadcaster:
+    """
+    Get the broadcaster configured by the MEDIA_STATUS_BROADCASTER setting.
+
+    "memory" only reaches subscribers in the same process, while "rabbitmq"
+    lets the consumer process feed the ASGI workers.
+
+    Returns:
+        AbstractBroadcaster: The process-wide broadcaster instance.
+
+    Raises:
+        ValueError: If the setting names an unknown broadcaster.
+    """
+
+    backend = settings.MEDIA_STATUS_BROADCASTER
+    if backend == "memory":
+        return InMemoryBroadcaster()
+    if backend == "rabbitmq":
+        return RabbitMQBroadcaster(host=settings.RABBITMQ_HOST)
+
+    raise ValueError(f"Unknown media status broadcaster: {backend}")
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0004_alter_audiovideomedia_media_type_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:13
+
+import src.core._shared.domain.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0005_video_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="audiovideomedia",
+            name="id",
+            field=models.UUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="imagemedia",
+            name="id",
+            field=models.UUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="video",
+            name="id",
+            field=models.UUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
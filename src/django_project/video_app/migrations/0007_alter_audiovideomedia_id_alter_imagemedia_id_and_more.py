@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:15
+
+import src.core._shared.domain.uuid7
+import src.django_project.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0006_alter_audiovideomedia_id_alter_imagemedia_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="audiovideomedia",
+            name="id",
+            field=src.django_project.fields.CompactUUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="imagemedia",
+            name="id",
+            field=src.django_project.fields.CompactUUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="video",
+            name="id",
+            field=src.django_project.fields.CompactUUIDField(
+                default=src.core._shared.domain.uuid7.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
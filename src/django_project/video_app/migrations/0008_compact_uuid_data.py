@@ -0,0 +1,90 @@
+import uuid
+
+from django.db import migrations
+
+APP_LABELS = ("category_app", "genre_app", "cast_member_app", "video_app")
+
+
+def _uuid_columns(model):
+    """
+    The columns of a model holding CompactUUIDField values, its own or
+    those of the keys it points to.
+    """
+
+    columns = []
+    for field in model._meta.local_fields:
+        target = field.target_field if field.is_relation else field
+        if target.get_internal_type() == "CompactUUIDField":
+            columns.append(field.column)
+
+    return columns
+
+
+def _convert(apps, schema_editor, convert):
+    """
+    Rewrite every UUID column of the catalog tables, on SQLite only, where the
+    columns changed from char(32) to blob but kept their text values.
+
+    All tables are converted in one migration so that keys and foreign keys
+    match again when the constraints are checked.
+    """
+
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    cursor = schema_editor.connection.cursor()
+    for label in APP_LABELS:
+        for model in apps.get_app_config(label).get_models(include_auto_created=True):
+            columns = _uuid_columns(model)
+            if not columns:
+                continue
+
+            table = schema_editor.quote_name(model._meta.db_table)
+            names = ", ".join(schema_editor.quote_name(column) for column in columns)
+            assignments = ", ".join(
+                f"{schema_editor.quote_name(column)} = %s" for column in columns
+            )
+            cursor.execute(f"SELECT rowid, {names} FROM {table}")
+            rows = [
+                [*(convert(value) for value in values), rowid]
+                for rowid, *values in cursor.fetchall()
+            ]
+            cursor.executemany(
+                f"UPDATE {table} SET {assignments} WHERE rowid = %s", rows
+            )
+
+
+def to_bytes(value):
+    if value is None or isinstance(value, bytes):
+        return value
+
+    return uuid.UUID(value).bytes
+
+
+def to_hex(value):
+    if value is None or isinstance(value, str):
+        return value
+
+    return uuid.UUID(bytes=value).hex
+
+
+def forwards(apps, schema_editor):
+    _convert(apps, schema_editor, to_bytes)
+
+
+def backwards(apps, schema_editor):
+    _convert(apps, schema_editor, to_hex)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0004_alter_castmember_id"),
+        ("category_app", "0004_alter_category_id"),
+        ("genre_app", "0005_alter_genre_id"),
+        ("video_app", "0007_alter_audiovideomedia_id_alter_imagemedia_id_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
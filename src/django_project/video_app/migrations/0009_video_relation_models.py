@@ -0,0 +1,153 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Declare the video_categories, video_genres and video_cast_members tables,
+    created implicitly for the Video relations, as models. The tables are
+    unchanged.
+    """
+
+    dependencies = [
+        ("cast_member_app", "0004_alter_castmember_id"),
+        ("category_app", "0004_alter_category_id"),
+        ("genre_app", "0006_genrecategory"),
+        ("video_app", "0008_compact_uuid_data"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="VideoCategory",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "video",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="video_app.video",
+                            ),
+                        ),
+                        (
+                            "category",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="category_app.category",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "video_categories",
+                        "unique_together": {("video", "category")},
+                    },
+                ),
+                migrations.CreateModel(
+                    name="VideoGenre",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "video",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="video_app.video",
+                            ),
+                        ),
+                        (
+                            "genre",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="genre_app.genre",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "video_genres",
+                        "unique_together": {("video", "genre")},
+                    },
+                ),
+                migrations.CreateModel(
+                    name="VideoCastMember",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "video",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="video_app.video",
+                            ),
+                        ),
+                        (
+                            "castmember",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                related_name="+",
+                                to="cast_member_app.castmember",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "video_cast_members",
+                        "unique_together": {("video", "castmember")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="video",
+                    name="categories",
+                    field=models.ManyToManyField(
+                        related_name="videos",
+                        through="video_app.VideoCategory",
+                        to="category_app.category",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="video",
+                    name="genres",
+                    field=models.ManyToManyField(
+                        related_name="videos",
+                        through="video_app.VideoGenre",
+                        to="genre_app.genre",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="video",
+                    name="cast_members",
+                    field=models.ManyToManyField(
+                        related_name="videos",
+                        through="video_app.VideoCastMember",
+                        to="cast_member_app.castmember",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.7 on 2026-10-19 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0005_castmember_cast_member_name_id_idx_and_more"),
+        ("category_app", "0005_category_category_name_id_idx_and_more"),
+        ("genre_app", "0007_genre_genre_name_id_idx_and_more"),
+        ("video_app", "0009_video_relation_models"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["title", "id"], name="video_title_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["launch_year", "id"], name="video_launch_year_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["published", "title", "id"], name="video_published_title_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["rating", "title", "id"], name="video_rating_title_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videocastmember",
+            index=models.Index(
+                fields=["castmember", "video"], name="video_cast_members_reverse_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videocategory",
+            index=models.Index(
+                fields=["category", "video"], name="video_categories_reverse_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videogenre",
+            index=models.Index(
+                fields=["genre", "video"], name="video_genres_reverse_idx"
+            ),
+        ),
+    ]
@@ -1,13 +1,13 @@
-import uuid
-
 from django.db import models
 
+from src.core._shared.domain.uuid7 import uuid7
 from src.core.video.domain.value_objects import (
     ImageType,
     MediaStatus,
     MediaType,
     Rating,
 )
+from src.django_project.fields import CompactUUIDField
 
 
 class Video(models.Model):
@@ -17,9 +17,9 @@ class Video(models.Model):
 
     RATING_CHOICES = [(rating.name, rating.name) for rating in Rating]
 
-    id = models.UUIDField(
+    id = CompactUUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     title = models.CharField(max_length=255)
@@ -38,18 +38,25 @@ class Video(models.Model):
         max_length=10,
         choices=RATING_CHOICES,
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+    )
 
     categories = models.ManyToManyField(
         "category_app.Category",
         related_name="videos",
+        through="VideoCategory",
     )
     genres = models.ManyToManyField(
         "genre_app.Genre",
         related_name="videos",
+        through="VideoGenre",
     )
     cast_members = models.ManyToManyField(
         "cast_member_app.CastMember",
         related_name="videos",
+        through="VideoCastMember",
     )
 
     banner = models.OneToOneField(
@@ -106,6 +113,75 @@ class Video(models.Model):
         db_table = "video"
         verbose_name = "Video"
         verbose_name_plural = "Videos"
+        indexes = [
+            models.Index(fields=["title", "id"], name="video_title_id_idx"),
+            models.Index(fields=["launch_year", "id"], name="video_launch_year_id_idx"),
+            models.Index(
+                fields=["published", "title", "id"], name="video_published_title_id_idx"
+            ),
+            models.Index(
+                fields=["rating", "title", "id"], name="video_rating_title_id_idx"
+            ),
+        ]
+
+
+class VideoCategory(models.Model):
+    """
+    Relation between a video and a category: the video_categories table,
+    declared to index its reverse lookups.
+    """
+
+    video = models.ForeignKey("Video", on_delete=models.CASCADE, related_name="+")
+    category = models.ForeignKey(
+        "category_app.Category", on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        db_table = "video_categories"
+        unique_together = [("video", "category")]
+        indexes = [
+            models.Index(
+                fields=["category", "video"], name="video_categories_reverse_idx"
+            ),
+        ]
+
+
+class VideoGenre(models.Model):
+    """
+    Relation between a video and a genre: the video_genres table.
+    """
+
+    video = models.ForeignKey("Video", on_delete=models.CASCADE, related_name="+")
+    genre = models.ForeignKey(
+        "genre_app.Genre", on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        db_table = "video_genres"
+        unique_together = [("video", "genre")]
+        indexes = [
+            models.Index(fields=["genre", "video"], name="video_genres_reverse_idx"),
+        ]
+
+
+class VideoCastMember(models.Model):
+    """
+    Relation between a video and a cast member: the video_cast_members table.
+    """
+
+    video = models.ForeignKey("Video", on_delete=models.CASCADE, related_name="+")
+    castmember = models.ForeignKey(
+        "cast_member_app.CastMember", on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        db_table = "video_cast_members"
+        unique_together = [("video", "castmember")]
+        indexes = [
+            models.Index(
+                fields=["castmember", "video"], name="video_cast_members_reverse_idx"
+            ),
+        ]
 
 
 class ImageMedia(models.Model):
@@ -115,9 +191,9 @@ class ImageMedia(models.Model):
 
     IMAGE_TYPE_CHOICES = [(type.name, type.name) for type in ImageType]
 
-    id = models.UUIDField(
+    id = CompactUUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     check_sum = models.CharField(max_length=255)
@@ -153,9 +229,9 @@ class AudioVideoMedia(models.Model):
     STATUS_CHOICES = [(status.name, status.name) for status in MediaStatus]
     MEDIA_TYPE_CHOICES = [(type.name, type.name) for type in MediaType]
 
-    id = models.UUIDField(
+    id = CompactUUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     check_sum = models.CharField(max_length=255)
@@ -1,8 +1,11 @@
 import uuid
-from typing import List
+from typing import Iterable, List, Set, Tuple
 
 from django.db import transaction
 
+from src.core.video.application.use_cases.list_video_without_media import (
+    VideoWithoutMediaOutput,
+)
 from src.core.video.domain.value_objects import (
     AudioVideoMedia,
     ImageMedia,
@@ -15,13 +18,20 @@ from src.core.video.domain.video_repository import VideoRepository
 from src.django_project.video_app.models import AudioVideoMedia as AudioVideoMediaModel
 from src.django_project.video_app.models import ImageMedia as ImageMediaModel
 from src.django_project.video_app.models import Video as VideoModel
+from src.django_project.metrics import instrument_repository
+from src.django_project.projections import arelated_ids, matching, ordering, related_ids
+from src.django_project.totals import atotal, record, total
 
 
+@instrument_repository("video")
 class DjangoORMVideoRepository(VideoRepository):
     """
     Django ORM implementation for a video repository.
     """
 
+    # The fields the list endpoint sorts by, each backed by a (field, id) index
+    sortable_fields = ("title", "launch_year", "id")
+
     def __init__(self, video_model: VideoModel | None = None):
         """
         Initialize the DjangoORMVideoRepository with an optional VideoModel.
@@ -54,6 +64,7 @@ class DjangoORMVideoRepository(VideoRepository):
             video_model.categories.set(video.categories)
             video_model.genres.set(video.genres)
             video_model.cast_members.set(video.cast_members)
+            record(self.video_model, 1)
 
     def get_by_id(self, video_id: uuid.UUID) -> Video | None:
         """
@@ -73,6 +84,96 @@ class DjangoORMVideoRepository(VideoRepository):
 
         return VideoModelMapper.to_entity(video_model)
 
+    def get_by_ids(self, video_ids: Iterable[uuid.UUID]) -> List[Video]:
+        """
+        Retrieve the videos with the given IDs from the repository, in one query
+        for the videos and their media and one per many-to-many relation.
+
+        Args:
+            video_ids (Iterable[uuid.UUID]): The IDs of the videos to be retrieved.
+
+        Returns:
+            List[Video]: The videos found, in no particular order.
+        """
+
+        return [
+            VideoModelMapper.to_entity(video_model)
+            for video_model in self._with_relations().filter(pk__in=list(video_ids))
+        ]
+
+    async def aget_by_id(self, video_id: uuid.UUID) -> Video | None:
+        """
+        Asynchronously retrieve a video by its ID from the repository.
+
+        Args:
+            video_id (uuid.UUID): The ID of the video to be retrieved.
+
+        Returns:
+            Video: The video with the given ID, or None if it doesn't exist.
+        """
+
+        try:
+            video_model = await self._with_relations().aget(pk=video_id)
+        except self.video_model.DoesNotExist:
+            return None
+
+        return VideoModelMapper.to_entity(video_model)
+
+    async def aget_by_ids(self, video_ids: Iterable[uuid.UUID]) -> List[Video]:
+        """
+        Asynchronously retrieve the videos with the given IDs from the repository.
+
+        Args:
+            video_ids (Iterable[uuid.UUID]): The IDs of the videos to be retrieved.
+
+        Returns:
+            List[Video]: The videos found, in no particular order.
+        """
+
+        return [
+            VideoModelMapper.to_entity(video_model)
+            async for video_model in self._with_relations().filter(
+                pk__in=list(video_ids)
+            )
+        ]
+
+    async def alist(self) -> List[Video]:
+        """
+        Asynchronously retrieve a list of all videos from the repository.
+
+        Returns:
+            List[Video]: A list of Video instances representing all videos in the repository.
+        """
+
+        return [
+            VideoModelMapper.to_entity(video_model)
+            async for video_model in self._with_relations()
+        ]
+
+    def _with_relations(self):
+        """
+        Build a queryset that loads every relation needed by the VideoModelMapper.
+
+        Media are joined and the many-to-many relations are prefetched, so mapping
+        the results never issues further queries. This is required by the async
+        methods, which cannot lazily load relations.
+
+        Returns:
+            QuerySet: The video queryset with its relations loaded.
+        """
+
+        return self.video_model.objects.select_related(
+            "banner",
+            "thumbnail",
+            "thumbnail_half",
+            "trailer",
+            "video",
+        ).prefetch_related(
+            "categories",
+            "genres",
+            "cast_members",
+        )
+
     def delete(self, video_id: uuid.UUID) -> None:
         """
         Delete a video by its ID from the repository.
@@ -81,7 +182,8 @@ class DjangoORMVideoRepository(VideoRepository):
             id (uuid.UUID): The ID of the video to be deleted.
         """
 
-        self.video_model.objects.filter(pk=video_id).delete()
+        _, deleted = self.video_model.objects.filter(pk=video_id).delete()
+        record(self.video_model, -deleted.get(self.video_model._meta.label, 0))
 
     def update(self, video: Video) -> None:
         """
@@ -137,6 +239,153 @@ class DjangoORMVideoRepository(VideoRepository):
             for video_model in self.video_model.objects.all()
         ]
 
+    # Columns of VideoWithoutMediaOutput read from the video table
+    _PROJECTION_COLUMNS = VideoWithoutMediaOutput._fields[:7]
+
+    def list_projections(self) -> List[VideoWithoutMediaOutput]:
+        """
+        List all videos as read-only outputs without media, skipping the
+        construction and validation of the entities.
+
+        The related ids come from one query per relation table, instead of
+        three queries per video.
+
+        Returns:
+            List[VideoWithoutMediaOutput]: A list of all videos.
+        """
+
+        categories = related_ids(self.video_model, "categories")
+        genres = related_ids(self.video_model, "genres")
+        cast_members = related_ids(self.video_model, "cast_members")
+
+        return [
+            VideoWithoutMediaOutput(
+                *row,
+                categories.get(row[0], set()),
+                genres.get(row[0], set()),
+                cast_members.get(row[0], set()),
+            )
+            for row in self.video_model.objects.values_list(*self._PROJECTION_COLUMNS)
+        ]
+
+    async def alist_projections(self) -> List[VideoWithoutMediaOutput]:
+        """
+        Asynchronously list all videos as read-only outputs without media.
+
+        Returns:
+            List[VideoWithoutMediaOutput]: A list of all videos.
+        """
+
+        categories = await arelated_ids(self.video_model, "categories")
+        genres = await arelated_ids(self.video_model, "genres")
+        cast_members = await arelated_ids(self.video_model, "cast_members")
+
+        return [
+            VideoWithoutMediaOutput(
+                *row,
+                categories.get(row[0], set()),
+                genres.get(row[0], set()),
+                cast_members.get(row[0], set()),
+            )
+            async for row in self.video_model.objects.values_list(
+                *self._PROJECTION_COLUMNS
+            )
+        ]
+
+    def page(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[VideoWithoutMediaOutput], int]:
+        """
+        Get a page of the videos as read-only outputs without media, sorted
+        and sliced by the database, reading the related ids of the page's
+        videos only.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of videos skipped.
+            limit (int): The maximum number of videos returned.
+            ids (Set[uuid.UUID] | None): Only page the videos with these ids.
+                Defaults to every video.
+
+        Returns:
+            Tuple[List[VideoWithoutMediaOutput], int]: The videos of the page and
+                the total number of videos.
+        """
+
+        matched = matching(self.video_model.objects.all(), ids)
+        rows = list(
+            matched.order_by(*ordering(order_by, descending)).values_list(
+                *self._PROJECTION_COLUMNS
+            )[offset : offset + limit]
+        )
+        page_ids = [row[0] for row in rows]
+        categories = related_ids(self.video_model, "categories", page_ids)
+        genres = related_ids(self.video_model, "genres", page_ids)
+        cast_members = related_ids(self.video_model, "cast_members", page_ids)
+
+        return [
+            VideoWithoutMediaOutput(
+                *row,
+                categories.get(row[0], set()),
+                genres.get(row[0], set()),
+                cast_members.get(row[0], set()),
+            )
+            for row in rows
+        ], total(matched, exact=ids is not None)
+
+    async def apage(
+        self,
+        order_by: str,
+        descending: bool,
+        offset: int,
+        limit: int,
+        ids: Set[uuid.UUID] | None = None,
+    ) -> Tuple[List[VideoWithoutMediaOutput], int]:
+        """
+        Asynchronously get a page of the videos as read-only outputs without
+        media.
+
+        Args:
+            order_by (str): The field to sort by, one of `sortable_fields`.
+            descending (bool): Whether to sort in descending order.
+            offset (int): The number of videos skipped.
+            limit (int): The maximum number of videos returned.
+            ids (Set[uuid.UUID] | None): Only page the videos with these ids.
+                Defaults to every video.
+
+        Returns:
+            Tuple[List[VideoWithoutMediaOutput], int]: The videos of the page and
+                the total number of videos.
+        """
+
+        matched = matching(self.video_model.objects.all(), ids)
+        rows = [
+            row
+            async for row in matched.order_by(
+                *ordering(order_by, descending)
+            ).values_list(*self._PROJECTION_COLUMNS)[offset : offset + limit]
+        ]
+        page_ids = [row[0] for row in rows]
+        categories = await arelated_ids(self.video_model, "categories", page_ids)
+        genres = await arelated_ids(self.video_model, "genres", page_ids)
+        cast_members = await arelated_ids(self.video_model, "cast_members", page_ids)
+
+        return [
+            VideoWithoutMediaOutput(
+                *row,
+                categories.get(row[0], set()),
+                genres.get(row[0], set()),
+                cast_members.get(row[0], set()),
+            )
+            for row in rows
+        ], await atotal(matched, exact=ids is not None)
+
 
 class VideoModelMapper:
     """
@@ -4,6 +4,7 @@ from src.core.video.domain.value_objects import ImageType
 from src.core.video.domain.value_objects import MediaStatus as MediaStatusType
 from src.core.video.domain.value_objects import MediaType
 from src.core.video.domain.value_objects import Rating as RatingType
+from src.django_project.compiled_serializers import compile_serializer
 from src.django_project.serializers import ListResponseSerializer, SetField
 
 
@@ -299,3 +300,10 @@ class VideoWithMediaResponseSerializer(serializers.Serializer):
     thumbnail_half = ImageMediaSerializer(required=False, allow_null=True)
     trailer = AudioVideoMediaSerializer(required=False, allow_null=True)
     video = AudioVideoMediaSerializer(required=False, allow_null=True)
+
+
+LIST_VIDEO_WITHOUT_MEDIA_RESPONSE = compile_serializer(
+    ListVideoWithoutMediaResponseSerializer()
+)
+
+VIDEO_WITH_MEDIA_RESPONSE = compile_serializer(VideoWithMediaResponseSerializer())
@@ -0,0 +1,54 @@
+import pytest
+
+from src.django_project.video_app.media_files import FileRange, parse_range
+
+
+class TestParseRange:
+    """
+    Test the parsing of the Range header
+    """
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-99", (0, 100)),
+            ("bytes=100-", (100, 900)),
+            ("bytes=-100", (900, 100)),
+            ("bytes=-5000", (0, 1000)),
+            ("bytes=900-5000", (900, 100)),
+            ("bytes=1000-", (0, 0)),
+            ("bytes=-0", (0, 0)),
+            ("bytes=50-10", None),
+            ("bytes=0-10,20-30", None),
+            ("items=0-10", None),
+            ("bytes=-", None),
+        ],
+    )
+    def test_parses_single_ranges(self, header, expected):
+        assert parse_range(header, 1000) == expected
+
+
+class TestFileRange:
+    """
+    Test the bounded view of a file used for the range responses
+    """
+
+    def test_reads_only_the_range(self, tmp_path):
+        path = tmp_path / "media.bin"
+        path.write_bytes(bytes(range(100)))
+
+        with FileRange(open(path, "rb"), start=10, length=20) as file_range:
+            assert file_range.tell() == 10
+            assert file_range.read(15) == bytes(range(10, 25))
+            assert file_range.read() == bytes(range(25, 30))
+            assert file_range.read() == b""
+
+    def test_exposes_the_file_for_sendfile(self, tmp_path):
+        path = tmp_path / "media.bin"
+        path.write_bytes(bytes(range(100)))
+        file = open(path, "rb")
+
+        with FileRange(file, start=10, length=20) as file_range:
+            assert file_range.fileno() == file.fileno()
+            file_range.seek(0, 2)
+            assert file_range.tell() == 30
@@ -1,8 +1,19 @@
+import uuid
+from decimal import Decimal
+from typing import List
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.category.domain.category import Category
 from src.core.genre.domain.genre import Genre
+from src.core.video.application.use_cases.list_video_without_media import (
+    VideoWithoutMediaOutput,
+)
 from src.core.video.domain.value_objects import Rating
 from src.core.video.domain.video import Video
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
@@ -653,3 +664,204 @@ class TestList:
         assert len(videos_from_db[1].categories) == 1  # type: ignore
         assert len(videos_from_db[1].genres) == 1  # type: ignore
         assert len(videos_from_db[1].cast_members) == 2  # type: ignores
+
+
+@pytest.mark.django_db
+class TestListProjections:
+    """
+    Test the read-only projections of the DjangoORMVideoRepository
+    """
+
+    def test_lists_outputs_with_related_ids_in_four_queries(
+        self,
+        movie_category: Category,
+        action_genre: Genre,
+        actor_cast_member: CastMember,
+        director_cast_member: CastMember,
+        django_assert_num_queries,
+    ):
+        DjangoORMCategoryRepository().save(movie_category)
+        DjangoORMGenreRepository().save(action_genre)
+        DjangoORMCastMemberRepository().save(actor_cast_member)
+        DjangoORMCastMemberRepository().save(director_cast_member)
+
+        video = Video(
+            title="Avatar",
+            description="Pandora",
+            duration=162.0,  # type: ignore
+            launch_year=2009,
+            rating=Rating.AGE_12,
+            categories={movie_category.id},
+            genres={action_genre.id},
+            cast_members={actor_cast_member.id, director_cast_member.id},
+        )
+        bare_video = Video(
+            title="Avatar 3",
+            description="Pandora",
+            duration=190.0,  # type: ignore
+            launch_year=2025,
+            rating=Rating.AGE_14,
+            categories=set(),
+            genres=set(),
+            cast_members=set(),
+        )
+        repository = DjangoORMVideoRepository()
+        repository.save(video)
+        repository.save(bare_video)
+
+        with django_assert_num_queries(4):
+            outputs = {output.id: output for output in repository.list_projections()}
+
+        assert outputs[video.id] == VideoWithoutMediaOutput(
+            id=video.id,
+            title="Avatar",
+            description="Pandora",
+            launch_year=2009,
+            duration=Decimal("162.00"),
+            rating=Rating.AGE_12,
+            published=False,
+            categories={movie_category.id},
+            genres={action_genre.id},
+            cast_members={actor_cast_member.id, director_cast_member.id},
+        )
+        assert outputs[bare_video.id].categories == set()
+        assert sorted(async_to_sync(repository.alist_projections)()) == sorted(
+            outputs.values()
+        )
+
+
+@pytest.mark.django_db
+class TestGetByIds:
+    """
+    Test the batch retrieval of the DjangoORMVideoRepository
+    """
+
+    def test_retrieves_videos_with_related_data_in_one_query_per_relation(
+        self,
+        movie_category: Category,
+        action_genre: Genre,
+        actor_cast_member: CastMember,
+        django_assert_num_queries,
+    ):
+        DjangoORMCategoryRepository().save(movie_category)
+        DjangoORMGenreRepository().save(action_genre)
+        DjangoORMCastMemberRepository().save(actor_cast_member)
+
+        videos = [
+            Video(
+                title=f"Avatar {index}",
+                description="Pandora",
+                duration=162.0,  # type: ignore
+                launch_year=2009,
+                rating=Rating.AGE_12,
+                categories={movie_category.id},
+                genres={action_genre.id},
+                cast_members={actor_cast_member.id},
+            )
+            for index in range(3)
+        ]
+        repository = DjangoORMVideoRepository()
+        for video in videos:
+            repository.save(video)
+        requested = [videos[0].id, videos[2].id, uuid.uuid4()]
+
+        with django_assert_num_queries(4):
+            found = repository.get_by_ids(requested)
+
+        assert {video.id for video in found} == {videos[0].id, videos[2].id}
+        assert all(
+            video.categories == {movie_category.id}
+            and video.genres == {action_genre.id}
+            and video.cast_members == {actor_cast_member.id}
+            for video in found
+        )
+        assert {
+            video.id for video in async_to_sync(repository.aget_by_ids)(requested)
+        } == {videos[0].id, videos[2].id}
+
+    def test_pages_only_the_requested_videos(self, movie_category: Category):
+        DjangoORMCategoryRepository().save(movie_category)
+        videos = [
+            Video(
+                title=title,
+                description="Pandora",
+                duration=162.0,  # type: ignore
+                launch_year=2009,
+                rating=Rating.AGE_12,
+                categories={movie_category.id},
+                genres=set(),
+                cast_members=set(),
+            )
+            for title in ("Avatar", "Avatar 2", "Avatar 3")
+        ]
+        repository = DjangoORMVideoRepository()
+        for video in videos:
+            repository.save(video)
+
+        page, total = repository.page(
+            "title", True, 0, 2, ids={videos[0].id, videos[2].id}
+        )
+
+        assert [output.title for output in page] == ["Avatar 3", "Avatar"]
+        assert page[0].categories == {movie_category.id}
+        assert total == 2
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedTotal:
+    """
+    Test the page totals of the DjangoORMVideoRepository kept in the cache
+    """
+
+    @pytest.fixture(autouse=True)
+    def cached_totals(self, settings):
+        settings.LIST_TOTAL_MODE = "cached"
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def videos(self, movie_category: Category) -> List[Video]:
+        DjangoORMCategoryRepository().save(movie_category)
+        videos = [
+            Video(
+                title=title,
+                description="Pandora",
+                duration=162.0,  # type: ignore
+                launch_year=2009,
+                rating=Rating.AGE_12,
+                categories={movie_category.id},
+                genres=set(),
+                cast_members=set(),
+            )
+            for title in ("Avatar", "Avatar 2", "Avatar 3")
+        ]
+        repository = DjangoORMVideoRepository()
+        for video in videos:
+            repository.save(video)
+        return videos
+
+    def test_pages_without_counting_once_the_total_is_cached(self, videos: List[Video]):
+        repository = DjangoORMVideoRepository()
+        assert repository.page("title", False, 0, 2)[1] == 3
+
+        with CaptureQueriesContext(connection) as queries:
+            _, sync_total = repository.page("title", False, 2, 2)
+            _, async_total = async_to_sync(repository.apage)("title", False, 0, 2)
+
+        assert sync_total == async_total == 3
+        assert not any("COUNT(" in query["sql"] for query in queries)
+
+    def test_counts_a_page_of_requested_videos(self, videos: List[Video]):
+        repository = DjangoORMVideoRepository()
+        requested = {videos[0].id, videos[2].id}
+        repository.page("title", False, 0, 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            _, sync_total = repository.page("title", False, 0, 2, ids=requested)
+            _, async_total = async_to_sync(repository.apage)(
+                "title", False, 0, 2, ids=requested
+            )
+
+        assert sync_total == async_total == 2
+        assert sum("COUNT(" in query["sql"] for query in queries) == 2
@@ -0,0 +1,104 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.application.use_cases.list import ListResponseMeta
+from src.core.video.application.use_cases.get_video import GetVideo
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    ImageType,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.django_project.video_app.serializers import (
+    LIST_VIDEO_WITHOUT_MEDIA_RESPONSE,
+    VIDEO_WITH_MEDIA_RESPONSE,
+    ListVideoWithoutMediaResponseSerializer,
+    VideoWithMediaResponseSerializer,
+)
+
+
+@pytest.fixture
+def avatar_output() -> GetVideo.Output:
+    """
+    Fixture for a GetVideo output with every media set.
+
+    Returns:
+        GetVideo.Output: The output of the GetVideo use case for "Avatar".
+    """
+
+    return GetVideo.Output(
+        id=uuid.uuid4(),
+        title="Avatar   Pandora",
+        description="A marine on an alien planet — ação",
+        launch_year=2009,
+        duration=Decimal("162.5"),
+        published=False,
+        rating=Rating.AGE_14,
+        categories={uuid.uuid4()},
+        genres={uuid.uuid4(), uuid.uuid4()},
+        cast_members=set(),
+        banner=ImageMedia(
+            name="banner",
+            location="location",
+            image_type=ImageType.BANNER,
+        ),
+        thumbnail=None,
+        thumbnail_half=None,
+        trailer=None,
+        video=AudioVideoMedia(
+            name="video",
+            raw_location="raw",
+            encoded_location="",
+            status=MediaStatus.PROCESSING,
+            media_type=MediaType.VIDEO,
+            check_sum="123",
+        ),
+    )
+
+
+class TestCompiledSerializer:
+    """
+    Tests that compiled serializers render the same bytes as the DRF serializers.
+    """
+
+    def test_retrieve_video_matches_serializer(self, avatar_output: GetVideo.Output):
+        expected = JSONRenderer().render(
+            VideoWithMediaResponseSerializer(instance=avatar_output).data
+        )
+
+        assert VIDEO_WITH_MEDIA_RESPONSE.render(avatar_output) == expected
+        assert (
+            VIDEO_WITH_MEDIA_RESPONSE.to_representation(avatar_output)
+            == VideoWithMediaResponseSerializer(instance=avatar_output).data
+        )
+
+    def test_list_videos_matches_serializer(self):
+        videos = [
+            Video(
+                title=f"Video {i}",
+                description="Description",
+                launch_year=2000 + i,
+                duration=Decimal("90.555"),
+                rating=rating,
+                categories={uuid.uuid4()},
+                genres=set(),
+                cast_members={uuid.uuid4(), uuid.uuid4()},
+            )
+            for i, rating in enumerate(Rating)
+        ]
+        res = {
+            "data": videos,
+            "meta": ListResponseMeta(current_page=1, per_page=2, total=len(videos)),
+        }
+
+        expected = JSONRenderer().render(
+            ListVideoWithoutMediaResponseSerializer(instance=res).data
+        )
+
+        assert LIST_VIDEO_WITHOUT_MEDIA_RESPONSE.render(res) == expected
@@ -1,11 +1,14 @@
+import json
 import os
 import uuid
 
 import pytest
+from asgiref.sync import async_to_sync
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
 )
@@ -13,14 +16,25 @@ from rest_framework.test import APIClient
 
 from src.config import DEFAULT_PAGE_SIZE
 from src.core._shared.infrastructure.auth.jwt_token_generator import JwtTokenGenerator
+from src.core._shared.infrastructure.storage.abstract_storage_service import (
+    sharded_path,
+)
+from src.core._shared.infrastructure.storage.local_storage import LocalStorage
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.category.domain.category import Category
 from src.core.genre.domain.genre import Genre
+from src.core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
 from src.core.video.domain.video import Video
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.media_status import (
+    get_media_status_broadcaster,
+    media_status_channel,
+    media_status_message,
+)
 from src.django_project.video_app.repository import DjangoORMVideoRepository
+from src.django_project.video_app.views import MediaStatusStreamView
 
 
 @pytest.fixture
@@ -399,6 +413,509 @@ class TestRetrieveAPI:
         assert response.data == {"error": "Video not found"}  # type: ignore
 
 
+@pytest.mark.django_db
+class TestAsyncReadAPI:
+    """
+    Test class for the async read endpoints served under ASGI.
+    """
+
+    def test_async_endpoints_match_sync_endpoints(
+        self,
+        avatar_movie: Video,
+        movie_category: Category,
+        action_genre: Genre,
+        adventure_genre: Genre,
+        actor_cast_member: CastMember,
+        director_cast_member: CastMember,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that the async list and retrieve endpoints render the same bytes as
+        the viewset endpoints.
+        """
+
+        DjangoORMCategoryRepository().save(movie_category)
+        genre_repository = DjangoORMGenreRepository()
+        genre_repository.save(action_genre)
+        genre_repository.save(adventure_genre)
+        cast_member_repository = DjangoORMCastMemberRepository()
+        cast_member_repository.save(actor_cast_member)
+        cast_member_repository.save(director_cast_member)
+        DjangoORMVideoRepository().save(avatar_movie)
+
+        for sync_url, async_url in [
+            ("/api/videos/", "/api/async/videos/"),
+            (
+                f"/api/videos/{avatar_movie.id}/",
+                f"/api/async/videos/{avatar_movie.id}/",
+            ),
+        ]:
+            sync_response = api_client_with_auth.get(path=sync_url)
+            async_response = api_client_with_auth.get(path=async_url)
+
+            assert async_response.status_code == HTTP_200_OK  # type: ignore
+            assert async_response.content == sync_response.content  # type: ignore
+
+    def test_async_get_video_with_invalid_id(
+        self,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that the async retrieve endpoint returns 404 for an unknown video.
+        """
+
+        response = api_client_with_auth.get(path=f"/api/async/videos/{uuid.uuid4()}/")
+
+        assert response.status_code == HTTP_404_NOT_FOUND  # type: ignore
+        assert response.json() == {"error": "Video not found"}  # type: ignore
+
+
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    """
+    Test class for ETag and Last-Modified support on the video endpoints
+    """
+
+    @pytest.fixture(autouse=True)
+    def save_related(
+        self,
+        movie_category: Category,
+        action_genre: Genre,
+        adventure_genre: Genre,
+        actor_cast_member: CastMember,
+        director_cast_member: CastMember,
+    ):
+        DjangoORMCategoryRepository().save(movie_category)
+        genre_repository = DjangoORMGenreRepository()
+        genre_repository.save(action_genre)
+        genre_repository.save(adventure_genre)
+        cast_member_repository = DjangoORMCastMemberRepository()
+        cast_member_repository.save(actor_cast_member)
+        cast_member_repository.save(director_cast_member)
+
+    def test_retrieve_returns_304_before_loading_video(
+        self,
+        avatar_movie: Video,
+        api_client_with_auth: APIClient,
+        django_assert_num_queries,
+    ):
+        """
+        Tests that a matching If-None-Match is answered with a single version
+        lookup, and a matching If-Modified-Since also returns 304.
+        """
+
+        DjangoORMVideoRepository().save(avatar_movie)
+        url = f"/api/videos/{avatar_movie.id}/"
+
+        response = api_client_with_auth.get(path=url)
+        assert response.status_code == HTTP_200_OK  # type: ignore
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+
+        with django_assert_num_queries(1):
+            response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTP_304_NOT_MODIFIED  # type: ignore
+        assert response.headers["ETag"] == etag
+
+        response = api_client_with_auth.get(
+            path=url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        assert response.status_code == HTTP_304_NOT_MODIFIED  # type: ignore
+
+    def test_retrieve_etag_changes_when_video_is_updated(
+        self,
+        avatar_movie: Video,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that updating the video invalidates the previous ETag.
+        """
+
+        video_repository = DjangoORMVideoRepository()
+        video_repository.save(avatar_movie)
+        url = f"/api/videos/{avatar_movie.id}/"
+        etag = api_client_with_auth.get(path=url).headers["ETag"]
+
+        avatar_movie.update(
+            title="Avatar Updated",
+            description=avatar_movie.description,
+            launch_year=avatar_movie.launch_year,
+            duration=avatar_movie.duration,
+            published=avatar_movie.published,
+            rating=avatar_movie.rating,
+        )
+        video_repository.update(avatar_movie)
+
+        response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTP_200_OK  # type: ignore
+        assert response.headers["ETag"] != etag
+        assert response.data["title"] == "Avatar Updated"  # type: ignore
+
+    def test_list_etag_changes_when_collection_changes(
+        self,
+        avatar_movie: Video,
+        avatar_2_movie: Video,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that the list ETag is stable while the collection is unchanged and
+        changes on inserts and deletes.
+        """
+
+        video_repository = DjangoORMVideoRepository()
+        video_repository.save(avatar_movie)
+        url = "/api/videos/"
+
+        etag = api_client_with_auth.get(path=url).headers["ETag"]
+        response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTP_304_NOT_MODIFIED  # type: ignore
+
+        video_repository.save(avatar_2_movie)
+        response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTP_200_OK  # type: ignore
+        etag = response.headers["ETag"]
+
+        video_repository.delete(avatar_2_movie.id)
+        response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTP_200_OK  # type: ignore
+        assert "Last-Modified" not in response.headers
+
+    def test_list_etag_depends_on_the_query(
+        self,
+        avatar_movie: Video,
+        avatar_2_movie: Video,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that each page, ordering and ids filter of the list has its own
+        ETag, so a version of one is never answered with 304 for another.
+        """
+
+        video_repository = DjangoORMVideoRepository()
+        video_repository.save(avatar_movie)
+        video_repository.save(avatar_2_movie)
+        etag = api_client_with_auth.get(path="/api/videos/").headers["ETag"]
+
+        etags = {etag}
+        for query in (
+            "current_page=2",
+            "order_by=launch_year",
+            "sort=desc",
+            f"ids={avatar_movie.id}",
+        ):
+            response = api_client_with_auth.get(
+                path=f"/api/videos/?{query}", HTTP_IF_NONE_MATCH=etag
+            )
+            assert response.status_code == HTTP_200_OK  # type: ignore
+            etags.add(response.headers["ETag"])
+
+        assert len(etags) == 5
+
+    @pytest.mark.parametrize(
+        "repository, related",
+        [
+            (DjangoORMCategoryRepository, "movie_category"),
+            (DjangoORMGenreRepository, "action_genre"),
+            (DjangoORMCastMemberRepository, "actor_cast_member"),
+        ],
+    )
+    def test_etags_change_when_a_related_row_is_deleted(
+        self,
+        repository,
+        related: str,
+        avatar_movie: Video,
+        api_client_with_auth: APIClient,
+        request,
+    ):
+        """
+        Tests that deleting a category, genre or cast member, which cascades
+        into the relations of the genres and videos, invalidates their ETags.
+        """
+
+        DjangoORMVideoRepository().save(avatar_movie)
+        urls = ["/api/videos/", f"/api/videos/{avatar_movie.id}/", "/api/genres/"]
+        etags = {
+            url: api_client_with_auth.get(path=url).headers["ETag"] for url in urls
+        }
+
+        repository().delete(request.getfixturevalue(related).id)
+
+        for url in urls:
+            response = api_client_with_auth.get(path=url, HTTP_IF_NONE_MATCH=etags[url])
+            if related == "actor_cast_member" and url == "/api/genres/":
+                assert response.status_code == HTTP_304_NOT_MODIFIED  # type: ignore
+            else:
+                assert response.status_code == HTTP_200_OK  # type: ignore
+                assert response.headers["ETag"] != etags[url]
+
+    def test_missing_video_has_no_etag(self, api_client_with_auth: APIClient):
+        """
+        Tests that a 404 response carries no ETag.
+        """
+
+        response = api_client_with_auth.get(path=f"/api/videos/{uuid.uuid4()}/")
+
+        assert response.status_code == HTTP_404_NOT_FOUND  # type: ignore
+        assert "ETag" not in response.headers
+
+
+@pytest.mark.django_db
+class TestMediaStatusStreamAPI:
+    """
+    Test class for the media status server-sent events stream
+    """
+
+    def test_returns_400_when_ids_are_missing_or_invalid(
+        self,
+        api_client_with_auth: APIClient,
+    ):
+        """
+        Tests that the stream is not opened without valid video ids.
+        """
+
+        url = "/api/videos/media-status/"
+
+        assert api_client_with_auth.get(url).status_code == HTTP_400_BAD_REQUEST  # type: ignore
+        assert (
+            api_client_with_auth.get(f"{url}?ids=123").status_code  # type: ignore
+            == HTTP_400_BAD_REQUEST
+        )
+
+    def test_requires_authentication(self):
+        """
+        Tests that the stream requires the same credentials as the viewsets.
+        """
+
+        response = APIClient().get(f"/api/videos/media-status/?ids={uuid.uuid4()}")
+
+        assert response.status_code == 403  # type: ignore
+
+    def test_streams_current_status_and_published_changes(
+        self,
+        avatar_movie: Video,
+        movie_category: Category,
+        action_genre: Genre,
+        adventure_genre: Genre,
+        actor_cast_member: CastMember,
+        director_cast_member: CastMember,
+    ):
+        """
+        Tests that the stream starts with the current media status and then
+        forwards the changes published to the video channel.
+        """
+
+        DjangoORMCategoryRepository().save(movie_category)
+        genre_repository = DjangoORMGenreRepository()
+        genre_repository.save(action_genre)
+        genre_repository.save(adventure_genre)
+        cast_member_repository = DjangoORMCastMemberRepository()
+        cast_member_repository.save(actor_cast_member)
+        cast_member_repository.save(director_cast_member)
+        avatar_movie.video = AudioVideoMedia(
+            name="avatar.mp4",
+            raw_location="videos/avatar.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        )
+        video_repository = DjangoORMVideoRepository()
+        video_repository.save(avatar_movie)
+        video_repository.update(avatar_movie)
+
+        broadcaster = get_media_status_broadcaster()
+        completed = media_status_message(
+            video_id=avatar_movie.id,
+            media_type=MediaType.VIDEO,
+            status=MediaStatus.COMPLETED,
+            encoded_location="videos/avatar/encoded",
+        )
+
+        async def read_events():
+            stream = MediaStatusStreamView().stream([avatar_movie.id])
+            events = [await anext(stream), await anext(stream)]
+            broadcaster.publish(media_status_channel(avatar_movie.id), completed)
+            events.append(await anext(stream))
+            await stream.aclose()
+            return events
+
+        retry, current, change = async_to_sync(read_events)()
+
+        assert retry.startswith("retry: ")
+        assert current == MediaStatusStreamView.event(
+            media_status_message(
+                video_id=avatar_movie.id,
+                media_type=MediaType.VIDEO,
+                status=MediaStatus.PENDING,
+                encoded_location="",
+            )
+        )
+        assert change == f"event: media_status\ndata: {json.dumps(completed)}\n\n"
+        assert broadcaster.subscriptions == {}  # type: ignore
+
+
+@pytest.mark.django_db
+class TestMediaAPI:
+    """
+    Test class for serving the stored media of a video
+    """
+
+    content = bytes(range(256)) * 40
+
+    @pytest.fixture(autouse=True)
+    def stored_video(
+        self,
+        settings,
+        tmp_path,
+        avatar_movie: Video,
+        movie_category: Category,
+        action_genre: Genre,
+        adventure_genre: Genre,
+        actor_cast_member: CastMember,
+        director_cast_member: CastMember,
+    ):
+        settings.STORAGE_BUCKET = str(tmp_path)
+        settings.MEDIA_ACCEL = ""
+        DjangoORMCategoryRepository().save(movie_category)
+        genre_repository = DjangoORMGenreRepository()
+        genre_repository.save(action_genre)
+        genre_repository.save(adventure_genre)
+        cast_member_repository = DjangoORMCastMemberRepository()
+        cast_member_repository.save(actor_cast_member)
+        cast_member_repository.save(director_cast_member)
+
+        location = sharded_path("videos", str(avatar_movie.id), "avatar.mp4")
+        check_sum = LocalStorage(bucket=str(tmp_path), fsync=False).store(
+            location, self.content, "video/mp4"
+        )
+        avatar_movie.video = AudioVideoMedia(
+            name="avatar.mp4",
+            raw_location=location,
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+            check_sum=check_sum,
+        )
+        video_repository = DjangoORMVideoRepository()
+        video_repository.save(avatar_movie)
+        video_repository.update(avatar_movie)
+        return check_sum
+
+    def url(self, video: Video, media_type: str = "video") -> str:
+        return f"/api/videos/{video.id}/media/{media_type}/"
+
+    def test_serves_the_whole_file(
+        self, avatar_movie: Video, stored_video: str, api_client_with_auth: APIClient
+    ):
+        response = api_client_with_auth.get(self.url(avatar_movie))
+
+        assert response.status_code == HTTP_200_OK
+        assert b"".join(response.streaming_content) == self.content
+        assert response["Content-Length"] == str(len(self.content))
+        assert response["Content-Type"] == "video/mp4"
+        assert response["ETag"] == f'"{stored_video}"'
+        assert response["Accept-Ranges"] == "bytes"
+
+    @pytest.mark.parametrize(
+        "header, start, end",
+        [
+            ("bytes=0-99", 0, 99),
+            ("bytes=10000-", 10000, 10239),
+            ("bytes=-40", 10200, 10239),
+            ("bytes=10200-99999", 10200, 10239),
+        ],
+    )
+    def test_serves_a_range(
+        self,
+        avatar_movie: Video,
+        api_client_with_auth: APIClient,
+        header: str,
+        start: int,
+        end: int,
+    ):
+        response = api_client_with_auth.get(self.url(avatar_movie), HTTP_RANGE=header)
+
+        assert response.status_code == 206
+        assert b"".join(response.streaming_content) == self.content[start : end + 1]
+        assert response["Content-Length"] == str(end - start + 1)
+        assert response["Content-Range"] == f"bytes {start}-{end}/{len(self.content)}"
+
+    def test_rejects_an_unsatisfiable_range(
+        self, avatar_movie: Video, api_client_with_auth: APIClient
+    ):
+        response = api_client_with_auth.get(
+            self.url(avatar_movie), HTTP_RANGE="bytes=20000-"
+        )
+
+        assert response.status_code == 416
+        assert response["Content-Range"] == f"bytes */{len(self.content)}"
+
+    def test_ignores_the_range_when_if_range_does_not_match(
+        self, avatar_movie: Video, api_client_with_auth: APIClient
+    ):
+        response = api_client_with_auth.get(
+            self.url(avatar_movie), HTTP_RANGE="bytes=0-99", HTTP_IF_RANGE='"stale"'
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response["Content-Length"] == str(len(self.content))
+
+    def test_returns_304_for_a_matching_etag(
+        self, avatar_movie: Video, stored_video: str, api_client_with_auth: APIClient
+    ):
+        response = api_client_with_auth.get(
+            self.url(avatar_movie), HTTP_IF_NONE_MATCH=f'"{stored_video}"'
+        )
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    def test_accepts_media_accept_headers(
+        self, avatar_movie: Video, api_client_with_auth: APIClient
+    ):
+        response = api_client_with_auth.get(
+            self.url(avatar_movie), HTTP_ACCEPT="video/mp4"
+        )
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_offloads_to_nginx(
+        self, settings, avatar_movie: Video, api_client_with_auth: APIClient
+    ):
+        settings.MEDIA_ACCEL = "nginx"
+        settings.MEDIA_ACCEL_PREFIX = "/protected-media/"
+
+        response = api_client_with_auth.get(self.url(avatar_movie))
+
+        location = sharded_path("videos", str(avatar_movie.id), "avatar.mp4")
+        assert response.status_code == HTTP_200_OK
+        assert response["X-Accel-Redirect"] == f"/protected-media/{location}"
+        assert response.content == b""
+
+    def test_offloads_to_sendfile(
+        self, settings, tmp_path, avatar_movie: Video, api_client_with_auth: APIClient
+    ):
+        settings.MEDIA_ACCEL = "sendfile"
+
+        response = api_client_with_auth.get(self.url(avatar_movie))
+
+        location = sharded_path("videos", str(avatar_movie.id), "avatar.mp4")
+        assert response["X-Sendfile"] == str((tmp_path / location).resolve())
+
+    @pytest.mark.parametrize("media_type", ["trailer", "banner", "title"])
+    def test_returns_404_for_missing_media(
+        self, avatar_movie: Video, api_client_with_auth: APIClient, media_type: str
+    ):
+        response = api_client_with_auth.get(self.url(avatar_movie, media_type))
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+        assert response.data == {"error": "Media not found"}  # type: ignore
+
+    def test_returns_404_for_missing_video(self, api_client_with_auth: APIClient):
+        response = api_client_with_auth.get(f"/api/videos/{uuid.uuid4()}/media/video/")
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+        assert response.data == {"error": "Video not found"}  # type: ignore
+
+
 @pytest.mark.django_db
 class TestCreateAPI:
     """
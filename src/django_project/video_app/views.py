@@ -1,6 +1,13 @@
+import asyncio
+import json
 import uuid
+from pathlib import Path
+from typing import AsyncIterator, List
 
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -12,11 +19,16 @@ from rest_framework.status import (
 )
 
 from src.core._shared.application.use_cases.delete import DeleteRequest
-from src.core._shared.application.use_cases.list import ListRequest, ListResponse
-from src.core._shared.events.message_bus import MessageBus
+from src.core._shared.application.use_cases.list import (
+    InvalidOrderBy,
+    ListRequest,
+    ListResponse,
+)
+from src.core._shared.infrastructure.instrumentation import timed
 from src.core._shared.infrastructure.storage.local_storage import LocalStorage
 from src.core.video.application.exceptions import (
     InvalidVideo,
+    MediaNotFound,
     RelatedEntitiesNotFound,
     VideoNotFound,
 )
@@ -27,6 +39,7 @@ from src.core.video.application.use_cases.delete_video_without_media import (
     DeleteVideoWithoutMedia,
 )
 from src.core.video.application.use_cases.get_video import GetVideo
+from src.core.video.application.use_cases.get_video_media import GetVideoMedia
 from src.core.video.application.use_cases.list_video_without_media import (
     ListVideoWithoutMedia,
 )
@@ -34,19 +47,38 @@ from src.core.video.application.use_cases.update_video_without_media import (
     UpdateVideoWithoutMedia,
 )
 from src.core.video.application.use_cases.upload_video import UploadVideo
+from src.django_project.async_views import AsyncReadView
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.conditional import (
+    collection_version,
+    conditional,
+    row_version,
+)
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.message_bus import get_message_bus
 from src.django_project.permissions import IsAdmin, IsAuthenticated
 from src.django_project.serializers import (
     CreateResponseSerializer,
+    ListRequestSerializer,
     RetrieveDeleteRequestSerializer,
 )
+from src.django_project.unit_of_work import DjangoUnitOfWork
+from src.django_project.video_app.media_files import (
+    IgnoreAcceptNegotiation,
+    media_response,
+)
+from src.django_project.video_app.media_status import (
+    get_media_status_broadcaster,
+    media_status_channel,
+    media_status_message,
+)
+from src.django_project.video_app.models import Video as VideoModel
 from src.django_project.video_app.repository import DjangoORMVideoRepository
 from src.django_project.video_app.serializers import (
-    ListVideoWithoutMediaResponseSerializer,
+    LIST_VIDEO_WITHOUT_MEDIA_RESPONSE,
+    VIDEO_WITH_MEDIA_RESPONSE,
     UpdateVideoWithoutMediaRequestSerializer,
-    VideoWithMediaResponseSerializer,
     VideoWithoutMediaRequestSerializer,
 )
 
@@ -59,6 +91,7 @@ class VideoViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
+    @conditional(collection_version(VideoModel))
     def list(self, request: Request) -> Response:
         """
         List all videos.
@@ -72,24 +105,32 @@ class VideoViewSet(viewsets.ViewSet):
 
         order_by = request.query_params.get("order_by", "title")
         reverse_order = request.query_params.get("sort", "asc")
-        current_page = request.query_params.get("current_page", 1)
+        filters = ListRequestSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
         use_case = ListVideoWithoutMedia(repository=DjangoORMVideoRepository())
-        res: ListResponse = use_case.execute(
-            ListRequest(
-                order_by=order_by,
-                sort=reverse_order,
-                current_page=int(current_page),
+        try:
+            with timed("use_case"):
+                res: ListResponse = use_case.execute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )  # type: ignore
+        except InvalidOrderBy as e:
+            return Response(
+                data={"error": str(e)},
+                status=HTTP_400_BAD_REQUEST,
             )
-        )  # type: ignore
-
-        serializer = ListVideoWithoutMediaResponseSerializer(instance=res)
 
         return Response(
-            data=serializer.data,
+            data=LIST_VIDEO_WITHOUT_MEDIA_RESPONSE.to_representation(res),
             status=HTTP_200_OK,
         )
 
+    @conditional(row_version(VideoModel))
     def retrieve(self, request: Request, pk=None) -> Response:
         """
         Retrieve a video by its ID.
@@ -107,15 +148,18 @@ class VideoViewSet(viewsets.ViewSet):
 
         try:
             use_case = GetVideo(repository=DjangoORMVideoRepository())
-            res: GetVideo.Output = use_case.execute(GetVideo.Input(id=uuid.UUID(pk)))  # type: ignore
+            with timed("use_case"):
+                res: GetVideo.Output = use_case.execute(GetVideo.Input(id=uuid.UUID(pk)))  # type: ignore
         except VideoNotFound:
             return Response(
                 data={"error": "Video not found"},
                 status=HTTP_404_NOT_FOUND,
             )
 
-        output = VideoWithMediaResponseSerializer(instance=res)
-        return Response(data=output.data, status=HTTP_200_OK)
+        return Response(
+            data=VIDEO_WITH_MEDIA_RESPONSE.to_representation(res),
+            status=HTTP_200_OK,
+        )
 
     def create(self, request: Request) -> Response:
         """
@@ -145,7 +189,8 @@ class VideoViewSet(viewsets.ViewSet):
         )
 
         try:
-            output: CreateVideoWithoutMedia.Output = use_case.execute(req)
+            with timed("use_case"):
+                output: CreateVideoWithoutMedia.Output = use_case.execute(req)
         except (InvalidVideo, RelatedEntitiesNotFound) as err:
             return Response(
                 data={"error": str(err)},
@@ -186,7 +231,8 @@ class VideoViewSet(viewsets.ViewSet):
         )
 
         try:
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except VideoNotFound:
             return Response(
                 data={"error": "Video not found"},
@@ -220,7 +266,8 @@ class VideoViewSet(viewsets.ViewSet):
         try:
             req = DeleteRequest(**serializer.validated_data)  # type: ignore
             use_case = DeleteVideoWithoutMedia(DjangoORMVideoRepository())
-            use_case.execute(req)
+            with timed("use_case"):
+                use_case.execute(req)
         except VideoNotFound:
             return Response(
                 data={"error": "Video not found"},
@@ -251,19 +298,20 @@ class VideoViewSet(viewsets.ViewSet):
 
         use_case = UploadVideo(
             DjangoORMVideoRepository(),
-            LocalStorage(),
-            MessageBus(),
+            LocalStorage(bucket=settings.STORAGE_BUCKET, fsync=settings.STORAGE_FSYNC),
+            DjangoUnitOfWork(get_message_bus()),
         )
 
         try:
-            use_case.execute(
-                UploadVideo.Input(
-                    video_id=uuid.UUID(pk),
-                    file_name=file.name,  # type: ignore
-                    content=content,
-                    content_type=content_type,  # type: ignore
+            with timed("use_case"):
+                use_case.execute(
+                    UploadVideo.Input(
+                        video_id=uuid.UUID(pk),
+                        file_name=file.name,  # type: ignore
+                        content=content,
+                        content_type=content_type,  # type: ignore
+                    )
                 )
-            )
         except VideoNotFound:
             return Response(
                 data={"error": "Video not found"},
@@ -273,3 +321,242 @@ class VideoViewSet(viewsets.ViewSet):
         return Response(
             status=HTTP_200_OK,
         )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"media/(?P<media_type>[a-z_]+)",
+        content_negotiation_class=IgnoreAcceptNegotiation,
+    )
+    def media(self, request: Request, pk=None, media_type=None) -> HttpResponse:
+        """
+        Download a stored media of a video.
+
+        Supports Range and conditional requests, with the content checksum as
+        ETag. The file is sent with sendfile where the server supports it, or
+        handed over to the proxy when MEDIA_ACCEL is set.
+
+        Args:
+            request (Request): The request object containing request data.
+            pk (str): The id of the video.
+            media_type (str): One of video, trailer, banner, thumbnail or
+                thumbnail_half.
+
+        Returns:
+            HttpResponse: The media content, or a 404 response if the video or
+                the media doesn't exist.
+        """
+
+        serializer = RetrieveDeleteRequestSerializer(data={"id": pk})
+        serializer.is_valid(raise_exception=True)
+
+        use_case = GetVideoMedia(repository=DjangoORMVideoRepository())
+        try:
+            with timed("use_case"):
+                media = use_case.execute(
+                    GetVideoMedia.Input(video_id=uuid.UUID(pk), media_type=media_type)  # type: ignore
+                )
+            return media_response(
+                request,
+                root=Path(settings.STORAGE_BUCKET),
+                location=media.location,
+                name=media.name,
+                check_sum=media.check_sum,
+            )
+        except VideoNotFound:
+            error = "Video not found"
+        except (MediaNotFound, FileNotFoundError):
+            error = "Media not found"
+
+        return Response(data={"error": error}, status=HTTP_404_NOT_FOUND)
+
+
+class AsyncVideoListView(AsyncReadView):
+    """
+    Async view for listing videos under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        List all videos.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+
+        Returns:
+            HttpResponse: A response object containing a list of video data.
+        """
+
+        order_by = request.GET.get("order_by", "title")
+        reverse_order = request.GET.get("sort", "asc")
+        filters = ListRequestSerializer(data=request.GET)
+        if not filters.is_valid():
+            return self.render(data=filters.errors, status=HTTP_400_BAD_REQUEST)
+
+        use_case = ListVideoWithoutMedia(repository=DjangoORMVideoRepository())
+        try:
+            with timed("use_case"):
+                res: ListResponse = await use_case.aexecute(
+                    ListRequest(
+                        order_by=order_by,
+                        sort=reverse_order,
+                        current_page=filters.validated_data["current_page"],  # type: ignore
+                        ids=filters.validated_data.get("ids"),  # type: ignore
+                    )
+                )  # type: ignore
+        except InvalidOrderBy as e:
+            return self.render(data={"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+
+        return self.render_compiled(LIST_VIDEO_WITHOUT_MEDIA_RESPONSE, res)
+
+
+class AsyncVideoDetailView(AsyncReadView):
+    """
+    Async view for retrieving a video under ASGI.
+    """
+
+    async def handle(self, request: HttpRequest, pk: str) -> HttpResponse:  # type: ignore
+        """
+        Retrieve a video by its ID.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+            pk (str): The id of the video to be retrieved.
+
+        Returns:
+            HttpResponse: A response object containing the video data.
+        """
+
+        serializer = RetrieveDeleteRequestSerializer(data={"id": pk})
+        if not serializer.is_valid():
+            return self.render(data=serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            use_case = GetVideo(repository=DjangoORMVideoRepository())
+            with timed("use_case"):
+                res: GetVideo.Output = await use_case.aexecute(
+                    GetVideo.Input(id=serializer.validated_data["id"])  # type: ignore
+                )
+        except VideoNotFound:
+            return self.render(
+                data={"error": "Video not found"},
+                status=HTTP_404_NOT_FOUND,
+            )
+
+        return self.render_compiled(VIDEO_WITH_MEDIA_RESPONSE, res)
+
+
+class MediaStatusStreamView(AsyncReadView):
+    """
+    Server-sent events stream of the media status changes of a set of videos.
+
+    Clients pass the video ids as `?ids=<id>,<id>`. The stream starts with the
+    current status of every media and then pushes each change published by the
+    video converted consumer, so a waiting client holds one idle connection
+    instead of polling the retrieve endpoint.
+    """
+
+    max_videos = 100
+    heartbeat_interval = 15.0
+
+    async def handle(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Open the media status stream for the requested videos.
+
+        Args:
+            request (HttpRequest): The request object containing request data.
+
+        Returns:
+            HttpResponse: A streaming response with the events, or a 400 response
+                if the ids are missing or invalid.
+        """
+
+        try:
+            video_ids = list(
+                dict.fromkeys(
+                    uuid.UUID(raw_id)
+                    for raw_id in request.GET.get("ids", "").split(",")
+                    if raw_id
+                )
+            )
+        except ValueError:
+            video_ids = []
+
+        if not video_ids or len(video_ids) > self.max_videos:
+            return self.render(
+                data={
+                    "error": f"Provide between 1 and {self.max_videos} valid video ids"
+                },
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        response = StreamingHttpResponse(
+            self.stream(video_ids),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, video_ids: List[uuid.UUID]) -> AsyncIterator[str]:
+        """
+        Yield the current media statuses, then every published change.
+
+        The subscription is opened before the current statuses are read, so no
+        change can fall between the snapshot and the stream.
+
+        Args:
+            video_ids (List[uuid.UUID]): The ids of the watched videos.
+
+        Yields:
+            str: The server-sent events.
+        """
+
+        subscription = get_media_status_broadcaster().subscribe(
+            media_status_channel(video_id) for video_id in video_ids
+        )
+        try:
+            yield f"retry: {int(self.heartbeat_interval * 1000)}\n\n"
+
+            repository = DjangoORMVideoRepository()
+            for video_id in video_ids:
+                video = await repository.aget_by_id(video_id)
+                if video is None:
+                    continue
+                for media in (video.trailer, video.video):
+                    if media is not None:
+                        yield self.event(
+                            media_status_message(
+                                video_id=video.id,
+                                media_type=media.media_type,
+                                status=media.status,
+                                encoded_location=media.encoded_location,
+                            )
+                        )
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.get(),
+                        timeout=self.heartbeat_interval,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield self.event(message)
+        finally:
+            subscription.close()
+
+    @staticmethod
+    def event(message: dict) -> str:
+        """
+        Format a media status message as a server-sent event.
+
+        Args:
+            message (dict): The media status message.
+
+        Returns:
+            str: The server-sent event.
+        """
+
+        return f"event: media_status\ndata: {json.dumps(message)}\n\n"